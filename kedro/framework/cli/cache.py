@@ -0,0 +1,75 @@
+"""A collection of CLI commands for working with the node cache of a Kedro
+project, which ``kedro run --memoize`` uses to skip the nodes whose function
+and inputs have not changed since a previous run.
+"""
+import time
+
+import click
+
+from kedro.framework.cli.utils import KedroCliError
+from kedro.framework.startup import ProjectMetadata
+from kedro.runner import NodeCache
+
+NODE_CACHE_DIR = "data/node_cache"
+PRUNE_MAX_SIZE_HELP = """Evict the least recently used entries until the cache
+fits in this size, e.g. 2GB."""
+PRUNE_ALL_HELP = """Evict every entry of the cache."""
+
+
+def _get_node_cache(metadata: ProjectMetadata) -> NodeCache:
+    return NodeCache(metadata.project_path / NODE_CACHE_DIR)
+
+
+def _format_size(size: float) -> str:
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            break
+        size /= 1024
+    return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+
+
+def _describe_entry(entry: dict) -> str:
+    last_used = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["last_used"]))
+    outputs = ", ".join(entry["outputs"])
+    return (
+        f"{entry['key'][:12]}  {_format_size(entry['size']):>8}  {last_used}  "
+        f"{entry['node']} -> {outputs}"
+    )
+
+
+# pylint: disable=missing-function-docstring
+@click.group(name="Kedro")
+def cache_cli():  # pragma: no cover
+    pass
+
+
+@cache_cli.group()
+def cache():
+    """Commands for working with the node cache of `kedro run --memoize`."""
+
+
+@cache.command("list")
+@click.pass_obj
+def list_cache_entries(metadata: ProjectMetadata):
+    """List the entries of the node cache, most recently used first."""
+    entries = _get_node_cache(metadata).entries()
+    for entry in entries:
+        click.echo(_describe_entry(entry))
+    total_size = sum(entry["size"] for entry in entries)
+    click.echo(f"{len(entries)} entries, {_format_size(total_size)} in total.")
+
+
+@cache.command("prune")
+@click.option("--max-size", type=str, default=None, help=PRUNE_MAX_SIZE_HELP)
+@click.option("--all", "prune_all", is_flag=True, help=PRUNE_ALL_HELP)
+@click.pass_obj
+def prune_cache(metadata: ProjectMetadata, max_size, prune_all):
+    """Evict entries from the node cache."""
+    if not prune_all and max_size is None:
+        raise KedroCliError("Please specify either --max-size or --all.")
+    try:
+        evicted = _get_node_cache(metadata).prune(0 if prune_all else max_size)
+    except ValueError as exc:
+        raise KedroCliError(str(exc)) from exc
+    total_size = sum(entry["size"] for entry in evicted)
+    click.echo(f"Evicted {len(evicted)} entries, {_format_size(total_size)} freed.")
@@ -17,6 +17,7 @@ from click.utils import get_os_args
 # pylint: disable=unused-import
 import kedro.config.default_logger  # noqa
 from kedro import __version__ as version
+from kedro.framework.cli.cache import cache_cli
 from kedro.framework.cli.catalog import catalog_cli
 from kedro.framework.cli.hooks import get_cli_hook_manager
 from kedro.framework.cli.jupyter import jupyter_cli
@@ -208,6 +209,7 @@ class KedroCLI(CommandCollection):
             return []
 
         built_in = [
+            cache_cli,
             catalog_cli,
             jupyter_cli,
             pipeline_cli,
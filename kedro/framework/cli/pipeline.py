@@ -22,6 +22,8 @@ from rope.refactor.rename import Rename
 from setuptools.dist import Distribution
 
 import kedro
+from kedro.framework.cli.cache import _format_size
+from kedro.framework.cli.catalog import _create_session
 from kedro.framework.cli.utils import (
     KedroCliError,
     _clean_pycache,
@@ -31,9 +33,18 @@ from kedro.framework.cli.utils import (
     command_with_verbosity,
     env_option,
     python_call,
+    split_string,
 )
 from kedro.framework.project import pipelines, settings
 from kedro.framework.startup import ProjectMetadata
+from kedro.runner.checkpoint import _in_memory_data_sets
+from kedro.runner.simulator import _RUNNERS, ScheduleSimulator
+
+ANALYZE_TRACE_HELP = """Trace of a previous run written by `kedro run --trace`, from
+which the durations of the nodes and the sizes of the datasets are read. If not
+set, every node is assumed to take one second and the memory is not predicted."""
+ANALYZE_WORKERS_HELP = """Comma-separated numbers of workers to simulate the runs
+on. Defaults to the powers of two up to the maximum width of the pipeline."""
 
 _SETUP_PY_TEMPLATE = """# -*- coding: utf-8 -*-
 from setuptools import setup, find_packages
@@ -248,6 +259,74 @@ def describe_pipeline(
     click.echo(yaml.dump(result))
 
 
+@pipeline.command("analyze")
+@click.argument("name", nargs=1, default="__default__")
+@click.option(
+    "--trace", type=click.Path(exists=True, dir_okay=False), help=ANALYZE_TRACE_HELP
+)
+@click.option(
+    "--workers", type=str, default="", help=ANALYZE_WORKERS_HELP, callback=split_string
+)
+@env_option
+@click.pass_obj  # this will pass the metadata as first argument
+def analyze_pipeline(  # pylint: disable=too-many-locals
+    metadata: ProjectMetadata, name, trace, workers, env
+):
+    """Analyse the dependency graph of a pipeline and predict the makespan and
+    the peak memory of its runs with the different runners.
+    """
+    pipeline_obj = pipelines.get(name)
+    if not pipeline_obj:
+        existing_pipelines = ", ".join(sorted(pipelines.keys()))
+        raise KedroCliError(
+            f"`{name}` pipeline not found. Existing pipelines: [{existing_pipelines}]"
+        )
+    try:
+        workers = sorted({int(count) for count in workers})
+    except ValueError as exc:
+        raise KedroCliError(f"Invalid number of workers: {exc}") from exc
+    if any(count <= 0 for count in workers):
+        raise KedroCliError("The numbers of workers should be positive.")
+
+    session = _create_session(metadata.package_name, env=env)
+    catalog = session.load_context().catalog
+    in_memory = _in_memory_data_sets(pipeline_obj, catalog)
+    if trace:
+        simulator = ScheduleSimulator.from_trace(pipeline_obj, trace, in_memory)
+    else:
+        simulator = ScheduleSimulator(pipeline_obj, in_memory=in_memory)
+
+    max_width = simulator.max_width
+    if not workers:
+        widest = max(max_width, 1)
+        workers = [2 ** power for power in range(widest.bit_length())]
+        workers = sorted(set(workers) | {widest})
+    simulations = {}
+    for runner in _RUNNERS:
+        runs = [simulator.simulate(runner, count) for count in workers]
+        simulations[runner] = {
+            run.workers: {
+                "Makespan": f"{run.makespan:.2f}s",
+                "Peak memory": _format_size(run.peak_memory),
+            }
+            for run in runs
+        }
+    result = {
+        "Nodes": simulator.node_count,
+        "Critical path": [node.name for node in simulator.critical_path],
+        "Critical path length": f"{simulator.critical_path_length:.2f}s",
+        "Layer widths": simulator.layer_widths,
+        "Maximum width": max_width,
+        "Theoretical speed-up": f"{simulator.speedup:.2f}x",
+        "Simulations": simulations,
+        "Recommended workers": {
+            runner: simulator.recommend_workers(runner)
+            for runner in ("ThreadRunner", "ParallelRunner")
+        },
+    }
+    click.echo(yaml.dump(result, sort_keys=False))
+
+
 @command_with_verbosity(pipeline, "pull")
 @click.argument("package_path", nargs=1, required=False)
 @click.option(
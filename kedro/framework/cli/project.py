@@ -1,5 +1,6 @@
 """A collection of CLI commands for working with Kedro project."""
 
+import inspect
 import os
 import shutil
 import subprocess
@@ -11,6 +12,7 @@ from typing import Sequence
 import click
 from click import secho
 
+from kedro.framework.cli.cache import NODE_CACHE_DIR
 from kedro.framework.cli.utils import (
     KedroCliError,
     _check_module_importable,
@@ -29,6 +31,8 @@ from kedro.framework.cli.utils import (
 )
 from kedro.framework.session import KedroSession
 from kedro.framework.startup import ProjectMetadata
+from kedro.runner import NodeCache, RunTracer
+from kedro.runner.distributed_runner import DEFAULT_ADDRESS, run_worker
 from kedro.utils import load_obj
 
 NO_DEPENDENCY_MESSAGE = """{module} is not installed. Please make sure {module} is in
@@ -44,7 +48,8 @@ FROM_NODES_HELP = """A list of node names which should be used as a starting poi
 TO_NODES_HELP = """A list of node names which should be used as an end point."""
 NODE_ARG_HELP = """Run only nodes with specified names."""
 RUNNER_ARG_HELP = """Specify a runner that you want to run the pipeline with.
-Available runners: `SequentialRunner`, `ParallelRunner` and `ThreadRunner`.
+Available runners: `SequentialRunner`, `ParallelRunner`, `ThreadRunner`,
+`AsyncioRunner` and `HybridRunner`.
 This option cannot be used together with --parallel."""
 PARALLEL_ARG_HELP = """(DEPRECATED) Run the pipeline using the `ParallelRunner`.
 If not specified, use the `SequentialRunner`. This flag cannot be used together
@@ -53,6 +58,28 @@ with --runner. In Kedro 0.18.0, `-p` will be an alias for `--pipeline` and the
 specifying `--runner=ParallelRunner` (or `-r ParallelRunner`)."""
 ASYNC_ARG_HELP = """Load and save node inputs and outputs asynchronously
 with threads. If not specified, load and save datasets synchronously."""
+MEMOIZE_ARG_HELP = """Restore the outputs of the nodes whose function and inputs
+have not changed since a previous memoized run from the node cache, instead of
+running them. The cache is kept in `data/node_cache` and can be inspected with
+`kedro cache list`."""
+MEMOIZE_MAX_SIZE_HELP = """Maximum size of the node cache, e.g. 10GB. The least
+recently used entries are evicted beyond it. If not set, the cache is not limited."""
+ONLY_STALE_ARG_HELP = """Run only the nodes whose outputs are missing or older
+than their inputs, and the nodes depending on them. With --memoize, the nodes
+whose code or parameters changed since they last ran are rerun too."""
+RESUME_ARG_HELP = """Resume the failed run of a previous session, given its id.
+The nodes which completed in that run are skipped and the in-memory data they
+produced is restored from the checkpoint saved when the run failed. Pass the
+other arguments of the failed command again."""
+TRACE_ARG_HELP = """Write the timeline of the run to this JSON file in the Chrome
+trace event format, to open it in https://ui.perfetto.dev or chrome://tracing."""
+COORDINATOR_ARG_HELP = """Address of the `DistributedRunner` to run nodes for, as
+HOST:PORT. The worker waits for the runner to listen, and connects again after
+each run. The authentication key is read from the KEDRO_WORKER_AUTHKEY
+environment variable."""
+WORKER_HOST_ARG_HELP = """Host name or IP address on which the runner and the
+other workers reach this worker. Defaults to the address it connects from."""
+ONCE_ARG_HELP = """Exit once the runner disconnects instead of connecting again."""
 TAG_ARG_HELP = """Construct the pipeline using only nodes which have this tag
 attached. Option can be used multiple times, what results in a
 pipeline constructed from nodes having any of those tags."""
@@ -326,6 +353,11 @@ def activate_nbstripout(
 )
 @click.option("--parallel", "-p", is_flag=True, multiple=False, help=PARALLEL_ARG_HELP)
 @click.option("--async", "is_async", is_flag=True, multiple=False, help=ASYNC_ARG_HELP)
+@click.option("--memoize", is_flag=True, multiple=False, help=MEMOIZE_ARG_HELP)
+@click.option("--memoize-max-size", type=str, default=None, help=MEMOIZE_MAX_SIZE_HELP)
+@click.option("--only-stale", is_flag=True, multiple=False, help=ONLY_STALE_ARG_HELP)
+@click.option("--resume", type=str, default=None, help=RESUME_ARG_HELP)
+@click.option("--trace", type=click.Path(dir_okay=False), help=TRACE_ARG_HELP)
 @env_option
 @click.option("--tag", "-t", type=str, multiple=True, help=TAG_ARG_HELP)
 @click.option(
@@ -347,13 +379,20 @@ def activate_nbstripout(
 @click.option(
     "--params", type=str, default="", help=PARAMS_ARG_HELP, callback=_split_params
 )
+@click.pass_obj  # this will pass the metadata as first argument
 # pylint: disable=too-many-arguments,unused-argument,too-many-locals
 def run(
+    metadata: ProjectMetadata,
     tag,
     env,
     parallel,
     runner,
     is_async,
+    memoize,
+    memoize_max_size,
+    only_stale,
+    resume,
+    trace,
     node_names,
     to_nodes,
     from_nodes,
@@ -382,6 +421,22 @@ def run(
         click.secho(deprecation_message, fg="red")
         runner = "ParallelRunner"
     runner_class = load_obj(runner, "kedro.runner")
+    runner_args = {"is_async": is_async}
+    if memoize:
+        if "node_cache" not in inspect.signature(runner_class).parameters:
+            raise KedroCliError(f"`{runner}` does not support --memoize.")
+        try:
+            # packaged projects run without metadata, from their project path
+            project_path = metadata.project_path if metadata else Path.cwd()
+            runner_args["node_cache"] = NodeCache(
+                project_path / NODE_CACHE_DIR, memoize_max_size
+            )
+        except ValueError as exc:
+            raise KedroCliError(str(exc)) from exc
+    if trace:
+        if "tracer" not in inspect.signature(runner_class).parameters:
+            raise KedroCliError(f"`{runner}` does not support --trace.")
+        runner_args["tracer"] = RunTracer(trace)
 
     tag = _get_values_as_tuple(tag) if tag else tag
     node_names = _get_values_as_tuple(node_names) if node_names else node_names
@@ -389,7 +444,7 @@ def run(
     with KedroSession.create(env=env, extra_params=params) as session:
         session.run(
             tags=tag,
-            runner=runner_class(is_async=is_async),
+            runner=runner_class(**runner_args),
             node_names=node_names,
             from_nodes=from_nodes,
             to_nodes=to_nodes,
@@ -397,4 +452,20 @@ def run(
             to_outputs=to_outputs,
             load_versions=load_version,
             pipeline_name=pipeline,
+            only_stale=only_stale,
+            resume=resume,
         )
+
+
+@project_group.command()
+@click.option(
+    "--coordinator", type=str, default=DEFAULT_ADDRESS, help=COORDINATOR_ARG_HELP
+)
+@click.option("--host", type=str, default=None, help=WORKER_HOST_ARG_HELP)
+@click.option("--once", is_flag=True, multiple=False, help=ONCE_ARG_HELP)
+def worker(coordinator, host, once):
+    """Run the nodes scheduled by a ``DistributedRunner``."""
+    try:
+        run_worker(coordinator, host=host, once=once)
+    except ValueError as exc:
+        raise KedroCliError(str(exc)) from exc
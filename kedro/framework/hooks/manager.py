@@ -3,7 +3,8 @@ in a Kedro's execution process.
 """
 # pylint: disable=global-statement,invalid-name
 import logging
-from typing import Any, Iterable
+from types import SimpleNamespace
+from typing import Any, Iterable, Optional
 
 from pluggy import PluginManager
 
@@ -23,9 +24,65 @@ _PLUGIN_HOOKS = "kedro.hooks"  # entry-point to load hooks from for installed pl
 logger = logging.getLogger(__name__)
 
 
+class _KedroPluginManager(PluginManager):
+    """``PluginManager`` keeping a dispatch table of its hooks, which is
+    rebuilt whenever a plugin or a hook spec is added or removed.
+    """
+
+    def __init__(self, project_name: str):
+        super().__init__(project_name)
+        self._dispatch = None  # type: Optional[SimpleNamespace]
+
+    @property
+    def dispatch(self) -> SimpleNamespace:
+        """Namespace holding the caller of every hook with at least one
+        implementation, and ``None`` for the hooks without any, so that
+        calling a hook nobody implements can be skipped altogether.
+        """
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._dispatch = SimpleNamespace(
+                **{
+                    name: caller if caller.get_hookimpls() else None
+                    for name, caller in vars(self.hook).items()
+                }
+            )
+        return dispatch
+
+    def add_hookspecs(self, module_or_class):
+        super().add_hookspecs(module_or_class)
+        self._dispatch = None
+
+    def register(self, plugin, name=None):
+        try:
+            return super().register(plugin, name)
+        finally:
+            self._dispatch = None
+
+    def unregister(self, plugin=None, name=None):
+        try:
+            return super().unregister(plugin, name)
+        finally:
+            self._dispatch = None
+
+    def set_blocked(self, name):
+        super().set_blocked(name)
+        self._dispatch = None
+
+
+def _hook_dispatch(hook_manager: PluginManager) -> Any:
+    """Return the dispatch table of ``hook_manager``, in which the hooks
+    without any implementation are ``None``. A hook manager without one,
+    i.e. not created by ``get_hook_manager``, gets all its hooks called.
+    """
+    if isinstance(hook_manager, _KedroPluginManager):
+        return hook_manager.dispatch
+    return hook_manager.hook
+
+
 def _create_hook_manager() -> PluginManager:
     """Create a new PluginManager instance and register Kedro's hook specs."""
-    manager = PluginManager(HOOK_NAMESPACE)
+    manager = _KedroPluginManager(HOOK_NAMESPACE)
     manager.add_hookspecs(NodeSpecs)
     manager.add_hookspecs(PipelineSpecs)
     manager.add_hookspecs(DataCatalogSpecs)
@@ -3,7 +3,7 @@ For more information about these specifications, please visit
 [Pluggy's documentation](https://pluggy.readthedocs.io/en/stable/#specs)
 """
 # pylint: disable=too-many-arguments
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from kedro.config import ConfigLoader
 from kedro.io import DataCatalog
@@ -285,6 +285,60 @@ class DatasetSpecs:
         """
         pass
 
+    @hook_spec
+    def before_datasets_loaded(self, node: Node, dataset_names: List[str]) -> None:
+        """Hook to be invoked once before the inputs of a node are loaded from
+        the catalog. It is cheaper than ``before_dataset_loaded`` for nodes
+        with many inputs, as it is called once for all of them.
+
+        Args:
+            node: the ``Node`` whose inputs are to be loaded.
+            dataset_names: names of the datasets to be loaded from the catalog.
+
+        """
+        pass
+
+    @hook_spec
+    def after_datasets_loaded(self, node: Node, data: Dict[str, Any]) -> None:
+        """Hook to be invoked once after the inputs of a node are loaded from
+        the catalog. It is cheaper than ``after_dataset_loaded`` for nodes
+        with many inputs, as it is called once for all of them.
+
+        Args:
+            node: the ``Node`` whose inputs were loaded.
+            data: the dictionary of the actual data that was loaded from the
+                catalog, keyed by dataset name.
+
+        """
+        pass
+
+    @hook_spec
+    def before_datasets_saved(self, node: Node, data: Dict[str, Any]) -> None:
+        """Hook to be invoked once before the outputs of a node are saved to
+        the catalog. It is cheaper than ``before_dataset_saved`` for nodes
+        with many outputs, as it is called once for all of them.
+
+        Args:
+            node: the ``Node`` whose outputs are to be saved.
+            data: the dictionary of the actual data to be saved to the
+                catalog, keyed by dataset name.
+
+        """
+        pass
+
+    @hook_spec
+    def after_datasets_saved(self, node: Node, data: Dict[str, Any]) -> None:
+        """Hook to be invoked once after the outputs of a node are saved to
+        the catalog. It is cheaper than ``after_dataset_saved`` for nodes
+        with many outputs, as it is called once for all of them.
+
+        Args:
+            node: the ``Node`` whose outputs were saved.
+            data: the dictionary of the actual data that was saved to the
+                catalog, keyed by dataset name.
+        """
+        pass
+
 
 class RegistrationSpecs:
     """Namespace that defines all specifications for hooks registering
@@ -1,6 +1,7 @@
 # pylint: disable=invalid-name,global-statement
 """This module implements Kedro session responsible for project lifecycle."""
 import getpass
+import inspect
 import logging
 import logging.config
 import os
@@ -8,7 +9,7 @@ import subprocess
 import traceback
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Optional, Union
 
 import click
 
@@ -27,7 +28,7 @@ from kedro.framework.project import (
 )
 from kedro.framework.session.store import BaseSessionStore
 from kedro.io.core import generate_timestamp
-from kedro.runner import AbstractRunner, SequentialRunner
+from kedro.runner import AbstractRunner, RunCheckpoint, SequentialRunner
 
 _active_session = None
 
@@ -96,6 +97,16 @@ def _jsonify_cli_context(ctx: click.core.Context) -> Dict[str, Any]:
     }
 
 
+def _accepts_checkpoints(run: Callable) -> bool:
+    """Tell if the ``run`` method of a runner takes the ``checkpoint`` and
+    ``resume`` arguments added to ``AbstractRunner.run``."""
+    parameters = inspect.signature(run).parameters.values()
+    names = {parameter.name for parameter in parameters}
+    return {"checkpoint", "resume"} <= names or any(
+        parameter.kind is parameter.VAR_KEYWORD for parameter in parameters
+    )
+
+
 class KedroSession:
     """``KedroSession`` is the object that is responsible for managing the lifecycle
     of a Kedro run.
@@ -217,6 +228,13 @@ class KedroSession:
         conf_logging = self._get_logging_config()
         logging.config.dictConfig(conf_logging)
 
+    def _get_checkpoint(self, session_id: str) -> RunCheckpoint:
+        # the directory the session store is configured with, as in `_init_store`
+        store_path = settings.SESSION_STORE_ARGS.get("path") or (
+            self._project_path / "sessions"
+        )
+        return RunCheckpoint(Path(store_path).expanduser() / session_id / "checkpoint")
+
     def _init_store(self) -> BaseSessionStore:
         store_class = settings.SESSION_STORE_CLASS
         classpath = f"{store_class.__module__}.{store_class.__qualname__}"
@@ -301,6 +319,8 @@ class KedroSession:
         from_inputs: Iterable[str] = None,
         to_outputs: Iterable[str] = None,
         load_versions: Dict[str, str] = None,
+        only_stale: bool = False,
+        resume: str = None,
     ) -> Dict[str, Any]:
         """Runs the pipeline with a specified runner.
 
@@ -324,9 +344,19 @@ class KedroSession:
                 used as an end point of the new ``Pipeline``.
             load_versions: An optional flag to specify a particular dataset
                 version timestamp to load.
+            only_stale: If True, run only the nodes of the ``Pipeline`` whose
+                outputs are missing or older than their inputs, and their
+                descendants. See ``AbstractRunner.run_only_stale``.
+            resume: An optional id of a previous session whose run failed.
+                The nodes which completed in that run are not run again, and
+                the in-memory data they produced is restored from its
+                checkpoint. The progress of every run is checkpointed in the
+                directory of its session in the session store when a node
+                fails.
         Raises:
             KedroContextError: If the named or `__default__` pipeline is not
-                defined by `register_pipelines`.
+                defined by `register_pipelines`, or if the session to resume
+                has no checkpoint.
             Exception: Any uncaught exception during the run will be re-raised
                 after being passed to ``on_pipeline_error`` hook.
         Returns:
@@ -385,14 +415,44 @@ class KedroSession:
 
         # Run the runner
         runner = runner or SequentialRunner()
+        # custom runners may override `run` without the checkpoint arguments
+        checkpoint = resume_checkpoint = None
+        if _accepts_checkpoints(runner.run):
+            checkpoint = self._get_checkpoint(self.session_id)
+        elif resume:
+            raise KedroContextError(
+                f"Cannot resume the run of session '{resume}', as "
+                f"`{type(runner).__name__}.run` has no `resume` argument."
+            )
+        if resume:
+            resume_checkpoint = self._get_checkpoint(resume)
+            if not resume_checkpoint.exists():
+                raise KedroContextError(
+                    f"Cannot resume the run of session '{resume}', as it has no "
+                    f"checkpoint. Only the runs which failed can be resumed."
+                )
+
         hook_manager = get_hook_manager()
         hook_manager.hook.before_pipeline_run(  # pylint: disable=no-member
             run_params=record_data, pipeline=filtered_pipeline, catalog=catalog
         )
 
         try:
-            run_result = runner.run(filtered_pipeline, catalog, run_id)
+            run = runner.run_only_stale if only_stale else runner.run
+            run_kwargs = (
+                {"checkpoint": checkpoint, "resume": resume_checkpoint}
+                if checkpoint is not None
+                else {}
+            )
+            run_result = run(filtered_pipeline, catalog, run_id, **run_kwargs)
         except Exception as error:
+            if checkpoint is not None and checkpoint.exists():
+                self._logger.warning(
+                    "You can resume the run from where it failed with "
+                    "`kedro run --resume %s`, adding the other arguments of "
+                    "your previous command.",
+                    self.session_id,
+                )
             hook_manager.hook.on_pipeline_error(
                 error=error,
                 run_params=record_data,
@@ -176,7 +176,7 @@ class AbstractDataSet(abc.ABC):
 
         """
 
-        self._logger.debug("Loading %s", str(self))
+        self._logger.debug("Loading %s", self)
 
         try:
             return self._load()
@@ -206,7 +206,7 @@ class AbstractDataSet(abc.ABC):
             raise DataSetError("Saving `None` to a `DataSet` is not allowed")
 
         try:
-            self._logger.debug("Saving %s", str(self))
+            self._logger.debug("Saving %s", self)
             self._save(data)
         except DataSetError:
             raise
@@ -276,7 +276,7 @@ class AbstractDataSet(abc.ABC):
 
         """
         try:
-            self._logger.debug("Checking whether target of %s exists", str(self))
+            self._logger.debug("Checking whether target of %s exists", self)
             return self._exists()
         except Exception as exc:
             message = (
@@ -299,7 +299,7 @@ class AbstractDataSet(abc.ABC):
 
         """
         try:
-            self._logger.debug("Releasing %s", str(self))
+            self._logger.debug("Releasing %s", self)
             self._release()
         except Exception as exc:
             message = f"Failed during release for data set {str(self)}.\n{str(exc)}"
@@ -631,7 +631,7 @@ class AbstractVersionedDataSet(AbstractDataSet, abc.ABC):
             DataSetError: when underlying exists method raises error.
 
         """
-        self._logger.debug("Checking whether target of %s exists", str(self))
+        self._logger.debug("Checking whether target of %s exists", self)
         try:
             return self._exists()
         except VersionNotFoundError:
@@ -147,6 +147,7 @@ class DataCatalog:
         default_transformers: List[AbstractTransformer] = None,
         journal: Journal = None,
         layers: Dict[str, Set[str]] = None,
+        io_limits: Dict[str, int] = None,
     ) -> None:
         """``DataCatalog`` stores instances of ``AbstractDataSet``
         implementations to provide ``load`` and ``save`` capabilities from
@@ -167,6 +168,9 @@ class DataCatalog:
                 to a set of data set names, according to the
                 data engineering convention. For more details, see
                 https://kedro.readthedocs.io/en/stable/12_faq/01_faq.html#what-is-data-engineering-convention
+            io_limits: A dictionary mapping data set names to the maximum
+                number of concurrent loads and saves of the data set during
+                a run.
         Raises:
             DataSetNotFoundError: When transformers are passed for a non
                 existent data set.
@@ -184,6 +188,7 @@ class DataCatalog:
         self._data_sets = dict(data_sets or {})
         self.datasets = _FrozenDatasets(self._data_sets)
         self.layers = layers
+        self.io_limits = dict(io_limits or {})
 
         if transformers or default_transformers:
             warnings.warn(
@@ -240,7 +245,9 @@ class DataCatalog:
                 class to be loaded is specified with the key ``type`` and their
                 fully qualified class name. All ``kedro.io`` data set can be
                 specified by their class name only, i.e. their module name
-                can be omitted.
+                can be omitted. The optional ``io_limit`` key sets the maximum
+                number of concurrent loads and saves of the data set during
+                a run.
             credentials: A dictionary containing credentials for different
                 data sets. Use the ``credentials`` key in a ``AbstractDataSet``
                 to refer to the appropriate credentials as shown in the example
@@ -314,10 +321,14 @@ class DataCatalog:
             )
 
         layers = defaultdict(set)  # type: Dict[str, Set[str]]
+        io_limits = {}  # type: Dict[str, int]
         for ds_name, ds_config in catalog.items():
             ds_layer = ds_config.pop("layer", None)
             if ds_layer is not None:
                 layers[ds_layer].add(ds_name)
+            ds_io_limit = ds_config.pop("io_limit", None)
+            if ds_io_limit is not None:
+                io_limits[ds_name] = int(ds_io_limit)
 
             ds_config = _resolve_credentials(ds_config, credentials)
             data_sets[ds_name] = AbstractDataSet.from_config(
@@ -325,7 +336,12 @@ class DataCatalog:
             )
 
         dataset_layers = layers or None
-        return cls(data_sets=data_sets, journal=journal, layers=dataset_layers)
+        return cls(
+            data_sets=data_sets,
+            journal=journal,
+            layers=dataset_layers,
+            io_limits=io_limits,
+        )
 
     def _get_dataset(
         self, data_set_name: str, version: Version = None
@@ -688,6 +704,7 @@ class DataCatalog:
             default_transformers=self._default_transformers,
             journal=self._journal,
             layers=self.layers,
+            io_limits=self.io_limits,
         )
 
     def __eq__(self, other):
@@ -0,0 +1,235 @@
+"""An ``ExecutionPlan`` is the immutable, precompiled form of a ``Pipeline``
+which runners consume: the order in which its nodes can run, the
+dependencies between them and when each of its datasets can be released.
+"""
+from collections import Counter, defaultdict
+from itertools import chain
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from kedro.pipeline.node import Node
+
+if TYPE_CHECKING:  # pragma: no cover
+    from kedro.pipeline.pipeline import Pipeline  # pylint: disable=cyclic-import
+
+
+class ExecutionPlan:
+    """``ExecutionPlan`` is the immutable, precompiled form of a ``Pipeline``.
+    It is computed once by ``Pipeline.compile()`` and cached on the pipeline,
+    so that runners do not rebuild the pipeline inputs, outputs and load
+    counts while they run it, nor on every run of the same pipeline.
+    """
+
+    def __init__(self, pipeline: "Pipeline"):
+        """Compile the execution plan of a pipeline.
+
+        Args:
+            pipeline: The ``Pipeline`` to compile.
+
+        """
+        nodes = tuple(pipeline.nodes)
+        self._nodes = nodes
+        self._node_dependencies = MappingProxyType(
+            {
+                node: frozenset(parents)
+                for node, parents in pipeline.node_dependencies.items()
+            }
+        )
+        self._inputs = frozenset(pipeline.inputs())
+        self._outputs = frozenset(pipeline.outputs())
+        self._data_sets = frozenset(pipeline.data_sets())
+        self._load_counts = MappingProxyType(
+            dict(Counter(chain.from_iterable(n.inputs for n in nodes)))
+        )
+
+        last_use = {}  # type: Dict[str, int]
+        for position, node in enumerate(nodes):
+            for name in chain(node.inputs, node.outputs):
+                last_use[name] = position
+        self._last_use = MappingProxyType(last_use)
+
+        schedule = defaultdict(list)  # type: Dict[int, List[str]]
+        for name, position in last_use.items():
+            if name not in self._inputs and name not in self._outputs:
+                schedule[position].append(name)
+        self._release_schedule = tuple(
+            tuple(sorted(schedule[position])) for position in range(len(nodes))
+        )
+        self._max_width = None  # type: Optional[int]
+
+    @property
+    def nodes(self) -> Tuple[Node, ...]:
+        """The nodes of the pipeline in topological order."""
+        return self._nodes
+
+    @property
+    def node_dependencies(self) -> Mapping[Node, FrozenSet[Node]]:
+        """Mapping of every node to the set of its parents."""
+        return self._node_dependencies
+
+    @property
+    def inputs(self) -> FrozenSet[str]:
+        """The free inputs of the pipeline, as given by ``Pipeline.inputs()``."""
+        return self._inputs
+
+    @property
+    def outputs(self) -> FrozenSet[str]:
+        """The final outputs of the pipeline, as given by ``Pipeline.outputs()``."""
+        return self._outputs
+
+    @property
+    def data_sets(self) -> FrozenSet[str]:
+        """All the datasets used by the pipeline."""
+        return self._data_sets
+
+    @property
+    def load_counts(self) -> Mapping[str, int]:
+        """Mapping of every dataset to the number of times nodes load it."""
+        return self._load_counts
+
+    @property
+    def last_use(self) -> Mapping[str, int]:
+        """Mapping of every dataset to the position in ``nodes`` of the last
+        node which loads or saves it."""
+        return self._last_use
+
+    @property
+    def release_schedule(self) -> Tuple[Tuple[str, ...], ...]:
+        """The datasets which can be released after each node in ``nodes``
+        has run, when the nodes run in that order. Free inputs and final
+        outputs of the pipeline are never released."""
+        return self._release_schedule
+
+    def max_width(self, limit: int = None) -> int:
+        """The maximum number of nodes which can run at the same time, i.e.
+        the size of the largest set of nodes none of which depends, even
+        indirectly, on another one. By Dilworth's theorem, it is the number
+        of nodes minus the size of a maximum matching between the nodes and
+        their descendants.
+
+        Args:
+            limit: Optional upper bound of the result. If the largest layer
+                of ``Pipeline.grouped_nodes`` already has ``limit`` nodes,
+                ``limit`` is returned without computing the exact width.
+
+        Returns:
+            The width of the dependency graph of the nodes, capped at
+            ``limit`` if it is set.
+
+        """
+        if self._max_width is None:
+            if limit is not None and self._max_layer_size() >= limit:
+                return limit
+            self._max_width = len(self._nodes) - self._max_matching()
+        return self._max_width if limit is None else min(self._max_width, limit)
+
+    def _max_layer_size(self) -> int:
+        """The number of nodes of the largest topological layer, which is a
+        lower bound of the width as the nodes of a layer are independent."""
+        depths = {}  # type: Dict[Node, int]
+        for node in self._nodes:
+            parents = [p for p in self._node_dependencies[node] if p in depths]
+            depths[node] = max((depths[p] + 1 for p in parents), default=0)
+        return max(Counter(depths.values()).values(), default=0)
+
+    def _max_matching(self) -> int:
+        """The size of a maximum matching of the bipartite graph linking every
+        node to its descendants, found with augmenting paths over the
+        transitive closure of the graph, held as one bitset per node.
+        """
+        positions = {node: position for position, node in enumerate(self._nodes)}
+        closure = [0] * len(self._nodes)
+        for node in reversed(self._nodes):
+            for parent in self._node_dependencies[node]:
+                if parent not in positions:
+                    continue  # only the nodes of the plan are matched
+                position = positions[node]
+                closure[positions[parent]] |= closure[position] | 1 << position
+
+        # node matched with every descendant, which is matched at most once
+        matches = {}  # type: Dict[int, int]
+        matched = 0
+        unmatched = []
+        for position, descendants in enumerate(closure):
+            free = descendants & ~matched
+            if free:
+                descendant = (free & -free).bit_length() - 1
+                matches[descendant] = position
+                matched |= 1 << descendant
+            elif descendants:
+                unmatched.append(position)
+        return len(matches) + sum(
+            _augment(root, closure, matches) for root in unmatched
+        )
+
+    def release_tracker(self) -> "ReleaseTracker":
+        """Start tracking which datasets can be released during a run whose
+        nodes may complete in any topological order.
+
+        Returns:
+            A new ``ReleaseTracker`` for this plan.
+
+        """
+        return ReleaseTracker(self)
+
+
+def _augment(root: int, closure: List[int], matches: Dict[int, int]) -> bool:
+    """Search for an augmenting path starting from the unmatched node at
+    position ``root`` and flip the matches along it if there is one.
+    """
+    visited = 0
+    stack = [root]
+    path = []  # type: List[int]
+    while stack:
+        free = closure[stack[-1]] & ~visited
+        if not free:
+            stack.pop()
+            if path:
+                path.pop()
+            continue
+        descendant = (free & -free).bit_length() - 1
+        visited |= 1 << descendant
+        path.append(descendant)
+        if descendant not in matches:
+            for position, matched in zip(stack, path):
+                matches[matched] = position
+            return True
+        stack.append(matches[descendant])
+    return False
+
+
+class ReleaseTracker:
+    """``ReleaseTracker`` counts the loads left for every dataset of an
+    ``ExecutionPlan`` during a run, to tell which datasets can be released
+    as soon as the last node using them has completed.
+    """
+
+    def __init__(self, plan: ExecutionPlan):
+        """Creates a new instance of ``ReleaseTracker``.
+
+        Args:
+            plan: The ``ExecutionPlan`` being run.
+
+        """
+        self._plan = plan
+        self._load_counts = Counter(plan.load_counts)
+
+    def mark_done(self, node: Node) -> List[str]:
+        """Record that a node has completed.
+
+        Args:
+            node: The node that has completed.
+
+        Returns:
+            The names of the datasets that are not needed anymore.
+
+        """
+        releasable = []
+        for name in node.inputs:
+            self._load_counts[name] -= 1
+            if self._load_counts[name] < 1 and name not in self._plan.inputs:
+                releasable.append(name)
+        for name in node.outputs:
+            if self._load_counts[name] < 1 and name not in self._plan.outputs:
+                releasable.append(name)
+        return releasable
@@ -7,7 +7,17 @@ import logging
 import re
 from collections import Counter
 from functools import reduce
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 from warnings import warn
 
 
@@ -423,26 +433,43 @@ class Node:  # pylint: disable=too-many-instance-attributes
 
         """
         self._logger.info("Running node: %s", str(self))
+        self._validate_run_inputs(inputs, "run")
 
-        outputs = None
+        try:
+            outputs = self._call_func({} if inputs is None else inputs)
+            return self._outputs_to_dictionary(outputs)
 
-        if not (inputs is None or isinstance(inputs, dict)):
-            raise ValueError(
-                f"Node.run() expects a dictionary or None, "
-                f"but got {type(inputs)} instead"
-            )
+        # purposely catch all exceptions
+        except Exception as exc:
+            self._logger.error("Node `%s` failed with error: \n%s", str(self), str(exc))
+            raise exc
 
-        try:
-            inputs = {} if inputs is None else inputs
-            if not self._inputs:
-                outputs = self._run_with_no_inputs(inputs)
-            elif isinstance(self._inputs, str):
-                outputs = self._run_with_one_input(inputs, self._inputs)
-            elif isinstance(self._inputs, list):
-                outputs = self._run_with_list(inputs, self._inputs)
-            elif isinstance(self._inputs, dict):
-                outputs = self._run_with_dict(inputs, self._inputs)
+    async def run_async(self, inputs: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Run this node using the provided inputs and return its results
+        in a dictionary, like ``run``. If the node function returns an
+        awaitable, e.g. because it is defined with ``async def``, the result
+        is awaited before being mapped to the node outputs.
+
+        Args:
+            inputs: Dictionary of inputs as specified at the creation of
+                the node.
+
+        Raises:
+            ValueError: In the same cases as ``run``.
+            Exception: Any exception thrown during execution of the node.
 
+        Returns:
+            All produced node outputs are returned in a dictionary, where the
+            keys are defined by the node outputs.
+
+        """
+        self._logger.info("Running node: %s", str(self))
+        self._validate_run_inputs(inputs, "run_async")
+
+        try:
+            outputs = self._call_func({} if inputs is None else inputs)
+            if inspect.isawaitable(outputs):
+                outputs = await outputs
             return self._outputs_to_dictionary(outputs)
 
         # purposely catch all exceptions
@@ -450,6 +477,23 @@ class Node:  # pylint: disable=too-many-instance-attributes
             self._logger.error("Node `%s` failed with error: \n%s", str(self), str(exc))
             raise exc
 
+    @staticmethod
+    def _validate_run_inputs(inputs: Optional[Dict[str, Any]], method: str) -> None:
+        if not (inputs is None or isinstance(inputs, dict)):
+            raise ValueError(
+                f"Node.{method}() expects a dictionary or None, "
+                f"but got {type(inputs)} instead"
+            )
+
+    def _call_func(self, inputs: Dict[str, Any]):
+        if not self._inputs:
+            return self._run_with_no_inputs(inputs)
+        if isinstance(self._inputs, str):
+            return self._run_with_one_input(inputs, self._inputs)
+        if isinstance(self._inputs, list):
+            return self._run_with_list(inputs, self._inputs)
+        return self._run_with_dict(inputs, self._inputs)
+
     def _run_with_no_inputs(self, inputs: Dict[str, Any]):
         if inputs:
             raise ValueError(
@@ -586,6 +630,244 @@ class Node:  # pylint: disable=too-many-instance-attributes
         return args, kwargs
 
 
+class MapNode(Node):
+    """``MapNode`` is a ``Node`` applying its function to every partition of
+    its first input, e.g. a ``PartitionedDataSet``, instead of to the whole
+    dataset. The function is called with the data of one partition and the
+    other inputs of the node, and its results are saved to the first output
+    of the node as a dictionary of partition ids to results, which can be
+    saved to a ``PartitionedDataSet``. An optional ``reduce`` function is
+    called with that dictionary, to save its result to the second output.
+
+    Runners run the partitions of a map node as separate tasks when its
+    partitioned input is a ``PartitionedDataSet`` of the catalog, see
+    ``expand``. Otherwise the partitions are processed one after the other.
+    """
+
+    def __init__(
+        self,
+        func: Callable,
+        inputs: Union[str, List[str], Dict[str, str]],
+        outputs: Union[str, List[str]],
+        *,
+        reduce: Callable[[Dict[str, Any]], Any] = None,
+        name: str = None,
+        tags: Union[str, Iterable[str]] = None,
+        decorators: Iterable[Callable] = None,
+        confirms: Union[str, List[str]] = None,
+        namespace: str = None,
+    ):
+        """Create a map node in the pipeline by providing a function to be
+        called on every partition of its first input.
+
+        Args:
+            func: A function that corresponds to the node logic, called with
+                the data of one partition as its first argument.
+            inputs: The name or the list of the names of variables used as
+                inputs to the function, as for ``Node``. The first one is the
+                partitioned input, whose data is a dictionary of partition
+                ids to the data of the partitions or to functions loading it,
+                as returned by ``PartitionedDataSet``. The other inputs are
+                passed unchanged to every call of the function.
+            outputs: The name of the variable the dictionary of partition ids
+                to the results of the function is saved to or, if ``reduce``
+                is provided, a list of that name and of the name of the
+                variable the result of ``reduce`` is saved to.
+            reduce: Optional function called with the dictionary of partition
+                ids to the results of the function.
+            name: Optional node name to be used when displaying the node in
+                logs or any other visualisations.
+            tags: Optional set of tags to be applied to the node.
+            decorators: Optional list of decorators to be applied to the node.
+            confirms: Optional name or the list of the names of the datasets
+                that should be confirmed once every partition is processed.
+            namespace: Optional node namespace.
+
+        Raises:
+            ValueError: Raised in the cases listed for ``Node``, when the
+                node has no input, when ``reduce`` is not a function or when
+                the number of outputs does not match ``reduce``.
+
+        """
+        super().__init__(
+            func,
+            inputs,
+            outputs,
+            name=name,
+            tags=tags,
+            decorators=decorators,
+            confirms=confirms,
+            namespace=namespace,
+        )
+        if not self.inputs:
+            raise ValueError(
+                _map_node_error_message("it must have a partitioned input.")
+            )
+        if reduce is not None and not callable(reduce):
+            raise ValueError(
+                _map_node_error_message(
+                    f"`reduce` must be a function, not `{type(reduce).__name__}`."
+                )
+            )
+        expected_outputs = 1 if reduce is None else 2
+        if isinstance(outputs, dict) or len(self.outputs) != expected_outputs:
+            raise ValueError(
+                _map_node_error_message(
+                    "`outputs` must be the name of the partitioned output, or "
+                    "a list of that name and of the name of the reduced output "
+                    "when `reduce` is provided."
+                )
+            )
+        self._reduce = reduce
+
+    def _copy(self, **overwrite_params):
+        """
+        Helper function to copy the map node, replacing some values.
+        """
+        params = {
+            "func": self._func,
+            "inputs": self._inputs,
+            "outputs": self._outputs,
+            "reduce": self._reduce,
+            "name": self._name,
+            "namespace": self._namespace,
+            "tags": self._tags,
+            "decorators": self._decorators,
+            "confirms": self._confirms,
+        }
+        params.update(overwrite_params)
+        return MapNode(**params)
+
+    @property
+    def partitioned_input(self) -> str:
+        """The name of the input whose partitions the function is applied to.
+
+        Returns:
+            The name of the first input of the node.
+        """
+        return self.inputs[0]
+
+    @property
+    def partitioned_output(self) -> str:
+        """The name of the output the results of the function are saved to.
+
+        Returns:
+            The name of the first output of the node.
+        """
+        return self.outputs[0]
+
+    @property
+    def reduce(self) -> Optional[Callable[[Dict[str, Any]], Any]]:
+        """The function reducing the results of the partitions, if any.
+
+        Returns:
+            The ``reduce`` function of the node, or None.
+        """
+        return self._reduce
+
+    def expand(self, partition_ids: Iterable[str]) -> List[Node]:
+        """Create the nodes running this node with each partition as a task
+        of its own, e.g. on a different worker. Every partition is processed
+        by a node loading it from the ``<input>[<partition id>]`` dataset and
+        saving its result to ``<output>[<partition id>]``. A last node, named
+        after this node if it has a name, gathers the results into the
+        partitioned output and reduces them.
+
+        Args:
+            partition_ids: The ids of the partitions of the partitioned input.
+
+        Returns:
+            The nodes, which have the tags and namespace of this node.
+
+        """
+        partition_ids = sorted(partition_ids)
+        partitioned_input = self.partitioned_input
+
+        def _replace(data_set: str, partition_id: str) -> str:
+            if data_set == partitioned_input:
+                return _partition_name(data_set, partition_id)
+            return data_set
+
+        nodes = []
+        for partition_id in partition_ids:
+            if isinstance(self._inputs, str):
+                inputs = _replace(self._inputs, partition_id)  # type: Any
+            elif isinstance(self._inputs, dict):
+                inputs = {
+                    arg: _replace(data_set, partition_id)
+                    for arg, data_set in self._inputs.items()
+                }
+            else:
+                inputs = [_replace(data_set, partition_id) for data_set in self._inputs]
+            # the default names of the nodes hold the names of the datasets of
+            # their partition, which are not valid node names
+            partition = Node(
+                self._func,
+                inputs,
+                _partition_name(self.partitioned_output, partition_id),
+                tags=self._tags,
+                decorators=self._decorators,
+                namespace=self._namespace,
+            )
+            nodes.append(partition)
+
+        gather = Node(
+            _GatherPartitions(partition_ids, self._reduce),
+            [_partition_name(self.partitioned_output, pid) for pid in partition_ids],
+            self._outputs,
+            name=self._name,
+            tags=self._tags,
+            confirms=self._confirms,
+            namespace=self._namespace,
+        )
+        nodes.append(gather)
+        return nodes
+
+    def _call_func(self, inputs: Dict[str, Any]):
+        partitions = inputs[self.partitioned_input]
+        partition_ids = sorted(partitions)
+        results = []
+        for partition_id in partition_ids:
+            data = partitions[partition_id]
+            # partitions loaded from a ``PartitionedDataSet`` are loaded lazily
+            data = data() if callable(data) else data
+            results.append(super()._call_func({**inputs, self.partitioned_input: data}))
+        return _GatherPartitions(partition_ids, self._reduce)(*results)
+
+
+class _GatherPartitions:
+    """Function gathering the results of the partitions of a ``MapNode`` into
+    a dictionary of partition ids to results, and reducing them.
+    """
+
+    def __init__(
+        self,
+        partition_ids: Sequence[str],
+        reduce: Callable[[Dict[str, Any]], Any] = None,
+    ):
+        self.__name__ = "gather_partitions"
+        self._partition_ids = list(partition_ids)
+        self._reduce = reduce
+
+    def __call__(self, *results: Any) -> Any:
+        partitions = dict(zip(self._partition_ids, results))
+        if self._reduce is None:
+            return partitions
+        return [partitions, self._reduce(partitions)]
+
+
+def _partition_name(data_set: str, partition_id: str) -> str:
+    """The name of the dataset holding one partition of ``data_set``."""
+    return f"{data_set}[{partition_id}]"
+
+
+def _map_node_error_message(msg) -> str:
+    return (
+        f"Invalid MapNode definition: {msg}\n"
+        f"Format should be: map_node(function, inputs, outputs, reduce=None)"
+    )
+
+
 def _node_error_message(msg) -> str:
     return (
         f"Invalid Node definition: {msg}\n"
@@ -669,6 +951,76 @@ def node(
     )
 
 
+def map_node(
+    func: Callable,
+    inputs: Union[str, List[str], Dict[str, str]],
+    outputs: Union[str, List[str]],
+    *,
+    reduce: Callable[[Dict[str, Any]], Any] = None,
+    name: str = None,
+    tags: Union[str, Iterable[str]] = None,
+    confirms: Union[str, List[str]] = None,
+    namespace: str = None,
+) -> MapNode:
+    """Create a node applying a function to every partition of its first
+    input, e.g. a ``PartitionedDataSet``, and saving the results to its first
+    output as a dictionary of partition ids to results. When the partitioned
+    input is a ``PartitionedDataSet`` of the catalog which is not produced
+    during the run, the runners run every partition as a task of its own, so
+    that ``ParallelRunner`` and ``ThreadRunner`` process them in parallel and
+    a resumed run only processes the partitions which did not complete.
+
+    Args:
+        func: A function that corresponds to the node logic, called with the
+            data of one partition as its first argument.
+        inputs: The name or the list of the names of variables used as inputs
+            to the function. The first one is the partitioned input. The
+            other inputs are passed unchanged to every call of the function.
+            When Dict[str, str] is provided, variable names will be mapped to
+            function argument names.
+        outputs: The name of the variable the results are saved to or, if
+            ``reduce`` is provided, a list of that name and of the name of the
+            variable the result of ``reduce`` is saved to.
+        reduce: Optional function called with the dictionary of partition ids
+            to the results of the function once every partition is processed.
+        name: Optional node name to be used when displaying the node in logs or
+            any other visualisations.
+        tags: Optional set of tags to be applied to the node.
+        confirms: Optional name or the list of the names of the datasets
+            that should be confirmed once every partition is processed.
+        namespace: Optional node namespace.
+
+    Returns:
+        A MapNode object with mapped inputs, outputs and function.
+
+    Example:
+    ::
+
+        >>> import pandas as pd
+        >>>
+        >>> def clean(partition: pd.DataFrame, threshold: float) -> pd.DataFrame:
+        >>>     return partition[partition["score"] > threshold]
+        >>>
+        >>> def count_rows(partitions: Dict[str, pd.DataFrame]) -> int:
+        >>>     return sum(len(partition) for partition in partitions.values())
+        >>>
+        >>> map_node(clean,
+        >>>          inputs=["raw_files", "params:threshold"],
+        >>>          outputs=["clean_files", "row_count"],
+        >>>          reduce=count_rows)
+    """
+    return MapNode(
+        func,
+        inputs,
+        outputs,
+        reduce=reduce,
+        name=name,
+        tags=tags,
+        confirms=confirms,
+        namespace=namespace,
+    )
+
+
 def _dict_inputs_to_list(func: Callable[[Any], Any], inputs: Dict[str, str]):
     """Convert a dict representation of the node inputs to a list, ensuring
     the appropriate order for binding them to the node's function.
@@ -7,13 +7,14 @@ import copy
 import json
 from collections import Counter, defaultdict
 from itertools import chain
-from typing import Callable, Dict, Iterable, List, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 from warnings import warn
 
 from toposort import CircularDependencyError as ToposortCircleError
 from toposort import toposort
 
 import kedro
+from kedro.pipeline.execution_plan import ExecutionPlan
 from kedro.pipeline.node import Node, _to_list
 
 TRANSCODING_SEPARATOR = "@"
@@ -164,6 +165,7 @@ class Pipeline:  # pylint: disable=too-many-public-methods
 
         self._nodes = nodes
         self._topo_sorted_nodes = _topologically_sorted(self.node_dependencies)
+        self._execution_plan = None  # type: Optional[ExecutionPlan]
 
     def __repr__(self):  # pragma: no cover
         """Pipeline ([node1, ..., node10 ...], name='pipeline_name')"""
@@ -352,6 +354,20 @@ class Pipeline:  # pylint: disable=too-many-public-methods
         """
         return list(chain.from_iterable(self._topo_sorted_nodes))
 
+    def compile(self) -> ExecutionPlan:
+        """Compile the pipeline into an immutable ``ExecutionPlan``, holding
+        the topological order of its nodes, their dependencies and when each
+        dataset can be released. The plan is computed on first use and cached
+        on the pipeline, which cannot change once created.
+
+        Returns:
+            The ``ExecutionPlan`` of the pipeline.
+
+        """
+        if self._execution_plan is None:
+            self._execution_plan = ExecutionPlan(self)
+        return self._execution_plan
+
     @property
     def grouped_nodes(self) -> List[Set[Node]]:
         """Return a list of the pipeline nodes in topologically ordered groups,
@@ -2,14 +2,30 @@
 to execute ``Pipeline`` instances.
 """
 
+from .asyncio_runner import AsyncioRunner
+from .checkpoint import RunCheckpoint
+from .dask_runner import DaskRunner
+from .distributed_runner import DistributedRunner
+from .hybrid_runner import HybridRunner
+from .node_cache import NodeCache
 from .parallel_runner import ParallelRunner
 from .runner import AbstractRunner, run_node
 from .sequential_runner import SequentialRunner
+from .simulator import ScheduleSimulator
 from .thread_runner import ThreadRunner
+from .trace import RunTracer
 
 __all__ = [
     "AbstractRunner",
+    "AsyncioRunner",
+    "DaskRunner",
+    "DistributedRunner",
+    "HybridRunner",
+    "NodeCache",
     "ParallelRunner",
+    "RunCheckpoint",
+    "RunTracer",
+    "ScheduleSimulator",
     "SequentialRunner",
     "ThreadRunner",
     "run_node",
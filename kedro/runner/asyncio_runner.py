@@ -0,0 +1,388 @@
+"""``AsyncioRunner`` is an ``AbstractRunner`` implementation. It can
+be used to run the ``Pipeline`` concurrently on a single ``asyncio``
+event loop.
+"""
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Set
+
+from kedro.framework.hooks import get_hook_manager
+from kedro.framework.hooks.manager import _hook_dispatch
+from kedro.io import AbstractVersionedDataSet, DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.runner import (
+    AbstractRunner,
+    _call_node_run,
+    _collect_inputs_from_hook,
+    _IOExecutor,
+    _ReadyQueue,
+)
+
+
+class AsyncioRunner(AbstractRunner):
+    """``AsyncioRunner`` is an ``AbstractRunner`` implementation. It can
+    be used to run the ``Pipeline`` concurrently on a single ``asyncio``
+    event loop. Nodes whose function is defined with ``async def`` are
+    awaited directly on the loop, while regular nodes run in a bounded
+    pool of threads. Datasets which implement the coroutine methods
+    ``load_async()`` and ``save_async(data)`` are loaded and saved on the
+    loop, any other dataset through the ``DataCatalog`` in the pool of
+    threads. Both ways are held to the I/O limits of the run, and the
+    versions of the datasets loaded and saved on the loop are recorded in
+    the journal of the catalog. If an event loop is already running in the
+    calling thread, e.g. in a Jupyter kernel, the pipeline runs on an event
+    loop of its own in another thread.
+    """
+
+    def __init__(  # pylint: disable=unused-argument
+        self,
+        max_workers: int = None,
+        is_async: bool = False,
+        max_concurrency: int = None,
+        io_limits: Dict[str, int] = None,
+    ):
+        """
+        Instantiates the runner.
+
+        Args:
+            max_workers: Number of threads used to run regular nodes and to
+                load and save datasets without coroutine methods. If not set,
+                the ``concurrent.futures.ThreadPoolExecutor`` default is used.
+            is_async: Ignored, since ``AsyncioRunner`` always loads and saves
+                the node inputs and outputs concurrently.
+            max_concurrency: Maximum number of nodes running at the same time.
+                If not set, every node is started as soon as its inputs are
+                available.
+            io_limits: Optional mapping of dataset types, e.g.
+                ``SQLTableDataSet``, filesystem protocols, e.g. ``s3``, or
+                dataset names to the maximum number of concurrent loads and
+                saves of the matching datasets. Limits set with the
+                ``io_limit`` key of the catalog entries take precedence.
+
+        Raises:
+            ValueError: bad parameters passed
+        """
+        super().__init__(is_async=True, io_limits=io_limits)
+
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers should be positive")
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency should be positive")
+
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency
+
+    def create_default_data_set(self, ds_name: str) -> MemoryDataSet:  # type: ignore
+        """Factory method for creating the default data set for the runner.
+
+        Args:
+            ds_name: Name of the missing data set
+
+        Returns:
+            An instance of an implementation of MemoryDataSet to be used
+            for all unregistered data sets.
+
+        """
+        return MemoryDataSet()
+
+    def _run(
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        """The abstract interface for running pipelines.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            run_id: The id of the run.
+
+        Raises:
+            Exception: in case of any downstream node failure.
+
+        """
+        # public as ``asyncio.get_running_loop`` from Python 3.7
+        if asyncio._get_running_loop() is None:  # pylint: disable=protected-access
+            self._run_on_loop(pipeline, catalog, run_id)
+        else:
+            # the loop of the thread cannot run another one until it returns
+            with ThreadPoolExecutor(max_workers=1) as thread:
+                thread.submit(self._run_on_loop, pipeline, catalog, run_id).result()
+
+    def _run_on_loop(
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        """Run the pipeline on a new event loop, which is the current loop of
+        the thread while it runs, as with ``asyncio.run``."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+                loop.run_until_complete(
+                    self._run_pipeline(pipeline, catalog, pool, run_id)
+                )
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+    async def _run_pipeline(  # pylint: disable=too-many-locals,too-many-branches
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        pool: ThreadPoolExecutor,
+        run_id: str = None,
+    ) -> None:
+        plan = pipeline.compile()
+        release_tracker = plan.release_tracker()
+        ready_queue = _ReadyQueue(plan.node_dependencies)
+        done_nodes = set()  # type: Set[Node]
+        tasks = {}  # type: Dict[asyncio.Future, Node]
+        semaphore = (
+            asyncio.Semaphore(self._max_concurrency) if self._max_concurrency else None
+        )
+        limits = _AsyncIOLimits(self._io_executor)
+
+        try:
+            while True:
+                for node in ready_queue.pop_all():
+                    task = asyncio.ensure_future(
+                        _run_node_on_loop(
+                            node, catalog, pool, limits, semaphore, run_id
+                        )
+                    )
+                    tasks[task] = node
+                if not tasks:
+                    if ready_queue.todo_nodes:
+                        raise RuntimeError(
+                            f"Unable to schedule new tasks although some nodes "
+                            f"have not been run:\ntodo_nodes = "
+                            f"{ready_queue.todo_nodes}\ndone_nodes = {done_nodes}"
+                        )
+                    break  # pragma: no cover
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node = tasks.pop(task)
+                    try:
+                        task.result()
+                    except Exception:
+                        self._suggest_resume_scenario(pipeline, done_nodes)
+                        raise
+                    done_nodes.add(node)
+                    ready_queue.mark_done(node)
+
+                    # Release any datasets we have finished with.
+                    for data_set in release_tracker.mark_done(node):
+                        catalog.release(data_set)
+        finally:
+            # do not leave nodes running on the loop once the run has failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _AsyncIOLimits:
+    """``_AsyncIOLimits`` holds the I/O limits of a run to the loads and saves
+    awaited on the event loop, with an ``asyncio.Semaphore`` per limit, so
+    that the tasks waiting for a slot do not block the loop or a thread.
+    """
+
+    def __init__(self, io_executor: _IOExecutor):
+        self._io_executor = io_executor
+        self._semaphores = {
+            key: asyncio.Semaphore(limit) for key, limit in io_executor.limits.items()
+        }
+
+    async def run(
+        self, catalog: DataCatalog, name: str, func: Callable, *args: Any
+    ) -> Any:
+        """Await ``func(*args)`` holding a slot of every limit matching a
+        dataset. The slots are acquired in the same order as the ones of
+        ``_IOExecutor.limit``."""
+        acquired = []
+        try:
+            for key in self._io_executor.limit_keys(catalog, name):
+                await self._semaphores[key].acquire()
+                acquired.append(self._semaphores[key])
+            return await func(*args)
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+
+def _get_coroutine_method(catalog: DataCatalog, name: str, method: str):
+    """Return the coroutine method ``method`` of the dataset ``name``, or None
+    if the dataset does not implement it or the ``DataCatalog`` applies
+    transformers to it, which only operate on the synchronous methods.
+    """
+    # pylint: disable=protected-access
+    if catalog._transformers.get(name):
+        return None
+    data_set = catalog._get_dataset(name)
+    func = getattr(data_set, method, None)
+    return func if inspect.iscoroutinefunction(func) else None
+
+
+def _log_version(catalog: DataCatalog, name: str, operation: str) -> None:
+    """Record the version of a dataset loaded or saved on the event loop in
+    the journal of the ``DataCatalog``, as ``DataCatalog.load`` and
+    ``DataCatalog.save`` do."""
+    # pylint: disable=protected-access
+    data_set = catalog._get_dataset(name)
+    if not catalog._journal or not isinstance(data_set, AbstractVersionedDataSet):
+        return
+    version = (
+        data_set.resolve_load_version()
+        if operation == "load"
+        else data_set.resolve_save_version()
+    )
+    if version:
+        catalog._journal.log_catalog(name, operation, version)
+
+
+async def _load(
+    catalog: DataCatalog, name: str, pool: ThreadPoolExecutor, limits: _AsyncIOLimits
+) -> Any:
+    hooks = _hook_dispatch(get_hook_manager())
+    if hooks.before_dataset_loaded is not None:
+        hooks.before_dataset_loaded(dataset_name=name)
+    load_async = _get_coroutine_method(catalog, name, "load_async")
+    if load_async:
+        catalog._logger.info(  # pylint: disable=protected-access
+            "Loading data from `%s` (%s)...", name, type(load_async.__self__).__name__
+        )
+        data = await limits.run(catalog, name, load_async)
+        _log_version(catalog, name, "load")
+    else:
+        loop = asyncio.get_event_loop()
+        data = await limits.run(
+            catalog, name, loop.run_in_executor, pool, catalog.load, name
+        )
+    if hooks.after_dataset_loaded is not None:
+        hooks.after_dataset_loaded(dataset_name=name, data=data)
+    return data
+
+
+async def _save(
+    catalog: DataCatalog,
+    name: str,
+    data: Any,
+    pool: ThreadPoolExecutor,
+    limits: _AsyncIOLimits,
+) -> None:
+    hooks = _hook_dispatch(get_hook_manager())
+    if hooks.before_dataset_saved is not None:
+        hooks.before_dataset_saved(dataset_name=name, data=data)
+    save_async = _get_coroutine_method(catalog, name, "save_async")
+    if save_async:
+        catalog._logger.info(  # pylint: disable=protected-access
+            "Saving data to `%s` (%s)...", name, type(save_async.__self__).__name__
+        )
+        await limits.run(catalog, name, save_async, data)
+        _log_version(catalog, name, "save")
+    else:
+        loop = asyncio.get_event_loop()
+        await limits.run(
+            catalog, name, loop.run_in_executor, pool, catalog.save, name, data
+        )
+    if hooks.after_dataset_saved is not None:
+        hooks.after_dataset_saved(dataset_name=name, data=data)
+
+
+async def _call_node_run_async(
+    node: Node,
+    catalog: DataCatalog,
+    inputs: Dict[str, Any],
+    is_async: bool,
+    run_id: str = None,
+) -> Dict[str, Any]:
+    hooks = _hook_dispatch(get_hook_manager())
+    try:
+        outputs = await node.run_async(inputs)
+    except Exception as exc:
+        if hooks.on_node_error is not None:
+            hooks.on_node_error(
+                error=exc,
+                node=node,
+                catalog=catalog,
+                inputs=inputs,
+                is_async=is_async,
+                run_id=run_id,
+            )
+        raise exc
+    if hooks.after_node_run is not None:
+        hooks.after_node_run(
+            node=node,
+            catalog=catalog,
+            inputs=inputs,
+            outputs=outputs,
+            is_async=is_async,
+            run_id=run_id,
+        )
+    return outputs
+
+
+def _run_node_in_thread(
+    node: Node, catalog: DataCatalog, inputs: Dict[str, Any], run_id: str = None
+) -> Dict[str, Any]:
+    inputs.update(_collect_inputs_from_hook(node, catalog, inputs, True, run_id))
+    return _call_node_run(node, catalog, inputs, True, run_id=run_id)
+
+
+async def _run_node_on_loop(  # pylint: disable=too-many-arguments
+    node: Node,
+    catalog: DataCatalog,
+    pool: ThreadPoolExecutor,
+    limits: _AsyncIOLimits,
+    semaphore: asyncio.Semaphore = None,
+    run_id: str = None,
+) -> Node:
+    """Run a single ``Node`` on the running event loop, once ``semaphore``
+    allows another node to run.
+    """
+    if semaphore is None:
+        return await _run_node_coroutine(node, catalog, pool, limits, run_id)
+    async with semaphore:
+        return await _run_node_coroutine(node, catalog, pool, limits, run_id)
+
+
+async def _run_node_coroutine(
+    node: Node,
+    catalog: DataCatalog,
+    pool: ThreadPoolExecutor,
+    limits: _AsyncIOLimits,
+    run_id: str = None,
+) -> Node:
+    """Load the inputs and save the outputs of a single ``Node`` concurrently.
+    The node function is awaited on the event loop if it is a coroutine
+    function, and run in ``pool`` otherwise.
+    """
+    hooks = _hook_dispatch(get_hook_manager())
+    if hooks.before_datasets_loaded is not None and node.inputs:
+        hooks.before_datasets_loaded(node=node, dataset_names=node.inputs)
+    values = await asyncio.gather(
+        *(_load(catalog, name, pool, limits) for name in node.inputs)
+    )
+    inputs = dict(zip(node.inputs, values))
+    if hooks.after_datasets_loaded is not None and inputs:
+        hooks.after_datasets_loaded(node=node, data=dict(inputs))
+
+    if inspect.iscoroutinefunction(node.func):
+        inputs.update(_collect_inputs_from_hook(node, catalog, inputs, True, run_id))
+        outputs = await _call_node_run_async(node, catalog, inputs, True, run_id)
+    else:
+        loop = asyncio.get_event_loop()
+        outputs = await loop.run_in_executor(
+            pool, _run_node_in_thread, node, catalog, inputs, run_id
+        )
+
+    if hooks.before_datasets_saved is not None and outputs:
+        hooks.before_datasets_saved(node=node, data=dict(outputs))
+    await asyncio.gather(
+        *(_save(catalog, name, data, pool, limits) for name, data in outputs.items())
+    )
+    if hooks.after_datasets_saved is not None and outputs:
+        hooks.after_datasets_saved(node=node, data=dict(outputs))
+
+    for name in node.confirms:
+        catalog.confirm(name)
+    return node
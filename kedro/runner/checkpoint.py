@@ -0,0 +1,208 @@
+"""``RunCheckpoint`` keeps the progress of a failed run on disk, i.e. the
+nodes which completed and a copy of the in-memory data the remaining nodes
+need, so that the run can be resumed from where it failed.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Set, Tuple, Union
+
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+_PROGRESS_FILE = "progress.json"
+_DATA_DIR = "data"
+
+
+def _in_memory_data_sets(pipeline: Pipeline, catalog: DataCatalog) -> Set[str]:
+    """Find the datasets of a pipeline whose data only lives in the memory of
+    the run, i.e. the ones not registered in ``catalog`` or registered as
+    ``MemoryDataSet``.
+    """
+    data_sets = catalog._data_sets  # pylint: disable=protected-access
+    return {
+        name
+        for name in pipeline.data_sets()
+        if name not in data_sets or isinstance(data_sets[name], MemoryDataSet)
+    }
+
+
+def _needed_data_sets(
+    pipeline: Pipeline, done_nodes: Set[Node], in_memory: Set[str]
+) -> Set[str]:
+    """Find the in-memory datasets produced by ``done_nodes`` which are loaded
+    by the other nodes of the pipeline or returned by the run.
+    """
+    remaining = Pipeline(set(pipeline.nodes) - done_nodes)
+    produced = {name for node in done_nodes for name in node.outputs}
+    return (remaining.inputs() | pipeline.outputs()) & produced & in_memory
+
+
+class RunCheckpoint:
+    """``RunCheckpoint`` keeps the progress of a failed run in a directory:
+    the names of the nodes which completed, and pickled copies of the data of
+    the in-memory datasets that the remaining nodes load or that the run
+    returns, which would otherwise be lost with the process. Persisted
+    datasets are not copied, as their data survives the run.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import RunCheckpoint, SequentialRunner
+        >>>
+        >>> checkpoint = RunCheckpoint("sessions/2021-08-01T12.00.00.000Z/checkpoint")
+        >>> runner = SequentialRunner()
+        >>> try:
+        >>>     runner.run(pipeline, catalog, checkpoint=checkpoint)
+        >>> except Exception:
+        >>>     # after fixing the failing node
+        >>>     runner.run(pipeline, catalog, resume=checkpoint)
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Creates a new instance of ``RunCheckpoint``.
+
+        Args:
+            path: The directory holding the checkpoint. It is created when
+                the checkpoint is saved.
+        """
+        self._path = Path(path)
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    def _data_path(self, name: str) -> Path:
+        file_name = hashlib.sha256(name.encode()).hexdigest()
+        return self._path / _DATA_DIR / f"{file_name}.pkl"
+
+    def _write(self, path: Path, write: Callable[[BinaryIO], None]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def exists(self) -> bool:
+        """Check whether a checkpoint was saved.
+
+        Returns:
+            True if the progress of a run was saved in the directory.
+        """
+        return (self._path / _PROGRESS_FILE).is_file()
+
+    def save(
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        done_nodes: Iterable[Node],
+        in_memory: Set[str],
+    ) -> None:
+        """Save the progress of a run, replacing any previous checkpoint.
+
+        Args:
+            pipeline: The ``Pipeline`` being run.
+            catalog: The ``DataCatalog`` of the run, holding the data of the
+                completed nodes.
+            done_nodes: The nodes of ``pipeline`` which completed.
+            in_memory: The names of the datasets whose data is lost with the
+                run, as given by ``_in_memory_data_sets``. The ones needed to
+                resume the run are copied to the checkpoint.
+        """
+        done_nodes = set(done_nodes)
+        shutil.rmtree(str(self._path), ignore_errors=True)
+
+        spilled = []
+        for name in sorted(_needed_data_sets(pipeline, done_nodes, in_memory)):
+            try:
+                data = catalog.load(name)
+                self._write(
+                    self._data_path(name),
+                    lambda file: pickle.dump(  # pylint: disable=cell-var-from-loop
+                        data, file, protocol=pickle.HIGHEST_PROTOCOL
+                    ),
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                self._logger.warning(
+                    "Cannot save dataset `%s` to the checkpoint, the nodes "
+                    "producing it will run again when resuming: %s",
+                    name,
+                    exc,
+                )
+                continue
+            spilled.append(name)
+
+        progress = {
+            "done_nodes": sorted(node.name for node in done_nodes),
+            "data_sets": spilled,
+        }
+        # the progress is written last, so that it only lists complete data
+        self._write(
+            self._path / _PROGRESS_FILE,
+            lambda file: file.write(json.dumps(progress, indent=2).encode()),
+        )
+        self._logger.info(
+            "Saved the progress of the run to `%s`: %d nodes completed, %d "
+            "in-memory datasets copied.",
+            self._path,
+            len(done_nodes),
+            len(spilled),
+        )
+
+    def load(self) -> Tuple[Set[str], Dict[str, Any]]:
+        """Load the progress of a run.
+
+        Returns:
+            The names of the nodes which completed, and the data of the
+            in-memory datasets copied to the checkpoint.
+        """
+        progress = json.loads((self._path / _PROGRESS_FILE).read_text())
+        data = {}
+        for name in progress["data_sets"]:
+            with self._data_path(name).open("rb") as file:
+                data[name] = pickle.load(file)  # nosec
+        return set(progress["done_nodes"]), data
+
+    def clear(self) -> None:
+        """Delete the checkpoint."""
+        shutil.rmtree(str(self._path), ignore_errors=True)
+
+
+def _resume_point(
+    pipeline: Pipeline, checkpoint: RunCheckpoint, in_memory: Set[str]
+) -> Tuple[Set[Node], Dict[str, Any]]:
+    """Find the nodes of a pipeline which do not need to run again when
+    resuming from a checkpoint, together with the data to restore.
+
+    The nodes which completed are skipped, except the ones producing
+    in-memory data that the checkpoint does not hold but the other nodes
+    need, e.g. because it could not be pickled.
+
+    Args:
+        pipeline: The ``Pipeline`` to resume.
+        checkpoint: The ``RunCheckpoint`` of the failed run.
+        in_memory: The names of the datasets whose data is lost with a run.
+
+    Returns:
+        The nodes to skip and the data of the in-memory datasets they
+        produced.
+    """
+    done_names, data = checkpoint.load()
+    done_nodes = {node for node in pipeline.nodes if node.name in done_names}
+    while True:
+        needed = _needed_data_sets(pipeline, done_nodes, in_memory)
+        lost = needed - set(data)
+        rerun = {node for node in done_nodes if lost & set(node.outputs)}
+        if not rerun:
+            return done_nodes, {name: data[name] for name in needed}
+        done_nodes -= rerun
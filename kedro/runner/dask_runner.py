@@ -0,0 +1,281 @@
+"""``DaskRunner`` is an ``AbstractRunner`` implementation. It can be
+used to distribute the execution of the nodes of a ``Pipeline`` across
+a Dask cluster, taking into account the inter-node dependencies.
+"""
+import logging.config
+import os
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Set
+
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.pipeline.pipeline import _strip_transcoding
+from kedro.runner.runner import AbstractRunner, run_node
+
+if TYPE_CHECKING:  # pragma: no cover
+    from distributed import Client
+
+    from kedro.runner.node_cache import NodeCache
+
+# the project packages configured in the current worker process
+_CONFIGURED_PACKAGES = set()  # type: Set[str]
+
+
+def _bootstrap_worker(
+    package_name: str, conf_logging: Dict[str, Any], runner_pid: int
+) -> None:
+    """Configure the project in a worker process of the Dask cluster, so that
+    its settings and hooks are available to the nodes, unless it runs in the
+    process of the runner or was configured already.
+    """
+    if (
+        package_name
+        and os.getpid() != runner_pid
+        and package_name not in _CONFIGURED_PACKAGES
+    ):  # pragma: no cover
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from kedro.framework.project import configure_project
+
+        configure_project(package_name)
+        if conf_logging:
+            logging.config.dictConfig(conf_logging)
+        _CONFIGURED_PACKAGES.add(package_name)
+
+
+def _run_node(  # pylint: disable=too-many-arguments
+    node: Node,
+    catalog: DataCatalog,
+    run_state: Dict[str, Any],
+    inputs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Run a node in a worker of the Dask cluster.
+
+    Args:
+        node: The ``Node`` to run.
+        catalog: The ``DataCatalog`` of the run.
+        run_state: The settings of the run shared by all its nodes.
+        inputs: The results of the tasks producing the inputs of the node,
+            i.e. the data of the in-memory inputs and ``None`` for the
+            persisted ones. Dask resolves them before running the task.
+
+    Returns:
+        The data of the in-memory outputs of the node.
+    """
+    _bootstrap_worker(*run_state["bootstrap"])
+    in_memory = run_state["in_memory"]
+    catalog = catalog.shallow_copy()
+    for name, data in inputs.items():
+        if name in in_memory:
+            # copied, as the tasks running on the same worker share the data
+            catalog.add(name, MemoryDataSet(data), replace=True)
+    outputs = {
+        name: MemoryDataSet(copy_mode="assign")
+        for name in node.outputs
+        if name in in_memory
+    }
+    for name, data_set in outputs.items():
+        catalog.add(name, data_set, replace=True)
+    run_node(
+        node,
+        catalog,
+        run_state["is_async"],
+        run_state["run_id"],
+        node_cache=run_state["node_cache"],
+    )
+    return {name: data_set.load() for name, data_set in outputs.items()}
+
+
+def _select(outputs: Dict[str, Any], name: str) -> Any:
+    """Select the data of one output of a node, so that the tasks loading it
+    only depend on that output.
+    """
+    return outputs.get(name)
+
+
+class DaskRunner(AbstractRunner):
+    """``DaskRunner`` is an ``AbstractRunner`` implementation. It can be
+    used to distribute the execution of the nodes of a ``Pipeline`` across
+    a Dask cluster, taking into account the inter-node dependencies.
+
+    Every node is submitted as a task to a ``distributed.Client``, which
+    connects to a ``LocalCluster`` unless told otherwise. The data of the
+    in-memory datasets stays in the memory of the Dask workers as the
+    results of these tasks, and the Dask scheduler moves it between workers,
+    balances the load with work stealing, spills it to disk under memory
+    pressure and frees it once the last node loading it has run. Only the
+    outputs of the pipeline are gathered by the runner.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import DaskRunner
+        >>>
+        >>> with DaskRunner(client_args={"n_workers": 4}) as runner:
+        >>>     runner.run(pipeline, catalog)
+    """
+
+    def __init__(
+        self,
+        client: "Client" = None,
+        client_args: Dict[str, Any] = None,
+        is_async: bool = False,
+        node_cache: "NodeCache" = None,
+    ):
+        """Instantiates the runner.
+
+        Args:
+            client: The ``distributed.Client`` to submit the nodes to. If not
+                set, a client is created with ``client_args``, and closed with
+                the runner.
+            client_args: Arguments of the ``distributed.Client`` created by
+                the runner. By default, the client connects to the scheduler
+                set in the ``DASK_SCHEDULER_ADDRESS`` environment variable, or
+                else starts a ``LocalCluster``.
+            is_async: If True, the node inputs and outputs are loaded and saved
+                asynchronously with threads. Defaults to False.
+            node_cache: Optional ``NodeCache`` from which the outputs of the
+                nodes are restored instead of running them, if they were
+                cached with the same node function and inputs. It must be
+                reachable from all the workers.
+
+        Raises:
+            ValueError: bad parameters passed
+        """
+        super().__init__(is_async=is_async, node_cache=node_cache)
+        if client is not None and client_args:
+            raise ValueError("`client` and `client_args` cannot be used together.")
+        # pylint: disable=import-outside-toplevel
+        from distributed import Client
+
+        self._owns_client = client is None
+        self._client = client or Client(**(client_args or {}))
+
+    @property
+    def client(self) -> "Client":
+        """The ``distributed.Client`` the nodes are submitted to."""
+        return self._client
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Close the ``distributed.Client``, if it was created by the runner,
+        together with its ``LocalCluster``.
+        """
+        client = getattr(self, "_client", None)
+        if client is not None and self._owns_client:
+            client.close()
+            if client.cluster is not None:
+                client.cluster.close()
+
+    def create_default_data_set(self, ds_name: str) -> MemoryDataSet:
+        """Factory method for creating the default dataset for the runner.
+
+        Args:
+            ds_name: Name of the missing dataset.
+
+        Returns:
+            An instance of ``MemoryDataSet``, which receives the data of the
+            pipeline outputs held by the Dask workers once the run completes.
+
+        """
+        return MemoryDataSet()
+
+    def _run(  # pylint: disable=too-many-locals
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        """The abstract interface for running pipelines.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            run_id: The id of the run.
+
+        Raises:
+            Exception: In case of any downstream node failure.
+
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from distributed import as_completed
+
+        from kedro.framework.project import PACKAGE_NAME
+        from kedro.framework.session.session import get_current_session
+
+        session = get_current_session(silent=True)
+        # pylint: disable=protected-access
+        conf_logging = session._get_logging_config() if session else None
+
+        plan = pipeline.compile()
+        data_sets = catalog._data_sets
+        # data which only lives in the memory of the Dask workers
+        in_memory = {
+            name
+            for name in pipeline.all_outputs()
+            if isinstance(data_sets.get(name), MemoryDataSet)
+        }
+        run_state = {
+            "bootstrap": (PACKAGE_NAME, conf_logging, os.getpid()),
+            "in_memory": in_memory,
+            "is_async": self._is_async,
+            "run_id": run_id,
+            "node_cache": self._node_cache,
+        }
+        client = self._client
+        run_token = uuid.uuid4().hex
+        # the catalog is sent to every worker once, not with every node
+        catalog_future = client.scatter(catalog, hash=False)
+
+        node_futures = {}
+        # keyed by the names without transcoding, as a node loading `df@pandas`
+        # waits for the node saving `df@spark`
+        output_futures = {}
+        for node in plan.nodes:
+            inputs = {
+                name: output_futures[_strip_transcoding(name)]
+                for name in node.inputs
+                if _strip_transcoding(name) in output_futures
+            }
+            future = client.submit(
+                _run_node,
+                node,
+                catalog_future,
+                run_state,
+                inputs,
+                key=f"{node.name}-{run_token}",
+                pure=False,
+            )
+            node_futures[future.key] = (future, node)
+            for name in node.outputs:
+                output_futures[_strip_transcoding(name)] = client.submit(
+                    _select, future, name, key=f"{name}-{run_token}", pure=False
+                )
+        # the scheduler frees the intermediate data once it is not needed
+        output_futures = {
+            name: output_futures[_strip_transcoding(name)]
+            for name in plan.outputs
+            if name in in_memory
+        }
+
+        done_nodes = set()  # type: Set[Node]
+        futures = as_completed([future for future, _ in node_futures.values()])
+        for i, future in enumerate(futures, start=1):
+            _, node = node_futures.pop(future.key)
+            if future.status == "error":
+                client.cancel([future for future, _ in node_futures.values()])
+                client.cancel(list(output_futures.values()))
+                self._suggest_resume_scenario(pipeline, done_nodes)
+                future.result()  # raises the error of the node
+            done_nodes.add(node)
+            self._logger.info("Completed node: %s", node.name)
+            self._logger.info("Completed %d out of %d tasks", i, len(plan.nodes))
+
+        # the outputs of the pipeline are returned by the runner
+        for name, data in client.gather(output_futures).items():
+            catalog.save(name, data)
@@ -0,0 +1,594 @@
+"""``DistributedRunner`` is an ``AbstractRunner`` implementation. It runs the
+nodes of a ``Pipeline`` on worker daemons, started with ``kedro worker`` on
+one or several hosts, which connect to it over TCP.
+"""
+import logging
+import os
+import pickle
+import socket
+import threading
+import time
+import traceback
+import uuid
+from multiprocessing.connection import Client, Connection, Listener, wait
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.runner import AbstractRunner, _ReadyQueue, run_node
+
+DEFAULT_ADDRESS = "localhost:8788"
+AUTHKEY_ENV_VAR = "KEDRO_WORKER_AUTHKEY"
+ADDRESS_ENV_VAR = "KEDRO_COORDINATOR_ADDRESS"
+
+Address = Tuple[str, int]
+
+
+def _parse_address(address: Union[str, Address]) -> Address:
+    if isinstance(address, str):
+        host, _, port = address.rpartition(":")
+        if not host or not port.isdigit():
+            raise ValueError(f"Invalid address `{address}`, expected `<host>:<port>`.")
+        return host, int(port)
+    return address[0], int(address[1])
+
+
+def _get_authkey(authkey: Union[str, bytes, None]) -> bytes:
+    authkey = authkey or os.environ.get(AUTHKEY_ENV_VAR)
+    if not authkey:
+        raise ValueError(
+            f"An authentication key shared by the runner and its workers is "
+            f"required. Please pass `authkey` or set the `{AUTHKEY_ENV_VAR}` "
+            f"environment variable."
+        )
+    return authkey.encode() if isinstance(authkey, str) else authkey
+
+
+def _unpicklable(objects: Dict[str, Any]) -> List[str]:
+    unpicklable = []
+    for name, obj in objects.items():
+        try:
+            pickle.dumps(obj)
+        except Exception:  # pylint: disable=broad-except
+            unpicklable.append(name)
+    return sorted(unpicklable)
+
+
+def _fetch(  # pylint: disable=too-many-arguments
+    connections: Dict[Address, Connection],
+    address: Address,
+    authkey: bytes,
+    run_token: str,
+    name: str,
+) -> Any:
+    """Request in-memory data from the data server of a worker, reusing the
+    connection to that worker if there is one already.
+    """
+    address = tuple(address)  # type: ignore
+    connection = connections.get(address)
+    if connection is None:
+        connection = connections[address] = Client(address, authkey=authkey)
+    connection.send(("get", run_token, name))
+    kind, payload = connection.recv()
+    if kind == "error":
+        raise RuntimeError(
+            f"Cannot fetch dataset `{name}` from the worker at "
+            f"{address[0]}:{address[1]}: {payload}"
+        )
+    return payload
+
+
+def _close_listener(listener: Listener) -> None:
+    # closing the socket does not interrupt a pending ``accept`` on Linux
+    server = listener._listener  # pylint: disable=protected-access
+    if server is None:
+        return
+    try:
+        server._socket.shutdown(socket.SHUT_RDWR)  # pylint: disable=W0212
+    except OSError:  # pragma: no cover
+        pass
+    listener.close()
+
+
+class _WorkerHandle:  # pylint: disable=too-few-public-methods
+    """``_WorkerHandle`` is the coordinator side of the connection to a
+    worker, together with the address of the data server of the worker.
+    """
+
+    def __init__(self, connection: Connection, data_address: Address):
+        self.connection = connection
+        self.data_address = data_address
+        self.run_token = None  # type: Optional[str]
+
+    def __repr__(self):  # pragma: no cover
+        return f"<worker {self.data_address[0]}:{self.data_address[1]}>"
+
+
+class DistributedRunner(AbstractRunner):
+    """``DistributedRunner`` is an ``AbstractRunner`` implementation. It
+    runs the nodes of a ``Pipeline`` on worker daemons, started with
+    ``kedro worker`` on one or several hosts, which connect to the address
+    the runner listens on.
+
+    Every worker runs one node at a time. Workers load and save the
+    persisted datasets themselves, while the in-memory data a node produces
+    is held by the worker which ran it, and fetched from it directly by the
+    workers running the nodes which load it. The data is only sent to the
+    runner if it is an output of the pipeline. Ready nodes are preferably
+    scheduled on a worker which holds some of their in-memory inputs.
+
+    Example:
+    ::
+
+        >>> # on every worker host, in the project directory:
+        >>> # KEDRO_WORKER_AUTHKEY=secret kedro worker --coordinator head:8788
+        >>> from kedro.runner import DistributedRunner
+        >>>
+        >>> runner = DistributedRunner("0.0.0.0:8788", authkey="secret")
+        >>> runner.run(pipeline, catalog)
+    """
+
+    def __init__(
+        self,
+        address: Union[str, Address] = None,
+        authkey: Union[str, bytes] = None,
+        min_workers: int = 1,
+        connect_timeout: float = 60.0,
+        is_async: bool = False,
+    ):
+        """Instantiates the runner and starts listening for workers.
+
+        Args:
+            address: The address the runner listens on for workers, either
+                as ``"<host>:<port>"`` or as a ``(host, port)`` tuple. Port 0
+                picks a free port, see ``address``. If not set, it is read
+                from the ``KEDRO_COORDINATOR_ADDRESS`` environment variable,
+                and defaults to ``localhost:8788``.
+            authkey: The authentication key the workers must present. If not
+                set, it is read from the ``KEDRO_WORKER_AUTHKEY`` environment
+                variable. Messages are pickled, so only trusted workers must
+                be given the key.
+            min_workers: The number of workers which must be connected for a
+                run to start. Workers connecting later are used as they come.
+            connect_timeout: Number of seconds to wait for ``min_workers``
+                workers to connect, and for a worker to be available if all
+                of them disconnected during a run.
+            is_async: If True, the node inputs and outputs are loaded and saved
+                asynchronously with threads in the workers. Defaults to False.
+
+        Raises:
+            ValueError: bad parameters passed
+        """
+        super().__init__(is_async=is_async)
+        self._listener = None  # type: Optional[Listener]
+        self._closed = threading.Event()
+        if min_workers < 1:
+            raise ValueError("`min_workers` must be at least 1.")
+        self._authkey = _get_authkey(authkey)
+        self._min_workers = min_workers
+        self._connect_timeout = connect_timeout
+        self._workers = []  # type: List[_WorkerHandle]
+        self._workers_changed = threading.Condition()
+        address = address or os.environ.get(ADDRESS_ENV_VAR, DEFAULT_ADDRESS)
+        self._listener = Listener(_parse_address(address), authkey=self._authkey)
+        self._accept_thread = threading.Thread(target=self._accept_workers, daemon=True)
+        self._accept_thread.start()
+
+    @property
+    def address(self) -> Address:
+        """The address the runner listens on for workers."""
+        return self._listener.address
+
+    def __del__(self):
+        self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_):
+        self.close()
+
+    def close(self) -> None:
+        """Stop listening for workers and disconnect the connected ones."""
+        self._closed.set()
+        if self._listener is not None:
+            _close_listener(self._listener)
+        with self._workers_changed:
+            for worker in self._workers:
+                worker.connection.close()
+            self._workers.clear()
+
+    def _accept_workers(self) -> None:
+        while True:
+            try:
+                connection = self._listener.accept()
+                _, data_address = connection.recv()
+            except Exception as exc:  # pylint: disable=broad-except
+                if self._closed.is_set():
+                    return
+                self._logger.warning("Rejected a worker connection: %s", exc)
+                continue
+            with self._workers_changed:
+                self._workers.append(_WorkerHandle(connection, data_address))
+                self._workers_changed.notify_all()
+            self._logger.info("Worker %s:%d connected.", *data_address)
+
+    def _wait_for_workers(self, count: int) -> List[_WorkerHandle]:
+        with self._workers_changed:
+            if not self._workers_changed.wait_for(
+                lambda: len(self._workers) >= count, timeout=self._connect_timeout
+            ):
+                raise RuntimeError(
+                    f"Only {len(self._workers)} of the {count} workers required "
+                    f"connected to {self.address[0]}:{self.address[1]} within "
+                    f"{self._connect_timeout}s. Start them with `kedro worker "
+                    f"--coordinator <host>:{self.address[1]}`."
+                )
+            return list(self._workers)
+
+    def _drop_worker(self, worker: _WorkerHandle) -> None:
+        with self._workers_changed:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        worker.connection.close()
+        self._logger.warning("Worker %s:%d disconnected.", *worker.data_address)
+
+    def create_default_data_set(self, ds_name: str) -> MemoryDataSet:
+        """Factory method for creating the default dataset for the runner.
+
+        Args:
+            ds_name: Name of the missing dataset.
+
+        Returns:
+            An instance of ``MemoryDataSet``, which receives the data of the
+            pipeline outputs held by the workers once the run completes.
+
+        """
+        return MemoryDataSet()
+
+    def _install(self, worker: _WorkerHandle, run_token: str, run_state: bytes):
+        if worker.run_token != run_token:
+            worker.connection.send(("install", run_token, run_state))
+            worker.run_token = run_token
+
+    def _run(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        """The abstract interface for running pipelines.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            run_id: The id of the run.
+
+        Raises:
+            AttributeError: When the nodes or datasets cannot be sent to the
+                workers.
+            RuntimeError: If no worker is available to run the pipeline, or
+                if a worker disconnects with in-memory data still needed.
+            Exception: In case of any downstream node failure.
+
+        """
+        # pylint: disable=protected-access
+        plan = pipeline.compile()
+        data_sets = catalog._data_sets
+        for kind, objects in (
+            ("nodes", {node.name: node for node in plan.nodes}),
+            ("data sets", data_sets),
+        ):
+            unpicklable = _unpicklable(objects)
+            if unpicklable:
+                raise AttributeError(
+                    f"The following {kind} cannot be sent to the workers: "
+                    f"{unpicklable}\nPlease make sure they can be pickled."
+                )
+        # data which only lives in the memory of the workers which produce it
+        in_memory = {
+            name
+            for name in pipeline.all_outputs()
+            if isinstance(data_sets.get(name), MemoryDataSet)
+        }
+        run_token = uuid.uuid4().hex
+        run_state = pickle.dumps(
+            {
+                "nodes": {node.name: node for node in plan.nodes},
+                "catalog": catalog,
+                "in_memory": in_memory,
+                "is_async": self._is_async,
+                "run_id": run_id,
+            }
+        )
+
+        ready_queue = _ReadyQueue(plan.node_dependencies)
+        release_tracker = plan.release_tracker()
+        pending = []  # type: List[Node]
+        busy = {}  # type: Dict[_WorkerHandle, Node]
+        locations = {}  # type: Dict[str, _WorkerHandle]
+        done_nodes = set()  # type: Set[Node]
+        workers = self._wait_for_workers(self._min_workers)
+        try:
+            while True:
+                pending.extend(ready_queue.pop_all())
+                workers = list(self._workers)
+                idle = [worker for worker in workers if worker not in busy]
+                while pending and idle:
+                    node = pending[0]
+                    # prefer the worker holding most of the node's inputs
+                    worker = max(
+                        idle,
+                        key=lambda w: sum(
+                            locations.get(name)
+                            is w  # pylint: disable=cell-var-from-loop
+                            for name in node.inputs
+                        ),
+                    )
+                    idle.remove(worker)
+                    sources = {
+                        name: locations[name].data_address
+                        for name in node.inputs
+                        if name in locations
+                    }
+                    try:
+                        self._install(worker, run_token, run_state)
+                        worker.connection.send(("run", run_token, node.name, sources))
+                    except OSError:  # pragma: no cover
+                        self._lose_worker(worker, locations, pipeline, done_nodes)
+                        continue
+                    busy[worker] = pending.pop(0)
+
+                if not busy:
+                    if not ready_queue.todo_nodes and not pending:
+                        break
+                    # every worker disconnected, wait for a new one
+                    self._wait_for_workers(1)
+                    continue
+
+                connections = {worker.connection: worker for worker in workers}
+                for connection in wait(list(connections)):
+                    worker = connections[connection]
+                    try:
+                        message = connection.recv()
+                    except (EOFError, OSError):
+                        self._lose_worker(worker, locations, pipeline, done_nodes)
+                        node = busy.pop(worker, None)
+                        if node is not None:
+                            # run the node again on another worker
+                            pending.insert(0, node)
+                        continue
+
+                    kind, token, _, payload = message
+                    if token != run_token:
+                        continue  # a node of a previous run which failed
+                    node = busy.pop(worker)
+                    if kind == "failed":
+                        self._suggest_resume_scenario(pipeline, done_nodes)
+                        raise payload
+                    for name in payload:
+                        locations[name] = worker
+                    done_nodes.add(node)
+                    ready_queue.mark_done(node)
+                    for name in release_tracker.mark_done(node):
+                        holder = locations.pop(name, None)
+                        if holder is not None:
+                            holder.connection.send(("release", run_token, [name]))
+
+            # the outputs of the pipeline are returned by the runner
+            connections = {}  # type: Dict[Address, Connection]
+            try:
+                for name, holder in locations.items():
+                    data = _fetch(
+                        connections,
+                        holder.data_address,
+                        self._authkey,
+                        run_token,
+                        name,
+                    )
+                    catalog.save(name, data)
+            finally:
+                for connection in connections.values():
+                    connection.close()
+        finally:
+            for worker in list(self._workers):
+                if worker.run_token == run_token:
+                    worker.run_token = None
+                    try:
+                        worker.connection.send(("end", run_token))
+                    except OSError:  # pragma: no cover
+                        self._drop_worker(worker)
+
+    def _lose_worker(
+        self,
+        worker: _WorkerHandle,
+        locations: Dict[str, _WorkerHandle],
+        pipeline: Pipeline,
+        done_nodes: Set[Node],
+    ) -> None:
+        self._drop_worker(worker)
+        lost = sorted(name for name, holder in locations.items() if holder is worker)
+        if lost:
+            self._suggest_resume_scenario(pipeline, done_nodes)
+            raise RuntimeError(
+                f"Worker {worker.data_address[0]}:{worker.data_address[1]} "
+                f"disconnected, losing the data of {lost}."
+            )
+
+
+class _Worker:
+    """``_Worker`` runs the nodes sent by a ``DistributedRunner`` over a
+    connection, and serves the in-memory data they produce to the other
+    workers from a data server of its own.
+    """
+
+    def __init__(self, connection: Connection, authkey: bytes, host: str):
+        self._connection = connection
+        self._authkey = authkey
+        self._run_states = {}  # type: Dict[str, Dict[str, Any]]
+        self._held = {}  # type: Dict[str, Dict[str, Any]]
+        self._connections = {}  # type: Dict[Address, Connection]
+        self._listener = Listener((host, 0), authkey=authkey)
+        self._closed = threading.Event()
+        threading.Thread(target=self._serve_data, daemon=True).start()
+
+    @property
+    def _logger(self) -> logging.Logger:
+        return logging.getLogger(__name__)
+
+    @property
+    def data_address(self) -> Address:
+        """The address of the data server of the worker."""
+        return self._listener.address
+
+    def _serve_data(self) -> None:
+        while True:
+            try:
+                connection = self._listener.accept()
+            except Exception:  # pylint: disable=broad-except
+                if self._closed.is_set():
+                    return
+                continue  # pragma: no cover
+            threading.Thread(
+                target=self._serve_requests, args=(connection,), daemon=True
+            ).start()
+
+    def _serve_requests(self, connection: Connection) -> None:
+        with connection:
+            while True:
+                try:
+                    _, run_token, name = connection.recv()
+                except (EOFError, OSError):
+                    return
+                held = self._held.get(run_token, {})
+                if name not in held:
+                    connection.send(("error", "the dataset is not held."))
+                    continue
+                try:
+                    connection.send(("data", held[name]))
+                except Exception as exc:  # pylint: disable=broad-except
+                    connection.send(("error", str(exc)))
+
+    def serve(self) -> None:
+        """Run the nodes sent by the runner until it disconnects."""
+        try:
+            while True:
+                try:
+                    message = self._connection.recv()
+                except (EOFError, OSError):
+                    return
+                handlers = {
+                    "install": self._install,
+                    "run": self._run,
+                    "release": self._release,
+                    "end": self._end,
+                }
+                handlers[message[0]](*message[1:])
+        finally:
+            self._closed.set()
+            _close_listener(self._listener)
+            self._close_connections()
+
+    def _close_connections(self) -> None:
+        for connection in self._connections.values():
+            connection.close()
+        self._connections.clear()
+
+    def _install(self, run_token: str, run_state: bytes) -> None:
+        self._run_states[run_token] = pickle.loads(run_state)
+        self._held[run_token] = {}
+
+    def _release(self, run_token: str, names: Iterable[str]) -> None:
+        for name in names:
+            self._held[run_token].pop(name, None)
+
+    def _end(self, run_token: str) -> None:
+        self._run_states.pop(run_token, None)
+        self._held.pop(run_token, None)
+        self._close_connections()
+
+    def _run(self, run_token: str, node_name: str, sources: Dict[str, Address]):
+        state = self._run_states[run_token]
+        held = self._held[run_token]
+        node = state["nodes"][node_name]
+        catalog = state["catalog"].shallow_copy()
+        outputs = {
+            name: MemoryDataSet(copy_mode="assign")
+            for name in node.outputs
+            if name in state["in_memory"]
+        }
+        try:
+            for name, address in sources.items():
+                if tuple(address) == self.data_address:
+                    data_set = MemoryDataSet(held[name])
+                else:
+                    data = _fetch(
+                        self._connections, address, self._authkey, run_token, name
+                    )
+                    data_set = MemoryDataSet(data, copy_mode="assign")
+                catalog.add(name, data_set, replace=True)
+            for name, data_set in outputs.items():
+                catalog.add(name, data_set, replace=True)
+            run_node(node, catalog, state["is_async"], state["run_id"])
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.error("Node `%s` failed.", node_name, exc_info=True)
+            try:
+                self._connection.send(("failed", run_token, node_name, exc))
+            except Exception:  # pylint: disable=broad-except
+                error = RuntimeError(
+                    f"Node `{node_name}` failed:\n{traceback.format_exc()}"
+                )
+                self._connection.send(("failed", run_token, node_name, error))
+            return
+        for name, data_set in outputs.items():
+            held[name] = data_set.load()
+        self._connection.send(("done", run_token, node_name, list(outputs)))
+
+
+def run_worker(
+    coordinator: Union[str, Address] = DEFAULT_ADDRESS,
+    authkey: Union[str, bytes] = None,
+    host: str = None,
+    once: bool = False,
+    retry_interval: float = 1.0,
+) -> None:
+    """Run a worker of ``DistributedRunner``, which connects to the runner
+    listening on ``coordinator`` and runs the nodes it sends. The worker
+    waits for the runner to listen, and connects again once it
+    disconnects, unless ``once`` is True.
+
+    Args:
+        coordinator: The address the runner listens on, either as
+            ``"<host>:<port>"`` or as a ``(host, port)`` tuple.
+        authkey: The authentication key of the runner. If not set, it is read
+            from the ``KEDRO_WORKER_AUTHKEY`` environment variable.
+        host: The host name or IP address on which the other workers and the
+            runner reach the data server of this worker. If not set, the
+            address this worker connects to the runner from is used.
+        once: If True, return once the runner disconnects.
+        retry_interval: Number of seconds between two attempts to connect to
+            the runner.
+
+    Raises:
+        ValueError: bad parameters passed
+    """
+    address = _parse_address(coordinator)
+    authkey = _get_authkey(authkey)
+    logger = logging.getLogger(__name__)
+    while True:
+        try:
+            connection = Client(address, authkey=authkey)
+        except ConnectionError:
+            time.sleep(retry_interval)
+            continue
+        with connection:
+            if host is None:
+                with socket.socket(fileno=os.dup(connection.fileno())) as sock:
+                    data_host = sock.getsockname()[0]
+            else:
+                data_host = host
+            worker = _Worker(connection, authkey, data_host)
+            connection.send(("hello", worker.data_address))
+            logger.info("Connected to the runner at %s:%d.", *address)
+            worker.serve()
+        logger.info("Disconnected from the runner at %s:%d.", *address)
+        if once:
+            return
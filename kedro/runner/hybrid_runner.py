@@ -0,0 +1,330 @@
+"""``HybridRunner`` is an ``AbstractRunner`` implementation. It can be
+used to run the ``Pipeline`` with every node routed to a pool of processes,
+a pool of threads or the main thread.
+"""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import chain
+from typing import Dict, Iterable, List, Set, Tuple
+
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.parallel_runner import (
+    ParallelRunner,
+    _run_node_synchronization,
+    _SharedMemoryDataSet,
+)
+from kedro.runner.runner import _ReadyQueue, run_node
+
+_EXECUTOR_TAG_PREFIX = "executor:"
+_EXECUTORS = ("process", "thread", "inline")
+
+
+def _validate_executor(executor: str) -> None:
+    if executor not in _EXECUTORS:
+        raise ValueError(
+            f"Unknown executor `{executor}`. Available executors: "
+            f"{', '.join(_EXECUTORS)}."
+        )
+
+
+def _get_executor(node: Node, default: str) -> str:
+    """Return the executor a node is routed to, as given by its
+    ``executor:<name>`` tag, or ``default`` if the node has no such tag.
+    """
+    executors = sorted(
+        tag[len(_EXECUTOR_TAG_PREFIX) :]
+        for tag in node.tags
+        if tag.startswith(_EXECUTOR_TAG_PREFIX)
+    )
+    if not executors:
+        return default
+    if len(executors) > 1:
+        raise ValueError(
+            f"Node `{node.name}` is tagged with more than one executor: "
+            f"{', '.join(executors)}."
+        )
+    _validate_executor(executors[0])
+    return executors[0]
+
+
+def _subset_catalog(catalog: DataCatalog, names: Set[str]) -> DataCatalog:
+    """Copy a ``DataCatalog`` with only the datasets named ``names``."""
+    # pylint: disable=protected-access
+    data_sets = {
+        name: data_set for name, data_set in catalog._data_sets.items() if name in names
+    }
+    return DataCatalog(
+        data_sets=data_sets,
+        transformers={
+            name: transformers
+            for name, transformers in catalog._transformers.items()
+            if name in data_sets
+        },
+        default_transformers=catalog._default_transformers,
+        journal=catalog._journal,
+        layers=catalog.layers,
+        io_limits=catalog.io_limits,
+    )
+
+
+class HybridRunner(ParallelRunner):
+    """``HybridRunner`` is an ``AbstractRunner`` implementation. It can be
+    used to run the ``Pipeline`` with every node routed to a pool of
+    processes, a pool of threads or the main thread, according to its
+    ``executor:process``, ``executor:thread`` or ``executor:inline`` tag.
+    Nodes without such a tag run on ``default_executor``. Datasets read or
+    written by nodes running in processes are shared through the
+    ``ParallelRunner`` manager, while any other unregistered dataset is kept
+    in memory in the main process.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_workers: int = None,
+        max_threads: int = None,
+        is_async: bool = False,
+        default_executor: str = "thread",
+        reuse_workers: bool = False,
+        io_limits: Dict[str, int] = None,
+        node_cache: NodeCache = None,
+    ):
+        """
+        Instantiates the runner by creating a Manager.
+
+        Args:
+            max_workers: Number of worker processes to spawn for the nodes
+                routed to processes. If not set, calculated automatically
+                based on the pipeline configuration and CPU core count.
+            max_threads: Number of threads used to run the nodes routed to
+                threads. If not set, the
+                ``concurrent.futures.ThreadPoolExecutor`` default is used.
+            is_async: If True, the node inputs and outputs are loaded and saved
+                asynchronously with threads. Defaults to False.
+            default_executor: Executor of the nodes without an
+                ``executor:<name>`` tag, one of "process", "thread" or
+                "inline". Defaults to "thread".
+            reuse_workers: If True, the worker processes are kept alive between
+                runs until ``close`` is called, as for ``ParallelRunner``.
+                Defaults to False.
+            io_limits: Optional mapping of dataset types, e.g.
+                ``SQLTableDataSet``, filesystem protocols, e.g. ``s3``, or
+                dataset names to the maximum number of concurrent loads and
+                saves of the matching datasets. Limits set with the
+                ``io_limit`` key of the catalog entries take precedence.
+                The limits apply within the main process and within each
+                worker process.
+            node_cache: Optional ``NodeCache`` memoizing the node outputs
+                across runs. Nodes whose function and inputs have not changed
+                since their outputs were cached are not run, their outputs are
+                restored from the cache instead.
+
+        Raises:
+            ValueError: bad parameters passed
+        """
+        if max_threads is not None and max_threads <= 0:
+            raise ValueError("max_threads should be positive")
+        _validate_executor(default_executor)
+        super().__init__(
+            max_workers=max_workers,
+            is_async=is_async,
+            reuse_workers=reuse_workers,
+            io_limits=io_limits,
+            node_cache=node_cache,
+        )
+        self._max_threads = max_threads
+        self._default_executor = default_executor
+        self._process_data_sets = set()  # type: Set[str]
+
+    def _prepare_pipeline(
+        self, pipeline: Pipeline, catalog: DataCatalog
+    ) -> Tuple[Pipeline, DataCatalog]:
+        """Prepare the pipeline and the catalog of a run, and find the
+        datasets read or written by the nodes routed to processes, including
+        the partitions of the map nodes, which are shared with the workers.
+
+        Raises:
+            ValueError: When a node is routed to an unknown executor.
+
+        """
+        pipeline, catalog = super()._prepare_pipeline(pipeline, catalog)
+        process_nodes = self._process_nodes(pipeline.nodes)
+        self._process_data_sets = set(
+            chain.from_iterable(n.inputs + n.outputs for n in process_nodes)
+        )
+        return pipeline, catalog
+
+    def create_default_data_set(self, ds_name: str) -> AbstractDataSet:  # type: ignore
+        """Factory method for creating the default dataset for the runner.
+
+        Args:
+            ds_name: Name of the missing dataset.
+
+        Returns:
+            An instance of ``_SharedMemoryDataSet`` if ``ds_name`` is read or
+            written by a node routed to processes, otherwise an instance of
+            ``MemoryDataSet``.
+
+        """
+        if ds_name in self._process_data_sets:
+            return _SharedMemoryDataSet(self._manager)
+        return MemoryDataSet()
+
+    @classmethod
+    def _validate_process_inputs(
+        cls, catalog: DataCatalog, pipeline: Pipeline, process_pipeline: Pipeline
+    ):
+        """Ensure that the nodes routed to processes do not read memory data
+        sets written during the run by other nodes, as the worker processes
+        only hold the copy of the ``DataCatalog`` taken when the run started.
+        """
+        data_sets = catalog._data_sets  # pylint: disable=protected-access
+
+        memory_data_sets = []
+        for name in process_pipeline.inputs() & pipeline.all_outputs():
+            if isinstance(data_sets.get(name), MemoryDataSet):
+                memory_data_sets.append(name)
+
+        if memory_data_sets:
+            raise AttributeError(
+                f"The following data sets are memory data sets: "
+                f"{sorted(memory_data_sets)}\n"
+                f"HybridRunner does not support passing externally created "
+                f"MemoryDataSets to nodes running in processes"
+            )
+
+    def _process_nodes(self, nodes: Iterable[Node]) -> List[Node]:
+        return [
+            node
+            for node in nodes
+            if _get_executor(node, self._default_executor) == "process"
+        ]
+
+    def _run(  # pylint: disable=too-many-locals,too-many-branches
+        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    ) -> None:
+        """The abstract interface for running pipelines.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            run_id: The id of the run.
+
+        Raises:
+            AttributeError: When the nodes routed to processes or their
+                datasets are not suitable for parallel execution.
+            RuntimeError: If the runner is unable to schedule the execution of
+                all pipeline nodes.
+            Exception: In case of any downstream node failure.
+
+        """
+        plan = pipeline.compile()
+        nodes = plan.nodes
+        executors = {
+            node: _get_executor(node, self._default_executor) for node in nodes
+        }
+        process_nodes = [node for node in nodes if executors[node] == "process"]
+        if process_nodes:
+            process_pipeline = Pipeline(process_nodes)
+            # only the datasets of the nodes routed to processes are sent to
+            # the workers, so that the others need not be serializable
+            process_catalog = _subset_catalog(catalog, process_pipeline.data_sets())
+            self._validate_catalog(process_catalog, process_pipeline)
+            self._validate_process_inputs(catalog, pipeline, process_pipeline)
+            self._validate_nodes(process_nodes)
+
+        release_tracker = plan.release_tracker()
+        ready_queue = _ReadyQueue(plan.node_dependencies)
+        done_nodes = set()  # type: Set[Node]
+        futures = {}  # type: Dict[Future, Node]
+
+        pool = run_token = None
+        if process_nodes:
+            max_workers = self._get_required_workers_count(process_pipeline)
+            pool, run_token = self._open_pool(
+                process_nodes, process_catalog, max_workers, run_id
+            )
+        try:
+            with ThreadPoolExecutor(max_workers=self._max_threads) as thread_pool:
+                while True:
+                    # Inline nodes block the scheduler, so start the others
+                    # before running them.
+                    ready = sorted(
+                        ready_queue.pop_all(),
+                        key=lambda n: executors[n] == "inline",
+                    )
+                    for node in ready:
+                        executor = executors[node]
+                        if executor == "process":
+                            future = pool.submit(  # type: ignore
+                                _run_node_synchronization, node.name, run_token
+                            )
+                        elif executor == "thread":
+                            future = thread_pool.submit(
+                                run_node,
+                                node,
+                                catalog,
+                                self._is_async,
+                                run_id,
+                                self._io_executor,
+                                self._node_cache,
+                            )
+                        else:
+                            future = self._run_inline(node, catalog, run_id)
+                        futures[future] = node
+                    if not futures:
+                        if ready_queue.todo_nodes:
+                            raise RuntimeError(
+                                f"Unable to schedule new tasks although some nodes "
+                                f"have not been run:\ntodo_nodes = "
+                                f"{ready_queue.todo_nodes}\ndone_nodes = {done_nodes}"
+                            )
+                        break  # pragma: no cover
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node = futures.pop(future)
+                        try:
+                            future.result()
+                        except Exception:
+                            self._suggest_resume_scenario(pipeline, done_nodes)
+                            raise
+                        done_nodes.add(node)
+                        ready_queue.mark_done(node)
+                        self._logger.info("Completed node: %s", node.name)
+                        self._logger.info(
+                            "Completed %d out of %d tasks", len(done_nodes), len(nodes)
+                        )
+
+                        # Release any datasets we have finished with.
+                        for data_set in release_tracker.mark_done(node):
+                            catalog.release(data_set)
+        except Exception:
+            # wait for the nodes still running, so that no worker can write to
+            # the shared memory segments anymore
+            wait(futures)
+            self._release_shared_data_sets(catalog)
+            raise
+        finally:
+            if pool is not None:
+                self._close_pool(pool, run_token)  # type: ignore
+
+    def _run_inline(self, node: Node, catalog: DataCatalog, run_id: str = None):
+        """Run a node in the main thread and return a completed ``Future``
+        holding its outcome, so that it is handled like the other nodes.
+        """
+        future = Future()  # type: Future
+        try:
+            future.set_result(
+                run_node(
+                    node,
+                    catalog,
+                    self._is_async,
+                    run_id,
+                    self._io_executor,
+                    self._node_cache,
+                )
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+        return future
@@ -0,0 +1,433 @@
+"""``NodeCache`` memoizes the outputs of nodes across runs in a local,
+content-addressed cache, so that nodes whose function and inputs have not
+changed since a previous run are not executed again.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from functools import partial
+from pathlib import Path
+from types import CodeType, MethodType
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
+
+from kedro.io import AbstractVersionedDataSet, DataCatalog, DataSetError, MemoryDataSet
+from kedro.pipeline.node import Node
+from kedro.runner.runner import _parse_memory
+
+# bumped whenever the fingerprints or the layout of the entries change
+_CACHE_FORMAT = 1
+_ENTRY_SUFFIX = ".pkl"
+_STAMPS_DIR = "stamps"
+_FINGERPRINTS_DIR = "fingerprints"
+# metadata returned by filesystems which changes whenever a file does
+_STAMP_KEYS = ("ETag", "etag", "md5", "generation", "LastModified", "mtime", "size")
+
+
+class _Unhashable(Exception):
+    pass
+
+
+def _hash_value(value: Any, digest: Any) -> None:
+    try:
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception as exc:
+        raise _Unhashable(
+            f"object of type `{type(value).__name__}` cannot be pickled"
+        ) from exc
+
+
+def _hash_code(code: CodeType, digest: Any) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _hash_code(const, digest)
+        else:
+            digest.update(repr(const).encode())
+
+
+def _hash_function(func: Callable, digest: Any) -> None:
+    """Hash the bytecode of a function together with its default arguments
+    and the values it closes over. Other functions it calls by name are not
+    followed.
+    """
+    if isinstance(func, partial):
+        _hash_function(func.func, digest)
+        _hash_value((func.args, func.keywords), digest)
+        return
+    if isinstance(func, MethodType):
+        _hash_value(func.__self__, digest)
+        func = func.__func__
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # builtins and callable objects are hashed by value
+        _hash_value(func, digest)
+        return
+
+    _hash_code(code, digest)
+    _hash_value((func.__defaults__, func.__kwdefaults__), digest)
+    for cell in func.__closure__ or ():
+        value = cell.cell_contents
+        if hasattr(value, "__code__"):
+            _hash_function(value, digest)
+        else:
+            _hash_value(value, digest)
+
+
+def _data_set_stamp(catalog: DataCatalog, name: str) -> Optional[str]:
+    """Describe the current version of the data of a dataset stored on a
+    filesystem without loading it, from the metadata of its file, such as
+    its ETag or modification time.
+    """
+    data_set = catalog._data_sets.get(name)  # pylint: disable=protected-access
+    fs = getattr(data_set, "_fs", None)
+    if fs is None:
+        return None
+    get_load_path = getattr(data_set, "_get_load_path", None)
+    path = get_load_path() if get_load_path else getattr(data_set, "_filepath", None)
+    if path is None:
+        return None
+    # wait for any pending save of the data before looking at its file
+    if not catalog.exists(name):
+        return None
+    try:
+        info = fs.info(str(path))
+    except Exception:  # pylint: disable=broad-except
+        return None
+    stamp = {key: str(info[key]) for key in _STAMP_KEYS if key in info}
+    if not stamp:
+        return None
+    return repr((str(data_set), str(path), sorted(stamp.items())))
+
+
+def _is_in_memory(name: str, data_set: Any) -> bool:
+    # pylint: disable=import-outside-toplevel,cyclic-import
+    from kedro.runner.parallel_runner import _SharedMemoryDataSet
+
+    return (
+        name == "parameters"
+        or name.startswith("params:")
+        or isinstance(data_set, (MemoryDataSet, _SharedMemoryDataSet))
+    )
+
+
+class NodeCache:
+    """``NodeCache`` memoizes the outputs of nodes across runs, in a local
+    directory. Every entry is addressed by a fingerprint of the node, made
+    of the bytecode, default arguments and closure of its function, and of
+    its inputs. Inputs stored in files are fingerprinted by the metadata of
+    their file, e.g. its ETag or modification time, inputs held in memory,
+    such as parameters, by their content, and the datasets which define a
+    ``fingerprint()`` method by the string it returns. The other inputs
+    cannot be fingerprinted without loading them, so the nodes loading them
+    are not memoized. Entries are evicted in least recently used order once
+    the cache exceeds its maximum size, at the end of every run.
+
+    Nodes are assumed to be deterministic. Changes to the functions a node
+    function calls, or to global variables it reads, do not invalidate its
+    entries.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import NodeCache, SequentialRunner
+        >>>
+        >>> runner = SequentialRunner(node_cache=NodeCache("data/node_cache", "1GB"))
+    """
+
+    def __init__(self, path: Union[str, Path], max_size: Union[int, str] = None):
+        """Creates a new instance of ``NodeCache``.
+
+        Args:
+            path: The directory holding the cache entries.
+            max_size: Optional maximum size of the cache, either in bytes or
+                as a string such as "1GB". If not set, entries are never
+                evicted.
+
+        Raises:
+            ValueError: If ``max_size`` is not a valid amount of memory.
+        """
+        self._path = Path(path)
+        self._max_size = _parse_memory(max_size) if max_size is not None else None
+
+    @property
+    def _logger(self):
+        return logging.getLogger(__name__)
+
+    def key(self, node: Node, catalog: DataCatalog) -> Optional[str]:
+        """Compute the fingerprint of a node and of its inputs in ``catalog``.
+        Only the inputs held in memory are loaded and hashed.
+
+        Args:
+            node: The node to fingerprint.
+            catalog: The ``DataCatalog`` holding the inputs of the node.
+
+        Returns:
+            The key of the node outputs in the cache, or None if the node
+            function or its inputs cannot be fingerprinted.
+
+        """
+        # pylint: disable=protected-access
+        digest = hashlib.sha256()
+        digest.update(repr((_CACHE_FORMAT, node._inputs, node._outputs)).encode())
+        try:
+            for func in (node.func, *node._decorators):
+                _hash_function(func, digest)
+            for name in node.inputs:
+                digest.update(name.encode())
+                self._hash_input(catalog, name, digest)
+        except _Unhashable as exc:
+            self._logger.warning("Node `%s` cannot be memoized: %s.", node.name, exc)
+            return None
+        return digest.hexdigest()
+
+    def _hash_input(self, catalog: DataCatalog, name: str, digest: Any) -> None:
+        data_set = catalog._data_sets.get(name)  # pylint: disable=protected-access
+        if _is_in_memory(name, data_set):
+            _hash_value(catalog.load(name), digest)
+            return
+        stamp = _data_set_stamp(catalog, name)
+        if stamp is not None:
+            digest.update(self._resolve_stamp(stamp).encode())
+            return
+
+        fingerprint = getattr(data_set, "fingerprint", None)
+        if callable(fingerprint):
+            stamp = fingerprint()
+        elif isinstance(data_set, AbstractVersionedDataSet):
+            try:
+                stamp = repr((str(data_set), data_set.resolve_load_version()))
+            except DataSetError:
+                stamp = None
+        if stamp is None:
+            raise _Unhashable(
+                f"input `{name}` cannot be fingerprinted without loading it"
+            )
+        digest.update(str(stamp).encode())
+
+    def fingerprint(self, node: Node, catalog: DataCatalog) -> Optional[str]:
+        """Compute the fingerprint of the code of a node and of the parameters
+        it loads, leaving out its other inputs.
+
+        Args:
+            node: The node to fingerprint.
+            catalog: The ``DataCatalog`` holding the parameters.
+
+        Returns:
+            The fingerprint, or None if the node function or its parameters
+            cannot be fingerprinted.
+
+        """
+        # pylint: disable=protected-access
+        digest = hashlib.sha256()
+        digest.update(repr((_CACHE_FORMAT, node._inputs, node._outputs)).encode())
+        try:
+            for func in (node.func, *node._decorators):
+                _hash_function(func, digest)
+            for name in node.inputs:
+                if name == "parameters" or name.startswith("params:"):
+                    _hash_value(catalog.load(name), digest)
+        except _Unhashable:
+            return None
+        return digest.hexdigest()
+
+    def _fingerprint_path(self, node: Node) -> Path:
+        node_id = hashlib.sha256(node.name.encode()).hexdigest()
+        return self._path / _FINGERPRINTS_DIR / node_id
+
+    def record_fingerprint(self, node: Node, catalog: DataCatalog) -> None:
+        """Record the fingerprint of the code and parameters of a node which
+        has just run, as given by ``fingerprint()``.
+
+        Args:
+            node: The node which has run.
+            catalog: The ``DataCatalog`` holding the parameters.
+
+        """
+        fingerprint = self.fingerprint(node, catalog)
+        if fingerprint is not None:
+            self._write(
+                self._fingerprint_path(node),
+                lambda file: file.write(fingerprint.encode()),  # type: ignore
+            )
+
+    def is_changed(self, node: Node, catalog: DataCatalog) -> bool:
+        """Tell whether the code or the parameters of a node have changed
+        since the node last ran with this cache.
+
+        Args:
+            node: The node to check.
+            catalog: The ``DataCatalog`` holding the parameters.
+
+        Returns:
+            True if the fingerprint of the node differs from the one recorded
+            when it last ran, if none was recorded or if it cannot be
+            fingerprinted.
+
+        """
+        try:
+            recorded = self._fingerprint_path(node).read_text()
+        except FileNotFoundError:
+            return True
+        return recorded != self.fingerprint(node, catalog)
+
+    def _entry_path(self, key: str) -> Path:
+        return self._path / f"{key}{_ENTRY_SUFFIX}"
+
+    def _stamp_path(self, stamp: str) -> Path:
+        return self._path / _STAMPS_DIR / hashlib.sha256(stamp.encode()).hexdigest()
+
+    def _resolve_stamp(self, stamp: str) -> str:
+        path = self._stamp_path(stamp)
+        try:
+            content_id = path.read_text()
+            os.utime(path)
+        except FileNotFoundError:
+            return stamp
+        return content_id
+
+    def _write(self, path: Path, write: Callable[[BinaryIO], None]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # files are written under a temporary name and moved in place, so
+        # that concurrent runs never read a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up the outputs cached under a key.
+
+        Args:
+            key: The key of the outputs, as given by ``key()``.
+
+        Returns:
+            A mapping of the output names to their data, or None if the
+            outputs are not cached.
+
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as file:
+                pickle.load(file)  # metadata
+                outputs = pickle.load(file)
+            # mark the entry as the most recently used one
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.warning("Ignoring invalid node cache entry `%s`: %s", key, exc)
+            return None
+        return outputs
+
+    def put(self, key: str, node: Node, outputs: Dict[str, Any]) -> None:
+        """Cache the outputs of a node. Outputs which cannot be pickled are not
+        cached. The cache is not pruned: the runners call ``prune()`` once at
+        the end of every run.
+
+        Args:
+            key: The key of the outputs, as given by ``key()``.
+            node: The node which produced the outputs.
+            outputs: A mapping of the output names to their data.
+
+        """
+        metadata = {"node": node.name, "outputs": sorted(outputs), "key": key}
+
+        def _write_entry(file: BinaryIO) -> None:
+            pickle.dump(metadata, file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(outputs, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        try:
+            self._write(self._entry_path(key), _write_entry)
+        except Exception as exc:  # pylint: disable=broad-except
+            self._logger.warning(
+                "Outputs of node `%s` cannot be memoized: %s", node.name, exc
+            )
+            return
+
+    def link_outputs(self, key: str, node: Node, catalog: DataCatalog) -> None:
+        """Record that the files of the outputs of a node, as they were just
+        saved, hold the outputs cached under ``key``. The nodes loading them
+        are then fingerprinted by this key rather than by the metadata of the
+        files, which changes every time the outputs are saved again.
+
+        Args:
+            key: The key of the outputs, as given by ``key()``.
+            node: The node which produced the outputs.
+            catalog: The ``DataCatalog`` the outputs were saved to.
+
+        """
+        for name in node.outputs:
+            stamp = _data_set_stamp(catalog, name)
+            if stamp is not None:
+                self._link(stamp, hashlib.sha256(f"{key}:{name}".encode()).hexdigest())
+
+    def _link(self, stamp: str, content_id: str) -> None:
+        self._write(
+            self._stamp_path(stamp), lambda file: file.write(content_id.encode())
+        )
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """List the entries of the cache, most recently used first.
+
+        Returns:
+            A list of dictionaries with the ``key`` of every entry, the
+            ``node`` and ``outputs`` it holds, its ``size`` in bytes and the
+            time it was ``last_used`` at, in seconds since the epoch.
+
+        """
+        entries = []
+        for path in self._path.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                with open(path, "rb") as file:
+                    metadata = pickle.load(file)
+                stat = path.stat()
+            except FileNotFoundError:  # pragma: no cover
+                continue  # evicted concurrently
+            entries.append(dict(metadata, size=stat.st_size, last_used=stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry["last_used"], reverse=True)
+
+    def prune(self, max_size: Union[int, str] = None) -> List[Dict[str, Any]]:
+        """Evict the least recently used entries until the cache fits in a
+        maximum size.
+
+        Args:
+            max_size: The maximum size of the cache, either in bytes or as a
+                string such as "1GB". Defaults to the maximum size of the
+                cache, if any.
+
+        Returns:
+            The evicted entries, as listed by ``entries()``.
+
+        """
+        max_size = _parse_memory(max_size) if max_size is not None else self._max_size
+        if max_size is None:
+            return []
+
+        entries = self.entries()
+        total_size = sum(entry["size"] for entry in entries)
+        evicted = []
+        while entries and total_size > max_size:
+            entry = entries.pop()
+            try:
+                os.remove(self._entry_path(entry["key"]))
+            except FileNotFoundError:  # pragma: no cover
+                pass  # evicted concurrently
+            total_size -= entry["size"]
+            evicted.append(entry)
+
+        # forget the links of outputs older than any entry left
+        oldest = entries[-1]["last_used"] if entries else float("inf")
+        for path in (self._path / _STAMPS_DIR).glob("*"):
+            try:
+                if path.stat().st_mtime < oldest:
+                    os.remove(path)
+            except FileNotFoundError:  # pragma: no cover
+                pass  # removed concurrently
+        return evicted
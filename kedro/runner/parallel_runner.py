@@ -2,30 +2,196 @@
 be used to run the ``Pipeline`` in parallel groups formed by toposort.
 """
 import logging.config
+import mmap
 import multiprocessing
 import os
 import pickle
 import sys
-from collections import Counter
-from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from itertools import chain
 from multiprocessing.managers import BaseProxy, SyncManager  # type: ignore
 from multiprocessing.reduction import ForkingPickler
 from pickle import PicklingError
-from typing import Any, Dict, Iterable, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+try:
+    from multiprocessing import resource_tracker  # type: ignore
+    from multiprocessing.shared_memory import SharedMemory  # type: ignore
+except ImportError:  # pragma: no cover
+    # ``multiprocessing.shared_memory``, its resource tracker and pickle
+    # protocol 5 need Python 3.8+
+    resource_tracker = SharedMemory = None
 
 from kedro.io import DataCatalog, DataSetError, MemoryDataSet
 from kedro.pipeline import Pipeline
+from kedro.pipeline.execution_plan import ExecutionPlan
 from kedro.pipeline.node import Node
-from kedro.runner.runner import AbstractRunner, run_node
+from kedro.pipeline.pipeline import TRANSCODING_SEPARATOR
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.runner import (
+    _SPECULATION_INTERVAL,
+    AbstractRunner,
+    _ClaimingCatalog,
+    _IOExecutor,
+    _critical_path_priorities,
+    _duration_history,
+    _estimate_durations,
+    _parse_memory,
+    _ReadyQueue,
+    _ResourceBudget,
+    _simulate_makespan,
+    _Speculator,
+    _validate_priority,
+    run_node,
+)
+from kedro.runner.trace import RunTracer, _no_span
 
 # see https://github.com/python/cpython/blob/master/Lib/concurrent/futures/process.py#L114
 _MAX_WINDOWS_WORKERS = 61
 
+# Windows frees a named shared memory block as soon as its creator closes it,
+# so intermediate data is only moved through shared memory on POSIX systems.
+_USE_SHARED_MEMORY = SharedMemory is not None and os.name != "nt"
+
+# Buffers smaller than this stay inside the pickled payload, since a shared
+# memory segment is not worth the extra system calls for them.
+_MIN_SHARED_BUFFER_SIZE = 64 * 1024
+
+# Tasks known to run faster than this, in seconds, are batched together when
+# node fusion is enabled, since scheduling them costs as much as running them.
+_TINY_TASK_DURATION = 0.01
+
+# In adaptive mode, workers idle for longer than this, in seconds, are shut
+# down, and the pool is resized at least this often while tasks are waiting.
+_IDLE_TIMEOUT = 1.0
+_SCALE_INTERVAL = 0.1
+
+# Fraction of the memory of the machine which must be available for the
+# adaptive pool to start another worker.
+_MIN_AVAILABLE_MEMORY = 0.1
+
+
+def _map_read_only(name: str, size: int) -> memoryview:
+    """Map an existing shared memory segment into this process as a read-only
+    buffer. The mapping stays alive for as long as the buffer is referenced,
+    i.e. for as long as the data deserialised on top of it.
+    """
+    segment = SharedMemory(name=name)
+    try:
+        # pylint: disable=protected-access
+        mapped = mmap.mmap(segment._fd, size, access=mmap.ACCESS_READ)
+    finally:
+        segment.close()
+    return memoryview(mapped)
+
+
+class _SharedMemoryPayload:
+    """``_SharedMemoryPayload`` is the form in which data saved to a
+    ``_SharedMemoryDataSet`` travels through the manager process. Large
+    contiguous buffers, such as the ones backing NumPy arrays, pandas DataFrames
+    or Arrow tables, are copied once into shared memory segments using pickle
+    protocol 5, so that only their names go through the manager and consumers
+    map them without copying.
+    """
+
+    def __init__(self, data: Any):
+        """Creates a new instance of ``_SharedMemoryPayload``, writing the
+        out-of-band buffers of ``data`` to new shared memory segments.
+
+        Args:
+            data: The data to share with other processes.
+
+        """
+        buffers = []  # type: List[pickle.PickleBuffer]
+
+        def _buffer_callback(buffer: pickle.PickleBuffer) -> bool:
+            # returning a true value keeps the buffer in the pickled stream
+            if buffer.raw().nbytes < _MIN_SHARED_BUFFER_SIZE:
+                return True
+            buffers.append(buffer)
+            return False
+
+        self.pickled = pickle.dumps(data, protocol=5, buffer_callback=_buffer_callback)
+        self.segments = []  # type: List[Tuple[str, int]]
+        try:
+            for buffer in buffers:
+                raw = buffer.raw()
+                segment = SharedMemory(create=True, size=raw.nbytes)
+                segment.buf[: raw.nbytes] = raw
+                self.segments.append((segment.name, raw.nbytes))
+                segment.close()
+        except Exception:
+            self.unlink()
+            raise
+
+    def load(self) -> Any:
+        """Rebuild the data on top of read-only mappings of the segments.
+
+        Returns:
+            The data, whose large buffers are shared rather than copied.
+
+        """
+        buffers = [_map_read_only(name, size) for name, size in self.segments]
+        return pickle.loads(self.pickled, buffers=buffers)
+
+    def unlink(self) -> None:
+        """Free the shared memory segments. Processes which still map them keep
+        access to the data until they drop it."""
+        for name, _ in self.segments:
+            try:
+                segment = SharedMemory(name=name)
+            except FileNotFoundError:
+                continue
+            segment.close()
+            segment.unlink()
+        self.segments = []
+
+
+class _SharedMemoryStore(MemoryDataSet):
+    """``_SharedMemoryStore`` is the ``MemoryDataSet`` hosted by the manager
+    process for every ``_SharedMemoryDataSet``. It frees the shared memory
+    segments of the stored payload when it is overwritten or released.
+    """
+
+    def __init__(self):
+        # Data always reaches the manager process pickled, so it is never
+        # shared with the caller and does not need to be copied again.
+        super().__init__(copy_mode="assign")
+
+    def _save(self, data: Any):
+        self._unlink()
+        super()._save(data)
+
+    def _release(self) -> None:
+        self._unlink()
+        super()._release()
+
+    def _unlink(self) -> None:
+        if isinstance(self._data, _SharedMemoryPayload):
+            self._data.unlink()
+
 
 class _SharedMemoryDataSet:
     """``_SharedMemoryDataSet`` is a wrapper class for a shared MemoryDataSet in SyncManager.
-    It is not inherited from AbstractDataSet class.
+    It is not inherited from AbstractDataSet class. On POSIX systems with
+    Python 3.8+, large buffers of the data are transferred through
+    ``multiprocessing.shared_memory`` segments, which consumers map read-only
+    without copying; the segments are freed on ``release()``.
     """
 
     def __init__(self, manager: SyncManager):
@@ -36,7 +202,7 @@ class _SharedMemoryDataSet:
             manager: An instance of multiprocessing manager for shared objects.
 
         """
-        self.shared_memory_dataset = manager.MemoryDataSet()  # type: ignore
+        self.shared_memory_dataset = manager.SharedMemoryStore()  # type: ignore
 
     def __getattr__(self, name):
         # This if condition prevents recursive call when deserializing
@@ -44,10 +210,20 @@ class _SharedMemoryDataSet:
             raise AttributeError()
         return getattr(self.shared_memory_dataset, name)
 
+    def load(self) -> Any:
+        """Calls load method of a shared MemoryDataSet in SyncManager."""
+        data = self.shared_memory_dataset.load()
+        if isinstance(data, _SharedMemoryPayload):
+            return data.load()
+        return data
+
     def save(self, data: Any):
         """Calls save method of a shared MemoryDataSet in SyncManager."""
         try:
-            self.shared_memory_dataset.save(data)
+            payload = data
+            if _USE_SHARED_MEMORY and data is not None:
+                payload = _SharedMemoryPayload(data)
+            self.shared_memory_dataset.save(payload)
         except Exception as exc:  # pylint: disable=broad-except
             # Checks if the error is due to serialisation or not
             try:
@@ -70,6 +246,9 @@ class ParallelRunnerManager(SyncManager):
 ParallelRunnerManager.register(  # pylint: disable=no-member
     "MemoryDataSet", MemoryDataSet
 )
+ParallelRunnerManager.register(  # pylint: disable=no-member
+    "SharedMemoryStore", _SharedMemoryStore
+)
 
 
 def _bootstrap_subprocess(package_name: str, conf_logging: Dict[str, Any]):
@@ -80,15 +259,16 @@ def _bootstrap_subprocess(package_name: str, conf_logging: Dict[str, Any]):
     logging.config.dictConfig(conf_logging)
 
 
-def _run_node_synchronization(  # pylint: disable=too-many-arguments
-    node: Node,
-    catalog: DataCatalog,
-    is_async: bool = False,
-    run_id: str = None,
+# State installed in every worker process by ``_init_worker``
+_WORKER_STATE = {}  # type: Dict[str, Any]
+
+
+def _init_worker(
+    run_states: Mapping[str, Any],
     package_name: str = None,
     conf_logging: Dict[str, Any] = None,
-) -> Node:
-    """Run a single `Node` with inputs from and outputs to the `catalog`.
+) -> None:
+    """Initialise a worker process of the ``ParallelRunner`` pool.
     `KedroSession` instance is activated in every subprocess because of Windows
     (and latest OSX with Python 3.8) limitation.
     Windows has no "fork", so every subprocess is a brand new process
@@ -96,23 +276,521 @@ def _run_node_synchronization(  # pylint: disable=too-many-arguments
     the hooks, and c) activate `KedroSession` in every subprocess.
 
     Args:
-        node: The ``Node`` to run.
-        catalog: A ``DataCatalog`` containing the node's inputs and outputs.
-        is_async: If True, the node inputs and outputs are loaded and saved
-            asynchronously with threads. Defaults to False.
-        run_id: The id of the pipeline run.
+        run_states: A mapping of run tokens to the state of each run, i.e. its
+            nodes, ``DataCatalog``, ``is_async`` flag and run id. The state is
+            installed in the worker once per run, rather than sent with every
+            node submission, so that the cost of scheduling a node does not
+            depend on the size of the catalog. The states of a reused pool are
+            published by the runner in a managed dictionary and stored pickled.
         package_name: The name of the project Python package.
         conf_logging: A dictionary containing logging configuration.
 
-    Returns:
-        The node argument.
-
     """
     if multiprocessing.get_start_method() == "spawn" and package_name:  # type: ignore
         conf_logging = conf_logging or {}
         _bootstrap_subprocess(package_name, conf_logging)
 
-    return run_node(node, catalog, is_async, run_id)
+    _WORKER_STATE.clear()
+    _WORKER_STATE["run_states"] = run_states
+
+
+def _install_run_state(run_token: str) -> None:
+    """Install the state of the run identified by ``run_token`` in the worker
+    process, unless it is already the current one.
+    """
+    if _WORKER_STATE.get("run_token") == run_token:
+        return
+
+    run_state = _WORKER_STATE["run_states"][run_token]
+    if isinstance(run_state, bytes):
+        run_state = pickle.loads(run_state)
+    # the path and origin of the trace, and the list the spans are sent to
+    trace = run_state.get("trace")
+    previous = _WORKER_STATE.get("io_executor")
+    if previous is not None:
+        previous.shutdown()
+    _WORKER_STATE.update(
+        run_state,
+        run_token=run_token,
+        held_data={},
+        io_executor=_IOExecutor(run_state.get("io_limits")),
+        node_cache=run_state.get("node_cache"),
+        tracer=RunTracer(*trace[:2]) if trace else None,
+    )
+
+
+def _send_trace_events() -> None:
+    """Send the spans recorded in the worker process to the runner, through
+    the managed list of the run.
+    """
+    tracer = _WORKER_STATE["tracer"]
+    if tracer is not None:
+        _WORKER_STATE["trace"][2].extend(tracer.pop_events())
+
+
+def _run_node_synchronization(
+    node_name: str, run_token: str, attempt: int = None
+) -> Dict[str, float]:
+    """Run a single `Node` with inputs from and outputs to the `catalog`
+    of the run installed in the worker process.
+
+    Args:
+        node_name: The name of the ``Node`` to run.
+        run_token: The token identifying the run the node belongs to.
+        attempt: The number of the attempt of an idempotent node which may
+            run several times at once in speculative mode. Only the attempt
+            which is the first to save an output saves the node outputs.
+
+    Returns:
+        A mapping of the node name to the time the node took to run, measured
+        in the worker so that it leaves out the time the node was queued for.
+
+    """
+    _install_run_state(run_token)
+    node = _WORKER_STATE["nodes"][node_name]
+    catalog = _WORKER_STATE["catalog"]
+    if attempt is not None:
+        catalog = _ClaimingCatalog(catalog, node, attempt, _WORKER_STATE["claims"])
+    start = time.perf_counter()
+    try:
+        run_node(
+            node,
+            catalog,
+            _WORKER_STATE["is_async"],
+            _WORKER_STATE["run_id"],
+            _WORKER_STATE["io_executor"],
+            _WORKER_STATE["node_cache"],
+            _WORKER_STATE["tracer"],
+        )
+    finally:
+        _send_trace_events()
+    return {node_name: time.perf_counter() - start}
+
+
+def _run_nodes_synchronization(
+    node_names: Sequence[str],
+    run_token: str,
+    local_data_sets: Sequence[str] = (),
+    held_data_sets: Sequence[str] = (),
+) -> Dict[str, float]:
+    """Run several nodes one after the other in the worker process, with
+    inputs from and outputs to the `catalog` of the run installed in it.
+
+    Args:
+        node_names: The names of the nodes to run, in topological order.
+        run_token: The token identifying the run the nodes belong to.
+        local_data_sets: Names of the datasets which are only used by these
+            nodes. They are kept in the memory of the worker process instead
+            of going through the manager.
+        held_data_sets: Names of the datasets saved by these nodes which are
+            only loaded by a node later run in the same worker. They are held
+            in the memory of the worker process until that node loads them.
+
+    Returns:
+        A mapping of the node names to the time they took to run.
+
+    """
+    _install_run_state(run_token)
+    nodes = _WORKER_STATE["nodes"]
+    held_data = _WORKER_STATE["held_data"]
+    catalog = _WORKER_STATE["catalog"]
+    held_inputs = [
+        name
+        for node_name in node_names
+        for name in nodes[node_name].inputs
+        if name in held_data
+    ]
+    if local_data_sets or held_data_sets or held_inputs:
+        catalog = catalog.shallow_copy()
+        for name in local_data_sets:
+            catalog.add(name, MemoryDataSet(copy_mode="assign"), replace=True)
+        for name in held_inputs:
+            catalog.add(name, held_data.pop(name), replace=True)
+        for name in held_data_sets:
+            held_data[name] = MemoryDataSet(copy_mode="assign")
+            catalog.add(name, held_data[name], replace=True)
+
+    durations = {}
+    try:
+        for node_name in node_names:
+            start = time.perf_counter()
+            run_node(
+                nodes[node_name],
+                catalog,
+                _WORKER_STATE["is_async"],
+                _WORKER_STATE["run_id"],
+                _WORKER_STATE["io_executor"],
+                _WORKER_STATE["node_cache"],
+                _WORKER_STATE["tracer"],
+            )
+            durations[node_name] = time.perf_counter() - start
+    finally:
+        _send_trace_events()
+    return durations
+
+
+# the tokens of the ``_InitializingPool`` instances initialised in this worker
+_INITIALIZED_POOLS = set()  # type: Set[str]
+
+
+def _run_initialized(
+    token: str, initializer: Callable, initargs: Tuple, fn: Callable, *args: Any
+) -> Any:
+    """Run the initializer of a ``_InitializingPool`` in the worker process
+    before its first task, then the task itself."""
+    if token not in _INITIALIZED_POOLS:
+        initializer(*initargs)
+        _INITIALIZED_POOLS.add(token)
+    return fn(*args)
+
+
+class _InitializingPool(ProcessPoolExecutor):
+    """``_InitializingPool`` is a ``ProcessPoolExecutor`` for Python 3.6, whose
+    pool has no ``initializer`` argument. The initializer is sent along with
+    every task instead, and run by every worker process before its first one.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None,
+        initializer: Callable = None,
+        initargs: Tuple = (),
+    ):
+        """Creates a new instance of ``_InitializingPool``.
+
+        Args:
+            max_workers: Number of worker processes.
+            initializer: Callable run at the start of every worker process.
+            initargs: Arguments passed to ``initializer``.
+
+        """
+        super().__init__(max_workers=max_workers)
+        self._token = uuid.uuid4().hex
+        self._init_call = (initializer, initargs)
+
+    def submit(self, fn: Callable, *args: Any) -> Future:  # type: ignore
+        initializer, initargs = self._init_call
+        if initializer is None:
+            return super().submit(fn, *args)
+        return super().submit(
+            _run_initialized, self._token, initializer, initargs, fn, *args
+        )
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # pylint: disable=invalid-name
+    ProcessPoolExecutor = _InitializingPool  # type: ignore  # noqa: F811
+
+
+class _AffinityPool:
+    """``_AffinityPool`` is a pool of worker processes in which a task can be
+    submitted to a given worker, so that it runs where the data it needs is
+    held. It is made of single-process ``ProcessPoolExecutor`` instances.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        initializer: Callable = None,
+        initargs: Tuple = (),
+    ):
+        """Creates a new instance of ``_AffinityPool``.
+
+        Args:
+            max_workers: Number of worker processes.
+            initializer: Callable run at the start of every worker process.
+            initargs: Arguments passed to ``initializer``.
+
+        """
+        self._workers = [
+            ProcessPoolExecutor(
+                max_workers=1, initializer=initializer, initargs=initargs
+            )
+            for _ in range(max_workers)
+        ]
+        self._pending = [set() for _ in self._workers]  # type: List[Set[Future]]
+
+    def _prune(self) -> None:
+        """Forget the completed tasks of every worker."""
+        for pending in self._pending:
+            pending.difference_update([f for f in pending if f.done()])
+
+    def least_busy(self) -> int:
+        """Return the index of the worker with the fewest pending tasks."""
+        self._prune()
+        return min(range(len(self._workers)), key=lambda w: len(self._pending[w]))
+
+    def submit_to(self, worker: int, fn: Callable, *args: Any) -> Future:
+        """Submit a task to the worker with index ``worker``."""
+        future = self._workers[worker].submit(fn, *args)
+        self._pending[worker].add(future)
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down all the worker processes."""
+        for worker in self._workers:
+            worker.shutdown(wait=wait)
+
+
+def _terminate_pool(pool: Union[ProcessPoolExecutor, _AffinityPool]) -> None:
+    """Kill the worker processes of a pool, which may be running discarded
+    attempts of nodes, and shut it down. ``shutdown(wait=False)`` cannot be
+    used instead, as it breaks the pool on Python 3.8.
+    """
+    # pylint: disable=protected-access
+    executors = pool._workers if isinstance(pool, _AffinityPool) else [pool]
+    for executor in executors:
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+    pool.shutdown()
+
+
+def _available_memory() -> Optional[Tuple[int, int]]:
+    """Return the memory available to new processes and the total memory of
+    the machine, in bytes, or ``None`` where they cannot be measured.
+    """
+    try:
+        with open("/proc/meminfo") as meminfo:
+            fields = dict(line.split(":", 1) for line in meminfo)
+        # reported in kB, and unlike free memory it counts reclaimable caches
+        return (
+            int(fields["MemAvailable"].split()[0]) * 1024,
+            int(fields["MemTotal"].split()[0]) * 1024,
+        )
+    except (OSError, KeyError, ValueError):  # pragma: no cover
+        pass
+    try:  # pragma: no cover
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        return (
+            os.sysconf("SC_AVPHYS_PAGES") * page_size,
+            os.sysconf("SC_PHYS_PAGES") * page_size,
+        )
+    except (AttributeError, OSError, ValueError):  # pragma: no cover
+        return None
+
+
+def _has_spare_capacity() -> bool:
+    """Tell whether the machine can take one more worker process, i.e. its
+    load average over the last minute is below its number of cores and at
+    least ``_MIN_AVAILABLE_MEMORY`` of its memory is available. What cannot
+    be measured, e.g. the load average on Windows, is not limiting.
+    """
+    try:
+        if os.getloadavg()[0] >= (os.cpu_count() or 1):
+            return False
+    except (AttributeError, OSError):  # pragma: no cover
+        pass
+    memory = _available_memory()
+    return memory is None or memory[0] >= memory[1] * _MIN_AVAILABLE_MEMORY
+
+
+class _AdaptivePool(_AffinityPool):
+    """``_AdaptivePool`` is a pool of worker processes which starts with a
+    single worker, grows while ready tasks wait for a free worker and the
+    machine has CPU and memory to spare, and shrinks when its workers stay
+    idle, so that a run only starts the processes it keeps busy.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        initializer: Callable = None,
+        initargs: Tuple = (),
+    ):
+        """Creates a new instance of ``_AdaptivePool``.
+
+        Args:
+            max_workers: Maximum number of worker processes.
+            initializer: Callable run at the start of every worker process.
+            initargs: Arguments passed to ``initializer``.
+
+        """
+        super().__init__(1, initializer=initializer, initargs=initargs)
+        self._max_workers = max_workers
+        self._initializer = initializer
+        self._initargs = initargs
+        # when each worker last became idle, ``None`` while it is busy
+        self._idle_since = [time.monotonic()]  # type: List[Optional[float]]
+
+    @property
+    def size(self) -> int:
+        """The number of worker processes currently in the pool."""
+        return len(self._workers)
+
+    def idle_workers(self) -> List[int]:
+        """Return the indices of the workers without pending tasks."""
+        self._prune()
+        now = time.monotonic()
+        idle = []
+        for worker, pending in enumerate(self._pending):
+            if not pending:
+                if self._idle_since[worker] is None:
+                    self._idle_since[worker] = now
+                idle.append(worker)
+        return idle
+
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        """Submit a task to the least busy worker."""
+        return self.submit_to(self.least_busy(), fn, *args)
+
+    def submit_to(self, worker: int, fn: Callable, *args: Any) -> Future:
+        """Submit a task to the worker with index ``worker``."""
+        self._idle_since[worker] = None
+        return super().submit_to(worker, fn, *args)
+
+    def scale(self, waiting: int) -> None:
+        """Resize the pool for the number of ready tasks waiting for a free
+        worker. The pool grows by at most its current size at once, since the
+        load of the workers it starts only shows in the load average later.
+        Idle workers are shut down after ``_IDLE_TIMEOUT`` seconds, or at once
+        if the machine is short of CPU or memory, always keeping one worker.
+
+        Args:
+            waiting: The number of ready tasks not submitted yet.
+
+        """
+        idle = self.idle_workers()
+        if waiting > len(idle):
+            if self.size < self._max_workers and _has_spare_capacity():
+                missing = min(waiting - len(idle), self._max_workers - self.size)
+                for _ in range(min(missing, self.size)):
+                    self._workers.append(
+                        ProcessPoolExecutor(
+                            max_workers=1,
+                            initializer=self._initializer,
+                            initargs=self._initargs,
+                        )
+                    )
+                    self._pending.append(set())
+                    self._idle_since.append(time.monotonic())
+            return
+
+        timeout = _IDLE_TIMEOUT if _has_spare_capacity() else 0.0
+        deadline = time.monotonic() - timeout
+        surplus = idle[waiting:]
+        for worker in reversed(surplus):
+            if self.size > 1 and self._idle_since[worker] <= deadline:  # type: ignore
+                self._workers.pop(worker).shutdown()
+                del self._pending[worker]
+                del self._idle_since[worker]
+
+
+def _fuse_chains(plan: ExecutionPlan) -> List[Tuple[Node, ...]]:
+    """Group the nodes of a plan into chains, in which every node is the only
+    child of the previous node and has no other parent, so that each chain
+    can run as one task in a single worker.
+    """
+    children = defaultdict(list)  # type: Dict[Node, List[Node]]
+    for node, parents in plan.node_dependencies.items():
+        for parent in parents:
+            children[parent].append(node)
+
+    chains = {}  # type: Dict[Node, List[Node]]
+    for node in plan.nodes:
+        parents = plan.node_dependencies[node]
+        if len(parents) == 1:
+            (parent,) = parents
+            if len(children[parent]) == 1:
+                chains[node] = chains[parent]
+                chains[node].append(node)
+                continue
+        chains[node] = [node]
+    return list(dict.fromkeys(tuple(chain_) for chain_ in chains.values()))
+
+
+def _task_dependencies(
+    tasks: Iterable[Tuple[Node, ...]], plan: ExecutionPlan
+) -> Dict[Tuple[Node, ...], Set[Tuple[Node, ...]]]:
+    """Map every task to the set of tasks it depends on. Parents which are
+    not part of any task are kept as they are, and are never satisfied.
+    """
+    task_of = {node: task for task in tasks for node in task}
+    return {
+        task: {
+            task_of.get(parent, parent)
+            for node in task
+            for parent in plan.node_dependencies[node]
+        }
+        - {task}
+        for task in task_of.values()
+    }
+
+
+def _local_data_sets(
+    task: Tuple[Node, ...], plan: ExecutionPlan, catalog: DataCatalog
+) -> Tuple[str, ...]:
+    """Return the default datasets which are produced and entirely consumed
+    by the nodes of a task, and can therefore stay in the worker memory.
+    """
+    data_sets = catalog._data_sets  # pylint: disable=protected-access
+    loads = Counter(chain.from_iterable(n.inputs for n in task))
+    return tuple(
+        name
+        for name in chain.from_iterable(n.outputs for n in task)
+        if loads[name]
+        and loads[name] == plan.load_counts.get(name)
+        and name not in plan.outputs
+        and TRANSCODING_SEPARATOR not in name
+        and isinstance(data_sets.get(name), _SharedMemoryDataSet)
+    )
+
+
+def _affine_data_sets(
+    tasks: Sequence[Tuple[Node, ...]],
+    plan: ExecutionPlan,
+    catalog: DataCatalog,
+) -> Dict[Tuple[Node, ...], Tuple[Tuple[Node, ...], str]]:
+    """Choose, for every task, at most one of its inputs which only this task
+    loads and which another task saves to a default dataset. That input can
+    be held in the memory of the worker which ran the task saving it, if the
+    task loading it runs in the same worker.
+
+    Returns:
+        A mapping of tasks to the task saving their chosen input and the
+        name of that input.
+
+    """
+    data_sets = catalog._data_sets  # pylint: disable=protected-access
+    producers = {name: task for task in tasks for node in task for name in node.outputs}
+    affinity = {}  # type: Dict[Tuple[Node, ...], Tuple[Tuple[Node, ...], str]]
+    for task in tasks:
+        for name in chain.from_iterable(n.inputs for n in task):
+            producer = producers.get(name)
+            if (
+                producer is not None
+                and producer != task
+                and plan.load_counts.get(name) == 1
+                and name not in plan.outputs
+                and TRANSCODING_SEPARATOR not in name
+                and isinstance(data_sets.get(name), _SharedMemoryDataSet)
+            ):
+                affinity[task] = (producer, name)
+                break
+    return affinity
+
+
+def _batch_tiny_tasks(
+    tasks: Iterable[Tuple[Node, ...]], node_durations: Dict[str, float]
+) -> List[List[Tuple[Node, ...]]]:
+    """Pack the tasks which previous runs found to take less than
+    ``_TINY_TASK_DURATION`` in total into batches no longer than that, so that
+    they share one submission. Any other task is submitted on its own.
+    """
+    batches = []  # type: List[List[Tuple[Node, ...]]]
+    batch = None  # type: Optional[List[Tuple[Node, ...]]]
+    batch_duration = 0.0
+    for task in tasks:
+        duration = sum(node_durations.get(n.name, _TINY_TASK_DURATION) for n in task)
+        if duration >= _TINY_TASK_DURATION:
+            batches.append([task])
+            continue
+        if batch is None or batch_duration + duration > _TINY_TASK_DURATION:
+            # a batch keeps the position of its first task
+            batch, batch_duration = [], 0.0
+            batches.append(batch)
+        batch.append(task)
+        batch_duration += duration
+    return batches
 
 
 class ParallelRunner(AbstractRunner):
@@ -123,7 +801,22 @@ class ParallelRunner(AbstractRunner):
     single process only using the `_SINGLE_PROCESS` dataset attribute.
     """
 
-    def __init__(self, max_workers: int = None, is_async: bool = False):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_workers: int = None,
+        is_async: bool = False,
+        priority: str = None,
+        node_durations: Dict[str, float] = None,
+        reuse_workers: bool = False,
+        max_memory: Union[int, str] = None,
+        fuse_nodes: bool = False,
+        locality: bool = False,
+        io_limits: Dict[str, int] = None,
+        node_cache: NodeCache = None,
+        adaptive: bool = False,
+        speculative: bool = False,
+        tracer: RunTracer = None,
+    ):
         """
         Instantiates the runner by creating a Manager.
 
@@ -134,13 +827,97 @@ class ParallelRunner(AbstractRunner):
                 cannot be larger than 61 and will be set to min(61, max_workers).
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            priority: Optional policy used to pick among ready nodes when
+                there are more of them than free workers. The only available
+                policy is "critical_path", which submits first the nodes with
+                the longest estimated remaining downstream path. If not set,
+                ready nodes are submitted in the order they became ready.
+            node_durations: Optional mapping of node names to their duration
+                in seconds, e.g. ``node_durations`` of a previous run, used by
+                the "critical_path" policy. Nodes without an estimate are
+                assumed to take the mean duration, or one second if no
+                estimates are provided.
+            reuse_workers: If True, the worker processes are started on the
+                first run and kept alive, with the project already imported,
+                for the following runs of this runner, until ``close`` is
+                called. Otherwise a new pool of worker processes is started
+                for every run. Defaults to False.
+            max_memory: Optional memory budget of the run, either in bytes or
+                as a string such as "16GB". Nodes declare the memory they need
+                with a ``memory:<amount>`` tag, e.g. ``memory:2GB``, and the
+                CPU slots they take with a ``cpus:<n>`` tag, out of
+                ``max_workers`` slots. Ready nodes only start while the
+                resources they declare are available. If not set, memory is
+                not limited.
+            fuse_nodes: If True, every chain of nodes in which each node is
+                the only child of the previous one runs as a single task in
+                one worker, with the default datasets passed along the chain
+                kept in the memory of the worker. Ready tasks which took less
+                than 10ms in previous runs of the runner, as recorded in
+                ``node_durations``, are also batched into one submission.
+                Defaults to False.
+            locality: If True, a default dataset which is loaded by a single
+                node is held in the memory of the worker which saved it, and
+                the node loading it is scheduled on that same worker, instead
+                of the dataset going through the manager. A node holds at most
+                one of its inputs this way, the others are shared as usual.
+                Defaults to False.
+            io_limits: Optional mapping of dataset types, e.g.
+                ``SQLTableDataSet``, filesystem protocols, e.g. ``s3``, or
+                dataset names to the maximum number of concurrent loads and
+                saves of the matching datasets. Limits set with the
+                ``io_limit`` key of the catalog entries take precedence.
+                The limits apply within each worker process.
+            node_cache: Optional ``NodeCache`` memoizing the node outputs
+                across runs. Nodes whose function and inputs have not changed
+                since their outputs were cached are not run, their outputs are
+                restored from the cache instead.
+            adaptive: If True, the runner starts a single worker process and
+                starts more, up to the number of nodes of the pipeline which
+                can run at the same time and ``max_workers``, only while ready
+                nodes wait for a free worker and the load average and the
+                available memory of the machine allow it. Workers idle for a
+                second are shut down. It cannot be used together with
+                ``locality``. Defaults to False.
+            speculative: If True, a node tagged ``idempotent`` which has run
+                for more than twice the longest of its last recorded
+                durations, and for more than a second, is started again on
+                an idle worker. The first attempt to complete is kept and the
+                outputs of the other one are never saved. Durations are
+                recorded in the previous runs of the runner or given with
+                ``node_durations``. Up to twice as many workers as nodes
+                which can run at the same time are started. It cannot be used
+                together with ``fuse_nodes`` or ``locality``. Defaults to
+                False.
+            tracer: Optional ``RunTracer`` recording the timeline of the runs
+                in the Chrome trace event format, with a track per worker
+                process. The trace is written at the end of every run, whether
+                it succeeds or not.
 
         Raises:
             ValueError: bad parameters passed
         """
-        super().__init__(is_async=is_async)
+        if adaptive and locality:
+            raise ValueError("`adaptive` and `locality` cannot be used together.")
+        if speculative and (fuse_nodes or locality):
+            raise ValueError(
+                "`speculative` cannot be used together with `fuse_nodes` or "
+                "`locality`."
+            )
+        super().__init__(
+            is_async=is_async, io_limits=io_limits, node_cache=node_cache, tracer=tracer
+        )
+        self._pool = None  # type: Optional[Union[ProcessPoolExecutor, _AffinityPool]]
+        self._adaptive = adaptive
+        self._run_states = None  # type: Optional[Dict[str, bytes]]
+        if _USE_SHARED_MEMORY:
+            # Start the resource tracker before any child process, so that the
+            # manager and the workers share it and the segments they create
+            # are not reclaimed when one of them exits.
+            resource_tracker.ensure_running()
         self._manager = ParallelRunnerManager()
         self._manager.start()  # pylint: disable=consider-using-with
+        _validate_priority(priority)
 
         # This code comes from the concurrent.futures library
         # https://github.com/python/cpython/blob/master/Lib/concurrent/futures/process.py#L588
@@ -152,9 +929,58 @@ class ParallelRunner(AbstractRunner):
                 max_workers = min(_MAX_WINDOWS_WORKERS, max_workers)
 
         self._max_workers = max_workers
+        self._priority = priority
+        self.node_durations = dict(node_durations or {})
+        self._reuse_workers = reuse_workers
+        self._max_memory = None if max_memory is None else _parse_memory(max_memory)
+        self._fuse_nodes = fuse_nodes
+        self._locality = locality
+        self._speculative = speculative
+        self._duration_history = _duration_history(self.node_durations)
 
     def __del__(self):
-        self._manager.shutdown()
+        self.close()
+        manager = getattr(self, "_manager", None)
+        if manager is not None:
+            manager.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker processes kept alive between runs when the
+        runner is created with ``reuse_workers=True``. The next run of the
+        runner starts a new pool of worker processes.
+        """
+        if getattr(self, "_pool", None) is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _pool_class(self) -> type:
+        """Return the class of the pools of worker processes of the runner."""
+        if self._adaptive:
+            return _AdaptivePool
+        return _AffinityPool if self._locality else ProcessPoolExecutor
+
+    def _get_persistent_pool(
+        self, package_name: Optional[str], conf_logging: Optional[Dict[str, Any]]
+    ) -> Union[ProcessPoolExecutor, _AffinityPool]:
+        """Return the pool of worker processes reused across runs, starting
+        it on first use. Its workers fetch the state of every run from a
+        dictionary hosted by the manager.
+        """
+        if self._pool is None:
+            if self._run_states is None:
+                self._run_states = self._manager.dict()
+            self._pool = self._pool_class()(
+                max_workers=self._max_workers,
+                initializer=_init_worker,
+                initargs=(self._run_states, package_name, conf_logging),
+            )
+        return self._pool
 
     def create_default_data_set(  # type: ignore
         self, ds_name: str
@@ -220,10 +1046,11 @@ class ParallelRunner(AbstractRunner):
                 f"decorated using functools.wraps()."
             )
 
+        all_outputs = pipeline.all_outputs()
         memory_data_sets = []
         for name, data_set in data_sets.items():
             if (
-                name in pipeline.all_outputs()
+                name in all_outputs
                 and isinstance(data_set, MemoryDataSet)
                 and not isinstance(data_set, BaseProxy)
             ):
@@ -237,21 +1064,91 @@ class ParallelRunner(AbstractRunner):
                 f"MemoryDataSets"
             )
 
-    def _get_required_workers_count(self, pipeline: Pipeline):
+    @staticmethod
+    def _release_shared_data_sets(catalog: DataCatalog) -> None:
+        """Free the shared memory held by the default datasets of a run which
+        did not finish, as they would never be released otherwise.
         """
-        Calculate the max number of processes required for the pipeline,
-        limit to the number of CPU cores.
+        data_sets = catalog._data_sets  # pylint: disable=protected-access
+        for name, data_set in data_sets.items():
+            if isinstance(data_set, _SharedMemoryDataSet):
+                catalog.release(name)
+
+    def _open_pool(
+        self,
+        nodes: Iterable[Node],
+        catalog: DataCatalog,
+        max_workers: int,
+        run_id: str = None,
+        claims: Mapping[str, int] = None,
+        trace_events: List[Dict[str, Any]] = None,
+    ) -> Tuple[Union[ProcessPoolExecutor, _AffinityPool], str]:
+        """Return the pool of worker processes for a run, together with the
+        token under which the run's nodes and ``DataCatalog`` are installed
+        in its workers, along with the managed dictionary of the ``claims``
+        of the node outputs in speculative mode and the managed list the
+        workers send their ``trace_events`` to. The pool must be handed back
+        to ``_close_pool``.
         """
-        # Number of nodes is a safe upper-bound estimate.
-        # It's also safe to reduce it by the number of layers minus one,
-        # because each layer means some nodes depend on other nodes
-        # and they can not run in parallel.
-        # It might be not a perfect solution, but good enough and simple.
-        required_processes = len(pipeline.nodes) - len(pipeline.grouped_nodes) + 1
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from kedro.framework.project import PACKAGE_NAME
+        from kedro.framework.session.session import get_current_session
+
+        session = get_current_session(silent=True)
+        # pylint: disable=protected-access
+        conf_logging = session._get_logging_config() if session else None
+
+        run_token = uuid.uuid4().hex
+        run_state = {
+            "nodes": {node.name: node for node in nodes},
+            "catalog": catalog,
+            "is_async": self._is_async,
+            "run_id": run_id,
+            "io_limits": self._io_executor.limits if self._io_executor else {},
+            "node_cache": self._node_cache,
+            "claims": claims,
+            "trace": None,
+        }
+        if trace_events is not None:
+            tracer = self._tracer
+            run_state["trace"] = (tracer.filepath, tracer.origin, trace_events)
+        if self._reuse_workers:
+            pool = self._get_persistent_pool(PACKAGE_NAME, conf_logging)
+            self._run_states[run_token] = pickle.dumps(run_state)  # type: ignore
+        else:
+            pool = self._pool_class()(  # type: ignore
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=({run_token: run_state}, PACKAGE_NAME, conf_logging),
+            )
+        return pool, run_token
+
+    def _close_pool(
+        self,
+        pool: Union[ProcessPoolExecutor, _AffinityPool],
+        run_token: str,
+        terminate: bool = False,
+    ) -> None:
+        if self._reuse_workers:
+            del self._run_states[run_token]  # type: ignore
+        elif terminate:
+            _terminate_pool(pool)
+        else:
+            pool.shutdown()
 
-        return min(required_processes, self._max_workers)
+    def _get_required_workers_count(self, pipeline: Pipeline):
+        """
+        Calculate the max number of processes required for the pipeline, i.e.
+        the largest number of its nodes which can run at the same time, or
+        twice as many in speculative mode, limit to the number of CPU cores.
+        """
+        workers = max(pipeline.compile().max_width(limit=self._max_workers), 1)
+        if self._speculative:
+            # room for a second attempt of every node which can run at once
+            workers *= 2
+        return min(workers, self._max_workers)
 
-    def _run(  # pylint: disable=too-many-locals,useless-suppression
+    def _run(  # pylint: disable=too-many-locals,too-many-statements
         self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
     ) -> None:
         """The abstract interface for running pipelines.
@@ -269,47 +1166,129 @@ class ParallelRunner(AbstractRunner):
             Exception: In case of any downstream node failure.
 
         """
-        # pylint: disable=import-outside-toplevel,cyclic-import
-        from kedro.framework.session.session import get_current_session
-
-        nodes = pipeline.nodes
+        plan = pipeline.compile()
+        nodes = plan.nodes
         self._validate_catalog(catalog, pipeline)
         self._validate_nodes(nodes)
 
-        load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
-        node_dependencies = pipeline.node_dependencies
-        todo_nodes = set(node_dependencies.keys())
+        # Without fusion, every node is a task of its own.
+        tasks = _fuse_chains(plan) if self._fuse_nodes else [(n,) for n in nodes]
+        task_dependencies = _task_dependencies(tasks, plan)
+        local_data_sets = {
+            task: _local_data_sets(task, plan, catalog) for task in tasks
+        }
+        held_data_sets = defaultdict(list)  # type: Dict[Tuple[Node, ...], List[str]]
+        consumers = defaultdict(
+            list
+        )  # type: Dict[Tuple[Node, ...], List[Tuple[Node, ...]]]
+        if self._locality:
+            affinity = _affine_data_sets(tasks, plan, catalog)
+            for consumer, (producer, name) in affinity.items():
+                held_data_sets[producer].append(name)
+                consumers[producer].append(consumer)
+        # tasks which must run on the worker holding one of their inputs
+        pinned = {}  # type: Dict[Tuple[Node, ...], int]
+        release_tracker = plan.release_tracker()
         done_nodes = set()  # type: Set[Node]
-        futures = set()
+        futures = {}  # type: Dict[Future, List[Tuple[Node, ...]]]
+        # attempts of completed nodes which still run, and hold their resources
+        discarded_attempts = {}  # type: Dict[Future, List[Tuple[Node, ...]]]
         done = None
         max_workers = self._get_required_workers_count(pipeline)
 
-        from kedro.framework.project import PACKAGE_NAME
+        priorities = predicted_makespan = None
+        if self._priority:
+            node_durations = _estimate_durations(nodes, self.node_durations)
+            durations = {task: sum(node_durations[n] for n in task) for task in tasks}
+            priorities = _critical_path_priorities(task_dependencies, durations)
+            predicted_makespan = _simulate_makespan(
+                task_dependencies, durations, max_workers, priorities
+            )
+        ready_queue = _ReadyQueue(task_dependencies, priorities)
+        budget = _ResourceBudget(tasks, max_workers, self._max_memory)
+        run_start = time.perf_counter()
+        speculator = claims = None
+        if self._speculative:
+            speculator = _Speculator(self._duration_history)
+            claims = self._manager.dict()
 
-        session = get_current_session(silent=True)
-        # pylint: disable=protected-access
-        conf_logging = session._get_logging_config() if session else None
+        span = _no_span
+        trace_events = None
+        if self._tracer is not None:
+            span = self._tracer.span
+            trace_events = self._manager.list()
 
-        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        pool, run_token = self._open_pool(
+            nodes, catalog, max_workers, run_id, claims, trace_events
+        )
+        try:
             while True:
-                ready = {n for n in todo_nodes if node_dependencies[n] <= done_nodes}
-                todo_nodes -= ready
-                for node in ready:
-                    futures.add(
-                        pool.submit(
-                            _run_node_synchronization,
-                            node,
-                            catalog,
-                            self._is_async,
-                            run_id,
-                            package_name=PACKAGE_NAME,
-                            conf_logging=conf_logging,
+                limit = None
+                stragglers = []  # type: List[Node]
+                if speculator is not None:
+                    idle = max_workers - len(futures) - speculator.running()
+                    stragglers = speculator.stragglers(idle)
+                if self._adaptive:
+                    # ready tasks stay queued until a worker is free for them
+                    pool.scale(len(ready_queue) + len(stragglers))  # type: ignore
+                    limit = len(pool.idle_workers())  # type: ignore
+                # Hold ready tasks back until their resources are free, so
+                # that the most urgent task that fits always starts next.
+                ready = ready_queue.pop_all(limit=limit, admit=budget.acquire)
+                if stragglers:
+                    # start the stragglers again on the workers left idle
+                    if limit is None:
+                        limit = max_workers - len(futures) - speculator.running()
+                    for node in stragglers[: max(limit - len(ready), 0)]:
+                        if budget.acquire((node,)):
+                            self._logger.warning(
+                                "Node `%s` runs longer than expected, "
+                                "starting it again.",
+                                node.name,
+                            )
+                            ready.append((node,))
+                if self._fuse_nodes or self._locality:
+                    # pinned tasks are never batched, as they must run where
+                    # their input is held
+                    batches = [[task] for task in ready if task in pinned]
+                    unpinned = [task for task in ready if task not in pinned]
+                    if self._fuse_nodes:
+                        batches += _batch_tiny_tasks(unpinned, self.node_durations)
+                    else:
+                        batches += [[task] for task in unpinned]
+                    for batch in batches:
+                        args = (
+                            _run_nodes_synchronization,
+                            [n.name for task in batch for n in task],
+                            run_token,
+                            [name for task in batch for name in local_data_sets[task]],
+                            [name for task in batch for name in held_data_sets[task]],
                         )
-                    )
-                if not futures:
-                    if todo_nodes:
+                        if self._locality:
+                            worker = pinned.pop(batch[0], None)
+                            if worker is None:
+                                worker = pool.least_busy()  # type: ignore
+                            future = pool.submit_to(worker, *args)  # type: ignore
+                            for task in batch:
+                                for consumer in consumers[task]:
+                                    pinned[consumer] = worker
+                        else:
+                            future = pool.submit(*args)
+                        futures[future] = batch
+                else:
+                    for (node,) in ready:
+                        args = (node.name, run_token)
+                        attempt = speculator.attempt(node) if speculator else None
+                        if attempt is not None:
+                            args += (attempt,)  # type: ignore
+                        future = pool.submit(_run_node_synchronization, *args)
+                        futures[future] = [(node,)]
+                        if speculator is not None:
+                            speculator.add(node, future)
+                if not futures and not (ready_queue.todo_nodes and discarded_attempts):
+                    if ready_queue.todo_nodes:
                         debug_data = {
-                            "todo_nodes": todo_nodes,
+                            "todo_nodes": ready_queue.todo_nodes,
                             "done_nodes": done_nodes,
                             "ready_nodes": ready,
                             "done_futures": done,
@@ -322,28 +1301,76 @@ class ParallelRunner(AbstractRunner):
                             f"have not been run:\n{debug_data_str}"
                         )
                     break  # pragma: no cover
-                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                # wake up regularly to grow the pool while tasks are waiting
+                # and to look for stragglers
+                timeout = None
+                if speculator is not None:
+                    timeout = _SPECULATION_INTERVAL
+                elif self._adaptive and ready_queue:
+                    timeout = _SCALE_INTERVAL
+                with span("wait", "scheduler"):
+                    done, _ = wait(
+                        [*futures, *discarded_attempts],
+                        timeout=timeout,
+                        return_when=FIRST_COMPLETED,
+                    )
                 for future in done:
+                    if future in discarded_attempts:
+                        for task in discarded_attempts.pop(future):
+                            budget.release(task)
+                        continue
+                    # the error of a failed attempt is not raised while
+                    # another attempt of the node still runs
+                    if (
+                        speculator is not None
+                        and future.exception() is not None
+                        and speculator.retry(futures[future][0][0], future)
+                    ):
+                        budget.release(futures.pop(future)[0])
+                        continue
                     try:
-                        node = future.result()
+                        result = future.result()
                     except Exception:
                         self._suggest_resume_scenario(pipeline, done_nodes)
                         raise
-                    done_nodes.add(node)
-
-                    # Decrement load counts, and release any datasets we
-                    # have finished with. This is particularly important
-                    # for the shared, default datasets we created above.
-                    for data_set in node.inputs:
-                        load_counts[data_set] -= 1
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.inputs()
-                        ):
-                            catalog.release(data_set)
-                    for data_set in node.outputs:
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.outputs()
-                        ):
-                            catalog.release(data_set)
+                    # durations measured by the worker, without the time the
+                    # tasks were queued for, used by the following runs to
+                    # prioritise nodes and find tiny tasks
+                    self.node_durations.update(result)
+
+                    for task in futures.pop(future):
+                        budget.release(task)
+                        if speculator is not None:
+                            for discarded in speculator.done(
+                                task[0], future, result[task[0].name]
+                            ):
+                                # its resources are released once it stops
+                                discarded_attempts[discarded] = futures.pop(discarded)
+                        ready_queue.mark_done(task)
+                        for node in task:
+                            done_nodes.add(node)
+                            # Release any datasets we have finished with. This
+                            # is particularly important for the shared,
+                            # default datasets we created above.
+                            for data_set in release_tracker.mark_done(node):
+                                catalog.release(data_set)
+        except Exception:
+            # wait for the nodes still running, so that no worker can write to
+            # the shared memory segments anymore
+            wait(futures)
+            self._release_shared_data_sets(catalog)
+            raise
+        finally:
+            # the workers still running discarded attempts are killed, unless
+            # they are reused, in which case the attempts complete first
+            terminate = bool(speculator and speculator.running())
+            self._close_pool(pool, run_token, terminate)
+            if trace_events is not None:
+                self._tracer.add_events(list(trace_events))
+
+        if priorities is not None:
+            self._logger.info(
+                "Pipeline makespan: %.2fs (predicted %.2fs)",
+                time.perf_counter() - run_start,
+                predicted_makespan,
+            )
@@ -0,0 +1,72 @@
+"""Expansion of the map nodes of a pipeline into a node per partition, which
+runners schedule as separate tasks, and a node gathering their results.
+"""
+import logging
+from typing import List, Tuple
+
+from kedro.io import DataCatalog, IncrementalDataSet, LambdaDataSet, PartitionedDataSet
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import MapNode, Node, _partition_name
+
+
+def _expand_map_nodes(
+    pipeline: Pipeline, catalog: DataCatalog
+) -> Tuple[Pipeline, DataCatalog]:
+    """Replace the map nodes of a pipeline whose partitioned input is a
+    ``PartitionedDataSet`` of the catalog, which no node of the pipeline
+    produces, with the nodes returned by ``MapNode.expand``. The partitions
+    are listed once, and a dataset loading every partition is added to a
+    copy of the catalog.
+
+    The other map nodes, e.g. mapping over an ``IncrementalDataSet`` or over
+    data produced during the run, whose partitions are only known once it is
+    loaded, process their partitions one after the other.
+
+    Args:
+        pipeline: The ``Pipeline`` to run.
+        catalog: The ``DataCatalog`` of the run.
+
+    Returns:
+        The pipeline and catalog to run, unchanged if no map node can be
+        expanded. Expanding them again is a no-op.
+
+    """
+    logger = logging.getLogger(__name__)
+    data_sets = catalog._data_sets  # pylint: disable=protected-access
+    produced = pipeline.all_outputs()
+    nodes = []  # type: List[Node]
+    expanded_catalog = catalog
+    for node in pipeline.nodes:
+        if not isinstance(node, MapNode):
+            nodes.append(node)
+            continue
+        name = node.partitioned_input
+        data_set = data_sets.get(name)
+        if (
+            not isinstance(data_set, PartitionedDataSet)
+            or isinstance(data_set, IncrementalDataSet)
+            or name in produced
+        ):
+            nodes.append(node)
+            continue
+
+        if expanded_catalog is catalog:
+            expanded_catalog = catalog.shallow_copy()
+        partitions = catalog.load(name)
+        for partition_id, load in partitions.items():
+            expanded_catalog.add(
+                _partition_name(name, partition_id),
+                LambdaDataSet(load=load, save=None),
+                replace=True,
+            )
+        nodes.extend(node.expand(partitions))
+        logger.info(
+            "Running the %d partitions of `%s` as separate tasks of node `%s`.",
+            len(partitions),
+            name,
+            node.name,
+        )
+
+    if expanded_catalog is catalog:
+        return pipeline, catalog
+    return Pipeline(nodes), expanded_catalog
@@ -2,8 +2,13 @@
 implementations.
 """
 
+import heapq
 import logging
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import defaultdict, deque
 from concurrent.futures import (
     ALL_COMPLETED,
     Future,
@@ -11,12 +16,41 @@ from concurrent.futures import (
     as_completed,
     wait,
 )
-from typing import Any, Dict, Iterable
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    DefaultDict,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from kedro.framework.hooks import get_hook_manager
-from kedro.io import AbstractDataSet, DataCatalog
+from kedro.framework.hooks.manager import _hook_dispatch
+from kedro.io import AbstractDataSet, DataCatalog, MemoryDataSet
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
+from kedro.pipeline.pipeline import _strip_transcoding
+from kedro.runner.checkpoint import RunCheckpoint, _in_memory_data_sets, _resume_point
+from kedro.runner.partitions import _expand_map_nodes
+from kedro.runner.staleness import _find_stale_nodes
+from kedro.runner.trace import RunTracer, _no_span
+
+if TYPE_CHECKING:  # pragma: no cover
+    from kedro.runner.node_cache import NodeCache  # pylint: disable=cyclic-import
 
 
 class AbstractRunner(ABC):
@@ -24,22 +58,59 @@ class AbstractRunner(ABC):
     implementations.
     """
 
-    def __init__(self, is_async: bool = False):
+    def __init__(
+        self,
+        is_async: bool = False,
+        write_behind: bool = False,
+        io_limits: Dict[str, int] = None,
+        node_cache: "NodeCache" = None,
+        tracer: RunTracer = None,
+    ):
         """Instantiates the runner classs.
 
         Args:
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            write_behind: If True, the outputs saved to persisted datasets are
+                written by background threads, and the nodes loading them get
+                the data held in memory without waiting for the save. The run
+                ends once every save has completed. Defaults to False.
+            io_limits: Optional mapping of dataset types, e.g.
+                ``SQLTableDataSet``, filesystem protocols, e.g. ``s3``, or
+                dataset names to the maximum number of concurrent loads and
+                saves of the matching datasets. Limits set with the
+                ``io_limit`` key of the catalog entries take precedence.
+            node_cache: Optional ``NodeCache`` memoizing the node outputs
+                across runs. Nodes whose function and inputs have not changed
+                since their outputs were cached are not run, their outputs are
+                restored from the cache instead.
+            tracer: Optional ``RunTracer`` recording the timeline of the runs
+                in the Chrome trace event format. The trace is written at the
+                end of every run, whether it succeeds or not.
 
+        Raises:
+            ValueError: bad parameters passed
         """
         self._is_async = is_async
+        self._write_behind = write_behind
+        self._io_limits = _validate_io_limits(io_limits)
+        self._io_executor = None  # type: Optional[_IOExecutor]
+        self._node_cache = node_cache
+        self._tracer = tracer
+        # saves the progress of the current run when a node fails
+        self._save_checkpoint = None  # type: Optional[Callable[[Set[Node]], None]]
 
     @property
     def _logger(self):
         return logging.getLogger(self.__module__)
 
-    def run(
-        self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
+    def run(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        run_id: str = None,
+        checkpoint: RunCheckpoint = None,
+        resume: RunCheckpoint = None,
     ) -> Dict[str, Any]:
         """Run the ``Pipeline`` using the datasets provided by ``catalog``
         and save results back to the same objects.
@@ -48,6 +119,12 @@ class AbstractRunner(ABC):
             pipeline: The ``Pipeline`` to run.
             catalog: The ``DataCatalog`` from which to fetch data.
             run_id: The id of the run.
+            checkpoint: Optional ``RunCheckpoint`` to which the progress of
+                the run is saved if a node fails.
+            resume: Optional ``RunCheckpoint`` of a failed run of the same
+                ``Pipeline``. The nodes which completed in that run are not
+                run again, and the in-memory data they produced is restored
+                from the checkpoint.
 
         Raises:
             ValueError: Raised when ``Pipeline`` inputs cannot be satisfied.
@@ -58,17 +135,48 @@ class AbstractRunner(ABC):
             by the node outputs.
 
         """
+        pipeline, catalog = self._prepare_pipeline(pipeline, catalog)
+        in_memory = (
+            _in_memory_data_sets(pipeline, catalog)
+            if checkpoint is not None or resume is not None
+            else set()
+        )
+        done_nodes = set()  # type: Set[Node]
+        restored = {}  # type: Dict[str, Any]
+        if resume is not None:
+            done_nodes, restored = _resume_point(pipeline, resume, in_memory)
+            self._logger.info(
+                "Resuming the run: %d of %d nodes already completed.",
+                len(done_nodes),
+                len(pipeline.nodes),
+            )
+
+        # one I/O executor shared by all the nodes of the run
+        io_executor = _IOExecutor(
+            {**self._io_limits, **_validate_io_limits(catalog.io_limits)}
+        )
+        if self._write_behind:
+            catalog = _WriteBehindCatalog(catalog, io_executor)
+        else:
+            catalog = catalog.shallow_copy()
+        free_outputs = pipeline.outputs() - set(catalog.list())
+        for ds_name, data in restored.items():
+            if ds_name not in catalog.list():
+                catalog.add(ds_name, self.create_default_data_set(ds_name))
+            catalog.save(ds_name, data)
 
-        catalog = catalog.shallow_copy()
+        full_pipeline = pipeline
+        if done_nodes:
+            pipeline = Pipeline(set(pipeline.nodes) - done_nodes)
+        plan = pipeline.compile()
 
-        unsatisfied = pipeline.inputs() - set(catalog.list())
+        unsatisfied = plan.inputs - set(catalog.list())
         if unsatisfied:
             raise ValueError(
-                f"Pipeline input(s) {unsatisfied} not found in the DataCatalog"
+                f"Pipeline input(s) {set(unsatisfied)} not found in the DataCatalog"
             )
 
-        free_outputs = pipeline.outputs() - set(catalog.list())
-        unregistered_ds = pipeline.data_sets() - set(catalog.list())
+        unregistered_ds = plan.data_sets - set(catalog.list())
         for ds_name in unregistered_ds:
             catalog.add(ds_name, self.create_default_data_set(ds_name))
 
@@ -76,11 +184,56 @@ class AbstractRunner(ABC):
             self._logger.info(
                 "Asynchronous mode is enabled for loading and saving data"
             )
-        self._run(pipeline, catalog, run_id)
+        self._io_executor = io_executor
+        if checkpoint is not None:
+            self._save_checkpoint = lambda done: checkpoint.save(  # type: ignore
+                full_pipeline, catalog, done_nodes | set(done), in_memory
+            )
+        try:
+            self._run(pipeline, catalog, run_id)
+        finally:
+            self._io_executor = None
+            self._save_checkpoint = None
+            try:
+                if isinstance(catalog, _WriteBehindCatalog):
+                    # the outputs of the completed nodes are saved even if the
+                    # run failed, and errors of the saves are raised here
+                    catalog.flush()
+            finally:
+                io_executor.shutdown()
+                if self._tracer is not None:
+                    self._tracer.save()
+                if self._node_cache is not None:
+                    # evicted once per run rather than after every cached node
+                    self._node_cache.prune()
 
         self._logger.info("Pipeline execution completed successfully.")
+        if resume is not None:
+            resume.clear()
 
-        return {ds_name: catalog.load(ds_name) for ds_name in free_outputs}
+        run_output = {}
+        for ds_name in free_outputs:
+            run_output[ds_name] = catalog.load(ds_name)
+            # free outputs are held by default datasets created for this run
+            catalog.release(ds_name)
+        return run_output
+
+    def _prepare_pipeline(
+        self, pipeline: Pipeline, catalog: DataCatalog
+    ) -> Tuple[Pipeline, DataCatalog]:
+        """Prepare the pipeline and the catalog of a run, before the default
+        datasets are created: the partitions of the map nodes run as nodes of
+        their own.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` of the run.
+
+        Returns:
+            The pipeline and catalog to run.
+
+        """
+        return _expand_map_nodes(pipeline, catalog)
 
     def run_only_missing(
         self, pipeline: Pipeline, catalog: DataCatalog
@@ -118,6 +271,57 @@ class AbstractRunner(ABC):
 
         return self.run(to_rerun, catalog)
 
+    def run_only_stale(  # pylint: disable=too-many-arguments
+        self,
+        pipeline: Pipeline,
+        catalog: DataCatalog,
+        run_id: str = None,
+        checkpoint: RunCheckpoint = None,
+        resume: RunCheckpoint = None,
+    ) -> Dict[str, Any]:
+        """Run only the stale nodes of the ``Pipeline`` and their descendants,
+        like ``make`` does. A node is stale if one of its outputs does not
+        exist, if one of its inputs was written after one of its outputs or,
+        when the runner has a ``NodeCache``, if its code or parameters have
+        changed since it last ran with this cache.
+
+        Args:
+            pipeline: The ``Pipeline`` to run.
+            catalog: The ``DataCatalog`` from which to fetch data.
+            run_id: The id of the run.
+            checkpoint: Optional ``RunCheckpoint`` to which the progress of
+                the run is saved if a node fails.
+            resume: Optional ``RunCheckpoint`` of a failed run to resume.
+        Raises:
+            ValueError: Raised when ``Pipeline`` inputs cannot be
+                satisfied.
+
+        Returns:
+            Any node outputs that cannot be processed by the
+            ``DataCatalog``. These are returned in a dictionary, where
+            the keys are defined by the node outputs.
+
+        """
+        stale = _find_stale_nodes(pipeline, catalog, self._node_cache)
+        self._logger.info("%d of %d nodes are stale.", len(stale), len(pipeline.nodes))
+        to_rerun = (
+            pipeline.from_nodes(*(node.name for node in stale))
+            if stale
+            else Pipeline([])
+        )
+
+        # As for `run_only_missing`, the nodes producing the unregistered
+        # datasets loaded by `to_rerun` have to run too.
+        unregistered_ds = pipeline.data_sets() - set(catalog.list())
+        output_to_unregistered = pipeline.only_nodes_with_outputs(*unregistered_ds)
+        input_from_unregistered = to_rerun.inputs() & unregistered_ds
+        to_rerun += output_to_unregistered.to_outputs(*input_from_unregistered)
+
+        if checkpoint is None and resume is None:
+            # subclasses may override `run` without the checkpoint arguments
+            return self.run(to_rerun, catalog, run_id)
+        return self.run(to_rerun, catalog, run_id, checkpoint, resume)
+
     @abstractmethod  # pragma: no cover
     def _run(
         self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
@@ -168,10 +372,810 @@ class AbstractRunner(ABC):
             len(remaining_nodes),
             postfix,
         )
+        if self._save_checkpoint is not None:
+            try:
+                self._save_checkpoint(set(done_nodes))
+            except Exception as exc:  # pylint: disable=broad-except
+                # the error of the node is the one to raise
+                self._logger.warning("Cannot save the run checkpoint: %s", exc)
+
+
+def _validate_io_limits(io_limits: Optional[Dict[str, int]]) -> Dict[str, int]:
+    io_limits = dict(io_limits or {})
+    for key, limit in io_limits.items():
+        if not isinstance(limit, int) or limit <= 0:
+            raise ValueError(
+                f"Invalid I/O limit `{limit}` for `{key}`. "
+                f"I/O limits should be positive integers."
+            )
+    return io_limits
+
+
+class _IOExecutor:
+    """``_IOExecutor`` loads and saves the datasets of a run. Its threads are
+    shared by all the nodes of the run, and it limits the number of
+    concurrent loads and saves per dataset type, filesystem protocol or
+    dataset name.
+    """
+
+    def __init__(self, limits: Dict[str, int] = None):
+        """Creates a new instance of ``_IOExecutor``.
+
+        Args:
+            limits: Mapping of dataset types, filesystem protocols or dataset
+                names to the maximum number of concurrent loads and saves of
+                the matching datasets.
+
+        """
+        self.limits = dict(limits or {})
+        self._semaphores = {
+            key: threading.BoundedSemaphore(limit) for key, limit in self.limits.items()
+        }
+        self._pool = None  # type: Optional[ThreadPoolExecutor]
+        self._lock = threading.Lock()
+        # calls still running when the executor is shut down, e.g. discarded
+        # attempts of nodes, which may still load and save
+        self._kept_alive = set()  # type: Set[Future]
+        self._closing = False
+
+    @contextmanager
+    def limit(self, catalog: DataCatalog, name: str) -> Iterator[None]:
+        """Hold a slot of every limit matching a dataset while loading or
+        saving it. The slots are acquired in a fixed order, so that two
+        operations never wait for each other."""
+        with ExitStack() as stack:
+            for key in self.limit_keys(catalog, name):
+                stack.enter_context(self._semaphores[key])
+            yield
+
+    @contextmanager
+    def limit_load(self, catalog: DataCatalog, name: str) -> Iterator[None]:
+        """Hold the slots of ``limit`` while loading a dataset. A load reading
+        back data saved behind first waits for the save, which may need the
+        same slots."""
+        wait_for_save = getattr(catalog, "wait_for_save", None)
+        if wait_for_save is not None:
+            wait_for_save(name)
+        with self.limit(catalog, name):
+            yield
+
+    def limit_keys(self, catalog: DataCatalog, name: str) -> List[str]:
+        """The keys of the limits matching a dataset, in the order in which
+        their slots are acquired."""
+        data_set = catalog._data_sets.get(name)  # pylint: disable=protected-access
+        keys = {name, type(data_set).__name__, getattr(data_set, "_protocol", None)}
+        return sorted(k for k in keys if k in self._semaphores)
+
+    def limited(self, catalog: DataCatalog, name: str, func: Callable) -> Callable:
+        """Wrap ``func`` to call it within the limits of a dataset."""
+
+        def _limited(*args: Any) -> Any:
+            with self.limit(catalog, name):
+                return func(*args)
+
+        return _limited
+
+    def submit(self, func: Callable, *args: Any) -> Future:
+        """Run ``func`` in one of the shared threads, started on first use."""
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(thread_name_prefix="kedro-io")
+        return self._pool.submit(func, *args)
+
+    def keep_alive(self, futures: Iterable[Future]) -> None:
+        """Defer the shutdown of the executor until ``futures`` are done, so
+        that the calls they run can still load and save through it."""
+        futures = list(futures)
+        with self._lock:
+            self._kept_alive.update(futures)
+        for future in futures:
+            future.add_done_callback(self._release)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._kept_alive.discard(future)
+            close = self._closing and not self._kept_alive
+        if close:
+            self._close()
+
+    def shutdown(self) -> None:
+        """Wait for the submitted calls and stop the threads, or only once
+        the futures given to ``keep_alive`` are done if some are running."""
+        with self._lock:
+            self._closing = True
+            if self._kept_alive:
+                return
+        self._close()
+
+    def _close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._closing = False
+        if pool is not None:
+            pool.shutdown()
+
+
+def _save_after(previous: Optional[Future], save: Callable, data: Any) -> None:
+    if previous is not None:
+        wait([previous])
+    save(data)
+
+
+def _load_after(save: Future, load: Callable) -> Any:
+    save.result()
+    return load()
+
+
+class _WriteBehindCatalog(DataCatalog):
+    """``_WriteBehindCatalog`` is a shallow copy of the ``DataCatalog`` of a
+    run, which saves the data of persisted datasets in background threads.
+    The saved data is also held in memory, so loading the dataset does not
+    wait for the save, while loading the same data under another transcoded
+    name waits for the save to complete. Saves of the same data complete in
+    the order they were made.
+    """
+
+    def __init__(self, catalog: DataCatalog, io_executor: "_IOExecutor"):
+        # pylint: disable=protected-access
+        super().__init__(
+            data_sets=catalog._data_sets,
+            transformers=catalog._transformers,
+            default_transformers=catalog._default_transformers,
+            journal=catalog._journal,
+            layers=catalog.layers,
+            io_limits=catalog.io_limits,
+        )
+        self._io_executor = io_executor
+        self._in_memory = {}  # type: Dict[str, MemoryDataSet]
+        # latest save of the data behind every name stripped of transcoding
+        self._saves = {}  # type: Dict[str, Future]
+
+    def _get_transformed_dataset_function(
+        self, data_set_name: str, operation: str, data_set: AbstractDataSet
+    ) -> Callable:
+        func = super()._get_transformed_dataset_function(
+            data_set_name, operation, data_set
+        )
+        if operation == "save" and not isinstance(data_set, MemoryDataSet):
+            return partial(self._save_behind, data_set_name, func)
+        if operation == "load":
+            self._raise_failed_save()
+            if data_set_name in self._in_memory:
+                return self._in_memory[data_set_name].load
+            future = self._saves.get(_strip_transcoding(data_set_name))
+            if future is not None:
+                return partial(_load_after, future, func)
+        return func
+
+    def _save_behind(self, name: str, save: Callable, data: Any) -> None:
+        self._raise_failed_save()
+        self._in_memory[name] = MemoryDataSet(data)
+        key = _strip_transcoding(name)
+        self._saves[key] = self._io_executor.submit(
+            _save_after,
+            self._saves.get(key),
+            self._io_executor.limited(self, name, save),
+            data,
+        )
+
+    def wait_for_save(self, name: str) -> None:
+        """Wait for the pending save of the data of a dataset, if loading it
+        reads the data back from storage, i.e. under another transcoded name.
+        """
+        if name not in self._in_memory:
+            future = self._saves.get(_strip_transcoding(name))
+            if future is not None:
+                wait([future])
+
+    def _raise_failed_save(self) -> None:
+        for future in list(self._saves.values()):
+            if future.done() and future.exception():
+                raise future.exception()  # type: ignore
+
+    def exists(self, name: str) -> bool:
+        future = self._saves.get(_strip_transcoding(name))
+        if future is not None:
+            wait([future])
+        return super().exists(name)
+
+    def release(self, name: str):
+        self._in_memory.pop(name, None)
+        future = self._saves.get(_strip_transcoding(name))
+        if future is not None and not future.done():
+            # release the dataset once its data is saved
+            future.add_done_callback(lambda _: DataCatalog.release(self, name))
+        else:
+            super().release(name)
+
+    def flush(self) -> None:
+        """Wait for all the saves to complete.
+
+        Raises:
+            Exception: The error of the first save which failed, if any.
+        """
+        wait(list(self._saves.values()))
+        self._raise_failed_save()
+
+
+class _ReadyQueue:
+    """``_ReadyQueue`` keeps track of the nodes that are ready to be run by
+    counting the unfinished dependencies of every node. Marking a node as done
+    only visits the children of that node, so the cost of scheduling stays
+    proportional to the number of edges in the pipeline rather than growing
+    quadratically with the number of nodes.
+    """
+
+    def __init__(
+        self,
+        node_dependencies: Dict[Hashable, Set[Hashable]],
+        priorities: Dict[Hashable, float] = None,
+    ):
+        """Creates a new instance of ``_ReadyQueue``.
+
+        Args:
+            node_dependencies: Mapping of every node to the set of its parents,
+                as returned by ``Pipeline.node_dependencies``.
+            priorities: Optional mapping of nodes to their priority. If provided,
+                ready nodes are handed out in decreasing order of priority,
+                otherwise in the order they became ready.
+
+        """
+        self._children = defaultdict(list)  # type: Dict[Hashable, List[Hashable]]
+        self._pending = {}  # type: Dict[Hashable, int]
+        self._priorities = priorities
+        self._ready = [] if priorities is not None else deque()  # type: Any
+        self._counter = count()
+        for node, parents in node_dependencies.items():
+            self._pending[node] = len(parents)
+            for parent in parents:
+                self._children[parent].append(node)
+            if not parents:
+                self._push(node)
+        self.todo_nodes = set(node_dependencies)
+
+    def __len__(self) -> int:
+        """Number of nodes that are ready to be run."""
+        return len(self._ready)
+
+    def _push(self, node: Hashable) -> None:
+        if self._priorities is None:
+            self._ready.append(node)
+        else:
+            # the counter breaks ties without comparing the nodes themselves
+            priority = self._priorities.get(node, 0.0)
+            heapq.heappush(self._ready, (-priority, next(self._counter), node))
+
+    def pop(self) -> Hashable:
+        """Take the next node that is ready to be run.
+
+        Returns:
+            A node whose dependencies have all been marked as done.
+
+        """
+        if self._priorities is None:
+            node = self._ready.popleft()
+        else:
+            node = heapq.heappop(self._ready)[-1]
+        self.todo_nodes.discard(node)
+        return node
+
+    def pop_all(
+        self, limit: int = None, admit: Callable[[Hashable], bool] = None
+    ) -> List[Hashable]:
+        """Take all nodes that are currently ready to be run.
+
+        Args:
+            limit: Optional maximum number of nodes to take.
+            admit: Optional callable deciding whether a ready node can be
+                taken now. Nodes it rejects stay ready, in their original
+                order, and nodes after them may still be taken.
+
+        Returns:
+            A list of nodes whose dependencies have all been marked as done.
+
+        """
+        if admit is None:
+            size = len(self._ready) if limit is None else min(limit, len(self._ready))
+            return [self.pop() for _ in range(max(size, 0))]
+
+        taken, held = [], []  # type: List[Hashable], List[Any]
+        while self._ready and (limit is None or len(taken) < limit):
+            if self._priorities is None:
+                entry = node = self._ready.popleft()
+            else:
+                entry = heapq.heappop(self._ready)
+                node = entry[-1]
+            if admit(node):
+                self.todo_nodes.discard(node)
+                taken.append(node)
+            else:
+                held.append(entry)
+
+        if self._priorities is None:
+            self._ready.extendleft(reversed(held))
+        else:
+            for entry in held:
+                heapq.heappush(self._ready, entry)
+        return taken
+
+    def mark_done(self, node: Hashable) -> List[Hashable]:
+        """Mark a node as done and enqueue any children that became ready.
+
+        Args:
+            node: The node that has finished running.
+
+        Returns:
+            The children of ``node`` that became ready to be run.
+
+        """
+        newly_ready = []
+        for child in self._children.get(node, ()):
+            self._pending[child] -= 1
+            if not self._pending[child]:
+                newly_ready.append(child)
+                self._push(child)
+        return newly_ready
+
+
+_CPUS_TAG_PREFIX = "cpus:"
+_MEMORY_TAG_PREFIX = "memory:"
+_MEMORY_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+_MEMORY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([KMGT]?)(?:i?B)?\s*$", re.I)
+
+
+def _parse_memory(memory: Union[int, str]) -> int:
+    """Convert an amount of memory such as ``512MB`` or ``4GiB`` to a number
+    of bytes. Units are powers of 1024 and integers are taken as bytes.
+    """
+    if isinstance(memory, (int, float)):
+        return int(memory)
+    match = _MEMORY_PATTERN.match(memory)
+    if not match:
+        raise ValueError(
+            f"Invalid amount of memory `{memory}`. Expected a number of bytes, "
+            f"optionally followed by a unit among K, M, G and T, e.g. `512MB`."
+        )
+    amount, unit = match.groups()
+    return int(float(amount) * _MEMORY_UNITS[unit.upper()])
+
+
+def _get_node_resources(node: Node) -> Tuple[int, int]:
+    """Return the CPU slots and the memory in bytes a node declares with its
+    ``cpus:<n>`` and ``memory:<amount>`` tags. Nodes take one CPU slot and no
+    memory by default.
+    """
+    cpus, memory = 1, 0
+    for tag in node.tags:
+        if tag.startswith(_CPUS_TAG_PREFIX):
+            value = tag[len(_CPUS_TAG_PREFIX) :]
+            if not value.isdigit() or not int(value):
+                raise ValueError(
+                    f"Invalid tag `{tag}` on node `{node.name}`: the number of "
+                    f"CPU slots should be a positive integer."
+                )
+            cpus = int(value)
+        elif tag.startswith(_MEMORY_TAG_PREFIX):
+            memory = _parse_memory(tag[len(_MEMORY_TAG_PREFIX) :])
+    return cpus, memory
+
+
+class _ResourceBudget:
+    """``_ResourceBudget`` admits nodes to run only while the CPU slots and
+    memory they declare fit in what is left of the runner budget. A node
+    declaring more than the whole budget is capped to it, so it runs on its
+    own rather than never. Tuples of nodes which run one after the other in
+    the same worker are admitted as one, with the largest requirements of
+    their nodes.
+    """
+
+    def __init__(self, nodes: Iterable[Hashable], cpus: int, memory: int = None):
+        """Creates a new instance of ``_ResourceBudget``.
+
+        Args:
+            nodes: The nodes, or tuples of nodes, to be admitted.
+            cpus: Total number of CPU slots, i.e. of workers.
+            memory: Optional total memory in bytes. If not set, the memory
+                declared by the nodes is not limited.
+
+        """
+        self._cpus = self._free_cpus = cpus
+        self._memory = self._free_memory = memory
+        self._requirements = {}  # type: Dict[Hashable, Tuple[int, int]]
+        for task in nodes:
+            task_cpus, task_memory = 0, 0
+            for node in task if isinstance(task, tuple) else (task,):
+                node_cpus, node_memory = _get_node_resources(node)
+                if memory is not None and node_memory > memory:
+                    logging.getLogger(__name__).warning(
+                        "Node `%s` declares more memory than the runner budget "
+                        "and will only run on its own.",
+                        node.name,
+                    )
+                task_cpus = max(task_cpus, node_cpus)
+                task_memory = max(task_memory, node_memory)
+            self._requirements[task] = (
+                min(task_cpus, cpus),
+                min(task_memory, memory or 0),
+            )
+
+    def acquire(self, node: Hashable) -> bool:
+        """Reserve the resources of a node if they are available.
+
+        Args:
+            node: The node, or tuple of nodes, to be run.
+
+        Returns:
+            Whether the node can be run now.
+
+        """
+        cpus, memory = self._requirements[node]
+        if cpus > self._free_cpus:
+            return False
+        if self._memory is not None and memory > self._free_memory:
+            return False
+        self._free_cpus -= cpus
+        if self._memory is not None:
+            self._free_memory -= memory
+        return True
+
+    def release(self, node: Hashable) -> None:
+        """Give back the resources of a node which has finished running.
+
+        Args:
+            node: The node, or tuple of nodes, that has finished running.
+
+        """
+        cpus, memory = self._requirements[node]
+        self._free_cpus += cpus
+        if self._memory is not None:
+            self._free_memory += memory
+
+
+# Nodes with this tag may run twice at the same time in speculative mode, as
+# they save the same outputs whenever they run on the same inputs.
+_IDEMPOTENT_TAG = "idempotent"
+
+# An idempotent node is started again once it has run for this many times
+# the longest of its recorded durations, and for at least this many seconds.
+_SPECULATION_FACTOR = 2.0
+_MIN_SPECULATION_DELAY = 1.0
+
+# How often, in seconds, the running nodes are checked in speculative mode.
+_SPECULATION_INTERVAL = 0.1
+
+# Number of durations recorded for every node in speculative mode.
+_DURATION_HISTORY_SIZE = 10
+
+
+def _duration_history(
+    node_durations: Dict[str, float]
+) -> DefaultDict[str, Deque[float]]:
+    """Create the history of the durations of the nodes of a runner, starting
+    with the durations it was given.
+    """
+    history = defaultdict(
+        partial(deque, maxlen=_DURATION_HISTORY_SIZE)
+    )  # type: DefaultDict[str, Deque[float]]
+    for name, duration in node_durations.items():
+        history[name].append(duration)
+    return history
+
+
+class _AttemptDiscarded(Exception):
+    """Raised by an attempt of a node which saves its outputs after another
+    attempt of the same node has claimed them."""
+
+
+class _ClaimingCatalog:
+    """``_ClaimingCatalog`` wraps the ``DataCatalog`` of a run for one attempt
+    of a node which may run several times at once. The first attempt whose
+    function returns, or which saves an output, claims all the outputs of
+    the node. Any other attempt then fails with ``_AttemptDiscarded`` at its
+    next load or save, or when its function returns, so that only one
+    attempt ever saves the outputs, calls the ``after_node_run`` hook and
+    caches the outputs.
+    """
+
+    def __init__(
+        self,
+        catalog: DataCatalog,
+        node: Node,
+        attempt: int,
+        claims: MutableMapping[str, int],
+    ):
+        """Creates a new instance of ``_ClaimingCatalog``.
+
+        Args:
+            catalog: The ``DataCatalog`` of the run.
+            node: The node being run.
+            attempt: The number of the attempt of the node.
+            claims: Mapping of node names to the attempt which claimed their
+                outputs, shared by all the attempts of the run. Its
+                ``setdefault`` method must be atomic.
+
+        """
+        self._catalog = catalog
+        self._node = node
+        self._attempt = attempt
+        self._claims = claims
+
+    def __getattr__(self, name):
+        return getattr(self._catalog, name)
+
+    def _discard(self, winner: int) -> None:
+        raise _AttemptDiscarded(
+            f"Attempt {self._attempt} of node `{self._node.name}` was "
+            f"discarded, as attempt {winner} claimed its outputs first."
+        )
+
+    def check(self) -> None:
+        """Check that no other attempt of the node has claimed its outputs.
+
+        Raises:
+            _AttemptDiscarded: When another attempt has claimed the outputs.
+
+        """
+        winner = self._claims.get(self._node.name, self._attempt)
+        if winner != self._attempt:
+            self._discard(winner)
+
+    def claim(self) -> None:
+        """Claim the outputs of the node for this attempt.
+
+        Raises:
+            _AttemptDiscarded: When another attempt has claimed the outputs.
+
+        """
+        winner = self._claims.setdefault(self._node.name, self._attempt)
+        if winner != self._attempt:
+            self._discard(winner)
+
+    def load(self, name: str) -> Any:
+        """Load the data of an input of the node, unless another attempt of
+        the node has claimed its outputs.
+
+        Raises:
+            _AttemptDiscarded: When another attempt has claimed the outputs.
+
+        """
+        self.check()
+        return self._catalog.load(name)
+
+    def save(self, name: str, data: Any) -> None:
+        """Save the data of an output of the node, unless another attempt of
+        the node has claimed its outputs.
+
+        Raises:
+            _AttemptDiscarded: When another attempt has claimed the outputs.
+
+        """
+        self.claim()
+        self._catalog.save(name, data)
+
+
+class _Speculator:
+    """``_Speculator`` tracks the attempts of the idempotent nodes of a run
+    and picks the ones which have run for much longer than their recorded
+    durations, e.g. because they hang on a slow read, to be started again.
+    The first attempt of a node to complete is kept, and the others are
+    discarded while they keep running in the background.
+    """
+
+    def __init__(self, history: DefaultDict[str, Deque[float]]):
+        """Creates a new instance of ``_Speculator``.
+
+        Args:
+            history: The recent durations of every node, which are updated
+                with the durations of the completed attempts.
+
+        """
+        self._history = history
+        self._attempts = defaultdict(list)  # type: Dict[Node, List[Future]]
+        self._start_times = {}  # type: Dict[Future, float]
+        self._discarded = set()  # type: Set[Future]
+        self._failed = set()  # type: Set[Future]
+
+    def attempt(self, node: Node) -> Optional[int]:
+        """Return the number of the next attempt of a node, or ``None`` if
+        the node is not idempotent and only ever runs once."""
+        if _IDEMPOTENT_TAG not in node.tags:
+            return None
+        return len(self._attempts[node])
+
+    def add(self, node: Node, future: Future) -> None:
+        """Track a new attempt of a node, unless the node is not idempotent."""
+        if _IDEMPOTENT_TAG in node.tags:
+            self._attempts[node].append(future)
+            self._start_times[future] = time.perf_counter()
+
+    def stragglers(self, limit: int) -> List[Node]:
+        """Find the nodes to start again, at most ``limit`` of them: those
+        with a single attempt, running for longer than ``_SPECULATION_FACTOR``
+        times their longest recorded duration and ``_MIN_SPECULATION_DELAY``.
+        Nodes without a recorded duration are never started again.
+
+        Args:
+            limit: The maximum number of nodes to return, e.g. the number of
+                idle workers.
+
+        Returns:
+            The nodes to start again, the most overdue first.
+
+        """
+        now = time.perf_counter()
+        overdue = []
+        for node, attempts in self._attempts.items():
+            future = attempts[0]
+            if not future.running() and not future.done():
+                # an attempt waiting for a worker has not started yet
+                self._start_times[future] = now
+            history = self._history.get(node.name)
+            if len(attempts) > 1 or future.done() or not history:
+                continue
+            expected = max(_SPECULATION_FACTOR * max(history), _MIN_SPECULATION_DELAY)
+            elapsed = now - self._start_times[future]
+            if elapsed > expected:
+                overdue.append((elapsed / expected, node))
+        overdue.sort(key=lambda item: item[0], reverse=True)
+        return [node for _, node in overdue[: max(limit, 0)]]
+
+    def done(self, node: Node, future: Future, duration: float = None) -> List[Future]:
+        """Record that an attempt of a node has completed.
+
+        Args:
+            node: The node whose attempt has completed.
+            future: The attempt which has completed.
+            duration: Optional duration of the attempt, measured where it
+                ran. Defaults to the time elapsed since the attempt started,
+                as seen by the scheduler.
+
+        Returns:
+            The other attempts of the node, which are now discarded.
+
+        """
+        attempts = self._attempts.pop(node, [future])
+        start_time = self._start_times.pop(future, None)
+        if duration is None and start_time is not None:
+            duration = time.perf_counter() - start_time
+        if duration is not None:
+            self._history[node.name].append(duration)
+        discarded = [
+            other
+            for other in attempts
+            if other is not future and other not in self._failed
+        ]
+        for other in discarded:
+            del self._start_times[other]
+        self._discarded.update(discarded)
+        return discarded
+
+    def retry(self, node: Node, future: Future) -> bool:
+        """Record that an attempt of a node has failed.
+
+        Args:
+            node: The node whose attempt has failed.
+            future: The attempt which has failed.
+
+        Returns:
+            Whether another attempt of the node is still running, in which
+            case the failure is ignored.
+
+        """
+        self._failed.add(future)
+        self._start_times.pop(future, None)
+        attempts = self._attempts.get(node, [])
+        return any(other not in self._failed for other in attempts)
+
+    def running(self) -> int:
+        """Return the number of discarded attempts which are still running."""
+        self._discarded = {f for f in self._discarded if not f.done()}
+        return len(self._discarded)
+
+
+_PRIORITY_POLICIES = ("critical_path",)
+
+
+def _validate_priority(priority: Optional[str]) -> None:
+    if priority is not None and priority not in _PRIORITY_POLICIES:
+        raise ValueError(
+            f"Unknown priority policy `{priority}`. Available policies: "
+            f"{', '.join(_PRIORITY_POLICIES)}."
+        )
+
+
+def _topological_order(
+    node_dependencies: Dict[Hashable, Set[Hashable]]
+) -> List[Hashable]:
+    ready_queue = _ReadyQueue(node_dependencies)
+    order = []
+    while ready_queue:
+        node = ready_queue.pop()
+        order.append(node)
+        ready_queue.mark_done(node)
+    return order
+
+
+def _estimate_durations(
+    nodes: Iterable[Node], node_durations: Dict[str, float] = None
+) -> Dict[Node, float]:
+    """Estimate how long each node takes to run, based on the durations observed
+    in previous runs. Nodes without any history are assumed to take the mean
+    observed duration, or one second if nothing has been observed yet.
+    """
+    node_durations = node_durations or {}
+    default = (
+        sum(node_durations.values()) / len(node_durations) if node_durations else 1.0
+    )
+    return {node: node_durations.get(node.name, default) for node in nodes}
+
+
+def _critical_path_priorities(
+    node_dependencies: Dict[Node, Set[Node]], durations: Dict[Node, float]
+) -> Dict[Node, float]:
+    """Rank every node by the length of the longest path from the node to the
+    end of the pipeline, including the node itself.
+
+    Args:
+        node_dependencies: Mapping of every node to the set of its parents.
+        durations: Estimated duration of every node.
+
+    Returns:
+        Mapping of every node to the estimated time needed to finish the
+        longest chain of nodes it starts.
+
+    """
+    children = defaultdict(list)  # type: Dict[Node, List[Node]]
+    for node, parents in node_dependencies.items():
+        for parent in parents:
+            children[parent].append(node)
+
+    priorities = {}  # type: Dict[Node, float]
+    for node in reversed(_topological_order(node_dependencies)):
+        downstream = max((priorities[c] for c in children[node]), default=0.0)
+        priorities[node] = durations[node] + downstream
+    return priorities
+
+
+def _simulate_makespan(
+    node_dependencies: Dict[Node, Set[Node]],
+    durations: Dict[Node, float],
+    workers: int,
+    priorities: Dict[Node, float] = None,
+) -> float:
+    """Predict the wall-clock time of a run by simulating a list schedule of
+    the pipeline on a fixed number of workers.
+
+    Args:
+        node_dependencies: Mapping of every node to the set of its parents.
+        durations: Estimated duration of every node.
+        workers: Number of nodes that can run at the same time.
+        priorities: Optional priorities used to pick among ready nodes.
+
+    Returns:
+        The predicted makespan in the same unit as ``durations``.
+
+    """
+    ready_queue = _ReadyQueue(node_dependencies, priorities)
+    running = []  # type: List
+    counter = count()
+    now = 0.0
+    while ready_queue or running:
+        while ready_queue and len(running) < workers:
+            node = ready_queue.pop()
+            heapq.heappush(running, (now + durations[node], next(counter), node))
+        now, _, node = heapq.heappop(running)
+        ready_queue.mark_done(node)
+    return now
 
 
 def run_node(
-    node: Node, catalog: DataCatalog, is_async: bool = False, run_id: str = None
+    node: Node,
+    catalog: DataCatalog,
+    is_async: bool = False,
+    run_id: str = None,
+    io_executor: _IOExecutor = None,
+    node_cache: "NodeCache" = None,
+    tracer: RunTracer = None,
 ) -> Node:
     """Run a single `Node` with inputs from and outputs to the `catalog`.
 
@@ -181,18 +1185,39 @@ def run_node(
         is_async: If True, the node inputs and outputs are loaded and saved
             asynchronously with threads. Defaults to False.
         run_id: The id of the pipeline run.
+        io_executor: The I/O executor of the run, which provides the threads
+            of the asynchronous loads and saves and limits their concurrency.
+            If not set, the node uses threads of its own, without limits.
+        node_cache: Optional ``NodeCache`` from which the outputs of the node
+            are restored instead of running it, if they were cached with the
+            same node function and inputs. Otherwise the outputs are cached
+            once the node has run. The fingerprint of the node code and
+            parameters is recorded in it either way, for ``run_only_stale``.
+        tracer: Optional ``RunTracer`` recording the loads, saves, hooks and
+            function call of the node as spans of the trace.
 
     Returns:
         The node argument.
 
     """
-    if is_async:
-        node = _run_node_async(node, catalog, run_id)
-    else:
-        node = _run_node_sequential(node, catalog, run_id)
-
-    for name in node.confirms:
-        catalog.confirm(name)
+    span = tracer.span if tracer is not None else _no_span
+    with span(node.name, "node"):
+        key = node_cache.key(node, catalog) if node_cache is not None else None
+        outputs = node_cache.get(key) if key is not None else None
+        args = (node, catalog, run_id, io_executor, node_cache, key, span)
+        if outputs is not None:
+            _restore_node_outputs(node, catalog, outputs, io_executor, span)
+        elif is_async:
+            node = _run_node_async(*args)
+        else:
+            node = _run_node_sequential(*args)
+        if key is not None:
+            node_cache.link_outputs(key, node, catalog)  # type: ignore
+        if node_cache is not None:
+            node_cache.record_fingerprint(node, catalog)
+
+        for name in node.confirms:
+            catalog.confirm(name)
     return node
 
 
@@ -202,16 +1227,20 @@ def _collect_inputs_from_hook(
     inputs: Dict[str, Any],
     is_async: bool,
     run_id: str = None,
+    span: Callable[..., ContextManager] = _no_span,
 ) -> Dict[str, Any]:
+    hooks = _hook_dispatch(get_hook_manager())
+    if hooks.before_node_run is None:
+        return {}
     inputs = inputs.copy()  # shallow copy to prevent in-place modification by the hook
-    hook_manager = get_hook_manager()
-    hook_response = hook_manager.hook.before_node_run(  # pylint: disable=no-member
-        node=node,
-        catalog=catalog,
-        inputs=inputs,
-        is_async=is_async,
-        run_id=run_id,
-    )
+    with span("before_node_run", "hook"):
+        hook_response = hooks.before_node_run(
+            node=node,
+            catalog=catalog,
+            inputs=inputs,
+            is_async=is_async,
+            run_id=run_id,
+        )
 
     additional_inputs = {}
     for response in hook_response:
@@ -233,107 +1262,202 @@ def _call_node_run(
     inputs: Dict[str, Any],
     is_async: bool,
     run_id: str = None,
+    span: Callable[..., ContextManager] = _no_span,
 ) -> Dict[str, Any]:
-    hook_manager = get_hook_manager()
+    hooks = _hook_dispatch(get_hook_manager())
     try:
-        outputs = node.run(inputs)
+        with span("function", "function"):
+            outputs = node.run(inputs)
     except Exception as exc:
-        hook_manager.hook.on_node_error(  # pylint: disable=no-member
-            error=exc,
-            node=node,
-            catalog=catalog,
-            inputs=inputs,
-            is_async=is_async,
-            run_id=run_id,
-        )
+        if isinstance(catalog, _ClaimingCatalog):
+            # the errors of discarded attempts are not reported
+            catalog.check()
+        if hooks.on_node_error is not None:
+            with span("on_node_error", "hook"):
+                hooks.on_node_error(
+                    error=exc,
+                    node=node,
+                    catalog=catalog,
+                    inputs=inputs,
+                    is_async=is_async,
+                    run_id=run_id,
+                )
         raise exc
-    hook_manager.hook.after_node_run(  # pylint: disable=no-member
-        node=node,
-        catalog=catalog,
-        inputs=inputs,
-        outputs=outputs,
-        is_async=is_async,
-        run_id=run_id,
-    )
+    if isinstance(catalog, _ClaimingCatalog):
+        # only the attempt claiming the outputs goes on with the hooks, the
+        # node cache and the saves
+        catalog.claim()
+    if hooks.after_node_run is not None:
+        with span("after_node_run", "hook"):
+            hooks.after_node_run(
+                node=node,
+                catalog=catalog,
+                inputs=inputs,
+                outputs=outputs,
+                is_async=is_async,
+                run_id=run_id,
+            )
     return outputs
 
 
-def _run_node_sequential(node: Node, catalog: DataCatalog, run_id: str = None) -> Node:
+def _restore_node_outputs(
+    node: Node,
+    catalog: DataCatalog,
+    outputs: Dict[str, Any],
+    io_executor: _IOExecutor = None,
+    span: Callable[..., ContextManager] = _no_span,
+) -> None:
+    logging.getLogger(__name__).info(
+        "Restoring outputs of node `%s` from the node cache", node.name
+    )
+    io_executor = io_executor or _IOExecutor()
+    for name, data in outputs.items():
+        with span(f"save {name}", "save", data=data):
+            with io_executor.limit(catalog, name):
+                catalog.save(name, data)
+
+
+def _run_node_sequential(  # pylint: disable=too-many-arguments
+    node: Node,
+    catalog: DataCatalog,
+    run_id: str = None,
+    io_executor: _IOExecutor = None,
+    node_cache: "NodeCache" = None,
+    cache_key: str = None,
+    span: Callable[..., ContextManager] = _no_span,
+) -> Node:
     inputs = {}
-    hook_manager = get_hook_manager()
+    # the hooks without any implementation are None and skipped
+    hooks = _hook_dispatch(get_hook_manager())
+    io_executor = io_executor or _IOExecutor()
 
+    if hooks.before_datasets_loaded is not None and node.inputs:
+        with span("before_datasets_loaded", "hook"):
+            hooks.before_datasets_loaded(node=node, dataset_names=node.inputs)
     for name in node.inputs:
-        hook_manager.hook.before_dataset_loaded(  # pylint: disable=no-member
-            dataset_name=name
-        )
-        inputs[name] = catalog.load(name)
-        hook_manager.hook.after_dataset_loaded(  # pylint: disable=no-member
-            dataset_name=name, data=inputs[name]
-        )
+        if hooks.before_dataset_loaded is not None:
+            with span("before_dataset_loaded", "hook"):
+                hooks.before_dataset_loaded(dataset_name=name)
+        with span(f"load {name}", "load"), io_executor.limit_load(catalog, name):
+            inputs[name] = catalog.load(name)
+        if hooks.after_dataset_loaded is not None:
+            with span("after_dataset_loaded", "hook"):
+                hooks.after_dataset_loaded(dataset_name=name, data=inputs[name])
+    if hooks.after_datasets_loaded is not None and inputs:
+        with span("after_datasets_loaded", "hook"):
+            hooks.after_datasets_loaded(node=node, data=dict(inputs))
 
     is_async = False
 
     additional_inputs = _collect_inputs_from_hook(
-        node, catalog, inputs, is_async, run_id=run_id
+        node, catalog, inputs, is_async, run_id=run_id, span=span
     )
     inputs.update(additional_inputs)
 
-    outputs = _call_node_run(node, catalog, inputs, is_async, run_id=run_id)
+    outputs = _call_node_run(node, catalog, inputs, is_async, run_id, span)
+    if cache_key is not None:
+        node_cache.put(cache_key, node, outputs)  # type: ignore
 
+    if hooks.before_datasets_saved is not None and outputs:
+        with span("before_datasets_saved", "hook"):
+            hooks.before_datasets_saved(node=node, data=dict(outputs))
     for name, data in outputs.items():
-        hook_manager.hook.before_dataset_saved(  # pylint: disable=no-member
-            dataset_name=name, data=data
-        )
-        catalog.save(name, data)
-        hook_manager.hook.after_dataset_saved(  # pylint: disable=no-member
-            dataset_name=name, data=data
-        )
+        if hooks.before_dataset_saved is not None:
+            with span("before_dataset_saved", "hook"):
+                hooks.before_dataset_saved(dataset_name=name, data=data)
+        with span(f"save {name}", "save", data=data):
+            with io_executor.limit(catalog, name):
+                catalog.save(name, data)
+        if hooks.after_dataset_saved is not None:
+            with span("after_dataset_saved", "hook"):
+                hooks.after_dataset_saved(dataset_name=name, data=data)
+    if hooks.after_datasets_saved is not None and outputs:
+        with span("after_datasets_saved", "hook"):
+            hooks.after_datasets_saved(node=node, data=dict(outputs))
     return node
 
 
-def _run_node_async(node: Node, catalog: DataCatalog, run_id: str = None) -> Node:
+def _run_node_async(  # pylint: disable=too-many-arguments
+    node: Node,
+    catalog: DataCatalog,
+    run_id: str = None,
+    io_executor: _IOExecutor = None,
+    node_cache: "NodeCache" = None,
+    cache_key: str = None,
+    span: Callable[..., ContextManager] = _no_span,
+) -> Node:
     def _synchronous_dataset_load(dataset_name: str):
         """Minimal wrapper to ensure Hooks are run synchronously
         within an asynchronous dataset load."""
-        hook_manager.hook.before_dataset_loaded(  # pylint: disable=no-member
-            dataset_name=dataset_name
-        )
-        return_ds = catalog.load(dataset_name)
-        hook_manager.hook.after_dataset_loaded(  # pylint: disable=no-member
-            dataset_name=dataset_name, data=return_ds
-        )
+        if hooks.before_dataset_loaded is not None:
+            with span("before_dataset_loaded", "hook"):
+                hooks.before_dataset_loaded(dataset_name=dataset_name)
+        with span(f"load {dataset_name}", "load"), pool.limit_load(
+            catalog, dataset_name
+        ):
+            return_ds = catalog.load(dataset_name)
+        if hooks.after_dataset_loaded is not None:
+            with span("after_dataset_loaded", "hook"):
+                hooks.after_dataset_loaded(dataset_name=dataset_name, data=return_ds)
         return return_ds
 
-    with ThreadPoolExecutor() as pool:
+    def _synchronous_dataset_save(dataset_name: str, data: Any) -> None:
+        with span(f"save {dataset_name}", "save", data=data):
+            with pool.limit(catalog, dataset_name):
+                catalog.save(dataset_name, data)
+
+    # without the I/O executor of a run, the node uses threads of its own
+    pool = io_executor or _IOExecutor()
+    try:
         inputs: Dict[str, Future] = {}
-        hook_manager = get_hook_manager()
+        # the hooks without any implementation are None and skipped
+        hooks = _hook_dispatch(get_hook_manager())
 
+        if hooks.before_datasets_loaded is not None and node.inputs:
+            with span("before_datasets_loaded", "hook"):
+                hooks.before_datasets_loaded(node=node, dataset_names=node.inputs)
         for name in node.inputs:
             inputs[name] = pool.submit(_synchronous_dataset_load, name)
 
         wait(inputs.values(), return_when=ALL_COMPLETED)
         inputs = {key: value.result() for key, value in inputs.items()}
+        if hooks.after_datasets_loaded is not None and inputs:
+            with span("after_datasets_loaded", "hook"):
+                hooks.after_datasets_loaded(node=node, data=dict(inputs))
         is_async = True
         additional_inputs = _collect_inputs_from_hook(
-            node, catalog, inputs, is_async, run_id=run_id
+            node, catalog, inputs, is_async, run_id=run_id, span=span
         )
         inputs.update(additional_inputs)
 
-        outputs = _call_node_run(node, catalog, inputs, is_async, run_id=run_id)
+        outputs = _call_node_run(node, catalog, inputs, is_async, run_id, span)
+        if cache_key is not None:
+            node_cache.put(cache_key, node, outputs)  # type: ignore
 
-        save_futures = set()
+        save_futures = {}
 
+        if hooks.before_datasets_saved is not None and outputs:
+            with span("before_datasets_saved", "hook"):
+                hooks.before_datasets_saved(node=node, data=dict(outputs))
         for name, data in outputs.items():
-            hook_manager.hook.before_dataset_saved(  # pylint: disable=no-member
-                dataset_name=name, data=data
-            )
-            save_futures.add(pool.submit(catalog.save, name, data))
+            if hooks.before_dataset_saved is not None:
+                with span("before_dataset_saved", "hook"):
+                    hooks.before_dataset_saved(dataset_name=name, data=data)
+            future = pool.submit(_synchronous_dataset_save, name, data)
+            save_futures[future] = name
 
         for future in as_completed(save_futures):
             exception = future.exception()
             if exception:
                 raise exception
-            hook_manager.hook.after_dataset_saved(  # pylint: disable=no-member
-                dataset_name=name, data=data  # pylint: disable=undefined-loop-variable
-            )
+            if hooks.after_dataset_saved is not None:
+                name = save_futures[future]
+                with span("after_dataset_saved", "hook"):
+                    hooks.after_dataset_saved(dataset_name=name, data=outputs[name])
+        if hooks.after_datasets_saved is not None and outputs:
+            with span("after_datasets_saved", "hook"):
+                hooks.after_datasets_saved(node=node, data=dict(outputs))
+    finally:
+        if io_executor is None:
+            pool.shutdown()
     return node
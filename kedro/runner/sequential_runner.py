@@ -2,13 +2,138 @@
 used to run the ``Pipeline`` in a sequential manner using a topological sort
 of provided nodes.
 """
-
-from collections import Counter
-from itertools import chain
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Deque, Dict, Set, Tuple, Union
 
 from kedro.io import AbstractDataSet, DataCatalog, MemoryDataSet
 from kedro.pipeline import Pipeline
-from kedro.runner.runner import AbstractRunner, run_node
+from kedro.pipeline.execution_plan import ExecutionPlan
+from kedro.pipeline.pipeline import _strip_transcoding
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.runner import (
+    AbstractRunner,
+    _IOExecutor,
+    _parse_memory,
+    run_node,
+)
+from kedro.runner.trace import RunTracer, _data_size
+
+
+class _PrefetchingCatalog(DataCatalog):
+    """``_PrefetchingCatalog`` is a shallow copy of the ``DataCatalog`` of a
+    run, whose loads return the data loaded ahead of time in the background
+    when there is some. The loads still go through ``DataCatalog.load``, so
+    logging, transformers and journal entries are unchanged. Other loads and
+    saves are delegated to the copied catalog. The loads ahead of time are
+    held to the I/O limits of the run like any other load.
+    """
+
+    def __init__(self, catalog: DataCatalog, io_executor: _IOExecutor = None):
+        # pylint: disable=protected-access
+        super().__init__(
+            data_sets=catalog._data_sets,
+            transformers=catalog._transformers,
+            default_transformers=catalog._default_transformers,
+            journal=catalog._journal,
+            layers=catalog.layers,
+            io_limits=catalog.io_limits,
+        )
+        self._catalog = catalog
+        self._io_executor = io_executor or _IOExecutor()
+        self._prefetched = defaultdict(deque)  # type: Dict[str, Deque[Future]]
+        # size in bytes of the last data loaded ahead of time per dataset
+        self._sizes = {}  # type: Dict[str, int]
+        self._lock = threading.Lock()
+
+    def prefetch(self, pool: ThreadPoolExecutor, name: str) -> None:
+        """Start loading a dataset in the background. The data is handed out
+        by the next load of the dataset."""
+        future = pool.submit(self._load_ahead, name)
+        self._prefetched[name].append(future)
+
+    def _load_ahead(self, name: str) -> Tuple[Any, int]:
+        with self._io_executor.limit(self, name):
+            data = self._data_sets[name].load()
+        size = _data_size(data)
+        with self._lock:
+            self._sizes[name] = size
+        return data, size
+
+    def expected_size(self, name: str, unknown: int = 0) -> int:
+        """The size in bytes of the previous data loaded ahead of time from a
+        dataset. Datasets not loaded ahead yet are expected to be as large as
+        the largest data loaded ahead so far, or ``unknown`` bytes if none
+        was."""
+        with self._lock:
+            return self._sizes.get(name, max(self._sizes.values(), default=unknown))
+
+    def prefetched_size(self, unknown: int = 0) -> int:
+        """The size in bytes of the prefetched data which was not loaded yet.
+        The loads still running are counted at their expected size, so that
+        they hold their share of the memory before their data arrives."""
+        size = 0
+        for name, futures in self._prefetched.items():
+            for future in futures:
+                if not future.done():
+                    size += self.expected_size(name, unknown)
+                elif not future.cancelled() and not future.exception():
+                    size += future.result()[1]
+        return size
+
+    def cancel_prefetch(self) -> None:
+        """Cancel the loads which have not started yet."""
+        for futures in self._prefetched.values():
+            for future in futures:
+                future.cancel()
+        self._prefetched.clear()
+
+    def _get_transformed_dataset_function(
+        self, data_set_name: str, operation: str, data_set: AbstractDataSet
+    ) -> Callable:
+        futures = self._prefetched.get(data_set_name)
+        if operation == "load" and futures:
+            future = futures.popleft()
+            data_set = SimpleNamespace(load=lambda: future.result()[0])  # type: ignore
+            return super()._get_transformed_dataset_function(
+                data_set_name, operation, data_set
+            )
+        # pylint: disable=protected-access
+        return self._catalog._get_transformed_dataset_function(
+            data_set_name, operation, data_set
+        )
+
+    def exists(self, name: str) -> bool:
+        return self._catalog.exists(name)
+
+    def wait_for_save(self, name: str) -> None:
+        """Wait for the pending save of a dataset in the copied catalog, if it
+        saves behind."""
+        wait_for_save = getattr(self._catalog, "wait_for_save", None)
+        if wait_for_save is not None:
+            wait_for_save(name)
+
+    def release(self, name: str):
+        self._prefetched.pop(name, None)
+        self._catalog.release(name)
+
+
+def _prefetchable_data_sets(plan: ExecutionPlan, catalog: DataCatalog) -> Set[str]:
+    """Names of the persisted inputs of the nodes, which can be loaded ahead
+    of time. Datasets held in memory gain nothing from it and datasets that
+    nodes confirm are left alone."""
+    data_sets = catalog._data_sets  # pylint: disable=protected-access
+    confirmed = {name for node in plan.nodes for name in node.confirms}
+    return {
+        name
+        for node in plan.nodes
+        for name in node.inputs
+        if name in data_sets
+        and not isinstance(data_sets[name], MemoryDataSet)
+        and name not in confirmed
+    }
 
 
 class SequentialRunner(AbstractRunner):
@@ -17,15 +142,67 @@ class SequentialRunner(AbstractRunner):
     topological sort of provided nodes.
     """
 
-    def __init__(self, is_async: bool = False):
+    def __init__(
+        self,
+        is_async: bool = False,
+        prefetch: int = 0,
+        max_prefetch_memory: Union[int, str] = None,
+        write_behind: bool = False,
+        io_limits: Dict[str, int] = None,
+        node_cache: NodeCache = None,
+        tracer: RunTracer = None,
+    ):
         """Instantiates the runner classs.
 
         Args:
             is_async: If True, the node inputs and outputs are loaded and saved
                 asynchronously with threads. Defaults to False.
+            prefetch: Number of upcoming nodes whose persisted inputs are
+                loaded by background threads while the current node runs.
+                An input is only loaded ahead of time once the nodes saving
+                it have completed. Defaults to 0, which disables prefetching.
+            max_prefetch_memory: Optional cap on the prefetched data not used
+                yet, either in bytes or as a string such as "2GB", counting
+                the deep memory usage of dataframes, the ``nbytes`` of arrays
+                and the items of builtin containers. An input is only loaded
+                ahead of time if its expected size fits in the cap along with
+                the loads still running. The expected size is the size of its
+                previous load, else the largest size loaded ahead so far, or
+                the whole cap before the first load. If not set, it is not
+                limited.
+            write_behind: If True, the outputs saved to persisted datasets are
+                written by background threads, and the following nodes get
+                the data held in memory without waiting for the save. The run
+                ends once every save has completed. Defaults to False.
+            io_limits: Optional mapping of dataset types, e.g.
+                ``SQLTableDataSet``, filesystem protocols, e.g. ``s3``, or
+                dataset names to the maximum number of concurrent loads and
+                saves of the matching datasets. Limits set with the
+                ``io_limit`` key of the catalog entries take precedence.
+            node_cache: Optional ``NodeCache`` memoizing the node outputs
+                across runs. Nodes whose function and inputs have not changed
+                since their outputs were cached are not run, their outputs are
+                restored from the cache instead.
+            tracer: Optional ``RunTracer`` recording the timeline of the runs
+                in the Chrome trace event format. The trace is written at the
+                end of every run, whether it succeeds or not.
 
+        Raises:
+            ValueError: bad parameters passed
         """
-        super().__init__(is_async=is_async)
+        super().__init__(
+            is_async=is_async,
+            write_behind=write_behind,
+            io_limits=io_limits,
+            node_cache=node_cache,
+            tracer=tracer,
+        )
+        if prefetch < 0:
+            raise ValueError("prefetch should be non-negative")
+        self._prefetch = prefetch
+        self._max_prefetch_memory = (
+            None if max_prefetch_memory is None else _parse_memory(max_prefetch_memory)
+        )
 
     def create_default_data_set(self, ds_name: str) -> AbstractDataSet:
         """Factory method for creating the default data set for the runner.
@@ -53,28 +230,99 @@ class SequentialRunner(AbstractRunner):
         Raises:
             Exception: in case of any downstream node failure.
         """
-        nodes = pipeline.nodes
+        plan = pipeline.compile()
+        nodes = plan.nodes
         done_nodes = set()
 
-        load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
+        if not self._prefetch:
+            pool = None
+        else:
+            catalog = _PrefetchingCatalog(catalog, self._io_executor)
+            pool = ThreadPoolExecutor(max_workers=self._prefetch)
+            prefetchable = _prefetchable_data_sets(plan, catalog)
+            # position of the last node saving each dataset, transcoded
+            # datasets being the same data under different names
+            saved_at = {
+                _strip_transcoding(name): position
+                for position, node in enumerate(nodes)
+                for name in node.outputs
+            }
+            if self._write_behind:
+                # the data saved during the run is held in memory, or has to
+                # wait for its save when loaded under another transcoded name
+                prefetchable = {
+                    name
+                    for name in prefetchable
+                    if _strip_transcoding(name) not in saved_at
+                }
+            prefetched = set()  # type: Set[Tuple[int, str]]
 
-        for exec_index, node in enumerate(nodes):
-            try:
-                run_node(node, catalog, self._is_async, run_id)
-                done_nodes.add(node)
-            except Exception:
-                self._suggest_resume_scenario(pipeline, done_nodes)
-                raise
+        try:
+            for exec_index, node in enumerate(nodes):
+                if pool is not None:
+                    self._prefetch_inputs(
+                        pool,
+                        catalog,
+                        nodes,
+                        exec_index,
+                        prefetchable,
+                        saved_at,
+                        prefetched,
+                    )
+                try:
+                    run_node(
+                        node,
+                        catalog,
+                        self._is_async,
+                        run_id,
+                        self._io_executor,
+                        self._node_cache,
+                        self._tracer,
+                    )
+                    done_nodes.add(node)
+                except Exception:
+                    self._suggest_resume_scenario(pipeline, done_nodes)
+                    raise
 
-            # decrement load counts and release any data sets we've finished with
-            for data_set in node.inputs:
-                load_counts[data_set] -= 1
-                if load_counts[data_set] < 1 and data_set not in pipeline.inputs():
-                    catalog.release(data_set)
-            for data_set in node.outputs:
-                if load_counts[data_set] < 1 and data_set not in pipeline.outputs():
+                # release any data sets we've finished with
+                for data_set in plan.release_schedule[exec_index]:
                     catalog.release(data_set)
 
-            self._logger.info(
-                "Completed %d out of %d tasks", exec_index + 1, len(nodes)
-            )
+                self._logger.info(
+                    "Completed %d out of %d tasks", exec_index + 1, len(nodes)
+                )
+        finally:
+            if pool is not None:
+                catalog.cancel_prefetch()  # type: ignore
+                pool.shutdown()
+
+    def _prefetch_inputs(  # pylint: disable=too-many-arguments
+        self,
+        pool: ThreadPoolExecutor,
+        catalog: _PrefetchingCatalog,
+        nodes: Tuple,
+        exec_index: int,
+        prefetchable: Set[str],
+        saved_at: Dict[str, int],
+        prefetched: Set[Tuple[int, str]],
+    ) -> None:
+        """Start loading the inputs of the nodes from ``exec_index`` to
+        ``exec_index + prefetch`` which are available, in plan order, so
+        that every node gets the data loaded ahead for it."""
+        window = nodes[exec_index : exec_index + self._prefetch + 1]
+        for position, node in enumerate(window, exec_index):
+            for name in node.inputs:
+                if (
+                    name not in prefetchable
+                    or (position, name) in prefetched
+                    or saved_at.get(_strip_transcoding(name), -1) >= exec_index
+                ):
+                    continue
+                cap = self._max_prefetch_memory
+                if cap is not None and (
+                    catalog.prefetched_size(cap) + catalog.expected_size(name, cap)
+                    > cap
+                ):
+                    return
+                catalog.prefetch(pool, name)
+                prefetched.add((position, name))
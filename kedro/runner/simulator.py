@@ -0,0 +1,271 @@
+"""``ScheduleSimulator`` analyses the dependency graph of a ``Pipeline`` and
+simulates how the runners schedule its nodes, to predict the makespan and
+the peak memory footprint of a run before choosing a runner and its number
+of workers.
+"""
+import heapq
+from collections import defaultdict
+from itertools import count
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple, Union
+
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+from kedro.runner.runner import (
+    _critical_path_priorities,
+    _estimate_durations,
+    _ReadyQueue,
+    _ResourceBudget,
+)
+from kedro.runner.trace import _read_trace
+
+_RUNNERS = ("SequentialRunner", "ThreadRunner", "ParallelRunner")
+
+
+class SimulatedRun(NamedTuple):
+    """The outcome of a run predicted by ``ScheduleSimulator.simulate``."""
+
+    runner: str
+    workers: int
+    makespan: float
+    peak_memory: int
+
+
+class ScheduleSimulator:
+    """``ScheduleSimulator`` analyses the dependency graph of a ``Pipeline``
+    and simulates how ``SequentialRunner``, ``ThreadRunner`` and
+    ``ParallelRunner`` schedule its nodes on a number of workers, given the
+    durations of the nodes and the sizes of the datasets measured in previous
+    runs, e.g. read from a trace written by ``RunTracer``.
+
+    The simulated runners start the nodes in the order they become ready,
+    within the CPU slots the nodes declare with their ``cpus:<n>`` tags. The
+    memory footprint of a run is made of the in-memory datasets, from the
+    start of the node saving them until they are released, and of the
+    persisted inputs and outputs of the running nodes. The nodes run by
+    ``ParallelRunner`` also hold copies of their in-memory inputs and
+    outputs, as the data is sent between processes.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import ScheduleSimulator
+        >>>
+        >>> simulator = ScheduleSimulator.from_trace(pipeline, "run.json")
+        >>> workers = simulator.recommend_workers("ParallelRunner")
+        >>> simulator.simulate("ParallelRunner", workers).makespan
+    """
+
+    def __init__(
+        self,
+        pipeline: Pipeline,
+        node_durations: Dict[str, float] = None,
+        data_set_sizes: Dict[str, int] = None,
+        in_memory: Iterable[str] = None,
+    ):
+        """Creates a new instance of ``ScheduleSimulator``.
+
+        Args:
+            pipeline: The ``Pipeline`` to analyse.
+            node_durations: Optional mapping of node names to their duration
+                in seconds, e.g. ``node_durations`` of a runner. Nodes without
+                a duration are assumed to take the mean duration, or one
+                second if no durations are provided.
+            data_set_sizes: Optional mapping of dataset names to the size of
+                their data in bytes. Datasets without a size are assumed to
+                take no memory.
+            in_memory: Optional names of the datasets whose data is held in
+                memory during the run, e.g. the ones not registered in the
+                catalog. Defaults to all the datasets saved by the nodes.
+
+        """
+        self._pipeline = pipeline
+        self._plan = pipeline.compile()
+        self._durations = _estimate_durations(self._plan.nodes, node_durations)
+        self._sizes = dict(data_set_sizes or {})
+        self._in_memory = (
+            set(in_memory) if in_memory is not None else pipeline.all_outputs()
+        )
+
+    @classmethod
+    def from_trace(
+        cls,
+        pipeline: Pipeline,
+        filepath: Union[str, Path],
+        in_memory: Iterable[str] = None,
+    ) -> "ScheduleSimulator":
+        """Create a ``ScheduleSimulator`` with the durations of the nodes and
+        the sizes of the datasets recorded in a trace written by
+        ``RunTracer``, e.g. with ``kedro run --trace``.
+
+        Args:
+            pipeline: The ``Pipeline`` to analyse.
+            filepath: The path of the JSON file of the trace. If it holds
+                several runs, the durations and sizes of the latest one are
+                used.
+            in_memory: Optional names of the datasets whose data is held in
+                memory during the run. Defaults to all the datasets saved by
+                the nodes.
+
+        Returns:
+            A new ``ScheduleSimulator``.
+
+        """
+        node_durations, data_set_sizes = _read_trace(filepath)
+        return cls(pipeline, node_durations, data_set_sizes, in_memory)
+
+    @property
+    def node_count(self) -> int:
+        """The number of nodes of the pipeline."""
+        return len(self._plan.nodes)
+
+    @property
+    def total_duration(self) -> float:
+        """The sum of the durations of the nodes in seconds, i.e. the
+        makespan of a sequential run."""
+        return sum(self._durations.values())
+
+    @property
+    def critical_path(self) -> List[Node]:
+        """The longest chain of dependent nodes, by duration, which no
+        number of workers can run faster than."""
+        priorities = _critical_path_priorities(
+            self._plan.node_dependencies, self._durations  # type: ignore
+        )
+        children = defaultdict(list)  # type: Dict[Node, List[Node]]
+        for node, parents in self._plan.node_dependencies.items():
+            for parent in parents:
+                children[parent].append(node)
+
+        path = []  # type: List[Node]
+        candidates = list(self._plan.nodes)
+        while candidates:
+            # the child with the longest remaining chain continues the path
+            node = max(candidates, key=priorities.__getitem__)
+            path.append(node)
+            candidates = children[node]
+        return path
+
+    @property
+    def critical_path_length(self) -> float:
+        """The duration of the critical path in seconds, i.e. the shortest
+        possible makespan of a run."""
+        return sum(self._durations[node] for node in self.critical_path)
+
+    @property
+    def layer_widths(self) -> List[int]:
+        """The number of nodes of every topological layer of the pipeline,
+        i.e. of ``Pipeline.grouped_nodes``, all of which can run in parallel.
+        """
+        return [len(layer) for layer in self._pipeline.grouped_nodes]
+
+    @property
+    def max_width(self) -> int:
+        """The maximum number of nodes which can run at the same time, i.e.
+        the number of workers beyond which a run gets no faster."""
+        return self._plan.max_width()
+
+    @property
+    def speedup(self) -> float:
+        """The theoretical speed-up of a run on enough workers over a
+        sequential run, i.e. the total duration of the nodes divided by the
+        duration of the critical path."""
+        length = self.critical_path_length
+        return self.total_duration / length if length else 1.0
+
+    def simulate(self, runner: str, workers: int = 1) -> SimulatedRun:
+        """Simulate a run of the pipeline.
+
+        Args:
+            runner: The name of the simulated runner, i.e. "SequentialRunner",
+                "ThreadRunner" or "ParallelRunner".
+            workers: The number of workers of the runner. A
+                ``SequentialRunner`` always runs on one worker.
+
+        Raises:
+            ValueError: bad parameters passed
+
+        Returns:
+            The predicted makespan in seconds and peak memory footprint in
+            bytes of the run.
+
+        """
+        if runner not in _RUNNERS:
+            raise ValueError(
+                f"Unknown runner `{runner}`. Simulated runners: {', '.join(_RUNNERS)}."
+            )
+        if workers <= 0:
+            raise ValueError("workers should be positive")
+        sequential = runner == "SequentialRunner"
+        if sequential:
+            workers = 1
+
+        plan = self._plan
+        # a SequentialRunner runs the nodes in the topological order of the plan
+        priorities = (
+            {node: -position for position, node in enumerate(plan.nodes)}
+            if sequential
+            else None
+        )
+        ready_queue = _ReadyQueue(plan.node_dependencies, priorities)  # type: ignore
+        budget = _ResourceBudget(plan.nodes, workers)
+        release_tracker = plan.release_tracker()
+        copied = runner == "ParallelRunner"
+
+        memory = peak = sum(self._held(name) for name in plan.inputs)
+        running = []  # type: List[Tuple[float, int, Node]]
+        counter = count()
+        now = 0.0
+        while running or ready_queue:
+            for node in ready_queue.pop_all(admit=budget.acquire):
+                memory += sum(self._held(name) for name in node.outputs)
+                memory += self._working_set(node, copied)
+                end = now + self._durations[node]
+                heapq.heappush(running, (end, next(counter), node))
+            peak = max(peak, memory)
+
+            now, _, node = heapq.heappop(running)
+            budget.release(node)
+            ready_queue.mark_done(node)
+            memory -= self._working_set(node, copied)
+            for name in release_tracker.mark_done(node):
+                memory -= self._held(name)
+        return SimulatedRun(runner, workers, now, peak)
+
+    def recommend_workers(self, runner: str, tolerance: float = 0.05) -> int:
+        """Find the smallest number of workers on which a run is predicted to
+        be at most ``tolerance`` slower than on ``max_width`` workers, on
+        which it is the fastest. The numbers of workers are tried one by one
+        from 1, since a run is not always faster on more workers.
+
+        Args:
+            runner: The name of the simulated runner, i.e. "SequentialRunner",
+                "ThreadRunner" or "ParallelRunner".
+            tolerance: The accepted slowdown, as a fraction of the shortest
+                makespan. Defaults to 5%.
+
+        Returns:
+            The recommended number of workers.
+
+        """
+        most = max(self.max_width, 1)
+        fastest = self.simulate(runner, most).makespan
+        for workers in range(1, most):
+            if self.simulate(runner, workers).makespan <= fastest * (1 + tolerance):
+                return workers
+        return most
+
+    def _held(self, name: str) -> int:
+        """The size of the data of a dataset held in memory during the run."""
+        return self._sizes.get(name, 0) if name in self._in_memory else 0
+
+    def _working_set(self, node: Node, copied: bool) -> int:
+        """The size of the data loaded and saved by a node while it runs,
+        besides the datasets held in memory, whose data is also copied into
+        the worker if ``copied``."""
+        names = set(node.inputs) | set(node.outputs)  # type: Set[str]
+        return sum(
+            self._sizes.get(name, 0)
+            for name in names
+            if copied or name not in self._in_memory
+        )
@@ -0,0 +1,227 @@
+"""Make-style staleness detection, which tells the nodes of a pipeline whose
+outputs are missing or older than their inputs. The status of the datasets
+is checked in batches, with one listing per directory of every filesystem,
+so that it takes a few round trips even on object stores.
+"""
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from kedro.io import DataCatalog
+from kedro.io.core import DataSetError
+from kedro.pipeline import Pipeline
+from kedro.pipeline.node import Node
+
+if TYPE_CHECKING:  # pragma: no cover
+    from kedro.runner.node_cache import NodeCache  # pylint: disable=cyclic-import
+
+# modification times returned by the most common fsspec filesystems
+_TIME_KEYS = ("mtime", "LastModified", "last_modified", "updated", "created")
+_MAX_STATUS_THREADS = 16
+
+
+class _Missing:
+    def __repr__(self):
+        return "_MISSING"
+
+
+_MISSING = _Missing()
+
+
+def _to_timestamp(value: Any) -> Optional[float]:
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return _to_timestamp(datetime.fromisoformat(value.replace("Z", "+00:00")))
+        except ValueError:
+            return None
+    return None
+
+
+def _locate(catalog: DataCatalog, name: str) -> Tuple[Any, Any]:
+    """Find the filesystem and the path a dataset loads its data from, i.e.
+    the path of its load version for versioned datasets.
+
+    Returns:
+        The filesystem, or None if the dataset is not stored in one, and the
+        path, or ``_MISSING`` if the dataset has no version to load.
+
+    """
+    data_set = catalog._data_sets[name]  # pylint: disable=protected-access
+    fs = getattr(data_set, "_fs", None)
+    get_load_path = getattr(data_set, "_get_load_path", None)
+    if fs is None or get_load_path is None:
+        return None, None
+    try:
+        return fs, str(get_load_path())
+    except DataSetError:
+        return fs, _MISSING
+
+
+def _list_directory(fs: Any, directory: str) -> Optional[Dict[str, Dict]]:
+    try:
+        entries = fs.ls(directory, detail=True)
+    except FileNotFoundError:
+        return {}
+    except Exception:  # pylint: disable=broad-except
+        return None
+    # pylint: disable=protected-access
+    return {fs._strip_protocol(entry["name"]).rstrip("/"): entry for entry in entries}
+
+
+def _file_status(info: Optional[Dict]) -> Any:
+    if info is None:
+        return _MISSING
+    for key in _TIME_KEYS:
+        timestamp = _to_timestamp(info.get(key))
+        if timestamp is not None:
+            return timestamp
+    return None
+
+
+def _get_data_set_statuses(
+    catalog: DataCatalog, names: Iterable[str]
+) -> Dict[str, Any]:
+    """Check the status of datasets in batches.
+
+    Datasets stored on a filesystem are looked up in a listing of their
+    directory, made once for all the datasets in the same directory. The
+    other datasets are checked with ``exists()``. All the checks run in a
+    pool of threads.
+
+    Args:
+        catalog: The ``DataCatalog`` holding the datasets.
+        names: The names of the datasets to check.
+
+    Returns:
+        A mapping of the dataset names to ``_MISSING`` if the dataset does
+        not exist or is not in ``catalog``, to the time its data was last
+        written at, in seconds since the epoch, or to None if the dataset
+        exists but that time is unknown.
+
+    """
+    names = list(names)
+    statuses = {}  # type: Dict[str, Any]
+    registered = [name for name in names if name in catalog._data_sets]
+    for name in set(names) - set(registered):
+        statuses[name] = _MISSING
+
+    with ThreadPoolExecutor(max_workers=_MAX_STATUS_THREADS) as pool:
+        located = dict(
+            zip(registered, pool.map(lambda n: _locate(catalog, n), registered))
+        )
+
+        by_directory = defaultdict(list)  # type: Dict[Tuple[int, str], List[str]]
+        filesystems = {}
+        paths = {}
+        unlocated = []
+        for name, (fs, path) in located.items():
+            if fs is None:
+                unlocated.append(name)
+            elif path is _MISSING:
+                statuses[name] = _MISSING
+            else:
+                # pylint: disable=protected-access
+                paths[name] = fs._strip_protocol(path).rstrip("/")
+                directory = paths[name].rsplit("/", 1)[0]
+                by_directory[(id(fs), directory)].append(name)
+                filesystems[id(fs)] = fs
+
+        directories = list(by_directory)
+        listings = pool.map(
+            lambda key: _list_directory(filesystems[key[0]], key[1]), directories
+        )
+        for key, listing in zip(directories, listings):
+            for name in by_directory[key]:
+                if listing is None:
+                    # the directory cannot be listed, so check the dataset
+                    unlocated.append(name)
+                else:
+                    statuses[name] = _file_status(listing.get(paths[name]))
+
+        exist = pool.map(catalog.exists, unlocated)
+        for name, exists in zip(unlocated, exist):
+            statuses[name] = None if exists else _MISSING
+    return statuses
+
+
+def _is_parameter(name: str) -> bool:
+    return name == "parameters" or name.startswith("params:")
+
+
+def _find_stale_nodes(
+    pipeline: Pipeline, catalog: DataCatalog, node_cache: "NodeCache" = None
+) -> Set[Node]:
+    """Find the nodes of a pipeline which are stale: at least one of their
+    outputs does not exist, or one of their inputs was written after one of
+    their outputs. Datasets whose write time is unknown are not compared.
+
+    Args:
+        pipeline: The ``Pipeline`` to check.
+        catalog: The ``DataCatalog`` holding the datasets of the pipeline.
+        node_cache: Optional ``NodeCache`` in which the fingerprints of the
+            code and parameters of the nodes were recorded when they last
+            ran. Nodes whose fingerprint changed since are also stale.
+
+    Returns:
+        The stale nodes, without their descendants, except the ones loading
+        in-memory data from a stale node. Nodes producing a free output of
+        the pipeline are always stale.
+
+    """
+    data_sets = {
+        name
+        for node in pipeline.nodes
+        for name in node.inputs + node.outputs
+        if not _is_parameter(name)
+    }
+    statuses = _get_data_set_statuses(catalog, sorted(data_sets))
+    # the nodes producing the unregistered datasets which are not outputs of
+    # the pipeline are only run if the nodes loading them are
+    in_memory = data_sets - set(catalog.list()) - pipeline.outputs()
+    for name in in_memory:
+        statuses[name] = None
+
+    stale = set()
+    stale_data = set()  # type: Set[str]
+    # in topological order, so that the in-memory data is dated by the newest
+    # input of its producer before the nodes loading it are checked
+    for node in pipeline.nodes:
+        input_times = [
+            statuses[name]
+            for name in node.inputs
+            if not _is_parameter(name) and statuses[name] not in (None, _MISSING)
+        ]
+        if _is_stale(node, statuses, input_times, stale_data) or (
+            node_cache is not None and node_cache.is_changed(node, catalog)
+        ):
+            stale.add(node)
+            stale_data.update(name for name in node.outputs if name in in_memory)
+        else:
+            for name in node.outputs:
+                if name in in_memory and input_times:
+                    statuses[name] = max(input_times)
+    return stale
+
+
+def _is_stale(
+    node: Node,
+    statuses: Dict[str, Any],
+    input_times: List[float],
+    stale_data: Set[str],
+) -> bool:
+    """Tell if a node is stale from the status of its outputs, the write
+    times of its inputs and the in-memory data produced by stale nodes."""
+    outputs = [statuses[name] for name in node.outputs]
+    if any(status is _MISSING for status in outputs):
+        return True
+    if stale_data.intersection(node.inputs):
+        return True
+    output_times = [status for status in outputs if status is not None]
+    return bool(output_times and input_times and max(input_times) > min(output_times))
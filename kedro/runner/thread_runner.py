@@ -2,16 +2,31 @@
 be used to run the ``Pipeline`` in parallel groups formed by toposort
 using threads.
 """
+import time
 import warnings
-from collections import Counter
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
-from itertools import chain
-from typing import Set
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Set, Union
 
 from kedro.io import DataCatalog, MemoryDataSet
 from kedro.pipeline import Pipeline
 from kedro.pipeline.node import Node
-from kedro.runner.runner import AbstractRunner, run_node
+from kedro.runner.node_cache import NodeCache
+from kedro.runner.runner import (
+    _SPECULATION_INTERVAL,
+    AbstractRunner,
+    _ClaimingCatalog,
+    _critical_path_priorities,
+    _duration_history,
+    _estimate_durations,
+    _parse_memory,
+    _ReadyQueue,
+    _ResourceBudget,
+    _simulate_makespan,
+    _Speculator,
+    _validate_priority,
+    run_node,
+)
+from kedro.runner.trace import RunTracer, _no_span
 
 
 class ThreadRunner(AbstractRunner):
@@ -20,7 +35,19 @@ class ThreadRunner(AbstractRunner):
     using threads.
     """
 
-    def __init__(self, max_workers: int = None, is_async: bool = False):
+    def __init__(
+        self,
+        max_workers: int = None,
+        is_async: bool = False,
+        priority: str = None,
+        node_durations: Dict[str, float] = None,
+        max_memory: Union[int, str] = None,
+        write_behind: bool = False,
+        io_limits: Dict[str, int] = None,
+        node_cache: NodeCache = None,
+        speculative: bool = False,
+        tracer: RunTracer = None,
+    ):
         """
         Instantiates the runner.
 
@@ -31,6 +58,47 @@ class ThreadRunner(AbstractRunner):
             is_async: If True, set to False, because `ThreadRunner`
                 doesn't support loading and saving the node inputs and
                 outputs asynchronously with threads. Defaults to False.
+            priority: Optional policy used to pick among ready nodes when
+                there are more of them than free workers. The only available
+                policy is "critical_path", which submits first the nodes with
+                the longest estimated remaining downstream path. If not set,
+                ready nodes are submitted in the order they became ready.
+            node_durations: Optional mapping of node names to their duration
+                in seconds, e.g. ``node_durations`` of a previous run, used by
+                the "critical_path" policy. Nodes without an estimate are
+                assumed to take the mean duration, or one second if no
+                estimates are provided.
+            max_memory: Optional memory budget of the run, either in bytes or
+                as a string such as "16GB". Nodes declare the memory they need
+                with a ``memory:<amount>`` tag, e.g. ``memory:2GB``, and the
+                CPU slots they take with a ``cpus:<n>`` tag, out of
+                ``max_workers`` slots. Ready nodes only start while the
+                resources they declare are available. If not set, memory is
+                not limited.
+            write_behind: If True, the outputs saved to persisted datasets are
+                written by background threads, and the nodes loading them get
+                the data held in memory without waiting for the save. The run
+                ends once every save has completed. Defaults to False.
+            io_limits: Optional mapping of dataset types, e.g.
+                ``SQLTableDataSet``, filesystem protocols, e.g. ``s3``, or
+                dataset names to the maximum number of concurrent loads and
+                saves of the matching datasets. Limits set with the
+                ``io_limit`` key of the catalog entries take precedence.
+            node_cache: Optional ``NodeCache`` memoizing the node outputs
+                across runs. Nodes whose function and inputs have not changed
+                since their outputs were cached are not run, their outputs are
+                restored from the cache instead.
+            speculative: If True, a node tagged ``idempotent`` which has run
+                for more than twice the longest of its last recorded
+                durations, and for more than a second, is started again on
+                an idle worker. The first attempt to complete is kept and the
+                outputs of the other one are never saved. Durations are
+                recorded in the previous runs of the runner or given with
+                ``node_durations``. Up to twice as many workers as nodes
+                which can run at the same time are started. Defaults to False.
+            tracer: Optional ``RunTracer`` recording the timeline of the runs
+                in the Chrome trace event format. The trace is written at the
+                end of every run, whether it succeeds or not.
 
         Raises:
             ValueError: bad parameters passed
@@ -41,12 +109,24 @@ class ThreadRunner(AbstractRunner):
                 "node inputs and outputs asynchronously with threads. "
                 "Setting `is_async` to False."
             )
-        super().__init__(is_async=False)
+        super().__init__(
+            is_async=False,
+            write_behind=write_behind,
+            io_limits=io_limits,
+            node_cache=node_cache,
+            tracer=tracer,
+        )
 
         if max_workers is not None and max_workers <= 0:
             raise ValueError("max_workers should be positive")
+        _validate_priority(priority)
 
         self._max_workers = max_workers
+        self._priority = priority
+        self.node_durations = dict(node_durations or {})
+        self._max_memory = None if max_memory is None else _parse_memory(max_memory)
+        self._speculative = speculative
+        self._duration_history = _duration_history(self.node_durations)
 
     def create_default_data_set(self, ds_name: str) -> MemoryDataSet:  # type: ignore
         """Factory method for creating the default dataset for the runner.
@@ -63,20 +143,15 @@ class ThreadRunner(AbstractRunner):
 
     def _get_required_workers_count(self, pipeline: Pipeline):
         """
-        Calculate the max number of processes required for the pipeline
+        Calculate the max number of threads required for the pipeline, i.e.
+        the largest number of its nodes which can run at the same time, or
+        twice as many in speculative mode.
         """
-        # Number of nodes is a safe upper-bound estimate.
-        # It's also safe to reduce it by the number of layers minus one,
-        # because each layer means some nodes depend on other nodes
-        # and they can not run in parallel.
-        # It might be not a perfect solution, but good enough and simple.
-        required_threads = len(pipeline.nodes) - len(pipeline.grouped_nodes) + 1
-
-        return (
-            min(required_threads, self._max_workers)
-            if self._max_workers
-            else required_threads
-        )
+        workers = max(pipeline.compile().max_width(limit=self._max_workers), 1)
+        if self._speculative:
+            # room for a second attempt of every node which can run at once
+            workers *= 2
+        return min(workers, self._max_workers) if self._max_workers else workers
 
     def _run(  # pylint: disable=too-many-locals,useless-suppression
         self, pipeline: Pipeline, catalog: DataCatalog, run_id: str = None
@@ -92,51 +167,130 @@ class ThreadRunner(AbstractRunner):
             Exception: in case of any downstream node failure.
 
         """
-        nodes = pipeline.nodes
-        load_counts = Counter(chain.from_iterable(n.inputs for n in nodes))
-        node_dependencies = pipeline.node_dependencies
-        todo_nodes = set(node_dependencies.keys())
+        plan = pipeline.compile()
+        nodes = plan.nodes
+        release_tracker = plan.release_tracker()
+        node_dependencies = plan.node_dependencies
         done_nodes = set()  # type: Set[Node]
-        futures = set()
+        futures = {}  # type: Dict[Future, Node]
+        # attempts of completed nodes which still run, and hold their resources
+        discarded_attempts = {}  # type: Dict[Future, Node]
         done = None
         max_workers = self._get_required_workers_count(pipeline)
 
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        priorities = predicted_makespan = None
+        if self._priority:
+            durations = _estimate_durations(nodes, self.node_durations)
+            priorities = _critical_path_priorities(node_dependencies, durations)
+            predicted_makespan = _simulate_makespan(
+                node_dependencies, durations, max_workers, priorities
+            )
+        ready_queue = _ReadyQueue(node_dependencies, priorities)
+        budget = _ResourceBudget(nodes, max_workers, self._max_memory)
+        start_times = {}  # type: Dict[Node, float]
+        run_start = time.perf_counter()
+        speculator = None
+        if self._speculative:
+            speculator = _Speculator(self._duration_history)
+        claims = {}  # type: Dict[str, int]
+        span = self._tracer.span if self._tracer is not None else _no_span
+
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+        try:
             while True:
-                ready = {n for n in todo_nodes if node_dependencies[n] <= done_nodes}
-                todo_nodes -= ready
+                # Hold ready nodes back until their resources are free, so
+                # that the most urgent node that fits always starts next.
+                ready = ready_queue.pop_all(admit=budget.acquire)
+                if speculator is not None:
+                    # start the stragglers again on the otherwise idle workers
+                    idle = max_workers - len(futures) - speculator.running()
+                    for node in speculator.stragglers(idle - len(ready)):
+                        if budget.acquire(node):
+                            self._logger.warning(
+                                "Node `%s` runs longer than expected, "
+                                "starting it again.",
+                                node.name,
+                            )
+                            ready.append(node)
                 for node in ready:
-                    futures.add(
-                        pool.submit(run_node, node, catalog, self._is_async, run_id)
+                    start_times.setdefault(node, time.perf_counter())
+                    node_catalog = catalog
+                    attempt = speculator.attempt(node) if speculator else None
+                    if attempt is not None:
+                        node_catalog = _ClaimingCatalog(catalog, node, attempt, claims)
+                    future = pool.submit(
+                        run_node,
+                        node,
+                        node_catalog,
+                        self._is_async,
+                        run_id,
+                        self._io_executor,
+                        self._node_cache,
+                        self._tracer,
                     )
-                if not futures:
+                    futures[future] = node
+                    if speculator is not None:
+                        speculator.add(node, future)
+                todo_nodes = ready_queue.todo_nodes
+                if not futures and not (todo_nodes and discarded_attempts):
                     assert not todo_nodes, (todo_nodes, done_nodes, ready, done)
                     break
-                done, futures = wait(futures, return_when=FIRST_COMPLETED)
+                # wake up regularly to look for stragglers
+                timeout = _SPECULATION_INTERVAL if speculator else None
+                with span("wait", "scheduler"):
+                    done, _ = wait(
+                        [*futures, *discarded_attempts],
+                        timeout=timeout,
+                        return_when=FIRST_COMPLETED,
+                    )
                 for future in done:
+                    if future in discarded_attempts:
+                        budget.release(discarded_attempts.pop(future))
+                        continue
+                    node = futures.pop(future)
+                    budget.release(node)
+                    # the error of a failed attempt is not raised while
+                    # another attempt of the node still runs
+                    if (
+                        speculator is not None
+                        and future.exception() is not None
+                        and speculator.retry(node, future)
+                    ):
+                        continue
                     try:
-                        node = future.result()
+                        future.result()
                     except Exception:
                         self._suggest_resume_scenario(pipeline, done_nodes)
                         raise
+                    if speculator is not None:
+                        for discarded in speculator.done(node, future):
+                            # its resources are released once it stops
+                            discarded_attempts[discarded] = futures.pop(discarded)
                     done_nodes.add(node)
+                    ready_queue.mark_done(node)
+                    if priorities is not None:
+                        self.node_durations[node.name] = (
+                            time.perf_counter() - start_times[node]
+                        )
                     self._logger.info("Completed node: %s", node.name)
                     self._logger.info(
                         "Completed %d out of %d tasks", len(done_nodes), len(nodes)
                     )
 
-                    # Decrement load counts, and release any datasets we
-                    # have finished with.
-                    for data_set in node.inputs:
-                        load_counts[data_set] -= 1
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.inputs()
-                        ):
-                            catalog.release(data_set)
-                    for data_set in node.outputs:
-                        if (
-                            load_counts[data_set] < 1
-                            and data_set not in pipeline.outputs()
-                        ):
-                            catalog.release(data_set)
+                    # Release any datasets we have finished with.
+                    for data_set in release_tracker.mark_done(node):
+                        catalog.release(data_set)
+        finally:
+            # discarded attempts keep running in the background until their
+            # next load or save, for which the I/O threads of the run are kept
+            running = [f for f in discarded_attempts if not f.done()]
+            if running:
+                self._io_executor.keep_alive(running)
+            pool.shutdown(wait=not running)
+
+        if priorities is not None:
+            self._logger.info(
+                "Pipeline makespan: %.2fs (predicted %.2fs)",
+                time.perf_counter() - run_start,
+                predicted_makespan,
+            )
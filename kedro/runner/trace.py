@@ -0,0 +1,237 @@
+"""``RunTracer`` records the timeline of a run in the Chrome trace event
+format, which can be opened in Perfetto or ``chrome://tracing``.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+
+class _NoSpan:
+    """Context manager doing nothing, used in place of the spans of a run
+    which is not traced.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def _data_size(data: Any) -> int:
+    """Estimate the size in bytes of some data with the objects it holds.
+    Dataframes report their deep memory usage and arrays their ``nbytes``,
+    while the items of builtin containers are measured once each.
+    """
+    size = 0
+    seen = set()
+    todo = [data]
+    while todo:
+        obj = todo.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        memory_usage = getattr(obj, "memory_usage", None)
+        nbytes = getattr(obj, "nbytes", None)
+        if callable(memory_usage):
+            usage = memory_usage(deep=True)
+            size += int(usage.sum() if hasattr(usage, "sum") else usage)
+        elif isinstance(nbytes, int):
+            size += nbytes
+        else:
+            size += sys.getsizeof(obj)
+            if isinstance(obj, dict):
+                todo.extend(obj.keys())
+                todo.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+                todo.extend(obj)
+    return size
+
+
+# pylint: disable=unused-argument
+def _no_span(name: str, category: str, **args: Any) -> _NoSpan:
+    """Return a span which records nothing, so that a run which is not
+    traced only pays for a function call per span.
+    """
+    return _NO_SPAN
+
+
+class RunTracer:
+    """``RunTracer`` records the timeline of the runs of a runner in the
+    Chrome trace event format, with one track per process and thread running
+    nodes. The spans of a node nest the loads of its inputs, the hooks, the
+    call of its function and the saves of its outputs, and the runners
+    record the time their scheduler waits for nodes to complete.
+
+    The trace is written to ``filepath`` at the end of every run, whether it
+    succeeds or not, and can be opened in https://ui.perfetto.dev or
+    ``chrome://tracing``.
+
+    Example:
+    ::
+
+        >>> from kedro.runner import RunTracer, ThreadRunner
+        >>>
+        >>> runner = ThreadRunner(tracer=RunTracer("run.json"))
+        >>> runner.run(pipeline, catalog)
+    """
+
+    def __init__(self, filepath: Union[str, Path], origin: float = None):
+        """Creates a new instance of ``RunTracer``.
+
+        Args:
+            filepath: The path of the JSON file the trace is written to.
+            origin: The value of ``time.perf_counter()`` at which the timeline
+                starts. Defaults to the creation of the tracer. Runners set
+                it for the tracers of their worker processes, so that all the
+                spans share the same timeline.
+
+        """
+        self._filepath = Path(filepath)
+        self._origin = time.perf_counter() if origin is None else origin
+        self._pid = os.getpid()
+        self._events = []  # type: List[Dict[str, Any]]
+        # names of the threads spans were recorded in, by process and thread
+        self._tracks = {}  # type: Dict[Tuple[int, int], str]
+
+    @property
+    def filepath(self) -> Path:
+        """The path of the JSON file the trace is written to."""
+        return self._filepath
+
+    @property
+    def origin(self) -> float:
+        """The value of ``time.perf_counter()`` at which the timeline starts."""
+        return self._origin
+
+    @contextmanager
+    def span(
+        self, name: str, category: str, data: Any = None, **args: Any
+    ) -> Iterator[None]:
+        """Record the time spent in the ``with`` block as a span of the track
+        of the current process and thread.
+
+        Args:
+            name: The name of the span.
+            category: The category of the span, e.g. ``node`` or ``load``.
+            data: Optional data saved in the ``with`` block. Its size in
+                bytes, counting the deep memory usage of dataframes, the
+                ``nbytes`` of arrays and the items of builtin containers, is
+                shown with the span as its ``size`` value.
+            **args: Values shown with the span.
+
+        """
+        if data is not None:
+            args["size"] = _data_size(data)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            thread = threading.current_thread()
+            track = (os.getpid(), thread.ident)
+            if track not in self._tracks:
+                self._tracks[track] = thread.name
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": track[0],
+                "tid": track[1],
+            }
+            if args:
+                event["args"] = args
+            self._events.append(event)
+
+    def pop_events(self) -> List[Dict[str, Any]]:
+        """Remove the events recorded so far from the tracer and return them,
+        together with the names of their threads, e.g. to send the events
+        recorded in a worker process to the tracer of the runner.
+
+        Returns:
+            A list of Chrome trace events.
+
+        """
+        events, self._events = self._events, []
+        threads = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for (pid, tid), name in self._tracks.items()
+        ]
+        return threads + events
+
+    def add_events(self, events: Iterable[Dict[str, Any]]) -> None:
+        """Add events returned by ``pop_events`` to the trace.
+
+        Args:
+            events: Chrome trace events.
+
+        """
+        for event in events:
+            if event["ph"] == "M":
+                self._tracks[(event["pid"], event["tid"])] = event["args"]["name"]
+            else:
+                self._events.append(event)
+
+    def save(self) -> None:
+        """Write the trace recorded so far to ``filepath``."""
+        events = self.pop_events()
+        self.add_events(events)
+        for pid in sorted({pid for pid, _ in self._tracks}):
+            name = "runner" if pid == self._pid else f"worker {pid}"
+            events.append(
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": 0,
+                    "args": {"name": name},
+                }
+            )
+        events.sort(key=lambda event: event.get("ts", -1))
+        self._filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._filepath, "w") as trace_file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file)
+
+
+def _read_trace(filepath: Union[str, Path]) -> Tuple[Dict[str, float], Dict[str, int]]:
+    """Read the durations of the nodes and the sizes of the datasets saved in
+    a trace written by ``RunTracer``. When the trace holds several runs, the
+    values of the latest one are kept.
+
+    Args:
+        filepath: The path of the JSON file of the trace.
+
+    Returns:
+        A mapping of node names to their duration in seconds, and a mapping
+        of dataset names to their size in bytes.
+
+    """
+    with open(filepath) as trace_file:
+        events = json.load(trace_file)["traceEvents"]
+    node_durations = {}  # type: Dict[str, float]
+    data_set_sizes = {}  # type: Dict[str, int]
+    for event in sorted(events, key=lambda event: event.get("ts", -1)):
+        if event["ph"] != "X":
+            continue
+        if event["cat"] == "node":
+            node_durations[event["name"]] = event["dur"] / 1e6
+        elif event["cat"] == "save" and "size" in event.get("args", {}):
+            data_set_sizes[event["name"][len("save ") :]] = event["args"]["size"]
+    return node_durations, data_set_sizes
@@ -16,6 +16,7 @@ from click.testing import CliRunner
 from pytest import fixture
 
 from kedro import __version__ as kedro_version
+from kedro.framework.cli.cache import cache_cli
 from kedro.framework.cli.catalog import catalog_cli
 from kedro.framework.cli.cli import cli
 from kedro.framework.cli.jupyter import jupyter_cli
@@ -101,6 +102,7 @@ def fake_kedro_cli():
         sources=[
             cli,
             create_cli,
+            cache_cli,
             catalog_cli,
             jupyter_cli,
             pipeline_cli,
@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 from pathlib import Path
@@ -11,6 +12,8 @@ from kedro.extras.datasets.pandas import CSVDataSet
 from kedro.framework.cli.pipeline import _sync_dirs
 from kedro.framework.project import settings
 from kedro.framework.session import KedroSession
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
 
 PACKAGE_NAME = "dummy_package"
 PIPELINE_NAME = "my_pipeline"
@@ -544,6 +547,146 @@ class TestPipelineDescribeCommand:
         yaml_dump_mock.assert_called_once_with(expected_dict)
 
 
+def identity(*args):
+    return args  # pragma: no cover
+
+
+@pytest.fixture
+def fan_out_fan_in():
+    return Pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="long"),
+            node(identity, "B", "D", name="short"),
+            node(identity, "B", "E", name="other_short"),
+            node(identity, ["C", "D", "E"], "F", name="last"),
+        ]
+    )
+
+
+@pytest.mark.usefixtures("chdir_to_dummy_project", "patch_log")
+class TestPipelineAnalyzeCommand:
+    @pytest.fixture(autouse=True)
+    def mock_pipelines(self, mocker, fan_out_fan_in):
+        return mocker.patch(
+            "kedro.framework.cli.pipeline.pipelines",
+            {"__default__": fan_out_fan_in, "other": Pipeline([])},
+        )
+
+    @pytest.fixture(autouse=True)
+    def fake_load_context(self, mocker):
+        context = mocker.MagicMock()
+        context.catalog = DataCatalog()
+        return mocker.patch(
+            "kedro.framework.session.KedroSession.load_context", return_value=context
+        )
+
+    def test_analyze_pipeline(self, fake_project_cli, fake_metadata):
+        result = CliRunner().invoke(
+            fake_project_cli, ["pipeline", "analyze"], obj=fake_metadata
+        )
+
+        assert not result.exit_code, result.output
+        analysis = yaml.safe_load(result.output)
+        assert analysis["Nodes"] == 5
+        critical_path = analysis["Critical path"]
+        assert [critical_path[0], critical_path[-1]] == ["first", "last"]
+        assert analysis["Critical path length"] == "3.00s"
+        assert analysis["Layer widths"] == [1, 3, 1]
+        assert analysis["Maximum width"] == 3
+        assert analysis["Theoretical speed-up"] == "1.67x"
+        simulations = analysis["Simulations"]
+        assert simulations["SequentialRunner"] == {
+            1: {"Makespan": "5.00s", "Peak memory": "0B"}
+        }
+        makespans = {
+            workers: run["Makespan"]
+            for workers, run in simulations["ThreadRunner"].items()
+        }
+        assert makespans == {1: "5.00s", 2: "4.00s", 3: "3.00s"}
+        assert analysis["Recommended workers"] == {
+            "ThreadRunner": 3,
+            "ParallelRunner": 3,
+        }
+
+    def test_analyze_trace(self, fake_project_cli, fake_metadata, tmp_path):
+        durations = {"first": 1, "long": 4, "short": 2, "other_short": 2, "last": 1}
+        events = [
+            {"name": name, "cat": "node", "ph": "X", "ts": 0, "dur": duration * 1e6}
+            for name, duration in durations.items()
+        ]
+        events.append(
+            {
+                "name": "save B",
+                "cat": "save",
+                "ph": "X",
+                "ts": 0,
+                "dur": 0,
+                "args": {"size": 2048},
+            }
+        )
+        trace = tmp_path / "run.json"
+        trace.write_text(json.dumps({"traceEvents": events}))
+
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["pipeline", "analyze", "--trace", str(trace), "--workers", "3, 2"],
+            obj=fake_metadata,
+        )
+
+        assert not result.exit_code, result.output
+        analysis = yaml.safe_load(result.output)
+        assert analysis["Critical path"] == ["first", "long", "last"]
+        assert analysis["Critical path length"] == "6.00s"
+        assert analysis["Simulations"]["ThreadRunner"] == {
+            2: {"Makespan": "6.00s", "Peak memory": "2.0KB"},
+            3: {"Makespan": "6.00s", "Peak memory": "2.0KB"},
+        }
+        # the workers hold copies of B
+        peak = analysis["Simulations"]["ParallelRunner"][3]["Peak memory"]
+        assert peak == "8.0KB"
+        assert analysis["Recommended workers"]["ThreadRunner"] == 2
+
+    def test_empty_pipeline(self, fake_project_cli, fake_metadata):
+        result = CliRunner().invoke(
+            fake_project_cli, ["pipeline", "analyze", "other"], obj=fake_metadata
+        )
+
+        assert not result.exit_code, result.output
+        analysis = yaml.safe_load(result.output)
+        assert analysis["Nodes"] == 0
+        assert list(analysis["Simulations"]["ThreadRunner"]) == [1]
+
+    @pytest.mark.parametrize(
+        "workers,error",
+        [
+            ("2,a", "Invalid number of workers: invalid literal for int()"),
+            ("2,0", "The numbers of workers should be positive."),
+        ],
+    )
+    def test_invalid_workers(self, fake_project_cli, fake_metadata, workers, error):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["pipeline", "analyze", "--workers", workers],
+            obj=fake_metadata,
+        )
+
+        assert result.exit_code
+        assert error in result.output
+
+    def test_not_found_pipeline(self, fake_project_cli, fake_metadata):
+        result = CliRunner().invoke(
+            fake_project_cli, ["pipeline", "analyze", "missing"], obj=fake_metadata
+        )
+
+        assert result.exit_code
+        expected_output = (
+            "Error: `missing` pipeline not found. Existing pipelines: "
+            "[__default__, other]\n"
+        )
+        assert expected_output in result.output
+
+
 class TestSyncDirs:
     @pytest.fixture(autouse=True)
     def mock_click(self, mocker):
@@ -0,0 +1,93 @@
+import os
+import shutil
+
+import pytest
+from click.testing import CliRunner
+
+from kedro.framework.cli.cache import NODE_CACHE_DIR, _format_size
+from kedro.pipeline import node
+from kedro.runner import NodeCache
+
+
+def identity(arg):
+    return arg  # pragma: no cover
+
+
+@pytest.fixture
+def node_cache(fake_metadata):
+    cache_path = fake_metadata.project_path / NODE_CACHE_DIR
+    node_cache = NodeCache(cache_path)
+    node_cache.put("a" * 64, node(identity, "A", "B", name="first"), {"B": 1})
+    node_cache.put("b" * 64, node(identity, "B", "C", name="second"), {"C": 2})
+    # the first entry is the least recently used one
+    os.utime(cache_path / f"{'a' * 64}.pkl", (0, 0))
+    yield node_cache
+    shutil.rmtree(str(cache_path))
+
+
+@pytest.mark.parametrize(
+    "size,expected",
+    [(0, "0B"), (1023, "1023B"), (2048, "2.0KB"), (3 * 1024 ** 5, "3072.0TB")],
+)
+def test_format_size(size, expected):
+    assert _format_size(size) == expected
+
+
+@pytest.mark.usefixtures("chdir_to_dummy_project", "patch_log")
+class TestCacheListCommand:
+    def test_list(self, fake_project_cli, fake_metadata, node_cache):
+        result = CliRunner().invoke(
+            fake_project_cli, ["cache", "list"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        lines = result.output.splitlines()
+        assert lines[0].startswith("bbbbbbbbbbbb")
+        assert lines[0].endswith("second -> C")
+        assert lines[1].startswith("aaaaaaaaaaaa")
+        assert lines[1].endswith("first -> B")
+        assert lines[2].startswith("2 entries")
+
+    def test_list_empty(self, fake_project_cli, fake_metadata):
+        result = CliRunner().invoke(
+            fake_project_cli, ["cache", "list"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        assert result.output == "0 entries, 0B in total.\n"
+
+
+@pytest.mark.usefixtures("chdir_to_dummy_project", "patch_log")
+class TestCachePruneCommand:
+    def test_prune_max_size(self, fake_project_cli, fake_metadata, node_cache):
+        max_size = max(entry["size"] for entry in node_cache.entries())
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["cache", "prune", "--max-size", str(max_size)],
+            obj=fake_metadata,
+        )
+        assert not result.exit_code
+        assert "Evicted 1 entries" in result.output
+        assert [entry["node"] for entry in node_cache.entries()] == ["second"]
+
+    def test_prune_all(self, fake_project_cli, fake_metadata, node_cache):
+        result = CliRunner().invoke(
+            fake_project_cli, ["cache", "prune", "--all"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        assert "Evicted 2 entries" in result.output
+        assert node_cache.entries() == []
+
+    def test_prune_without_options(self, fake_project_cli, fake_metadata):
+        result = CliRunner().invoke(
+            fake_project_cli, ["cache", "prune"], obj=fake_metadata
+        )
+        assert result.exit_code
+        assert "Please specify either --max-size or --all." in result.output
+
+    def test_prune_invalid_max_size(self, fake_project_cli, fake_metadata):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["cache", "prune", "--max-size", "lots"],
+            obj=fake_metadata,
+        )
+        assert result.exit_code
+        assert "Invalid amount of memory `lots`" in result.output
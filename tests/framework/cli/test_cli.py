@@ -11,6 +11,7 @@ from pytest import fixture, mark, raises
 
 from kedro import __version__ as version
 from kedro.framework.cli import get_project_context, load_entry_points
+from kedro.framework.cli.cache import NODE_CACHE_DIR, cache_cli
 from kedro.framework.cli.catalog import catalog_cli
 from kedro.framework.cli.cli import KedroCLI, _init_plugins, cli
 from kedro.framework.cli.jupyter import jupyter_cli
@@ -28,7 +29,7 @@ from kedro.framework.cli.utils import (
     get_pkg_version,
 )
 from kedro.framework.session import KedroSession
-from kedro.runner import ParallelRunner, SequentialRunner
+from kedro.runner import NodeCache, ParallelRunner, RunTracer, SequentialRunner
 
 
 @click.group(name="stub_cli")
@@ -381,8 +382,9 @@ class TestKedroCLI:
             "kedro.framework.cli.cli.bootstrap_project", return_value=fake_metadata
         )
         kedro_cli = KedroCLI(fake_metadata.project_path)
-        assert len(kedro_cli.project_groups) == 6
+        assert len(kedro_cli.project_groups) == 7
         assert kedro_cli.project_groups == [
+            cache_cli,
             catalog_cli,
             jupyter_cli,
             pipeline_cli,
@@ -419,8 +421,9 @@ class TestKedroCLI:
             "kedro.framework.cli.cli.bootstrap_project", return_value=fake_metadata
         )
         kedro_cli = KedroCLI(fake_metadata.project_path)
-        assert len(kedro_cli.project_groups) == 7
+        assert len(kedro_cli.project_groups) == 8
         assert kedro_cli.project_groups == [
+            cache_cli,
             catalog_cli,
             jupyter_cli,
             pipeline_cli,
@@ -456,8 +459,9 @@ class TestKedroCLI:
 
         assert len(kedro_cli.global_groups) == 2
         assert kedro_cli.global_groups == [cli, create_cli]
-        assert len(kedro_cli.project_groups) == 7
+        assert len(kedro_cli.project_groups) == 8
         assert kedro_cli.project_groups == [
+            cache_cli,
             catalog_cli,
             jupyter_cli,
             pipeline_cli,
@@ -515,6 +519,8 @@ class TestRunCommand:
             to_outputs=[],
             load_versions={},
             pipeline_name=None,
+            only_stale=False,
+            resume=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -542,6 +548,8 @@ class TestRunCommand:
             to_outputs=[],
             load_versions={},
             pipeline_name=None,
+            only_stale=False,
+            resume=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -576,6 +584,8 @@ class TestRunCommand:
             to_outputs=[],
             load_versions={},
             pipeline_name=None,
+            only_stale=False,
+            resume=None,
         )
 
         runner = fake_session.run.call_args_list[0][1]["runner"]
@@ -602,6 +612,96 @@ class TestRunCommand:
         assert isinstance(runner, SequentialRunner)
         assert runner._is_async
 
+    def test_run_memoize(self, fake_project_cli, fake_metadata, fake_session):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--memoize", "--memoize-max-size", "1GB"],
+            obj=fake_metadata,
+        )
+        assert not result.exit_code
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert isinstance(runner, SequentialRunner)
+        assert isinstance(runner._node_cache, NodeCache)
+        assert runner._node_cache._max_size == 1024 ** 3
+        # the cache is found from any working directory
+        assert runner._node_cache._path == fake_metadata.project_path / NODE_CACHE_DIR
+
+    def test_run_memoize_packaged(
+        self, fake_project_cli, fake_session, tmp_path, monkeypatch
+    ):
+        monkeypatch.chdir(tmp_path)
+        result = CliRunner().invoke(fake_project_cli, ["run", "--memoize"], obj=None)
+        assert not result.exit_code
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert runner._node_cache._path == tmp_path / NODE_CACHE_DIR
+
+    def test_run_memoize_invalid_max_size(
+        self, fake_project_cli, fake_metadata, fake_session
+    ):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--memoize", "--memoize-max-size", "lots"],
+            obj=fake_metadata,
+        )
+        assert result.exit_code
+        assert "Invalid amount of memory `lots`" in result.output
+        fake_session.run.assert_not_called()
+
+    def test_run_memoize_unsupported_runner(
+        self, fake_project_cli, fake_metadata, fake_session
+    ):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--memoize", "--runner=AsyncioRunner"],
+            obj=fake_metadata,
+        )
+        assert result.exit_code
+        assert "`AsyncioRunner` does not support --memoize" in result.output
+        fake_session.run.assert_not_called()
+
+    def test_run_trace(self, fake_project_cli, fake_metadata, fake_session, tmp_path):
+        trace_path = tmp_path / "run.json"
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--trace", str(trace_path), "--runner=ThreadRunner"],
+            obj=fake_metadata,
+        )
+        assert not result.exit_code
+        runner = fake_session.run.call_args_list[0][1]["runner"]
+        assert isinstance(runner._tracer, RunTracer)
+        assert runner._tracer.filepath == trace_path
+
+    def test_run_trace_unsupported_runner(
+        self, fake_project_cli, fake_metadata, fake_session
+    ):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--trace", "run.json", "--runner=AsyncioRunner"],
+            obj=fake_metadata,
+        )
+        assert result.exit_code
+        assert "`AsyncioRunner` does not support --trace" in result.output
+        fake_session.run.assert_not_called()
+
+    def test_run_resume(self, fake_project_cli, fake_metadata, fake_session):
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["run", "--resume", "2021-08-01T12.00.00.000Z"],
+            obj=fake_metadata,
+        )
+        assert not result.exit_code
+        assert (
+            fake_session.run.call_args_list[0][1]["resume"]
+            == "2021-08-01T12.00.00.000Z"
+        )
+
+    def test_run_only_stale(self, fake_project_cli, fake_metadata, fake_session):
+        result = CliRunner().invoke(
+            fake_project_cli, ["run", "--only-stale"], obj=fake_metadata
+        )
+        assert not result.exit_code
+        assert fake_session.run.call_args_list[0][1]["only_stale"]
+
     @mark.parametrize("config_flag", ["--config", "-c"])
     def test_run_with_config(
         self,
@@ -626,6 +726,8 @@ class TestRunCommand:
             to_outputs=[],
             load_versions={},
             pipeline_name="pipeline1",
+            only_stale=False,
+            resume=None,
         )
 
     @mark.parametrize(
@@ -669,6 +771,8 @@ class TestRunCommand:
             to_outputs=[],
             load_versions={},
             pipeline_name="pipeline1",
+            only_stale=False,
+            resume=None,
         )
         mock_session_create.assert_called_once_with(
             env=mocker.ANY, extra_params=expected
@@ -765,6 +869,8 @@ class TestRunCommand:
             to_outputs=[],
             load_versions={ds: t},
             pipeline_name=None,
+            only_stale=False,
+            resume=None,
         )
 
     def test_fail_reformat_load_versions(self, fake_project_cli, fake_metadata):
@@ -780,3 +886,31 @@ class TestRunCommand:
             f"found {load_version} instead\n"
         )
         assert expected_output in result.output
+
+
+class TestWorkerCommand:
+    def test_worker(self, fake_project_cli, fake_metadata, mocker):
+        run_worker = mocker.patch("kedro.framework.cli.project.run_worker")
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["worker", "--coordinator", "head:9000", "--host", "10.0.0.2", "--once"],
+            obj=fake_metadata,
+        )
+        assert not result.exit_code, result.output
+        run_worker.assert_called_once_with("head:9000", host="10.0.0.2", once=True)
+
+    def test_worker_defaults(self, fake_project_cli, fake_metadata, mocker):
+        run_worker = mocker.patch("kedro.framework.cli.project.run_worker")
+        result = CliRunner().invoke(fake_project_cli, ["worker"], obj=fake_metadata)
+        assert not result.exit_code, result.output
+        run_worker.assert_called_once_with("localhost:8788", host=None, once=False)
+
+    def test_worker_without_authkey(self, fake_project_cli, fake_metadata, monkeypatch):
+        monkeypatch.delenv("KEDRO_WORKER_AUTHKEY", raising=False)
+        result = CliRunner().invoke(
+            fake_project_cli,
+            ["worker", "--coordinator", "head:9000"],
+            obj=fake_metadata,
+        )
+        assert result.exit_code
+        assert "KEDRO_WORKER_AUTHKEY" in result.output
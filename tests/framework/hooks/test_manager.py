@@ -1,7 +1,14 @@
 import pytest
 
-from kedro.framework.hooks.manager import _create_hook_manager
-from kedro.framework.hooks.specs import DataCatalogSpecs, NodeSpecs, PipelineSpecs
+from kedro.framework.hooks import hook_impl
+from kedro.framework.hooks.manager import _create_hook_manager, _hook_dispatch
+from kedro.framework.hooks.markers import hook_spec
+from kedro.framework.hooks.specs import (
+    DataCatalogSpecs,
+    DatasetSpecs,
+    NodeSpecs,
+    PipelineSpecs,
+)
 
 
 @pytest.mark.parametrize(
@@ -42,6 +49,10 @@ from kedro.framework.hooks.specs import DataCatalogSpecs, NodeSpecs, PipelineSpe
             "on_pipeline_error",
             ("error", "run_params", "pipeline", "catalog"),
         ),
+        (DatasetSpecs, "before_datasets_loaded", ("node", "dataset_names")),
+        (DatasetSpecs, "after_datasets_loaded", ("node", "data")),
+        (DatasetSpecs, "before_datasets_saved", ("node", "data")),
+        (DatasetSpecs, "after_datasets_saved", ("node", "data")),
     ],
 )
 def test_hook_manager_can_call_hooks_defined_in_specs(
@@ -56,3 +67,53 @@ def test_hook_manager_can_call_hooks_defined_in_specs(
     # since there hasn't been any hook implementation, the result should be empty
     # but it shouldn't have raised
     assert result == []
+
+
+class DatasetHooks:
+    @hook_impl
+    def before_dataset_loaded(self, dataset_name):
+        pass
+
+
+class TestHookDispatch:
+    def test_hooks_without_implementation(self):
+        dispatch = _hook_dispatch(_create_hook_manager())
+        assert dispatch.before_dataset_loaded is None
+        assert dispatch.before_node_run is None
+
+    def test_registered_hooks(self):
+        hook_manager = _create_hook_manager()
+        hooks = DatasetHooks()
+        hook_manager.register(hooks)
+        dispatch = _hook_dispatch(hook_manager)
+        assert dispatch.before_dataset_loaded is hook_manager.hook.before_dataset_loaded
+        assert dispatch.after_dataset_loaded is None
+        # the table is only rebuilt when the hooks change
+        assert _hook_dispatch(hook_manager) is dispatch
+
+        hook_manager.unregister(hooks)
+        assert _hook_dispatch(hook_manager).before_dataset_loaded is None
+
+    def test_blocked_hooks(self):
+        hook_manager = _create_hook_manager()
+        hook_manager.register(DatasetHooks(), name="dataset_hooks")
+        assert _hook_dispatch(hook_manager).before_dataset_loaded is not None
+
+        hook_manager.set_blocked("dataset_hooks")
+        assert _hook_dispatch(hook_manager).before_dataset_loaded is None
+
+    def test_added_hook_specs(self):
+        hook_manager = _create_hook_manager()
+        assert not hasattr(_hook_dispatch(hook_manager), "extra_hook")
+
+        class ExtraSpecs:  # pylint: disable=too-few-public-methods
+            @hook_spec
+            def extra_hook(self):
+                pass
+
+        hook_manager.add_hookspecs(ExtraSpecs)
+        assert _hook_dispatch(hook_manager).extra_hook is None
+
+    def test_other_hook_manager(self, mocker):
+        hook_manager = mocker.Mock()
+        assert _hook_dispatch(hook_manager) is hook_manager.hook
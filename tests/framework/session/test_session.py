@@ -3,6 +3,7 @@ import logging
 import re
 import subprocess
 import textwrap
+from collections import UserDict
 from pathlib import Path
 from typing import Iterable
 
@@ -21,6 +22,9 @@ from kedro.framework.project import (
 )
 from kedro.framework.session import KedroSession, get_current_session
 from kedro.framework.session.store import BaseSessionStore, ShelveStore
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline
+from kedro.runner import RunCheckpoint
 
 _FAKE_PROJECT_NAME = "fake_project"
 _FAKE_PIPELINE_NAME = "fake_pipeline"
@@ -142,6 +146,45 @@ def mock_settings_shelve_session_store(mocker, fake_project):
     return _mock_imported_settings_paths(mocker, MockSettings())
 
 
+class PathlessStore(UserDict):
+    """A custom session store which does not keep the path it is given."""
+
+    def __init__(self, path, session_id):  # pylint: disable=unused-argument
+        super().__init__(session_id=session_id)
+
+    def save(self):
+        pass
+
+
+@pytest.fixture
+def mock_settings_pathless_session_store(mocker, mock_context_class, fake_project):
+    class MockSettings(_ProjectSettings):
+        _HOOKS = Validator("HOOKS", default=(ConfigLoaderHooks(),))
+        _CONTEXT_CLASS = Validator(
+            "CONTEXT_CLASS", default=lambda *_: mock_context_class
+        )
+        _SESSION_STORE_CLASS = Validator(
+            "SESSION_STORE_CLASS", default=lambda *_: PathlessStore
+        )
+        _SESSION_STORE_ARGS = Validator(
+            "SESSION_STORE_ARGS",
+            default={"path": (fake_project / "custom").as_posix()},
+        )
+
+    return _mock_imported_settings_paths(mocker, MockSettings())
+
+
+class LegacyRunner:
+    """A custom runner overriding ``run`` without the checkpoint arguments."""
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self, pipeline, catalog, run_id=None):
+        self.calls.append((pipeline, catalog, run_id))
+        return {}
+
+
 @pytest.fixture
 def fake_session_id(mocker):
     session_id = "fake_session_id"
@@ -553,7 +596,15 @@ class TestKedroSession:
             run_params=record_data, pipeline=mock_pipeline, catalog=mock_catalog
         )
         mock_runner.run.assert_called_once_with(
-            mock_pipeline, mock_catalog, fake_session_id
+            mock_pipeline,
+            mock_catalog,
+            fake_session_id,
+            checkpoint=mocker.ANY,
+            resume=None,
+        )
+        checkpoint = mock_runner.run.call_args[1]["checkpoint"]
+        assert checkpoint._path == fake_project / "sessions" / fake_session_id / (
+            "checkpoint"
         )
         mock_hook.after_pipeline_run.assert_called_once_with(
             run_params=record_data,
@@ -562,6 +613,143 @@ class TestKedroSession:
             catalog=mock_catalog,
         )
 
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_only_stale(
+        self,
+        fake_project,
+        fake_session_id,
+        mock_context_class,
+        mock_package_name,
+        mocker,
+    ):
+        mocker.patch("kedro.framework.session.session.get_hook_manager")
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            return_value={"__default__": mocker.Mock()},
+        )
+        mock_context = mock_context_class.return_value
+        mock_catalog = mock_context._get_catalog.return_value
+        mock_pipeline = mock_context._filter_pipeline.return_value
+        mock_runner = mocker.Mock()
+
+        with KedroSession.create(mock_package_name, fake_project) as session:
+            result = session.run(runner=mock_runner, only_stale=True)
+
+        mock_runner.run.assert_not_called()
+        mock_runner.run_only_stale.assert_called_once_with(
+            mock_pipeline,
+            mock_catalog,
+            fake_session_id,
+            checkpoint=mocker.ANY,
+            resume=None,
+        )
+        assert result == mock_runner.run_only_stale.return_value
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_resume(self, fake_project, mock_package_name, mocker):
+        mocker.patch("kedro.framework.session.session.get_hook_manager")
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            return_value={"__default__": mocker.Mock()},
+        )
+        checkpoint_path = fake_project / "sessions" / "failed" / "checkpoint"
+        RunCheckpoint(checkpoint_path).save(Pipeline([]), DataCatalog(), [], set())
+        mock_runner = mocker.Mock()
+
+        with KedroSession.create(mock_package_name, fake_project) as session:
+            session.run(runner=mock_runner, resume="failed")
+
+        assert mock_runner.run.call_args[1]["resume"]._path == checkpoint_path
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_resume_without_checkpoint(
+        self, fake_project, mock_package_name, mocker
+    ):
+        mocker.patch("kedro.framework.session.session.get_hook_manager")
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            return_value={"__default__": mocker.Mock()},
+        )
+        mock_runner = mocker.Mock()
+
+        pattern = "Cannot resume the run of session 'unknown', as it has no checkpoint"
+        with KedroSession.create(mock_package_name, fake_project) as session:
+            with pytest.raises(KedroContextError, match=pattern):
+                session.run(runner=mock_runner, resume="unknown")
+        mock_runner.run.assert_not_called()
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_legacy_runner(
+        self, fake_project, fake_session_id, mock_package_name, mocker
+    ):
+        mocker.patch("kedro.framework.session.session.get_hook_manager")
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            return_value={"__default__": mocker.Mock()},
+        )
+        runner = LegacyRunner()
+
+        with KedroSession.create(mock_package_name, fake_project) as session:
+            assert session.run(runner=runner) == {}
+        assert len(runner.calls) == 1
+        assert runner.calls[0][2] == fake_session_id
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_resume_legacy_runner(self, fake_project, mock_package_name, mocker):
+        mocker.patch("kedro.framework.session.session.get_hook_manager")
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            return_value={"__default__": mocker.Mock()},
+        )
+        runner = LegacyRunner()
+
+        pattern = r"`LegacyRunner\.run` has no `resume` argument"
+        with KedroSession.create(mock_package_name, fake_project) as session:
+            with pytest.raises(KedroContextError, match=pattern):
+                session.run(runner=runner, resume="failed")
+        assert not runner.calls
+
+    @pytest.mark.usefixtures("mock_settings_pathless_session_store")
+    def test_run_pathless_session_store(
+        self, fake_project, fake_session_id, mock_package_name, mocker
+    ):
+        mocker.patch("kedro.framework.session.session.get_hook_manager")
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            return_value={"__default__": mocker.Mock()},
+        )
+        mock_runner = mocker.Mock()
+
+        with KedroSession.create(mock_package_name, fake_project) as session:
+            session.run(runner=mock_runner)
+        checkpoint = mock_runner.run.call_args[1]["checkpoint"]
+        assert checkpoint._path == fake_project / "custom" / fake_session_id / (
+            "checkpoint"
+        )
+
+    @pytest.mark.usefixtures("mock_settings_context_class")
+    def test_run_exception_suggests_resume(
+        self, fake_project, fake_session_id, mock_package_name, mocker, caplog
+    ):
+        mocker.patch("kedro.framework.session.session.get_hook_manager")
+        mocker.patch(
+            "kedro.framework.session.session.pipelines",
+            return_value={"__default__": mocker.Mock()},
+        )
+
+        def fail(*args, checkpoint, resume):  # pylint: disable=unused-argument
+            checkpoint.save(Pipeline([]), DataCatalog(), [], set())
+            raise FakeException("You shall not pass!")
+
+        mock_runner = mocker.Mock()
+        mock_runner.run.side_effect = fail
+
+        with pytest.raises(FakeException), KedroSession.create(
+            mock_package_name, fake_project
+        ) as session:
+            session.run(runner=mock_runner)
+        assert f"`kedro run --resume {fake_session_id}`" in caplog.text
+
     @pytest.mark.usefixtures("mock_settings_context_class")
     def test_run_non_existent_pipeline(self, fake_project, mock_package_name, mocker):
         mock_runner = mocker.Mock()
@@ -15,7 +15,7 @@ from kedro.framework.session import KedroSession
 from kedro.io import DataCatalog, MemoryDataSet
 from kedro.pipeline import Pipeline, node
 from kedro.pipeline.node import Node
-from kedro.runner import ParallelRunner
+from kedro.runner import DaskRunner, ParallelRunner
 from kedro.runner.runner import _run_node_async
 from tests.framework.session.conftest import (
     _assert_hook_call_record_has_expected_parameters,
@@ -292,6 +292,25 @@ class TestNodeHooks:
             assert record.node.name in ["node1", "node2"]
             assert set(record.outputs.keys()) <= {"planes", "ships"}
 
+    @pytest.mark.usefixtures("mock_pipelines")
+    def test_before_and_after_node_run_hooks_dask_runner(
+        self, mock_session, logs_listener, dummy_dataframe
+    ):
+        context = mock_session.load_context()
+        catalog = context.catalog
+        catalog.save("cars", dummy_dataframe)
+        catalog.save("boats", dummy_dataframe)
+
+        with DaskRunner(client_args={"processes": False}) as runner:
+            mock_session.run(runner=runner, node_names=["node1", "node2"])
+
+        for hook_name in ("before_node_run", "after_node_run"):
+            records = [r for r in logs_listener.logs if r.funcName == hook_name]
+            assert sorted(record.node.name for record in records) == [
+                "node1",
+                "node2",
+            ]
+
 
 class TestDataSetHooks:
     @pytest.mark.usefixtures("mock_pipelines")
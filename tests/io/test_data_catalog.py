@@ -338,6 +338,13 @@ class TestDataCatalog:
         # only one dataset is assigned a layer in the config
         assert data_catalog_from_config.layers == {"raw": {"cars"}}
 
+    def test_io_limits(self, sane_config):
+        """Test the I/O limits of the datasets are correctly parsed"""
+        sane_config["catalog"]["boats"]["io_limit"] = 2
+        catalog = DataCatalog.from_config(**sane_config)
+        assert catalog.io_limits == {"boats": 2}
+        assert catalog.shallow_copy().io_limits == {"boats": 2}
+
 
 class TestDataCatalogFromConfig:
     def test_from_sane_config(self, data_catalog_from_config, dummy_dataframe):
@@ -0,0 +1,155 @@
+import random
+from itertools import combinations
+
+import pytest
+
+from kedro.pipeline import Pipeline, node
+from kedro.pipeline.execution_plan import ExecutionPlan
+
+
+def identity(arg):
+    return arg
+
+
+def biconcat(arg1, arg2):
+    return arg1 + arg2  # pragma: no cover
+
+
+def combine(*args):
+    return args  # pragma: no cover
+
+
+def random_pipeline(seed, size=9):
+    rng = random.Random(seed)
+    nodes = []
+    for i in range(size):
+        inputs = [f"ds{j}" for j in range(i) if rng.random() < 0.3]
+        nodes.append(node(combine, inputs or None, f"ds{i}", name=f"node{i}"))
+    return Pipeline(nodes)
+
+
+def brute_force_width(plan):
+    descendants = {n: set() for n in plan.nodes}
+    for n in reversed(plan.nodes):
+        for parent in plan.node_dependencies[n]:
+            descendants[parent] |= descendants[n] | {n}
+    for size in range(len(plan.nodes), 0, -1):
+        for subset in combinations(plan.nodes, size):
+            if all(b not in descendants[a] for a in subset for b in subset):
+                return size
+    return 0  # pragma: no cover
+
+
+@pytest.fixture
+def pipeline():
+    return Pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="second"),
+            node(biconcat, ["B", "C"], "D", name="third"),
+            node(identity, "A", "E", name="side"),
+        ]
+    )
+
+
+class TestExecutionPlan:
+    def test_compile_is_cached(self, pipeline):
+        plan = pipeline.compile()
+        assert isinstance(plan, ExecutionPlan)
+        assert pipeline.compile() is plan
+
+    def test_matches_pipeline(self, pipeline):
+        plan = pipeline.compile()
+        assert list(plan.nodes) == pipeline.nodes
+        assert plan.node_dependencies == pipeline.node_dependencies
+        assert plan.inputs == pipeline.inputs()
+        assert plan.outputs == pipeline.outputs()
+        assert plan.data_sets == pipeline.data_sets()
+        assert plan.load_counts == {"A": 2, "B": 2, "C": 1}
+
+    def test_immutable(self, pipeline):
+        plan = pipeline.compile()
+        with pytest.raises(TypeError):
+            plan.load_counts["A"] = 0  # type: ignore
+        with pytest.raises(AttributeError):
+            plan.nodes = ()  # type: ignore
+
+    def test_release_schedule(self, pipeline):
+        plan = pipeline.compile()
+        positions = {n.name: i for i, n in enumerate(plan.nodes)}
+        assert plan.last_use["B"] == positions["third"]
+        assert plan.last_use["C"] == positions["third"]
+
+        released = {
+            plan.nodes[i].name: names
+            for i, names in enumerate(plan.release_schedule)
+            if names
+        }
+        # free inputs and final outputs are never released
+        assert released == {"third": ("B", "C")}
+
+    def test_release_tracker(self, pipeline):
+        plan = pipeline.compile()
+        nodes = {n.name: n for n in plan.nodes}
+        tracker = plan.release_tracker()
+
+        assert tracker.mark_done(nodes["side"]) == []
+        assert tracker.mark_done(nodes["first"]) == []
+        assert tracker.mark_done(nodes["second"]) == []
+        assert tracker.mark_done(nodes["third"]) == ["B", "C"]
+
+    def test_release_transcoded(self):
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "ds@save", name="save"),
+                node(identity, "ds@load", "Z"),
+            ]
+        )
+        plan = pipeline.compile()
+        released = [name for names in plan.release_schedule for name in names]
+        assert released == ["ds@save", "ds@load"]
+
+    def test_max_width(self, pipeline):
+        assert pipeline.compile().max_width() == 2
+        assert Pipeline([]).compile().max_width() == 0
+
+    def test_max_width_across_layers(self):
+        # the largest set of independent nodes, "third", "side" and "other",
+        # is spread over three layers, none of which has more than two nodes
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(identity, "B", "C", name="second"),
+                node(identity, "C", "D", name="third"),
+                node(identity, "B", "E", name="side"),
+                node(identity, "F", "G", name="other"),
+            ]
+        )
+        assert max(len(layer) for layer in pipeline.grouped_nodes) == 2
+        assert pipeline.compile().max_width() == 3
+
+    def test_max_width_limit(self):
+        pipeline = Pipeline(
+            [node(identity, "A", f"B{i}", name=f"node{i}") for i in range(4)]
+        )
+        plan = pipeline.compile()
+        # the largest layer reaches the limit, the width is not computed
+        assert plan.max_width(limit=2) == 2
+        assert plan._max_width is None
+        assert plan.max_width(limit=8) == 4
+        assert plan.max_width(limit=2) == 2
+        assert plan.max_width() == 4
+
+    def test_max_width_unknown_parents(self, pipeline, mocker):
+        # dependencies on anything but the nodes of the plan are ignored
+        mocker.patch(
+            "kedro.pipeline.Pipeline.node_dependencies",
+            new_callable=mocker.PropertyMock,
+            return_value={n: {"unknown"} for n in pipeline.nodes},
+        )
+        assert pipeline.compile().max_width() == 4
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_max_width_random(self, seed):
+        plan = random_pipeline(seed).compile()
+        assert plan.max_width() == brute_force_width(plan)
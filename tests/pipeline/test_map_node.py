@@ -0,0 +1,151 @@
+import pytest
+
+from kedro.pipeline import Pipeline, map_node, node, pipeline
+from kedro.pipeline.node import MapNode
+
+
+def scale(partition, factor):
+    return partition * factor
+
+
+def identity(partition):
+    return partition
+
+
+def total(partitions):
+    return sum(partitions.values())
+
+
+@pytest.fixture
+def scaling_node():
+    return map_node(
+        scale,
+        ["numbers", "params:factor"],
+        ["scaled", "total"],
+        reduce=total,
+        name="scale",
+        tags="tag",
+    )
+
+
+class TestMapNodeRun:
+    def test_run(self, scaling_node):
+        outputs = scaling_node.run({"numbers": {"b": 2, "a": 1}, "params:factor": 10})
+        assert outputs == {"scaled": {"a": 10, "b": 20}, "total": 30}
+
+    def test_lazy_partitions(self):
+        mapping = map_node(identity, "numbers", "copied")
+        outputs = mapping.run({"numbers": {"a": lambda: 1, "b": lambda: 2}})
+        assert outputs == {"copied": {"a": 1, "b": 2}}
+
+    def test_dict_inputs(self):
+        mapping = map_node(
+            scale, {"factor": "params:factor", "partition": "numbers"}, "scaled"
+        )
+        assert mapping.partitioned_input == "numbers"
+        outputs = mapping.run({"numbers": {"a": 1}, "params:factor": 3})
+        assert outputs == {"scaled": {"a": 3}}
+
+    def test_call(self):
+        mapping = map_node(identity, "numbers", "copied")
+        assert mapping(numbers={"a": 1}) == {"copied": {"a": 1}}
+
+
+class TestMapNodeDefinition:
+    def test_properties(self, scaling_node):
+        assert isinstance(scaling_node, MapNode)
+        assert scaling_node.partitioned_input == "numbers"
+        assert scaling_node.partitioned_output == "scaled"
+        assert scaling_node.reduce is total
+        assert scaling_node.name == "scale"
+
+    def test_without_reduce(self):
+        mapping = map_node(identity, "numbers", ["copied"])
+        assert mapping.reduce is None
+        assert mapping.partitioned_output == "copied"
+
+    def test_tag(self, scaling_node):
+        tagged = scaling_node.tag("other")
+        assert isinstance(tagged, MapNode)
+        assert tagged.tags == {"tag", "other"}
+        assert tagged.reduce is total
+
+    def test_namespace(self, scaling_node):
+        namespaced = pipeline(
+            Pipeline([scaling_node]),
+            parameters={"params:factor"},
+            namespace="ns",
+        ).nodes[0]
+        assert isinstance(namespaced, MapNode)
+        assert namespaced.name == "ns.scale"
+        assert namespaced.partitioned_input == "ns.numbers"
+        assert namespaced.outputs == ["ns.scaled", "ns.total"]
+        assert namespaced.reduce is total
+
+    def test_no_inputs(self):
+        pattern = r"Invalid MapNode definition: it must have a partitioned input"
+        with pytest.raises(ValueError, match=pattern):
+            map_node(lambda: None, None, "scaled")
+
+    def test_invalid_reduce(self):
+        pattern = r"`reduce` must be a function, not `str`"
+        with pytest.raises(ValueError, match=pattern):
+            map_node(identity, "numbers", ["copied", "total"], reduce="sum")
+
+    @pytest.mark.parametrize(
+        "outputs,reduce",
+        [
+            (["copied", "total"], None),
+            ("copied", total),
+            ({"result": "copied"}, None),
+            (["copied", "total", "other"], total),
+        ],
+    )
+    def test_invalid_outputs(self, outputs, reduce):
+        pattern = r"`outputs` must be the name of the partitioned output"
+        with pytest.raises(ValueError, match=pattern):
+            map_node(identity, "numbers", outputs, reduce=reduce)
+
+
+class TestExpand:
+    def test_expand(self, scaling_node):
+        nodes = scaling_node.expand(["b", "a"])
+        assert [(n.inputs, n.outputs) for n in nodes] == [
+            (["numbers[a]", "params:factor"], ["scaled[a]"]),
+            (["numbers[b]", "params:factor"], ["scaled[b]"]),
+            (["scaled[a]", "scaled[b]"], ["scaled", "total"]),
+        ]
+        assert all(n.tags == {"tag"} for n in nodes)
+        assert not any(isinstance(n, MapNode) for n in nodes)
+
+        partition, gather = nodes[0], nodes[-1]
+        assert partition.name == "scale([numbers[a],params:factor]) -> [scaled[a]]"
+        assert partition.run({"numbers[a]": 1, "params:factor": 10}) == {
+            "scaled[a]": 10
+        }
+        assert gather.name == "scale"
+        assert gather.run({"scaled[a]": 10, "scaled[b]": 20}) == {
+            "scaled": {"a": 10, "b": 20},
+            "total": 30,
+        }
+
+    def test_expand_inputs(self):
+        single = map_node(identity, "numbers", "copied").expand(["a"])
+        assert single[0].inputs == ["numbers[a]"]
+        keyword = map_node(
+            scale, {"partition": "numbers", "factor": "params:factor"}, "scaled"
+        ).expand(["a"])
+        assert keyword[0].inputs == ["numbers[a]", "params:factor"]
+
+    def test_expand_unnamed(self):
+        mapping = map_node(identity, "numbers", "copied", namespace="ns")
+        gather = mapping.expand(["a"])[-1]
+        assert gather.name == "ns.gather_partitions([copied[a]]) -> [copied]"
+        assert gather.run({"copied[a]": 1}) == {"copied": {"a": 1}}
+
+    def test_expanded_pipeline(self, scaling_node):
+        expanded = Pipeline(
+            scaling_node.expand(["a", "b"]) + [node(identity, "total", "result")]
+        )
+        assert expanded.inputs() == {"numbers[a]", "numbers[b]", "params:factor"}
+        assert expanded.outputs() == {"scaled", "result"}
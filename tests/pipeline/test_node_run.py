@@ -1,5 +1,7 @@
 # pylint: disable=unused-argument
 
+import asyncio
+
 import pytest
 
 from kedro.io import LambdaDataSet
@@ -139,3 +141,36 @@ class TestNodeRunInvalidOutput:
         pattern += r"the node definition contains 3 output\(s\)\."
         with pytest.raises(ValueError, match=pattern):
             node(one_in_two_out, "ds1", ["A", "B", "C"]).run(dict(ds1=mocked_dataset))
+
+
+async def async_one_in_dict_out(arg):
+    await asyncio.sleep(0)
+    return dict(ret=arg)
+
+
+def run_async(node_, inputs=None):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(node_.run_async(inputs))
+    finally:
+        loop.close()
+
+
+class TestNodeRunAsync:
+    def test_coroutine_function(self):
+        node_ = node(async_one_in_dict_out, dict(arg="ds1"), dict(ret="dsOut"))
+        assert run_async(node_, dict(ds1=42)) == {"dsOut": 42}
+
+    def test_regular_function(self, valid_nodes_with_inputs):
+        for node_, input_ in valid_nodes_with_inputs:
+            assert run_async(node_, input_)["dsOut"] == 42
+
+    def test_got_dataframe(self, mocked_dataset):
+        pattern = r"Node.run_async\(\) expects a dictionary or None"
+        with pytest.raises(ValueError, match=pattern):
+            run_async(node(one_in_one_out, "ds1", "A"), mocked_dataset)
+
+    def test_invalid_output(self):
+        pattern = r"The node definition contains a list of outputs"
+        with pytest.raises(ValueError, match=pattern):
+            run_async(node(async_one_in_dict_out, "ds1", ["A", "B"]), dict(ds1=1))
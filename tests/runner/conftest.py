@@ -0,0 +1,26 @@
+from kedro.framework.hooks import hook_impl
+
+
+class RecordingHooks:
+    def __init__(self):
+        self.calls = []
+
+    @hook_impl
+    def before_datasets_loaded(self, node, dataset_names):
+        self.calls.append(("before_datasets_loaded", node.name, dataset_names))
+
+    @hook_impl
+    def after_datasets_loaded(self, node, data):
+        self.calls.append(("after_datasets_loaded", node.name, data))
+
+    @hook_impl
+    def before_datasets_saved(self, node, data):
+        self.calls.append(("before_datasets_saved", node.name, data))
+
+    @hook_impl
+    def after_datasets_saved(self, node, data):
+        self.calls.append(("after_datasets_saved", node.name, data))
+
+    @hook_impl
+    def after_dataset_saved(self, dataset_name, data):
+        self.calls.append(("after_dataset_saved", dataset_name, data))
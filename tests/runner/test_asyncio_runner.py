@@ -0,0 +1,610 @@
+import asyncio
+import threading
+import time
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict
+
+import pytest
+
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import (
+    AbstractDataSet,
+    AbstractVersionedDataSet,
+    DataCatalog,
+    DataSetError,
+    MemoryDataSet,
+    Version,
+)
+from kedro.io.transformers import AbstractTransformer
+from kedro.pipeline import Pipeline, node
+from kedro.pipeline.decorators import log_time
+from kedro.runner import AsyncioRunner
+from tests.runner.conftest import RecordingHooks
+
+
+def source():
+    return "stuff"
+
+
+def identity(arg):
+    return arg
+
+
+def fan_in(*args):
+    return args
+
+
+def exception_fn(arg):
+    raise Exception("test exception")
+
+
+def return_none(arg):
+    arg = None
+    return arg
+
+
+async def async_identity(arg):
+    await asyncio.sleep(0)
+    return arg
+
+
+async def async_sink(arg):  # pylint: disable=unused-argument
+    await asyncio.sleep(0)
+
+
+async def async_exception_fn(arg):
+    await asyncio.sleep(0)
+    raise Exception("async test exception")
+
+
+class Concurrency:
+    """Count the coroutine nodes waiting on I/O at the same time."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self.finished = 0
+
+    async def sleep(self, arg):
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        await asyncio.sleep(0.05)
+        self.current -= 1
+        self.finished += 1
+        return arg
+
+
+@pytest.fixture
+def catalog():
+    return DataCatalog()
+
+
+@pytest.fixture
+def fan_out_fan_in():
+    return Pipeline(
+        [
+            node(identity, "A", "B"),
+            node(identity, "B", "C"),
+            node(identity, "B", "D"),
+            node(identity, "B", "E"),
+            node(fan_in, ["C", "D", "E"], "Z"),
+        ]
+    )
+
+
+@pytest.fixture
+def async_fan_out_fan_in():
+    return Pipeline(
+        [
+            node(async_identity, "A", "B"),
+            node(async_identity, "B", "C"),
+            node(identity, "B", "D"),
+            node(async_identity, "B", "E"),
+            node(fan_in, ["C", "D", "E"], "Z"),
+        ]
+    )
+
+
+def wide_pipeline(func, width):
+    return Pipeline([node(func, "A", f"out{i}", name=f"node{i}") for i in range(width)])
+
+
+class TestValidAsyncioRunner:
+    def test_create_default_data_set(self):
+        data_set = AsyncioRunner().create_default_data_set("")
+        assert isinstance(data_set, MemoryDataSet)
+
+    def test_run(self, fan_out_fan_in, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        result = AsyncioRunner().run(fan_out_fan_in, catalog)
+        assert result["Z"] == (42, 42, 42)
+
+    def test_run_coroutine_nodes(self, async_fan_out_fan_in, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        result = AsyncioRunner().run(async_fan_out_fan_in, catalog)
+        assert result["Z"] == (42, 42, 42)
+
+    def test_memory_data_set_input(self, async_fan_out_fan_in):
+        catalog = DataCatalog({"A": MemoryDataSet("42")})
+        result = AsyncioRunner().run(async_fan_out_fan_in, catalog)
+        assert result["Z"] == ("42", "42", "42")
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_is_async_ignored(self, is_async, async_fan_out_fan_in, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        result = AsyncioRunner(is_async=is_async).run(async_fan_out_fan_in, catalog)
+        assert result["Z"] == (42, 42, 42)
+
+    def test_run_in_running_loop(self, async_fan_out_fan_in, catalog):
+        async def notebook_cell():
+            # a Jupyter kernel runs the cells on its own event loop
+            return AsyncioRunner().run(async_fan_out_fan_in, catalog)
+
+        catalog.add_feed_dict(dict(A=42))
+        loop = asyncio.new_event_loop()
+        try:
+            result = loop.run_until_complete(notebook_cell())
+        finally:
+            loop.close()
+        assert result == {"Z": (42, 42, 42)}
+
+    def test_coroutine_nodes_share_the_loop(self):
+        """A single thread is enough to run many coroutine nodes, with their
+        inputs loaded on the event loop, concurrently."""
+        concurrency = Concurrency()
+        catalog = DataCatalog({"A": AsyncLoggingDataSet([], "A", 42)})
+
+        result = AsyncioRunner(max_workers=1).run(
+            wide_pipeline(concurrency.sleep, 200), catalog
+        )
+
+        assert set(result.values()) == {42}
+        assert concurrency.peak == 200
+
+
+class TestMaxConcurrency:
+    def test_max_concurrency(self, catalog):
+        concurrency = Concurrency()
+        catalog.add_feed_dict(dict(A=42))
+        AsyncioRunner(max_concurrency=3).run(
+            wide_pipeline(concurrency.sleep, 10), catalog
+        )
+        assert concurrency.peak == 3
+
+    @pytest.mark.parametrize(
+        "kwargs,pattern",
+        [
+            ({"max_workers": 0}, "max_workers should be positive"),
+            ({"max_concurrency": -1}, "max_concurrency should be positive"),
+        ],
+    )
+    def test_init_with_non_positive_values(self, kwargs, pattern):
+        with pytest.raises(ValueError, match=pattern):
+            AsyncioRunner(**kwargs)
+
+
+class AsyncLoggingDataSet(AbstractDataSet):
+    """A dataset which can be loaded and saved both synchronously and on an
+    event loop, and logs which way it was used."""
+
+    def __init__(self, log, name, value=None):
+        self.log = log
+        self.name = name
+        self.value = value
+
+    def _load(self) -> Any:
+        self.log.append(("load", self.name))
+        return self.value
+
+    def _save(self, data: Any) -> None:
+        self.log.append(("save", self.name))
+        self.value = data
+
+    async def load_async(self) -> Any:
+        await asyncio.sleep(0)
+        self.log.append(("load_async", self.name))
+        return self.value
+
+    async def save_async(self, data: Any) -> None:
+        await asyncio.sleep(0)
+        self.log.append(("save_async", self.name))
+        self.value = data
+
+    def confirm(self) -> None:
+        self.log.append(("confirm", self.name))
+
+    def _describe(self) -> Dict[str, Any]:
+        return {}
+
+
+class UpperTransformer(AbstractTransformer):
+    def load(self, data_set_name, load):
+        return load().upper()
+
+    def save(self, data_set_name, save, data):
+        save(data)
+
+
+class AsyncVersionedDataSet(AbstractVersionedDataSet):
+    def __init__(self, filepath, version=None):
+        super().__init__(PurePosixPath(filepath), version)
+
+    def _load(self) -> Any:
+        return Path(self._get_load_path()).read_text()
+
+    def _save(self, data: Any) -> None:
+        save_path = Path(self._get_save_path())
+        save_path.parent.mkdir(parents=True)
+        save_path.write_text(data)
+
+    async def load_async(self) -> Any:
+        await asyncio.sleep(0)
+        return self._load()
+
+    async def save_async(self, data: Any) -> None:
+        await asyncio.sleep(0)
+        self._save(data)
+
+    def _describe(self) -> Dict[str, Any]:
+        return {}
+
+
+class TestAsyncDataSets:
+    def test_coroutine_methods_used(self):
+        log = []
+        pipeline = Pipeline([node(async_identity, "in", "out")])
+        catalog = DataCatalog(
+            {
+                "in": AsyncLoggingDataSet(log, "in", "stuff"),
+                "out": AsyncLoggingDataSet(log, "out"),
+            }
+        )
+        AsyncioRunner().run(pipeline, catalog)
+
+        assert log == [("load_async", "in"), ("save_async", "out")]
+        assert catalog.load("out") == "stuff"
+
+    def test_confirms(self):
+        log = []
+        pipeline = Pipeline([node(async_identity, "in", "out", confirms="in")])
+        catalog = DataCatalog(
+            {
+                "in": AsyncLoggingDataSet(log, "in", "stuff"),
+                "out": AsyncLoggingDataSet(log, "out"),
+            }
+        )
+        AsyncioRunner().run(pipeline, catalog)
+
+        assert log[-1] == ("confirm", "in")
+
+    def test_versions_journaled(self, tmp_path, mocker):
+        journal = mocker.Mock()
+        for version in ("v1", "v2"):
+            AsyncVersionedDataSet(tmp_path / "in", Version(None, version)).save(version)
+        pipeline = Pipeline([node(async_identity, "in", "out")])
+        catalog = DataCatalog(
+            {
+                "in": AsyncVersionedDataSet(tmp_path / "in", Version("v1", None)),
+                "out": AsyncVersionedDataSet(tmp_path / "out", Version(None, "v3")),
+            },
+            journal=journal,
+        )
+        AsyncioRunner().run(pipeline, catalog)
+
+        # the version set for the load, rather than the latest one
+        assert catalog.load("out") == "v1"
+        journal.log_catalog.assert_any_call("in", "load", "v1")
+        journal.log_catalog.assert_any_call("out", "save", "v3")
+
+    def test_transformed_data_set(self):
+        log = []
+        pipeline = Pipeline([node(identity, "in", "out")])
+        catalog = DataCatalog(
+            {
+                "in": AsyncLoggingDataSet(log, "in", "stuff"),
+                "out": AsyncLoggingDataSet(log, "out"),
+            }
+        )
+        catalog.add_transformer(UpperTransformer(), "in")
+        AsyncioRunner().run(pipeline, catalog)
+
+        assert log == [("load", "in"), ("save_async", "out")]
+        assert catalog.load("out") == "STUFF"
+
+
+class ConcurrentDataSet(AbstractDataSet):
+    """A dataset counting its loads and saves running at the same time, both
+    on the event loop and in threads."""
+
+    def __init__(self, concurrency, value=None):
+        self.concurrency = concurrency
+        self.value = value
+        self.lock = threading.Lock()
+
+    def _count(self, delta):
+        with self.lock:
+            self.concurrency.current += delta
+            self.concurrency.peak = max(self.concurrency.peak, self.concurrency.current)
+
+    def _load(self) -> Any:
+        self._count(1)
+        time.sleep(0.05)
+        self._count(-1)
+        return self.value
+
+    def _save(self, data: Any) -> None:
+        self._count(1)
+        time.sleep(0.05)
+        self._count(-1)
+        self.value = data
+
+    def _describe(self) -> Dict[str, Any]:
+        return {}
+
+
+class AsyncConcurrentDataSet(ConcurrentDataSet):
+    async def load_async(self) -> Any:
+        self._count(1)
+        await asyncio.sleep(0.05)
+        self._count(-1)
+        return self.value
+
+    async def save_async(self, data: Any) -> None:
+        self._count(1)
+        await asyncio.sleep(0.05)
+        self._count(-1)
+        self.value = data
+
+
+class TestIOLimits:
+    def test_coroutine_methods_limited(self):
+        concurrency = Concurrency()
+        pipeline = Pipeline(
+            [node(async_identity, f"in{i}", f"out{i}") for i in range(5)]
+        )
+        catalog = DataCatalog(
+            {
+                **{f"in{i}": AsyncConcurrentDataSet(concurrency, i) for i in range(5)},
+                **{f"out{i}": AsyncConcurrentDataSet(concurrency) for i in range(5)},
+            }
+        )
+        AsyncioRunner(io_limits={"AsyncConcurrentDataSet": 2}).run(pipeline, catalog)
+        assert concurrency.peak == 2
+        assert catalog.load("out4") == 4
+
+    def test_catalog_io_limit_in_threads(self):
+        concurrency = Concurrency()
+        pipeline = Pipeline([node(identity, "in", f"out{i}") for i in range(5)])
+        catalog = DataCatalog(
+            {"in": ConcurrentDataSet(concurrency, 42)}, io_limits={"in": 1}
+        )
+        result = AsyncioRunner(max_workers=5).run(pipeline, catalog)
+        assert concurrency.peak == 1
+        assert result == {f"out{i}": 42 for i in range(5)}
+
+
+class TestHooks:
+    @pytest.mark.parametrize("func", [identity, async_identity])
+    def test_node_hooks(self, mocker, func):
+        hook_manager = mocker.patch(
+            "kedro.runner.asyncio_runner.get_hook_manager"
+        ).return_value
+        mocker.patch("kedro.runner.runner.get_hook_manager", return_value=hook_manager)
+        hook_manager.hook.before_node_run.return_value = [{"A": 1}, None]
+        catalog = DataCatalog(feed_dict={"A": 42})
+
+        result = AsyncioRunner().run(Pipeline([node(func, "A", "B")]), catalog)
+
+        assert result == {"B": 1}
+        hook_manager.hook.before_dataset_loaded.assert_called_once_with(
+            dataset_name="A"
+        )
+        hook_manager.hook.after_dataset_saved.assert_called_once_with(
+            dataset_name="B", data=1
+        )
+        kwargs = hook_manager.hook.after_node_run.call_args[1]
+        assert kwargs["outputs"] == {"B": 1}
+        assert kwargs["is_async"]
+
+    def test_on_node_error(self, mocker):
+        hook_manager = mocker.patch(
+            "kedro.runner.asyncio_runner.get_hook_manager"
+        ).return_value
+        mocker.patch("kedro.runner.runner.get_hook_manager", return_value=hook_manager)
+        hook_manager.hook.before_node_run.return_value = []
+        catalog = DataCatalog(feed_dict={"A": 42})
+        pipeline = Pipeline([node(async_exception_fn, "A", "B")])
+
+        with pytest.raises(Exception, match="async test exception"):
+            AsyncioRunner().run(pipeline, catalog)
+
+        kwargs = hook_manager.hook.on_node_error.call_args[1]
+        assert str(kwargs["error"]) == "async test exception"
+        hook_manager.hook.after_node_run.assert_not_called()
+
+    @pytest.mark.parametrize("func", [identity, async_identity])
+    def test_batched_hooks(self, mocker, func):
+        hook_manager = _create_hook_manager()
+        for module in ("asyncio_runner", "runner"):
+            mocker.patch(
+                f"kedro.runner.{module}.get_hook_manager", return_value=hook_manager
+            )
+        hooks = RecordingHooks()
+        hook_manager.register(hooks)
+        catalog = DataCatalog(feed_dict={"A": 42})
+
+        AsyncioRunner().run(Pipeline([node(func, "A", "B", name="n")]), catalog)
+
+        assert hooks.calls == [
+            ("before_datasets_loaded", "n", ["A"]),
+            ("after_datasets_loaded", "n", {"A": 42}),
+            ("before_datasets_saved", "n", {"B": 42}),
+            ("after_dataset_saved", "B", 42),
+            ("after_datasets_saved", "n", {"B": 42}),
+        ]
+
+    @pytest.mark.parametrize(
+        "func,error", [(async_identity, None), (async_exception_fn, Exception)]
+    )
+    def test_hooks_without_implementation(self, mocker, func, error):
+        hook_manager = _create_hook_manager()
+        for module in ("asyncio_runner", "runner"):
+            mocker.patch(
+                f"kedro.runner.{module}.get_hook_manager", return_value=hook_manager
+            )
+        caller_spy = mocker.spy(type(hook_manager.hook.after_node_run), "__call__")
+        catalog = DataCatalog(feed_dict={"A": 42})
+        pipeline = Pipeline([node(func, "A", "B")])
+
+        if error is None:
+            assert AsyncioRunner().run(pipeline, catalog) == {"B": 42}
+        else:
+            with pytest.raises(error):
+                AsyncioRunner().run(pipeline, catalog)
+        caller_spy.assert_not_called()
+
+
+class TestInvalidAsyncioRunner:
+    @pytest.mark.parametrize("func", [exception_fn, async_exception_fn])
+    def test_task_exception(self, fan_out_fan_in, catalog, func):
+        catalog.add_feed_dict(feed_dict=dict(A=42))
+        pipeline = Pipeline([fan_out_fan_in, node(func, "Z", "X")])
+        with pytest.raises(Exception, match="test exception"):
+            AsyncioRunner().run(pipeline, catalog)
+
+    def test_running_nodes_cancelled(self, catalog):
+        concurrency = Concurrency()
+        catalog.add_feed_dict(feed_dict=dict(A=42))
+        pipeline = Pipeline(
+            [
+                wide_pipeline(concurrency.sleep, 3),
+                node(async_exception_fn, "A", "X"),
+            ]
+        )
+        with pytest.raises(Exception, match="async test exception"):
+            AsyncioRunner().run(pipeline, catalog)
+        assert concurrency.peak == 3
+        assert concurrency.finished == 0
+
+    def test_node_returning_none(self):
+        pipeline = Pipeline(
+            [node(async_identity, "A", "B"), node(return_none, "B", "C")]
+        )
+        catalog = DataCatalog({"A": MemoryDataSet("42")})
+        pattern = "Saving `None` to a `DataSet` is not allowed"
+        with pytest.raises(DataSetError, match=pattern):
+            AsyncioRunner().run(pipeline, catalog)
+
+    def test_unable_to_schedule_all_nodes(self, mocker, fan_out_fan_in, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        fake_node_deps = {
+            k: {"you_shall_not_pass"} for k in fan_out_fan_in.node_dependencies
+        }
+        mocker.patch(
+            "kedro.pipeline.Pipeline.node_dependencies",
+            new_callable=mocker.PropertyMock,
+            return_value=fake_node_deps,
+        )
+
+        pattern = "Unable to schedule new tasks although some nodes have not been run"
+        with pytest.raises(RuntimeError, match=pattern):
+            AsyncioRunner().run(fan_out_fan_in, catalog)
+
+
+@log_time
+def decorated_identity(*args, **kwargs):
+    return identity(*args, **kwargs)
+
+
+class TestAsyncioRunnerDecorator:
+    def test_decorate_pipeline(self, async_fan_out_fan_in, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        result = AsyncioRunner().run(async_fan_out_fan_in.decorate(log_time), catalog)
+        assert result["Z"] == (42, 42, 42)
+
+    def test_decorated_nodes(self, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        pipeline = Pipeline(
+            [node(decorated_identity, "A", "B"), node(async_identity, "B", "C")]
+        )
+        result = AsyncioRunner().run(pipeline, catalog)
+        assert result["C"] == 42
+
+
+class LoggingDataSet(AbstractDataSet):
+    def __init__(self, log, name, value=None):
+        self.log = log
+        self.name = name
+        self.value = value
+
+    def _load(self) -> Any:
+        self.log.append(("load", self.name))
+        return self.value
+
+    def _save(self, data: Any) -> None:
+        self.value = data
+
+    def _release(self) -> None:
+        self.log.append(("release", self.name))
+        self.value = None
+
+    def _describe(self) -> Dict[str, Any]:
+        return {}
+
+
+class TestAsyncioRunnerRelease:
+    def test_dont_release_inputs_and_outputs(self):
+        log = []
+
+        pipeline = Pipeline(
+            [node(async_identity, "in", "middle"), node(identity, "middle", "out")]
+        )
+        catalog = DataCatalog(
+            {
+                "in": LoggingDataSet(log, "in", "stuff"),
+                "middle": LoggingDataSet(log, "middle"),
+                "out": LoggingDataSet(log, "out"),
+            }
+        )
+        AsyncioRunner().run(pipeline, catalog)
+
+        # we don't want to see release in or out in here
+        assert list(log) == [("load", "in"), ("load", "middle"), ("release", "middle")]
+
+    def test_count_multiple_loads(self):
+        log = []
+
+        pipeline = Pipeline(
+            [
+                node(source, None, "dataset"),
+                node(async_sink, "dataset", None, name="bob"),
+                node(async_sink, "dataset", None, name="fred"),
+            ]
+        )
+        catalog = DataCatalog({"dataset": LoggingDataSet(log, "dataset")})
+        AsyncioRunner().run(pipeline, catalog)
+
+        # we want to the release after both the loads
+        assert list(log) == [
+            ("load", "dataset"),
+            ("load", "dataset"),
+            ("release", "dataset"),
+        ]
+
+    def test_release_transcoded(self):
+        log = []
+
+        pipeline = Pipeline(
+            [node(source, None, "ds@save"), node(async_sink, "ds@load", None)]
+        )
+        catalog = DataCatalog(
+            {
+                "ds@save": LoggingDataSet(log, "save"),
+                "ds@load": LoggingDataSet(log, "load"),
+            }
+        )
+
+        AsyncioRunner().run(pipeline, catalog)
+
+        # we want to see both datasets being released
+        assert list(log) == [("release", "save"), ("load", "load"), ("release", "load")]
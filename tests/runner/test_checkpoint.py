@@ -0,0 +1,231 @@
+import os
+import sys
+import threading
+from collections import Counter
+
+import pytest
+
+from kedro.extras.datasets.pickle import PickleDataSet
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import (
+    HybridRunner,
+    ParallelRunner,
+    RunCheckpoint,
+    SequentialRunner,
+    ThreadRunner,
+)
+from kedro.runner.checkpoint import _in_memory_data_sets
+
+CALLS = Counter()  # type: Counter
+FAILING = set()
+
+
+def step(name):
+    def _step(arg):
+        CALLS[name] += 1
+        if name in FAILING:
+            raise ValueError(f"{name} failed")
+        return arg + 1
+
+    _step.__name__ = name
+    return _step
+
+
+def make_callback(arg):
+    CALLS["make_callback"] += 1
+    return lambda: arg
+
+
+def use_callback(callback):
+    CALLS["use_callback"] += 1
+    if "use_callback" in FAILING:
+        raise ValueError("use_callback failed")
+    return callback()
+
+
+def increment(arg):  # pragma: no cover
+    # run in worker processes
+    return arg + 1
+
+
+def fail_when_set(arg):  # pragma: no cover
+    # run in worker processes
+    if os.environ.get("KEDRO_TEST_CHECKPOINT_FAIL"):
+        raise ValueError("node failed")
+    return arg + 1
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    CALLS.clear()
+    FAILING.clear()
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return RunCheckpoint(tmp_path / "checkpoint")
+
+
+@pytest.fixture
+def pipeline():
+    # A is persisted, B and C are in memory, D is a free output
+    return Pipeline(
+        [
+            node(step("first"), "A", "B", name="first"),
+            node(step("second"), "B", "C", name="second"),
+            node(step("third"), "C", "D", name="third"),
+            node(step("side"), "B", "E", name="side"),
+        ]
+    )
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = DataCatalog(
+        {"A": PickleDataSet(str(tmp_path / "A.pkl")), "C": MemoryDataSet()}
+    )
+    catalog.save("A", 1)
+    return catalog
+
+
+def fail_run(runner, pipeline, catalog, checkpoint, failing):
+    FAILING.add(failing)
+    with pytest.raises(ValueError, match=f"{failing} failed"):
+        runner.run(pipeline, catalog, checkpoint=checkpoint)
+    FAILING.clear()
+    CALLS.clear()
+
+
+def test_in_memory_data_sets(pipeline, catalog):
+    assert _in_memory_data_sets(pipeline, catalog) == {"B", "C", "D", "E"}
+
+
+class TestRunCheckpoint:
+    def test_save_and_load(self, checkpoint, pipeline, catalog, caplog):
+        catalog.save("C", 3)
+        catalog.add_feed_dict({"B": 2, "E": 3})
+        done_nodes = [n for n in pipeline.nodes if n.name != "third"]
+        assert not checkpoint.exists()
+
+        checkpoint.save(pipeline, catalog, done_nodes, {"B", "C", "D", "E"})
+        assert checkpoint.exists()
+        # B is not needed anymore, and A is persisted
+        assert checkpoint.load() == ({"first", "second", "side"}, {"C": 3, "E": 3})
+        assert "3 nodes completed, 2 in-memory datasets copied" in caplog.text
+
+    def test_save_replaces_previous_checkpoint(self, checkpoint, pipeline, catalog):
+        catalog.add_feed_dict({"B": 2})
+        first = [n for n in pipeline.nodes if n.name == "first"]
+        checkpoint.save(pipeline, catalog, first, {"B"})
+        checkpoint.save(pipeline, DataCatalog(), [], set())
+        assert checkpoint.load() == (set(), {})
+        assert not (checkpoint._path / "data").exists()
+
+    def test_unpicklable_data(self, checkpoint, pipeline, caplog):
+        catalog = DataCatalog(
+            {"B": MemoryDataSet(threading.Lock(), copy_mode="assign")}
+        )
+        first = [n for n in pipeline.nodes if n.name == "first"]
+        checkpoint.save(pipeline, catalog, first, {"B"})
+        assert checkpoint.load() == ({"first"}, {})
+        assert "Cannot save dataset `B` to the checkpoint" in caplog.text
+        assert not list((checkpoint._path / "data").iterdir())
+
+    def test_clear(self, checkpoint):
+        checkpoint.save(Pipeline([]), DataCatalog(), [], set())
+        checkpoint.clear()
+        assert not checkpoint.exists()
+        assert not checkpoint._path.exists()
+
+
+class TestResume:
+    @pytest.mark.parametrize("runner_class", [SequentialRunner, ThreadRunner])
+    def test_resume(self, runner_class, checkpoint, pipeline, catalog):
+        runner = runner_class()
+        fail_run(runner, pipeline, catalog, checkpoint, "third")
+        assert checkpoint.exists()
+
+        result = runner.run(pipeline, catalog, resume=checkpoint)
+        assert CALLS == {"third": 1}
+        assert result == {"D": 4, "E": 3}
+        # the checkpoint is consumed by the resumed run
+        assert not checkpoint.exists()
+
+    def test_no_checkpoint_without_failure(self, checkpoint, pipeline, catalog):
+        SequentialRunner().run(pipeline, catalog, checkpoint=checkpoint)
+        assert not checkpoint.exists()
+
+    def test_resume_twice(self, tmp_path, checkpoint, pipeline, catalog):
+        runner = SequentialRunner()
+        fail_run(runner, pipeline, catalog, checkpoint, "second")
+
+        # the resumed run fails too, and saves its own checkpoint
+        second_checkpoint = RunCheckpoint(tmp_path / "second")
+        FAILING.add("third")
+        with pytest.raises(ValueError, match="third failed"):
+            runner.run(
+                pipeline, catalog, checkpoint=second_checkpoint, resume=checkpoint
+            )
+        assert checkpoint.exists()
+        FAILING.clear()
+        CALLS.clear()
+
+        assert runner.run(pipeline, catalog, resume=second_checkpoint) == {
+            "D": 4,
+            "E": 3,
+        }
+        assert CALLS == {"third": 1}
+
+    def test_rerun_producer_of_lost_data(self, checkpoint, catalog, caplog):
+        pipeline = Pipeline(
+            [
+                node(make_callback, "A", "callback", name="make_callback"),
+                node(use_callback, "callback", "result", name="use_callback"),
+            ]
+        )
+        runner = SequentialRunner()
+        fail_run(runner, pipeline, catalog, checkpoint, "use_callback")
+        assert "Cannot save dataset `callback` to the checkpoint" in caplog.text
+
+        assert runner.run(pipeline, catalog, resume=checkpoint) == {"result": 1}
+        assert CALLS == {"make_callback": 1, "use_callback": 1}
+
+    def test_checkpoint_error(self, checkpoint, pipeline, catalog, mocker, caplog):
+        mocker.patch.object(checkpoint, "save", side_effect=OSError("disk full"))
+        FAILING.add("third")
+        with pytest.raises(ValueError, match="third failed"):
+            SequentialRunner().run(pipeline, catalog, checkpoint=checkpoint)
+        assert "Cannot save the run checkpoint: disk full" in caplog.text
+
+    def test_run_only_stale(self, checkpoint, pipeline, catalog):
+        runner = SequentialRunner()
+        FAILING.add("third")
+        with pytest.raises(ValueError, match="third failed"):
+            runner.run_only_stale(pipeline, catalog, checkpoint=checkpoint)
+        FAILING.clear()
+        CALLS.clear()
+
+        runner.run_only_stale(pipeline, catalog, resume=checkpoint)
+        assert CALLS == {"third": 1}
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+    )
+    @pytest.mark.parametrize("runner_class", [ParallelRunner, HybridRunner])
+    def test_resume_in_processes(self, runner_class, checkpoint, catalog, monkeypatch):
+        pipeline = Pipeline(
+            [
+                node(increment, "A", "B", name="first"),
+                node(fail_when_set, "B", "C", name="second"),
+            ]
+        )
+        catalog = DataCatalog({"A": catalog._data_sets["A"]})
+        runner = runner_class()
+        monkeypatch.setenv("KEDRO_TEST_CHECKPOINT_FAIL", "1")
+        with pytest.raises(ValueError, match="node failed"):
+            runner.run(pipeline, catalog, checkpoint=checkpoint)
+        assert checkpoint.load() == ({"first"}, {"B": 2})
+
+        monkeypatch.delenv("KEDRO_TEST_CHECKPOINT_FAIL")
+        assert runner.run(pipeline, catalog, resume=checkpoint) == {"C": 3}
@@ -0,0 +1,170 @@
+import os
+import time
+from collections import Counter
+
+import pytest
+from distributed import Client, LocalCluster
+
+from kedro.extras.datasets.pickle import PickleDataSet
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import DaskRunner, NodeCache, RunCheckpoint
+
+CALLS = Counter()  # type: Counter
+
+
+def increment(arg):
+    CALLS["increment"] += 1
+    return arg + 1
+
+
+def slow_increment(arg):
+    time.sleep(0.5)
+    return arg + 1
+
+
+def add(left, right):
+    return left + right
+
+
+def append(arg):
+    arg.append(len(arg))
+    return arg
+
+
+def fail(arg):
+    raise ValueError(f"{arg} failed")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    CALLS.clear()
+
+
+@pytest.fixture
+def client():
+    with LocalCluster(n_workers=2, processes=False) as cluster, Client(
+        cluster
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def runner(client):
+    return DaskRunner(client=client)
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = DataCatalog(
+        {
+            "A": PickleDataSet(str(tmp_path / "A.pkl")),
+            "D": PickleDataSet(str(tmp_path / "D.pkl")),
+        }
+    )
+    catalog.save("A", 1)
+    return catalog
+
+
+class TestDaskRunner:
+    def test_run(self, runner, catalog, caplog):
+        # B and C are in memory, D is persisted by a worker, E is a free output
+        pipeline = Pipeline(
+            [
+                node(increment, "A", "B", name="first"),
+                node(increment, "B", "C", name="second"),
+                node(add, ["B", "C"], "D", name="third"),
+                node(increment, "D", "E", name="fourth"),
+            ]
+        )
+        assert runner.run(pipeline, catalog) == {"E": 6}
+        assert catalog.load("D") == 5
+        assert "Completed 4 out of 4 tasks" in caplog.text
+
+    def test_registered_memory_data_set(self, runner, catalog):
+        catalog.add("C", MemoryDataSet())
+        pipeline = Pipeline(
+            [
+                node(increment, "A", "B", name="first"),
+                node(increment, "B", "C", name="second"),
+            ]
+        )
+        assert runner.run(pipeline, catalog) == {}
+        assert catalog.load("C") == 3
+
+    def test_inputs_are_copied(self, runner, catalog):
+        catalog.add_feed_dict({"A": []}, replace=True)
+        pipeline = Pipeline(
+            [
+                node(append, "A", "B", name="first"),
+                node(append, "B", "C", name="second"),
+                node(append, "B", "D", name="third"),
+            ]
+        )
+        assert runner.run(pipeline, DataCatalog({"A": catalog._data_sets["A"]})) == {
+            "C": [0, 1],
+            "D": [0, 1],
+        }
+
+    def test_transcoded_data_sets(self, runner, catalog, tmp_path):
+        for name in ("T@first", "T@second"):
+            catalog.add(name, PickleDataSet(str(tmp_path / "T.pkl")))
+        pipeline = Pipeline(
+            [
+                node(slow_increment, "A", "T@first", name="save"),
+                node(increment, "T@second", "E", name="load"),
+            ]
+        )
+        # the node loading T waits for the node saving it under another name
+        assert runner.run(pipeline, catalog) == {"E": 3}
+
+    def test_node_failure(self, runner, catalog, tmp_path):
+        pipeline = Pipeline(
+            [
+                node(increment, "A", "B", name="first"),
+                node(fail, "B", "C", name="fail"),
+                node(increment, "C", "E", name="last"),
+            ]
+        )
+        checkpoint = RunCheckpoint(tmp_path / "checkpoint")
+        with pytest.raises(ValueError, match="2 failed"):
+            runner.run(pipeline, catalog, checkpoint=checkpoint)
+        assert checkpoint.load()[0] == {"first"}
+
+    def test_node_cache(self, client, catalog, tmp_path):
+        runner = DaskRunner(client=client, node_cache=NodeCache(tmp_path / "cache"))
+        pipeline = Pipeline([node(increment, "A", "D", name="first")])
+        runner.run(pipeline, catalog)
+        os.remove(catalog._data_sets["D"]._filepath)
+        runner.run(pipeline, catalog)
+        # restored from the cache instead of running the node again
+        assert catalog.load("D") == 2
+        assert CALLS == {"increment": 1}
+
+    def test_client_and_client_args(self, client):
+        with pytest.raises(ValueError, match="cannot be used together"):
+            DaskRunner(client=client, client_args={"processes": False})
+
+    def test_runner_client_is_not_closed(self, runner, client):
+        runner.close()
+        assert runner.client is client
+        assert client.status == "running"
+
+    def test_create_default_data_set(self, runner):
+        assert isinstance(runner.create_default_data_set("A"), MemoryDataSet)
+
+    def test_local_cluster(self, catalog):
+        runner = DaskRunner(client_args={"n_workers": 2, "processes": False})
+        with runner:
+            pipeline = Pipeline(
+                [
+                    node(increment, "A", "B", name="first"),
+                    node(increment, "A", "C", name="second"),
+                    node(add, ["B", "C"], "D", name="third"),
+                ]
+            )
+            assert runner.run(pipeline, catalog) == {}
+            assert catalog.load("D") == 4
+        # the client and the cluster created by the runner are closed with it
+        assert runner.client.status == "closed"
+        assert runner.client.cluster.status.name == "closed"
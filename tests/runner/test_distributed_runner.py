@@ -0,0 +1,329 @@
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+from multiprocessing.connection import AuthenticationError, Client, Pipe
+
+import pytest
+
+from kedro.extras.datasets.pickle import PickleDataSet
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import DistributedRunner, RunCheckpoint
+from kedro.runner.distributed_runner import _fetch, _parse_address, _Worker, run_worker
+
+AUTHKEY = "secret"
+TEST_PID = os.getpid()
+RAN_ON = {}
+
+
+def identity(arg):
+    RAN_ON[arg] = threading.current_thread().name
+    return arg
+
+
+def add(left, right):
+    return left + right
+
+
+class Record:
+    def __init__(self, name):
+        self.__name__ = name
+
+    def __call__(self, arg):
+        RAN_ON[self.__name__] = threading.current_thread().name
+        return arg + 1
+
+
+def sleep(arg):
+    time.sleep(0.5)
+    return arg
+
+
+def fail(arg):
+    raise ValueError(f"{arg} failed")
+
+
+class UnpicklableError(Exception):
+    def __init__(self):
+        super().__init__("unpicklable")
+        self.lock = threading.Lock()
+
+
+def fail_unpicklable(arg):
+    raise UnpicklableError()
+
+
+def exit_in_child(arg):
+    if os.getpid() != TEST_PID:  # pragma: no cover
+        os._exit(1)
+    return arg + 1
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    RAN_ON.clear()
+
+
+@pytest.fixture
+def runner():
+    runner = DistributedRunner(("localhost", 0), authkey=AUTHKEY, connect_timeout=10)
+    yield runner
+    runner.close()
+
+
+def start_worker(runner, name="worker", **kwargs):
+    thread = threading.Thread(
+        target=run_worker,
+        args=(runner.address,),
+        kwargs={"authkey": AUTHKEY, "once": True, **kwargs},
+        name=name,
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def start_process_worker(runner):
+    process = multiprocessing.Process(
+        target=run_worker,
+        args=(runner.address,),
+        kwargs={"authkey": AUTHKEY, "once": True},
+        daemon=True,
+    )
+    process.start()
+    # wait for it, so that it is the first worker to be scheduled on
+    runner._wait_for_workers(1)
+    return process
+
+
+@pytest.fixture
+def workers(runner):
+    threads = [start_worker(runner, f"worker-{i}") for i in range(2)]
+    runner._wait_for_workers(2)
+    yield threads
+    runner.close()
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = DataCatalog(
+        {
+            "A": PickleDataSet(str(tmp_path / "A.pkl")),
+            "D": PickleDataSet(str(tmp_path / "D.pkl")),
+        }
+    )
+    catalog.save("A", 1)
+    return catalog
+
+
+class TestDistributedRunner:
+    def test_run(self, runner, workers, catalog):
+        # B and C are in memory, D is persisted by a worker, E is a free output
+        pipeline = Pipeline(
+            [
+                node(Record("first"), "A", "B", name="first"),
+                node(Record("second"), "B", "C", name="second"),
+                node(Record("third"), "C", "D", name="third"),
+                node(Record("fourth"), "D", "E", name="fourth"),
+            ]
+        )
+        assert runner.run(pipeline, catalog) == {"E": 5}
+        assert catalog.load("D") == 4
+        # the in-memory data does not move between workers
+        assert RAN_ON["first"] == RAN_ON["second"] == RAN_ON["third"]
+
+    def test_transfer_between_workers(self, runner, workers, catalog):
+        catalog.add("C", MemoryDataSet())
+        pipeline = Pipeline(
+            [
+                node(sleep, "A", "B1", name="left"),
+                node(sleep, "A", "B2", name="right"),
+                node(add, ["B1", "B2"], "C", name="add"),
+            ]
+        )
+        assert runner.run(pipeline, catalog) == {}
+        # registered in-memory outputs are sent back to the runner
+        assert catalog.load("C") == 2
+
+    def test_several_runs(self, runner, workers, catalog):
+        pipeline = Pipeline([node(identity, "A", "B")])
+        for _ in range(3):
+            assert runner.run(pipeline, catalog) == {"B": 1}
+
+    def test_node_failure(self, runner, workers, catalog, tmp_path):
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(fail, "B", "C", name="fail"),
+                node(sleep, "A", "E", name="slow"),
+            ]
+        )
+        checkpoint = RunCheckpoint(tmp_path / "checkpoint")
+        with pytest.raises(ValueError, match="1 failed"):
+            runner.run(pipeline, catalog, checkpoint=checkpoint)
+        assert checkpoint.load()[0] == {"first"}
+
+        # the result of the slow node of the failed run is ignored
+        pipeline = Pipeline([node(sleep, "A", "B")])
+        assert runner.run(pipeline, catalog) == {"B": 1}
+
+    def test_unpicklable_exception(self, runner, workers, catalog):
+        pipeline = Pipeline([node(fail_unpicklable, "A", "B", name="fail")])
+        pattern = r"(?s)Node `fail` failed:.*UnpicklableError: unpicklable"
+        with pytest.raises(RuntimeError, match=pattern):
+            runner.run(pipeline, catalog)
+
+    def test_unpicklable_node(self, runner, catalog):
+        pipeline = Pipeline([node(lambda x: x, "A", "B", name="lambda")])
+        pattern = r"nodes cannot be sent to the workers: \['lambda'\]"
+        with pytest.raises(AttributeError, match=pattern):
+            runner.run(pipeline, catalog)
+
+    def test_unpicklable_data_set(self, runner, catalog):
+        catalog.add("B", MemoryDataSet(threading.Lock(), copy_mode="assign"))
+        pipeline = Pipeline([node(identity, "B", "C")])
+        pattern = r"data sets cannot be sent to the workers: \['B'\]"
+        with pytest.raises(AttributeError, match=pattern):
+            runner.run(pipeline, catalog)
+
+    def test_no_workers(self, catalog):
+        with DistributedRunner(
+            ("localhost", 0), authkey=AUTHKEY, min_workers=2, connect_timeout=0.1
+        ) as runner:
+            pipeline = Pipeline([node(identity, "A", "B")])
+            with pytest.raises(RuntimeError, match="Only 0 of the 2 workers"):
+                runner.run(pipeline, catalog)
+
+    def test_wrong_authkey(self, runner, caplog):
+        with pytest.raises(AuthenticationError):
+            Client(runner.address, authkey=b"wrong")
+        runner.close()
+        runner._accept_thread.join(5)
+        assert "Rejected a worker connection" in caplog.text
+        assert not runner._workers
+
+    def test_worker_waits_for_runner(self, catalog):
+        with socket.socket() as sock:
+            sock.bind(("localhost", 0))
+            address = sock.getsockname()
+        thread = threading.Thread(
+            target=run_worker,
+            args=(f"localhost:{address[1]}",),
+            kwargs={"authkey": AUTHKEY, "once": True, "retry_interval": 0.05},
+            daemon=True,
+        )
+        thread.start()
+        time.sleep(0.2)
+        with DistributedRunner(address, authkey=AUTHKEY, connect_timeout=10) as runner:
+            assert runner.run(Pipeline([node(identity, "A", "B")]), catalog) == {"B": 1}
+        thread.join(5)
+        assert not thread.is_alive()
+
+    def test_worker_host(self, runner, catalog):
+        thread = start_worker(runner, host="127.0.0.1")
+        assert runner.run(Pipeline([node(identity, "A", "B")]), catalog) == {"B": 1}
+        assert runner._workers[0].data_address[0] == "127.0.0.1"
+        runner.close()
+        thread.join(5)
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"), reason="Worker processes are forked"
+    )
+    def test_worker_lost_while_running(self, runner, catalog, caplog):
+        process = start_process_worker(runner)
+        # the node runs again on the next worker which connects
+        timer = threading.Timer(0.5, start_worker, args=(runner,))
+        timer.start()
+        pipeline = Pipeline([node(exit_in_child, "A", "B", name="exit")])
+        assert runner.run(pipeline, catalog) == {"B": 2}
+        assert "disconnected" in caplog.text
+        process.join(5)
+        timer.join(5)
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"), reason="Worker processes are forked"
+    )
+    def test_worker_lost_with_data(self, runner, catalog):
+        process = start_process_worker(runner)
+        thread = start_worker(runner)
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B", name="first"),
+                node(exit_in_child, "B", "C", name="exit"),
+            ]
+        )
+        with pytest.raises(RuntimeError, match=r"losing the data of \['B'\]"):
+            runner.run(pipeline, catalog)
+        process.join(5)
+        runner.close()
+        thread.join(5)
+
+
+class TestDataServer:
+    @pytest.fixture
+    def worker(self):
+        connection, other = Pipe()
+        worker = _Worker(connection, AUTHKEY.encode(), "localhost")
+        worker._held["run"] = {"A": 1, "lock": threading.Lock()}
+        thread = threading.Thread(target=worker.serve, daemon=True)
+        thread.start()
+        yield worker
+        other.close()
+        thread.join(5)
+
+    def test_fetch(self, worker):
+        connections = {}
+        address = list(worker.data_address)
+        assert _fetch(connections, address, AUTHKEY.encode(), "run", "A") == 1
+        assert _fetch(connections, address, AUTHKEY.encode(), "run", "A") == 1
+        assert len(connections) == 1
+
+    @pytest.mark.parametrize(
+        "name,error",
+        [("B", "the dataset is not held"), ("lock", "(cannot|can.t) pickle")],
+    )
+    def test_fetch_error(self, worker, name, error):
+        pattern = f"Cannot fetch dataset `{name}` from the worker at .*: {error}"
+        with pytest.raises(RuntimeError, match=pattern):
+            _fetch({}, worker.data_address, AUTHKEY.encode(), "run", name)
+
+
+class TestConfiguration:
+    def test_authkey_from_env(self, monkeypatch):
+        monkeypatch.setenv("KEDRO_WORKER_AUTHKEY", AUTHKEY)
+        monkeypatch.setenv("KEDRO_COORDINATOR_ADDRESS", "localhost:0")
+        with DistributedRunner() as runner:
+            assert runner._authkey == b"secret"
+            assert runner.address[0] == "127.0.0.1"
+
+    def test_no_authkey(self, monkeypatch):
+        monkeypatch.delenv("KEDRO_WORKER_AUTHKEY", raising=False)
+        with pytest.raises(ValueError, match="KEDRO_WORKER_AUTHKEY"):
+            DistributedRunner(("localhost", 0))
+        with pytest.raises(ValueError, match="KEDRO_WORKER_AUTHKEY"):
+            run_worker()
+
+    def test_min_workers(self):
+        with pytest.raises(ValueError, match="must be at least 1"):
+            DistributedRunner(("localhost", 0), authkey=AUTHKEY, min_workers=0)
+
+    @pytest.mark.parametrize(
+        "address,expected",
+        [("localhost:8788", ("localhost", 8788)), (("::1", "80"), ("::1", 80))],
+    )
+    def test_parse_address(self, address, expected):
+        assert _parse_address(address) == expected
+
+    @pytest.mark.parametrize("address", ["localhost", ":8788", "localhost:port"])
+    def test_invalid_address(self, address):
+        with pytest.raises(ValueError, match="expected `<host>:<port>`"):
+            _parse_address(address)
+
+    def test_create_default_data_set(self, runner):
+        assert isinstance(runner.create_default_data_set("A"), MemoryDataSet)
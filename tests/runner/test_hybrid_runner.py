@@ -0,0 +1,175 @@
+import os
+import sys
+import threading
+
+import pytest
+
+from kedro.io import DataCatalog, LambdaDataSet, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import HybridRunner
+from kedro.runner.hybrid_runner import _get_executor
+from kedro.runner.parallel_runner import _SharedMemoryDataSet
+
+
+def identity(arg):
+    return arg
+
+
+def fan_in(*args):
+    return args
+
+
+def where(arg):  # pylint: disable=unused-argument
+    return os.getpid(), threading.get_ident()
+
+
+def exception_fn(arg):
+    raise Exception("test exception")
+
+
+@pytest.fixture
+def catalog():
+    return DataCatalog()
+
+
+@pytest.fixture
+def mixed_pipeline():
+    return Pipeline(
+        [
+            node(identity, "A", "B", tags="executor:thread"),
+            node(where, "B", "C", name="in_process", tags="executor:process"),
+            node(where, "B", "D", name="in_thread", tags="executor:thread"),
+            node(where, "B", "E", name="inline", tags="executor:inline"),
+            node(fan_in, ["C", "D", "E"], "Z", tags="executor:process"),
+        ]
+    )
+
+
+class TestGetExecutor:
+    def test_default(self):
+        assert _get_executor(node(identity, "A", "B"), "thread") == "thread"
+
+    def test_tagged(self):
+        node_ = node(identity, "A", "B", tags=["other", "executor:process"])
+        assert _get_executor(node_, "thread") == "process"
+
+    def test_unknown_executor(self):
+        node_ = node(identity, "A", "B", tags="executor:gpu")
+        with pytest.raises(ValueError, match=r"Unknown executor `gpu`"):
+            _get_executor(node_, "thread")
+
+    def test_several_executors(self):
+        node_ = node(identity, "A", "B", tags=["executor:thread", "executor:inline"])
+        with pytest.raises(ValueError, match=r"more than one executor"):
+            _get_executor(node_, "thread")
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestValidHybridRunner:
+    def test_routing(self, mixed_pipeline, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        result = HybridRunner().run(mixed_pipeline, catalog)
+        in_process, in_thread, inline = result["Z"]
+
+        main = os.getpid(), threading.get_ident()
+        assert in_process[0] != main[0]
+        assert in_thread[0] == main[0]
+        assert in_thread[1] != main[1]
+        assert inline == main
+
+    @pytest.mark.parametrize("default_executor", ["process", "thread", "inline"])
+    def test_default_executor(self, default_executor, catalog):
+        pipeline = Pipeline([node(identity, "A", "B"), node(identity, "B", "C")])
+        catalog.add_feed_dict(dict(A=42))
+        runner = HybridRunner(default_executor=default_executor)
+        assert runner.run(pipeline, catalog) == {"C": 42}
+
+    def test_default_data_sets(self, mixed_pipeline):
+        runner = HybridRunner()
+        runner._process_data_sets = {"B"}
+
+        assert isinstance(runner.create_default_data_set("B"), _SharedMemoryDataSet)
+        assert isinstance(runner.create_default_data_set("D"), MemoryDataSet)
+
+        runner.run(mixed_pipeline, DataCatalog({"A": MemoryDataSet(42)}))
+        # datasets read or written by the nodes routed to processes
+        assert runner._process_data_sets == {"B", "C", "D", "E", "Z"}
+
+    def test_no_process_pool_without_process_nodes(self, catalog, mocker):
+        pipeline = Pipeline([node(identity, "A", "B", tags="executor:inline")])
+        catalog.add_feed_dict(dict(A=42))
+        runner = HybridRunner()
+        open_pool = mocker.spy(runner, "_open_pool")
+        assert runner.run(pipeline, catalog) == {"B": 42}
+        open_pool.assert_not_called()
+
+    def test_data_sets_of_thread_nodes_not_validated(self):
+        class SingleProcessDataSet(MemoryDataSet):
+            _SINGLE_PROCESS = True
+
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B", tags="executor:thread"),
+                node(identity, "B", "C", tags="executor:inline"),
+                node(identity, "in", "out", tags="executor:process"),
+            ]
+        )
+        catalog = DataCatalog(
+            {
+                "A": SingleProcessDataSet(42),
+                # not serializable, as it loads with a lambda
+                "B": LambdaDataSet(load=lambda: 42, save=lambda data: None),
+            },
+            feed_dict={"in": 1},
+        )
+        assert HybridRunner().run(pipeline, catalog) == {"C": 42, "out": 1}
+
+    def test_non_serializable_node_in_thread(self, catalog):
+        pipeline = Pipeline([node(lambda x: x, "A", "B", tags="executor:thread")])
+        catalog.add_feed_dict(dict(A=42))
+        assert HybridRunner().run(pipeline, catalog) == {"B": 42}
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestInvalidHybridRunner:
+    def test_init_with_unknown_default_executor(self):
+        with pytest.raises(ValueError, match=r"Unknown executor `gpu`"):
+            HybridRunner(default_executor="gpu")
+
+    def test_init_with_non_positive_max_threads(self):
+        with pytest.raises(ValueError, match=r"max_threads should be positive"):
+            HybridRunner(max_threads=0)
+
+    def test_non_serializable_node_in_process(self, catalog):
+        pipeline = Pipeline([node(lambda x: x, "A", "B", tags="executor:process")])
+        catalog.add_feed_dict(dict(A=42))
+        with pytest.raises(AttributeError, match=r"cannot be serialized"):
+            HybridRunner().run(pipeline, catalog)
+
+    def test_memory_data_set_input_of_process_node(self):
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B", tags="executor:thread"),
+                node(identity, "B", "C", tags="executor:process"),
+            ]
+        )
+        catalog = DataCatalog({"A": MemoryDataSet(42), "B": MemoryDataSet()})
+        with pytest.raises(AttributeError, match=r"\['B'\]"):
+            HybridRunner().run(pipeline, catalog)
+
+    @pytest.mark.parametrize("executor", ["process", "thread", "inline"])
+    def test_task_exception(self, executor, catalog, caplog):
+        pipeline = Pipeline(
+            [
+                node(identity, "A", "B", tags="executor:thread"),
+                node(exception_fn, "B", "C", tags=f"executor:{executor}"),
+            ]
+        )
+        catalog.add_feed_dict(dict(A=42))
+        with pytest.raises(Exception, match=r"test exception"):
+            HybridRunner().run(pipeline, catalog)
+        assert "You can resume the pipeline run" in caplog.text
@@ -0,0 +1,446 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import Counter
+from functools import partial
+from pathlib import PurePosixPath
+
+import pytest
+
+from kedro.extras.datasets.pickle import PickleDataSet
+from kedro.io import (
+    AbstractDataSet,
+    AbstractVersionedDataSet,
+    DataCatalog,
+    MemoryDataSet,
+    Version,
+)
+from kedro.io.core import VersionNotFoundError
+from kedro.pipeline import Pipeline, node
+from kedro.runner import (
+    NodeCache,
+    ParallelRunner,
+    SequentialRunner,
+    ThreadRunner,
+    run_node,
+)
+from kedro.runner.node_cache import _data_set_stamp, _hash_function
+
+CALLS = Counter()  # type: Counter
+
+
+def identity(arg):
+    CALLS["identity"] += 1
+    return arg
+
+
+def add(arg, params):
+    CALLS["add"] += 1
+    return arg + params
+
+
+def add_one(arg):
+    return arg + 1  # pragma: no cover
+
+
+def fail_when_set(arg):  # pragma: no cover
+    # run in worker processes
+    if os.environ.get("KEDRO_TEST_NODE_CACHE_FAIL"):
+        raise RuntimeError("node should have been restored from the cache")
+    return arg + 1
+
+
+def make_adder(amount):
+    def adder(arg):
+        return arg + amount  # pragma: no cover
+
+    return adder
+
+
+def fingerprint(func):
+    digest = hashlib.sha256()
+    _hash_function(func, digest)
+    return digest.hexdigest()
+
+
+class QueryDataSet(AbstractDataSet):
+    """A dataset held by an external service, which is counted as loaded
+    every time its data is read.
+    """
+
+    def __init__(self, data):
+        self.data = data
+
+    def _load(self):
+        CALLS["load"] += 1
+        return self.data
+
+    def _save(self, data):
+        self.data = data  # pragma: no cover
+
+    def _describe(self):
+        return {}
+
+
+class FingerprintedDataSet(QueryDataSet):
+    def fingerprint(self):
+        return f"revision {self.data}"
+
+
+class VersionedQueryDataSet(AbstractVersionedDataSet):
+    def __init__(self, version):
+        super().__init__(PurePosixPath("query"), version)
+
+    def _load(self):
+        return self.resolve_load_version()  # pragma: no cover
+
+    def _save(self, data):
+        pass  # pragma: no cover
+
+    def _describe(self):
+        return {}
+
+
+class Adder:
+    def __init__(self, amount):
+        self.amount = amount
+
+    def add(self, arg):
+        return arg + self.amount  # pragma: no cover
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    CALLS.clear()
+
+
+@pytest.fixture
+def node_cache(tmp_path):
+    return NodeCache(tmp_path / "node_cache")
+
+
+@pytest.fixture
+def pipeline():
+    return Pipeline(
+        [
+            node(add, ["A", "params:amount"], "B", name="add"),
+            node(identity, "B", "C", name="identity"),
+        ]
+    )
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return DataCatalog(
+        {
+            "A": PickleDataSet(str(tmp_path / "A.pkl")),
+            "B": PickleDataSet(str(tmp_path / "B.pkl")),
+            "params:amount": MemoryDataSet(1),
+        }
+    )
+
+
+class TestHashFunction:
+    def test_same_function(self):
+        assert fingerprint(add_one) == fingerprint(add_one)
+        assert fingerprint(add_one) != fingerprint(identity)
+
+    def test_closure(self):
+        assert fingerprint(make_adder(1)) == fingerprint(make_adder(1))
+        assert fingerprint(make_adder(1)) != fingerprint(make_adder(2))
+        assert fingerprint(make_adder(add_one)) != fingerprint(make_adder(identity))
+
+    def test_defaults(self):
+        def with_default(arg, amount=1):
+            return arg + amount  # pragma: no cover
+
+        before = fingerprint(with_default)
+        with_default.__defaults__ = (2,)
+        assert fingerprint(with_default) != before
+
+    def test_partial(self):
+        assert fingerprint(partial(add, params=1)) == fingerprint(
+            partial(add, params=1)
+        )
+        assert fingerprint(partial(add, params=1)) != fingerprint(
+            partial(add, params=2)
+        )
+
+    def test_bound_method(self):
+        assert fingerprint(Adder(1).add) == fingerprint(Adder(1).add)
+        assert fingerprint(Adder(1).add) != fingerprint(Adder(2).add)
+
+    def test_builtin(self):
+        assert fingerprint(max) != fingerprint(min)
+
+
+class TestDataSetStamp:
+    def test_memory_data_set(self):
+        assert _data_set_stamp(DataCatalog({"ds": MemoryDataSet(1)}), "ds") is None
+
+    def test_file(self, catalog):
+        catalog.save("A", 1)
+        stamp = _data_set_stamp(catalog, "A")
+        assert stamp is not None
+        assert stamp == _data_set_stamp(catalog, "A")
+
+        os.utime(catalog._data_sets["A"]._filepath, (0, 0))
+        assert _data_set_stamp(catalog, "A") != stamp
+
+    def test_missing_file(self, catalog):
+        assert _data_set_stamp(catalog, "A") is None
+
+    def test_no_path(self, catalog, mocker):
+        data_set = catalog._data_sets["A"]
+        mocker.patch.object(data_set, "_get_load_path", return_value=None)
+        assert _data_set_stamp(catalog, "A") is None
+
+    def test_info_error(self, catalog, mocker):
+        catalog.save("A", 1)
+        data_set = catalog._data_sets["A"]
+        mocker.patch.object(catalog, "exists", return_value=True)
+        mocker.patch.object(data_set._fs, "info", side_effect=OSError)
+        assert _data_set_stamp(catalog, "A") is None
+
+    def test_no_metadata(self, catalog, mocker):
+        catalog.save("A", 1)
+        data_set = catalog._data_sets["A"]
+        mocker.patch.object(data_set._fs, "info", return_value={"name": "A.pkl"})
+        assert _data_set_stamp(catalog, "A") is None
+
+
+class TestNodeCache:
+    def test_key(self, node_cache, catalog):
+        catalog.save("A", 1)
+        node_ = node(add, ["A", "params:amount"], "B")
+        key = node_cache.key(node_, catalog)
+        assert key == node_cache.key(node_, catalog)
+
+        catalog.add_feed_dict({"params:amount": 2}, replace=True)
+        assert node_cache.key(node_, catalog) != key
+
+    def test_key_decorated(self, node_cache, catalog):
+        catalog.save("A", 1)
+        node_ = node(add_one, "A", "B")
+        assert node_cache.key(node_, catalog) != node_cache.key(
+            node_.decorate(make_adder), catalog
+        )
+
+    def test_key_unpicklable_input(self, node_cache, caplog):
+        catalog = DataCatalog(
+            {"A": MemoryDataSet(threading.Lock(), copy_mode="assign")}
+        )
+        assert node_cache.key(node(add_one, "A", "B", name="lock"), catalog) is None
+        assert "Node `lock` cannot be memoized" in caplog.text
+
+    def test_key_fingerprint_method(self, node_cache):
+        catalog = DataCatalog({"A": FingerprintedDataSet(1)})
+        node_ = node(add_one, "A", "B")
+        key = node_cache.key(node_, catalog)
+        assert key is not None
+        assert key == node_cache.key(node_, catalog)
+
+        catalog._data_sets["A"].data = 2
+        assert node_cache.key(node_, catalog) != key
+        assert CALLS["load"] == 0
+
+    def test_key_load_version(self, node_cache):
+        node_ = node(add_one, "A", "B")
+        key = node_cache.key(
+            node_, DataCatalog({"A": VersionedQueryDataSet(Version("v1", None))})
+        )
+        assert key is not None
+        assert key != node_cache.key(
+            node_, DataCatalog({"A": VersionedQueryDataSet(Version("v2", None))})
+        )
+
+    def test_key_missing_load_version(self, node_cache, mocker):
+        data_set = VersionedQueryDataSet(Version(None, None))
+        mocker.patch.object(
+            data_set, "_fetch_latest_load_version", side_effect=VersionNotFoundError
+        )
+        node_ = node(add_one, "A", "B")
+        assert node_cache.key(node_, DataCatalog({"A": data_set})) is None
+
+    def test_key_external_input(self, node_cache, caplog):
+        catalog = DataCatalog({"A": QueryDataSet(1)})
+        assert node_cache.key(node(add_one, "A", "B", name="query"), catalog) is None
+        assert CALLS["load"] == 0
+        assert (
+            "Node `query` cannot be memoized: input `A` cannot be fingerprinted "
+            "without loading it" in caplog.text
+        )
+
+    def test_put_and_get(self, node_cache):
+        assert node_cache.get("key") is None
+        node_cache.put("key", node(add_one, "A", "B"), {"B": 2})
+        assert node_cache.get("key") == {"B": 2}
+
+    def test_put_unpicklable_output(self, node_cache, caplog):
+        node_cache.put(
+            "key", node(add_one, "A", "B", name="lock"), {"B": threading.Lock()}
+        )
+        assert node_cache.get("key") is None
+        assert node_cache.entries() == []
+        assert list(node_cache._path.iterdir()) == []
+        assert "Outputs of node `lock` cannot be memoized" in caplog.text
+
+    def test_get_invalid_entry(self, node_cache, caplog):
+        node_cache._path.mkdir()
+        (node_cache._path / "key.pkl").write_bytes(b"invalid")
+        assert node_cache.get("key") is None
+        assert "Ignoring invalid node cache entry `key`" in caplog.text
+
+    def test_entries(self, node_cache):
+        node_cache.put("first", node(add_one, "A", "B", name="first"), {"B": 2})
+        node_cache.put("second", node(add_one, "B", "C", name="second"), {"C": 3})
+        os.utime(node_cache._entry_path("second"), (0, 0))
+
+        entries = node_cache.entries()
+        assert [entry["key"] for entry in entries] == ["first", "second"]
+        assert entries[0]["node"] == "first"
+        assert entries[0]["outputs"] == ["B"]
+        assert entries[0]["size"] == node_cache._entry_path("first").stat().st_size
+
+        # getting an entry makes it the most recently used one
+        node_cache.get("second")
+        assert [entry["key"] for entry in node_cache.entries()] == ["second", "first"]
+
+    def test_lru_eviction(self, tmp_path):
+        node_ = node(add_one, "A", "B")
+        node_cache = NodeCache(tmp_path, max_size="1KB")
+        node_cache.put("first", node_, {"B": b"1" * 400})
+        node_cache.put("second", node_, {"B": b"2" * 400})
+        os.utime(node_cache._entry_path("first"), (0, 0))
+
+        node_cache.put("third", node_, {"B": b"3" * 400})
+        # entries are only evicted once pruned
+        assert len(node_cache.entries()) == 3
+
+        node_cache.prune()
+        assert node_cache.get("first") is None
+        assert node_cache.get("second") is not None
+        assert node_cache.get("third") is not None
+
+    def test_prune(self, node_cache):
+        node_cache.put("key", node(add_one, "A", "B"), {"B": 2})
+        assert node_cache.prune() == []
+        assert [entry["key"] for entry in node_cache.prune("1MB")] == []
+        assert [entry["key"] for entry in node_cache.prune(0)] == ["key"]
+        assert node_cache.entries() == []
+
+    def test_invalid_max_size(self, tmp_path):
+        with pytest.raises(ValueError, match=r"Invalid amount of memory `lots`"):
+            NodeCache(tmp_path, max_size="lots")
+
+    def test_link_outputs(self, node_cache, catalog):
+        node_ = node(add_one, "A", "B")
+        catalog.save("A", 1)
+        key = node_cache.key(node_, catalog)
+        catalog.save("B", 2)
+        node_cache.link_outputs(key, node_, catalog)
+
+        # saving the same outputs again does not change the fingerprint of
+        # the nodes loading them
+        next_node = node(add_one, "B", "C")
+        next_key = node_cache.key(next_node, catalog)
+        os.utime(catalog._data_sets["B"]._filepath, (0, 0))
+        node_cache.link_outputs(key, node_, catalog)
+        assert node_cache.key(next_node, catalog) == next_key
+
+        # the links are forgotten with the entries
+        node_cache.prune(0)
+        assert node_cache.key(next_node, catalog) != next_key
+
+    def test_fingerprint(self, node_cache, catalog):
+        node_ = node(add, ["A", "params:amount"], "B", name="add")
+        assert node_cache.is_changed(node_, catalog)
+        node_cache.record_fingerprint(node_, catalog)
+        assert not node_cache.is_changed(node_, catalog)
+
+        # other inputs are left out of the fingerprint
+        catalog.save("A", 2)
+        assert not node_cache.is_changed(node_, catalog)
+        catalog.add_feed_dict({"params:amount": 2}, replace=True)
+        assert node_cache.is_changed(node_, catalog)
+
+    def test_fingerprint_unpicklable_parameter(self, node_cache):
+        catalog = DataCatalog(
+            {"params:lock": MemoryDataSet(threading.Lock(), copy_mode="assign")}
+        )
+        node_ = node(add_one, "params:lock", "B", name="lock")
+        assert node_cache.fingerprint(node_, catalog) is None
+        node_cache.record_fingerprint(node_, catalog)
+        assert node_cache.is_changed(node_, catalog)
+
+
+class TestMemoizedRun:
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_sequential_runner(self, node_cache, pipeline, catalog, is_async):
+        catalog.save("A", 1)
+        runner = SequentialRunner(is_async=is_async, node_cache=node_cache)
+        assert runner.run(pipeline, catalog) == {"C": 2}
+        assert CALLS == {"add": 1, "identity": 1}
+
+        assert runner.run(pipeline, catalog) == {"C": 2}
+        assert CALLS == {"add": 1, "identity": 1}
+        assert catalog.load("B") == 2
+
+    def test_changed_input(self, node_cache, pipeline, catalog):
+        catalog.save("A", 1)
+        runner = SequentialRunner(node_cache=node_cache)
+        runner.run(pipeline, catalog)
+
+        catalog.add_feed_dict({"params:amount": 2}, replace=True)
+        assert runner.run(pipeline, catalog) == {"C": 3}
+        assert CALLS == {"add": 2, "identity": 2}
+
+        catalog.add_feed_dict({"params:amount": 1}, replace=True)
+        assert runner.run(pipeline, catalog) == {"C": 2}
+        assert CALLS == {"add": 2, "identity": 2}
+
+    def test_pruned_once_per_run(self, tmp_path, pipeline, catalog, mocker):
+        node_cache = NodeCache(tmp_path / "node_cache", max_size=0)
+        prune = mocker.spy(node_cache, "prune")
+        catalog.save("A", 1)
+        runner = SequentialRunner(node_cache=node_cache)
+        assert runner.run(pipeline, catalog) == {"C": 2}
+        prune.assert_called_once_with()
+        assert node_cache.entries() == []
+
+    def test_thread_runner(self, node_cache, pipeline, catalog):
+        catalog.save("A", 1)
+        runner = ThreadRunner(node_cache=node_cache)
+        runner.run(pipeline, catalog)
+        assert runner.run(pipeline, catalog) == {"C": 2}
+        assert CALLS == {"add": 1, "identity": 1}
+
+    def test_run_node_restores_outputs(self, node_cache, catalog, caplog):
+        node_ = node(add, ["A", "params:amount"], "B", name="add")
+        catalog.save("A", 1)
+        run_node(node_, catalog, node_cache=node_cache)
+        catalog.release("B")
+        os.remove(catalog._data_sets["B"]._filepath)
+
+        run_node(node_, catalog, node_cache=node_cache)
+        assert CALLS == {"add": 1}
+        assert catalog.load("B") == 2
+        assert "Restoring outputs of node `add` from the node cache" in caplog.text
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+    )
+    def test_parallel_runner(self, node_cache, catalog, monkeypatch):
+        pipeline = Pipeline(
+            [
+                node(fail_when_set, "A", "B", name="first"),
+                node(fail_when_set, "B", "C", name="second"),
+            ]
+        )
+        catalog.save("A", 1)
+        runner = ParallelRunner(max_workers=2, node_cache=node_cache)
+        assert runner.run(pipeline, catalog) == {"C": 3}
+
+        monkeypatch.setenv("KEDRO_TEST_NODE_CACHE_FAIL", "1")
+        assert runner.run(pipeline, catalog) == {"C": 3}
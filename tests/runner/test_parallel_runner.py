@@ -1,9 +1,18 @@
+import os
+import pickle
+import subprocess
 import sys
+import time
+from concurrent.futures import wait
 from concurrent.futures.process import ProcessPoolExecutor
+from pathlib import Path
 from typing import Any, Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 
+from kedro.extras.datasets.pickle import PickleDataSet
 from kedro.io import (
     AbstractDataSet,
     DataCatalog,
@@ -13,13 +22,31 @@ from kedro.io import (
 )
 from kedro.pipeline import Pipeline, node
 from kedro.pipeline.decorators import log_time
-from kedro.runner import ParallelRunner
+from kedro.runner import ParallelRunner, parallel_runner
 from kedro.runner.parallel_runner import (
     _MAX_WINDOWS_WORKERS,
+    _USE_SHARED_MEMORY,
+    _WORKER_STATE,
     ParallelRunnerManager,
+    _AdaptivePool,
+    _affine_data_sets,
+    _available_memory,
+    _batch_tiny_tasks,
+    _fuse_chains,
+    _has_spare_capacity,
+    _init_worker,
+    _InitializingPool,
+    _local_data_sets,
+    _run_initialized,
     _run_node_synchronization,
+    _run_nodes_synchronization,
     _SharedMemoryDataSet,
+    _SharedMemoryPayload,
 )
+from kedro.runner.runner import _ClaimingCatalog, _IOExecutor
+
+if _USE_SHARED_MEMORY:
+    from multiprocessing.shared_memory import SharedMemory
 
 
 def source():
@@ -108,6 +135,36 @@ class TestValidParallelRunner:
         assert len(result["Z"]) == 3
         assert result["Z"] == ("42", "42", "42")
 
+    def test_critical_path_priority(self, fan_out_fan_in, catalog, caplog):
+        catalog.add_feed_dict(dict(A=42))
+        runner = ParallelRunner(max_workers=2, priority="critical_path")
+        result = runner.run(fan_out_fan_in, catalog)
+        assert result["Z"] == (42, 42, 42)
+        assert set(runner.node_durations) == {n.name for n in fan_out_fan_in.nodes}
+        assert "Pipeline makespan" in caplog.text
+
+    def test_durations_measured_by_workers(self):
+        pipeline = Pipeline(
+            [node(sleep_pid, "A", f"pid{i}", name=f"pid{i}") for i in range(3)]
+        )
+        runner = ParallelRunner(max_workers=1)
+        runner.run(pipeline, DataCatalog(feed_dict={"A": 1}))
+        # the nodes queued behind the others are not counted as slower
+        assert set(runner.node_durations) == {"pid0", "pid1", "pid2"}
+        assert max(runner.node_durations.values()) < 0.55
+
+    def test_resource_budget(self, fan_out_fan_in, catalog):
+        pipeline = Pipeline(
+            [n.tag(["cpus:2", "memory:1G"]) for n in fan_out_fan_in.nodes]
+        )
+        catalog.add_feed_dict(dict(A=42))
+        result = ParallelRunner(max_workers=2, max_memory="1G").run(pipeline, catalog)
+        assert result == {"Z": (42, 42, 42)}
+
+    def test_init_with_unknown_priority(self):
+        with pytest.raises(ValueError, match="Unknown priority policy"):
+            ParallelRunner(priority="fifo")
+
 
 @pytest.mark.skipif(
     sys.platform.startswith("win"), reason="Due to bug in parallel runner"
@@ -154,7 +211,8 @@ class TestMaxWorkers:
         ).run(fan_out_fan_in, catalog)
         assert result == {"Z": (42, 42, 42)}
 
-        executor_cls_mock.assert_called_once_with(max_workers=expected_number)
+        executor_cls_mock.assert_called_once()
+        assert executor_cls_mock.call_args[1]["max_workers"] == expected_number
 
     def test_max_worker_windows(self, mocker):
         """The ProcessPoolExecutor on Python 3.7+
@@ -168,6 +226,166 @@ class TestMaxWorkers:
         assert parallel_runner._max_workers == _MAX_WINDOWS_WORKERS
 
 
+def count_init(counter):
+    counter.append(os.getpid())
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestInitializingPool:
+    """The pool used on Python 3.6, which has no pool initializer."""
+
+    def test_initializer_once_per_worker(self):
+        manager = ParallelRunnerManager()
+        manager.start()
+        try:
+            counter = manager.list()
+            pool = _InitializingPool(
+                max_workers=2, initializer=count_init, initargs=(counter,)
+            )
+            with pool:
+                pids = list(pool.map(worker_pid, range(10)))
+            assert sorted(counter) == sorted(set(pids))
+        finally:
+            manager.shutdown()
+
+    def test_without_initializer(self):
+        with _InitializingPool(max_workers=1) as pool:
+            assert pool.submit(abs, -1).result() == 1
+
+    def test_run_initialized(self, mocker):
+        mocker.patch("kedro.runner.parallel_runner._INITIALIZED_POOLS", set())
+        initializer = mocker.Mock()
+        for arg in (-1, -2):
+            assert _run_initialized("pool", initializer, ("init",), abs, arg) == -arg
+        initializer.assert_called_once_with("init")
+
+    @pytest.mark.parametrize(
+        "options", [{}, {"reuse_workers": True}, {"locality": True}]
+    )
+    def test_run(self, mocker, fan_out_fan_in, catalog, options):
+        mocker.patch(
+            "kedro.runner.parallel_runner.ProcessPoolExecutor", _InitializingPool
+        )
+        catalog.add_feed_dict(dict(A=42))
+        with ParallelRunner(max_workers=2, **options) as runner:
+            for _ in range(2):
+                assert runner.run(fan_out_fan_in, catalog) == {"Z": (42, 42, 42)}
+
+
+def make_array():
+    return np.arange(100_000, dtype="float64")
+
+
+def make_frame(array):
+    return pd.DataFrame({"a": array, "b": array * 2})
+
+
+def check_read_only(data):
+    if isinstance(data, pd.DataFrame):
+        data = data["a"].values
+    assert not data.flags.writeable
+    return float(data.sum())
+
+
+def _segment_exists(name):
+    try:
+        SharedMemory(name=name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+@pytest.mark.skipif(
+    not _USE_SHARED_MEMORY, reason="Shared memory transport requires POSIX"
+)
+class TestSharedMemoryTransport:
+    def test_large_buffers_in_shared_memory(self):
+        array = make_array()
+        payload = _SharedMemoryPayload(array)
+        assert len(payload.segments) == 1
+        assert len(payload.pickled) < 1024
+
+        loaded = payload.load()
+        np.testing.assert_array_equal(loaded, array)
+        assert not loaded.flags.writeable
+
+        name = payload.segments[0][0]
+        payload.unlink()
+        assert not _segment_exists(name)
+        # data that was loaded stays available after the segment is freed
+        np.testing.assert_array_equal(loaded, array)
+
+    def test_small_data_stays_in_band(self):
+        payload = _SharedMemoryPayload({"key": [1, 2, 3]})
+        assert not payload.segments
+        assert payload.load() == {"key": [1, 2, 3]}
+
+    def test_release_frees_segments(self):
+        runner = ParallelRunner()
+        data_set = runner.create_default_data_set("")
+        data_set.save(make_frame(make_array()))
+        names = [name for name, _ in data_set.shared_memory_dataset.load().segments]
+        assert names
+        assert all(_segment_exists(name) for name in names)
+
+        pd.testing.assert_frame_equal(data_set.load(), make_frame(make_array()))
+        data_set.release()
+        assert not any(_segment_exists(name) for name in names)
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_parallel_run(self, is_async):
+        pipeline = Pipeline(
+            [
+                node(make_array, None, "array"),
+                node(make_frame, "array", "frame"),
+                node(check_read_only, "array", "array_sum"),
+                node(check_read_only, "frame", "frame_sum"),
+            ]
+        )
+        result = ParallelRunner(is_async=is_async).run(pipeline, DataCatalog())
+        expected = float(make_array().sum())
+        assert result == {"array_sum": expected, "frame_sum": expected}
+
+    def test_release_on_failure(self, mocker):
+        pipeline = Pipeline(
+            [node(make_array, None, "array"), node(exception_fn, "array", "out")]
+        )
+        runner = ParallelRunner()
+        release_spy = mocker.spy(runner, "_release_shared_data_sets")
+        with pytest.raises(Exception, match="test exception"):
+            runner.run(pipeline, DataCatalog())
+        release_spy.assert_called_once()
+
+
+# fails the imports of the ``multiprocessing`` modules added in Python 3.8
+_WITHOUT_SHARED_MEMORY = """
+import sys
+
+class Python37Finder:
+    def find_spec(self, name, path=None, target=None):
+        if name.split(".")[-1] in ("resource_tracker", "shared_memory"):
+            raise ImportError(name)
+
+sys.meta_path.insert(0, Python37Finder())
+from kedro.io import DataCatalog
+from kedro.pipeline import Pipeline, node
+from kedro.runner import ParallelRunner, parallel_runner
+
+assert not parallel_runner._USE_SHARED_MEMORY
+result = ParallelRunner(max_workers=2).run(
+    Pipeline([node(abs, "A", "B")]), DataCatalog(feed_dict={"A": -1})
+)
+assert result == {"B": 1}, result
+"""
+
+
+def test_without_shared_memory():
+    """Pythons older than 3.8 have no shared memory and resource tracker."""
+    subprocess.run([sys.executable, "-c", _WITHOUT_SHARED_MEMORY], check=True)
+
+
 @pytest.mark.skipif(
     sys.platform.startswith("win"), reason="Due to bug in parallel runner"
 )
@@ -424,17 +642,33 @@ class TestParallelRunnerRelease:
         assert list(log) == [("release", "save"), ("load", "load"), ("release", "load")]
 
 
+def run_states(node_, catalog, is_async, run_id):
+    return {
+        "token": {
+            "nodes": {node_.name: node_},
+            "catalog": catalog,
+            "is_async": is_async,
+            "run_id": run_id,
+        }
+    }
+
+
 @pytest.mark.parametrize("is_async", [False, True])
 class TestRunNodeSynchronisationHelper:
-    """Test class for _run_node_synchronization helper. It is tested manually
-    in isolation since it's called in the subprocess, which ParallelRunner
-    patches have no access to.
+    """Test class for _init_worker and _run_node_synchronization helpers. They
+    are tested manually in isolation since they're called in the subprocess,
+    which ParallelRunner patches have no access to.
     """
 
     @pytest.fixture(autouse=True)
     def mock_logging(self, mocker):
         return mocker.patch("logging.config.dictConfig")
 
+    @pytest.fixture(autouse=True)
+    def clean_worker_state(self):
+        yield
+        _WORKER_STATE.clear()
+
     @pytest.fixture
     def mock_run_node(self, mocker):
         return mocker.patch("kedro.runner.parallel_runner.run_node")
@@ -443,6 +677,10 @@ class TestRunNodeSynchronisationHelper:
     def mock_configure_project(self, mocker):
         return mocker.patch("kedro.framework.project.configure_project")
 
+    @pytest.fixture
+    def node_(self):
+        return node(identity, "A", "B", name="identity")
+
     @pytest.mark.parametrize("conf_logging", [{"fake_logging_config": True}, {}])
     def test_package_name_and_logging_provided(
         self,
@@ -451,23 +689,27 @@ class TestRunNodeSynchronisationHelper:
         mock_configure_project,
         is_async,
         conf_logging,
+        node_,
         mocker,
-    ):
+    ):  # pylint: disable=too-many-arguments
         mocker.patch("multiprocessing.get_start_method", return_value="spawn")
-        node_ = mocker.sentinel.node
         catalog = mocker.sentinel.catalog
         run_id = "fake_run_id"
         package_name = mocker.sentinel.package_name
 
-        _run_node_synchronization(
-            node_,
-            catalog,
-            is_async,
-            run_id,
+        _init_worker(
+            run_states(node_, catalog, is_async, run_id),
             package_name=package_name,
             conf_logging=conf_logging,
         )
-        mock_run_node.assert_called_once_with(node_, catalog, is_async, run_id)
+        durations = _run_node_synchronization("identity", "token")
+        assert list(durations) == ["identity"]
+        assert durations["identity"] >= 0
+        mock_run_node.assert_called_once_with(
+            node_, catalog, is_async, run_id, mocker.ANY, None, None
+        )
+        # nodes of the same run share the I/O executor of the worker
+        assert isinstance(mock_run_node.call_args[0][4], _IOExecutor)
         mock_logging.assert_called_once_with(conf_logging)
         mock_configure_project.assert_called_once_with(package_name)
 
@@ -477,32 +719,630 @@ class TestRunNodeSynchronisationHelper:
         mock_run_node,
         mock_configure_project,
         is_async,
+        node_,
         mocker,
-    ):
+    ):  # pylint: disable=too-many-arguments
         mocker.patch("multiprocessing.get_start_method", return_value="spawn")
-        node_ = mocker.sentinel.node
         catalog = mocker.sentinel.catalog
         run_id = "fake_run_id"
         package_name = mocker.sentinel.package_name
 
-        _run_node_synchronization(
-            node_, catalog, is_async, run_id, package_name=package_name
+        _init_worker(
+            run_states(node_, catalog, is_async, run_id), package_name=package_name
+        )
+        _run_node_synchronization("identity", "token")
+        mock_run_node.assert_called_once_with(
+            node_, catalog, is_async, run_id, mocker.ANY, None, None
         )
-        mock_run_node.assert_called_once_with(node_, catalog, is_async, run_id)
+        # nodes of the same run share the I/O executor of the worker
+        assert isinstance(mock_run_node.call_args[0][4], _IOExecutor)
         mock_logging.assert_called_once_with({})
         mock_configure_project.assert_called_once_with(package_name)
 
     def test_package_name_not_provided(
-        self, mock_logging, mock_run_node, is_async, mocker
+        self, mock_logging, mock_run_node, is_async, node_, mocker
     ):
         mocker.patch("multiprocessing.get_start_method", return_value="fork")
-        node_ = mocker.sentinel.node
         catalog = mocker.sentinel.catalog
         run_id = "fake_run_id"
         package_name = mocker.sentinel.package_name
 
-        _run_node_synchronization(
-            node_, catalog, is_async, run_id, package_name=package_name
+        _init_worker(
+            run_states(node_, catalog, is_async, run_id), package_name=package_name
+        )
+        _run_node_synchronization("identity", "token")
+        mock_run_node.assert_called_once_with(
+            node_, catalog, is_async, run_id, mocker.ANY, None, None
         )
-        mock_run_node.assert_called_once_with(node_, catalog, is_async, run_id)
+        # nodes of the same run share the I/O executor of the worker
+        assert isinstance(mock_run_node.call_args[0][4], _IOExecutor)
         mock_logging.assert_not_called()
+
+    def test_pickled_run_state_installed_once_per_run(
+        self, mock_run_node, is_async, node_, mocker
+    ):
+        """A reused pool fetches the pickled state of a run on the first node
+        of that run it is asked to execute."""
+        states = {
+            token: pickle.dumps(state)
+            for token, state in run_states(node_, "catalog", is_async, "run").items()
+        }
+        states["other_token"] = states["token"]
+        loads_spy = mocker.spy(pickle, "loads")
+
+        _init_worker(states)
+        _run_node_synchronization("identity", "token")
+        _run_node_synchronization("identity", "token")
+        assert loads_spy.call_count == 1
+
+        _run_node_synchronization("identity", "other_token")
+        assert loads_spy.call_count == 2
+        assert mock_run_node.call_count == 3
+
+    def test_attempt_saves_through_claims(self, mock_run_node, is_async, node_):
+        catalog = DataCatalog({"B": MemoryDataSet()})
+        states = run_states(node_, catalog, is_async, "run")
+        states["token"]["claims"] = {}
+        _init_worker(states)
+        _run_node_synchronization("identity", "token", 2)
+
+        attempt_catalog = mock_run_node.call_args[0][1]
+        assert isinstance(attempt_catalog, _ClaimingCatalog)
+        attempt_catalog.save("B", 42)
+        assert states["token"]["claims"] == {"identity": 2}
+        assert catalog.load("B") == 42
+
+    def test_spans_sent_to_runner(self, is_async, node_, tmp_path):
+        catalog = DataCatalog({"B": MemoryDataSet()}, feed_dict={"A": 42})
+        states = run_states(node_, catalog, is_async, "run")
+        events = []
+        states["token"]["trace"] = (tmp_path / "run.json", time.perf_counter(), events)
+        _init_worker(states)
+        _run_node_synchronization("identity", "token")
+
+        names = [event["name"] for event in events if event["ph"] == "X"]
+        assert names == ["load A", "function", "save B", "identity"]
+        assert _WORKER_STATE["tracer"].filepath == tmp_path / "run.json"
+
+    def test_catalog_sent_once_per_worker(self, is_async, node_, mocker):
+        """The catalog is installed by the pool initializer, so that node
+        submissions only carry the node name."""
+        executor_cls_mock = mocker.patch(
+            "kedro.runner.parallel_runner.ProcessPoolExecutor",
+            wraps=ProcessPoolExecutor,
+        )
+        submit_spy = mocker.spy(ProcessPoolExecutor, "submit")
+        catalog = DataCatalog(feed_dict={"A": 42})
+
+        ParallelRunner(is_async=is_async).run(Pipeline([node_]), catalog)
+
+        initargs = executor_cls_mock.call_args[1]["initargs"]
+        ((run_token, run_state),) = initargs[0].items()
+        assert run_state["nodes"] == {"identity": node_}
+        assert isinstance(run_state["catalog"], DataCatalog)
+        submit_spy.assert_called_once()
+        assert submit_spy.call_args[0][1:] == (
+            _run_node_synchronization,
+            "identity",
+            run_token,
+        )
+
+
+def worker_pid(arg):  # pylint: disable=unused-argument
+    return os.getpid()
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestReuseWorkers:
+    @pytest.fixture
+    def pid_pipeline(self):
+        return Pipeline(
+            [node(worker_pid, "A", f"pid{i}", name=f"pid{i}") for i in range(4)]
+        )
+
+    def test_workers_reused_across_runs(self, pid_pipeline, mocker):
+        executor_cls_mock = mocker.patch(
+            "kedro.runner.parallel_runner.ProcessPoolExecutor",
+            wraps=ProcessPoolExecutor,
+        )
+        runner = ParallelRunner(max_workers=2, reuse_workers=True)
+
+        first = runner.run(pid_pipeline, DataCatalog(feed_dict={"A": 1}))
+        second = runner.run(pid_pipeline, DataCatalog(feed_dict={"A": 2}))
+
+        executor_cls_mock.assert_called_once()
+        assert executor_cls_mock.call_args[1]["max_workers"] == 2
+        pids = set(first.values()) | set(second.values())
+        assert len(pids) <= 2
+        assert os.getpid() not in pids
+        assert not runner._run_states  # pylint: disable=protected-access
+        runner.close()
+
+    def test_close(self, pid_pipeline):
+        runner = ParallelRunner(reuse_workers=True)
+        first = runner.run(pid_pipeline, DataCatalog(feed_dict={"A": 1}))
+
+        runner.close()
+        runner.close()
+        second = runner.run(pid_pipeline, DataCatalog(feed_dict={"A": 1}))
+
+        assert not set(first.values()) & set(second.values())
+        runner.close()
+
+    def test_context_manager(self, pid_pipeline):
+        with ParallelRunner(reuse_workers=True) as runner:
+            runner.run(pid_pipeline, DataCatalog(feed_dict={"A": 1}))
+            assert runner._pool is not None  # pylint: disable=protected-access
+        assert runner._pool is None  # pylint: disable=protected-access
+
+    def test_pool_usable_after_failure(self, fan_out_fan_in):
+        with ParallelRunner(reuse_workers=True) as runner:
+            failing = Pipeline([node(exception_fn, "A", "B")])
+            with pytest.raises(Exception, match="test exception"):
+                runner.run(failing, DataCatalog(feed_dict={"A": 1}))
+
+            result = runner.run(fan_out_fan_in, DataCatalog(feed_dict={"A": 42}))
+            assert result["Z"] == (42, 42, 42)
+            assert not runner._run_states  # pylint: disable=protected-access
+
+
+@pytest.fixture
+def chains():
+    return Pipeline(
+        [
+            node(identity, "A", "B", name="head"),
+            node(identity, "B", "C", name="left1"),
+            node(identity, "C", "D", name="left2"),
+            node(identity, "B", "E", name="right1"),
+            node(identity, "E", "F", name="right2"),
+            node(fan_in, ["D", "F"], "Z", name="tail"),
+        ]
+    )
+
+
+def _task_names(tasks):
+    return sorted(tuple(n.name for n in task) for task in tasks)
+
+
+class TestNodeFusion:
+    def test_fuse_chains(self, chains):
+        tasks = _fuse_chains(chains.compile())
+        assert _task_names(tasks) == [
+            ("head",),
+            ("left1", "left2"),
+            ("right1", "right2"),
+            ("tail",),
+        ]
+
+    def test_fuse_linear_pipeline(self):
+        pipeline = Pipeline(
+            [node(identity, "A", "B", name="a"), node(identity, "B", "C", name="b")]
+        )
+        assert _task_names(_fuse_chains(pipeline.compile())) == [("a", "b")]
+
+    def test_local_data_sets(self, chains):
+        plan = chains.compile()
+        runner = ParallelRunner()
+        catalog = DataCatalog({"A": MemoryDataSet(42)})
+        for name in "BCDEFZ":
+            catalog.add(name, runner.create_default_data_set(name))
+        tasks = {tuple(n.name for n in task): task for task in _fuse_chains(plan)}
+
+        assert _local_data_sets(tasks[("left1", "left2")], plan, catalog) == ("C",)
+        assert _local_data_sets(tasks[("head",)], plan, catalog) == ()
+        assert _local_data_sets(tasks[("tail",)], plan, catalog) == ()
+
+    def test_registered_data_sets_are_not_local(self, chains):
+        plan = chains.compile()
+        catalog = DataCatalog({"C": LambdaDataSet(None, None)})
+        task = next(t for t in _fuse_chains(plan) if t[0].name == "left1")
+        assert _local_data_sets(task, plan, catalog) == ()
+
+    def test_batch_tiny_tasks(self, chains):
+        tasks = {tuple(n.name for n in t): t for t in _fuse_chains(chains.compile())}
+        ordered = [
+            tasks[("head",)],
+            tasks[("left1", "left2")],
+            tasks[("right1", "right2")],
+            tasks[("tail",)],
+        ]
+        durations = {"head": 0.004, "left1": 0.002, "left2": 0.002, "tail": 0.2}
+        batches = [
+            [tuple(n.name for n in task) for task in batch]
+            for batch in _batch_tiny_tasks(ordered, durations)
+        ]
+        # tasks without a known duration are not considered tiny
+        assert batches == [
+            [("head",), ("left1", "left2")],
+            [("right1", "right2")],
+            [("tail",)],
+        ]
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+    )
+    def test_parallel_run(self, chains, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        runner = ParallelRunner(fuse_nodes=True)
+        assert runner.run(chains, catalog) == {"Z": (42, 42)}
+        assert set(runner.node_durations) == {n.name for n in chains.nodes}
+        # the second run batches the tasks which were found to be tiny
+        assert runner.run(chains, catalog) == {"Z": (42, 42)}
+
+    def test_run_nodes_synchronization(self, chains, mocker):
+        run_node_spy = mocker.spy(parallel_runner, "run_node")
+        shared = mocker.Mock()
+        catalog = DataCatalog(
+            {"B": MemoryDataSet(42), "C": shared, "D": MemoryDataSet()}
+        )
+        nodes = {n.name: n for n in chains.nodes}
+        _init_worker(
+            {
+                "token": {
+                    "nodes": nodes,
+                    "catalog": catalog,
+                    "is_async": False,
+                    "run_id": None,
+                }
+            }
+        )
+        try:
+            durations = _run_nodes_synchronization(["left1", "left2"], "token", ["C"])
+        finally:
+            _WORKER_STATE.clear()
+
+        assert set(durations) == {"left1", "left2"}
+        assert [args[0].name for args, _ in run_node_spy.call_args_list] == [
+            "left1",
+            "left2",
+        ]
+        # "C" stayed in the worker memory
+        shared.save.assert_not_called()
+        assert catalog.load("D") == 42
+
+
+def with_pid(arg):
+    return os.getpid(), arg
+
+
+@pytest.fixture
+def pid_chains():
+    return Pipeline(
+        [
+            node(with_pid, "A", "B1", name="first1"),
+            node(with_pid, "B1", "C1", name="second1"),
+            node(with_pid, "A", "B2", name="first2"),
+            node(with_pid, "B2", "C2", name="second2"),
+        ]
+    )
+
+
+class TestLocality:
+    def test_affine_data_sets(self, chains):
+        plan = chains.compile()
+        runner = ParallelRunner()
+        catalog = DataCatalog({"A": MemoryDataSet(42)})
+        for name in "BCDEFZ":
+            catalog.add(name, runner.create_default_data_set(name))
+        tasks = [(n,) for n in plan.nodes]
+
+        affinity = {
+            consumer[0].name: (producer[0].name, name)
+            for consumer, (producer, name) in _affine_data_sets(
+                tasks, plan, catalog
+            ).items()
+        }
+        # "B" is loaded twice and "Z" is a pipeline output
+        assert affinity == {
+            "left2": ("left1", "C"),
+            "right2": ("right1", "E"),
+            "tail": ("left2", "D"),
+        }
+
+    def test_registered_data_sets_are_not_affine(self, chains):
+        plan = chains.compile()
+        catalog = DataCatalog({"C": LambdaDataSet(None, None)})
+        tasks = [(n,) for n in plan.nodes]
+        assert _affine_data_sets(tasks, plan, catalog) == {}
+
+    def test_held_data_sets(self, chains, mocker):
+        shared = mocker.Mock()
+        catalog = DataCatalog(
+            {"B": MemoryDataSet(42), "C": shared, "D": MemoryDataSet()}
+        )
+        _init_worker(
+            {
+                "token": {
+                    "nodes": {n.name: n for n in chains.nodes},
+                    "catalog": catalog,
+                    "is_async": False,
+                    "run_id": None,
+                }
+            }
+        )
+        try:
+            _run_nodes_synchronization(["left1"], "token", (), ["C"])
+            assert "C" in _WORKER_STATE["held_data"]
+            _run_nodes_synchronization(["left2"], "token")
+            # the consumer took the held data out of the worker memory
+            assert not _WORKER_STATE["held_data"]
+        finally:
+            _WORKER_STATE.clear()
+
+        shared.save.assert_not_called()
+        shared.load.assert_not_called()
+        assert catalog.load("D") == 42
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+    )
+    @pytest.mark.parametrize("fuse_nodes", [False, True])
+    def test_parallel_run(self, chains, catalog, fuse_nodes):
+        catalog.add_feed_dict(dict(A=42))
+        runner = ParallelRunner(locality=True, fuse_nodes=fuse_nodes)
+        assert runner.run(chains, catalog) == {"Z": (42, 42)}
+
+    @pytest.mark.skipif(
+        sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+    )
+    @pytest.mark.parametrize("reuse_workers", [False, True])
+    def test_consumer_runs_on_producer_worker(self, pid_chains, reuse_workers):
+        with ParallelRunner(
+            max_workers=2, locality=True, reuse_workers=reuse_workers
+        ) as runner:
+            for _ in range(2):
+                result = runner.run(pid_chains, DataCatalog(feed_dict={"A": 42}))
+                for i in "12":
+                    consumer_pid, (producer_pid, value) = result[f"C{i}"]
+                    assert consumer_pid == producer_pid
+                    assert value == 42
+
+
+def sleep_pid(arg):  # pylint: disable=unused-argument
+    time.sleep(0.3)
+    return os.getpid()
+
+
+@pytest.fixture
+def spare_capacity(mocker):
+    return mocker.patch(
+        "kedro.runner.parallel_runner._has_spare_capacity", return_value=True
+    )
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestAdaptiveWorkers:
+    def test_parallel_run(self, fan_out_fan_in, catalog):
+        catalog.add_feed_dict(dict(A=42))
+        runner = ParallelRunner(adaptive=True, fuse_nodes=True)
+        assert runner.run(fan_out_fan_in, catalog) == {"Z": (42, 42, 42)}
+
+    def test_pool_grows_with_waiting_tasks(self, spare_capacity):
+        pipeline = Pipeline(
+            [node(sleep_pid, "A", f"pid{i}", name=f"pid{i}") for i in range(4)]
+        )
+        with ParallelRunner(max_workers=8, adaptive=True) as runner:
+            result = runner.run(pipeline, DataCatalog(feed_dict={"A": 1}))
+        # the pool starts with one worker and is doubled while tasks wait
+        assert 1 < len(set(result.values())) <= 4
+
+    def test_pool_limited_by_spare_capacity(self, spare_capacity):
+        spare_capacity.return_value = False
+        pipeline = Pipeline(
+            [node(sleep_pid, "A", f"pid{i}", name=f"pid{i}") for i in range(2)]
+        )
+        runner = ParallelRunner(max_workers=2, adaptive=True)
+        result = runner.run(pipeline, DataCatalog(feed_dict={"A": 1}))
+        assert len(set(result.values())) == 1
+
+    def test_persistent_pool(self, fan_out_fan_in):
+        with ParallelRunner(adaptive=True, reuse_workers=True) as runner:
+            for value in range(2):
+                result = runner.run(fan_out_fan_in, DataCatalog(feed_dict={"A": value}))
+                assert result == {"Z": (value, value, value)}
+            assert isinstance(runner._pool, _AdaptivePool)
+
+    def test_scale(self, spare_capacity, mocker):
+        pool = _AdaptivePool(max_workers=4)
+        try:
+            assert pool.size == 1
+            # grows by at most its size at once, and never beyond max_workers
+            pool.scale(waiting=5)
+            assert pool.size == 2
+            pool.scale(waiting=5)
+            assert pool.size == 4
+            pool.scale(waiting=5)
+            assert pool.size == 4
+
+            # idle workers are kept for a while, then shut down, keeping one
+            future = pool.submit(time.sleep, 0.5)
+            pool.scale(waiting=0)
+            assert pool.size == 4
+            mocker.patch("kedro.runner.parallel_runner._IDLE_TIMEOUT", 0.0)
+            pool.scale(waiting=1)
+            assert pool.size == 2
+            pool.scale(waiting=0)
+            assert pool.size == 1
+            future.result()
+            assert pool.idle_workers() == [0]
+        finally:
+            pool.shutdown()
+
+    def test_shrink_without_spare_capacity(self, spare_capacity):
+        pool = _AdaptivePool(max_workers=2)
+        try:
+            pool.scale(waiting=2)
+            assert pool.size == 2
+            spare_capacity.return_value = False
+            pool.scale(waiting=3)
+            assert pool.size == 2
+            pool.scale(waiting=0)
+            assert pool.size == 1
+        finally:
+            pool.shutdown()
+
+    def test_adaptive_with_locality(self):
+        pattern = "`adaptive` and `locality` cannot be used together"
+        with pytest.raises(ValueError, match=pattern):
+            ParallelRunner(adaptive=True, locality=True)
+
+
+class TestSpareCapacity:
+    @pytest.mark.parametrize(
+        "load,memory,expected",
+        [
+            (0.5, (50, 100), True),
+            (0.5, None, True),
+            (4.0, (50, 100), False),
+            (0.5, (5, 100), False),
+        ],
+    )
+    def test_has_spare_capacity(
+        self, mocker, load, memory, expected
+    ):  # pylint: disable=too-many-arguments
+        mocker.patch("os.cpu_count", return_value=2)
+        mocker.patch("os.getloadavg", return_value=(load, load, load))
+        mocker.patch(
+            "kedro.runner.parallel_runner._available_memory", return_value=memory
+        )
+        assert _has_spare_capacity() is expected
+
+    @pytest.mark.skipif(
+        not sys.platform.startswith("linux"), reason="Reads /proc/meminfo"
+    )
+    def test_available_memory(self):
+        available, total = _available_memory()
+        assert 0 < available <= total
+
+
+def hang_first_attempt(marker):
+    if os.path.exists(marker):
+        return "second"
+    open(marker, "w").close()  # pylint: disable=consider-using-with
+    time.sleep(1.0)  # pragma: no cover
+    return "first"  # pragma: no cover
+
+
+def slow_first_attempt(marker):
+    if not os.path.exists(marker):
+        open(marker, "w").close()  # pylint: disable=consider-using-with
+        time.sleep(0.3)
+
+
+def record_first_attempt(marker):
+    if os.path.exists(marker):
+        return "second"
+    open(marker, "w").close()  # pylint: disable=consider-using-with
+    time.sleep(0.6)
+    Path(f"{marker}.end").write_text(str(time.time()))
+    return "first"
+
+
+def record_start(arg, marker):
+    Path(f"{marker}.start").write_text(str(time.time()))
+    return arg
+
+
+def fail_second_attempt(marker):
+    if os.path.exists(marker):
+        raise ValueError("second attempt failed")
+    open(marker, "w").close()  # pylint: disable=consider-using-with
+    time.sleep(0.6)
+    return "first"
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win"), reason="Due to bug in parallel runner"
+)
+class TestSpeculativeExecution:
+    @pytest.fixture
+    def run(self, tmp_path, mocker):
+        mocker.patch("kedro.runner.runner._MIN_SPECULATION_DELAY", 0.1)
+
+        def _run(func, **kwargs):
+            catalog = DataCatalog(
+                {"B": PickleDataSet(str(tmp_path / "B.pkl"))},
+                feed_dict={"marker": str(tmp_path / "marker")},
+            )
+            pipeline = Pipeline(
+                [node(func, "marker", "B", name="straggler", tags="idempotent")]
+            )
+            runner = ParallelRunner(
+                max_workers=2,
+                speculative=True,
+                node_durations={"straggler": 0.01},
+                **kwargs,
+            )
+            runner.run(pipeline, catalog)
+            return catalog
+
+        return _run
+
+    @pytest.mark.parametrize("adaptive", [False, True])
+    def test_straggler_started_again(self, run, adaptive, mocker):
+        mocker.patch(
+            "kedro.runner.parallel_runner._has_spare_capacity", return_value=True
+        )
+        start = time.perf_counter()
+        catalog = run(hang_first_attempt, adaptive=adaptive)
+        assert time.perf_counter() - start < 1.0
+        # the worker running the discarded attempt was killed
+        assert catalog.load("B") == "second"
+
+    def test_failed_attempt_ignored(self, run):
+        assert run(fail_second_attempt).load("B") == "first"
+
+    def test_attempts_completed_together(self, tmp_path, mocker):
+        """The attempt completed last is skipped when both attempts of a node
+        without outputs complete before the runner looks at either."""
+        mocker.patch("kedro.runner.runner._MIN_SPECULATION_DELAY", 0.1)
+
+        def wait_all(futures, timeout, return_when):
+            if len(futures) > 1:
+                return wait(futures)
+            return wait(futures, timeout=timeout, return_when=return_when)
+
+        mocker.patch("kedro.runner.parallel_runner.wait", side_effect=wait_all)
+        catalog = DataCatalog(feed_dict={"marker": str(tmp_path / "marker")})
+        pipeline = Pipeline(
+            [node(slow_first_attempt, "marker", None, name="n", tags="idempotent")]
+        )
+        runner = ParallelRunner(
+            max_workers=2, speculative=True, node_durations={"n": 0.01}
+        )
+        runner.run(pipeline, catalog)
+        assert runner.node_durations["n"] < 0.3
+
+    def test_resources_held_by_discarded_attempt(self, tmp_path, mocker):
+        mocker.patch("kedro.runner.runner._MIN_SPECULATION_DELAY", 0.1)
+        marker = str(tmp_path / "marker")
+        pipeline = Pipeline(
+            [
+                node(
+                    record_first_attempt,
+                    "marker",
+                    "B",
+                    name="straggler",
+                    tags="idempotent",
+                ),
+                # needs both CPU slots, one of which the discarded attempt holds
+                node(record_start, ["B", "marker"], "C", name="next", tags="cpus:2"),
+            ]
+        )
+        runner = ParallelRunner(
+            max_workers=2, speculative=True, node_durations={"straggler": 0.01}
+        )
+        catalog = DataCatalog(feed_dict={"marker": marker})
+        assert runner.run(pipeline, catalog) == {"C": "second"}
+        start = float(Path(f"{marker}.start").read_text())
+        assert start >= float(Path(f"{marker}.end").read_text())
+
+    @pytest.mark.parametrize("option", [{"fuse_nodes": True}, {"locality": True}])
+    def test_invalid_options(self, option):
+        pattern = "`speculative` cannot be used together with `fuse_nodes`"
+        with pytest.raises(ValueError, match=pattern):
+            ParallelRunner(speculative=True, **option)
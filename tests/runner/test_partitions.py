@@ -0,0 +1,146 @@
+from collections import Counter
+
+import pytest
+
+from kedro.io import DataCatalog, IncrementalDataSet, PartitionedDataSet
+from kedro.pipeline import Pipeline, map_node, node
+from kedro.runner import (
+    HybridRunner,
+    ParallelRunner,
+    RunCheckpoint,
+    SequentialRunner,
+    ThreadRunner,
+)
+from kedro.runner.partitions import _expand_map_nodes
+
+CALLS = Counter()  # type: Counter
+FAILING = set()
+
+
+def scale(partition, factor):
+    CALLS[partition] += 1
+    if partition in FAILING:
+        raise ValueError(f"partition {partition} failed")
+    return partition * factor
+
+
+def total(partitions):
+    return sum(partitions.values())
+
+
+def make_numbers():
+    return {"a": 1, "b": 2}
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    yield
+    CALLS.clear()
+    FAILING.clear()
+
+
+def partitioned(path):
+    return PartitionedDataSet(str(path), "pickle.PickleDataSet", filename_suffix=".pkl")
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    numbers = partitioned(tmp_path / "numbers")
+    numbers.save({f"p{number}": number for number in range(1, 5)})
+    return DataCatalog(
+        {"numbers": numbers, "scaled": partitioned(tmp_path / "scaled")},
+        feed_dict={"params:factor": 10},
+    )
+
+
+@pytest.fixture
+def mapping():
+    return Pipeline(
+        [
+            map_node(
+                scale,
+                ["numbers", "params:factor"],
+                ["scaled", "total"],
+                reduce=total,
+                name="scale",
+            )
+        ]
+    )
+
+
+class TestExpandMapNodes:
+    def test_expand(self, mapping, catalog):
+        expanded, expanded_catalog = _expand_map_nodes(mapping, catalog)
+        assert len(expanded.nodes) == 5
+        assert expanded.inputs() == {
+            "numbers[p1]",
+            "numbers[p2]",
+            "numbers[p3]",
+            "numbers[p4]",
+            "params:factor",
+        }
+        assert expanded_catalog.load("numbers[p3]") == 3
+        # the catalog of the run is left untouched
+        assert "numbers[p3]" not in catalog.list()
+        # expanding the pipeline again changes nothing
+        assert _expand_map_nodes(expanded, expanded_catalog) == (
+            expanded,
+            expanded_catalog,
+        )
+
+    def test_incremental_data_set(self, mapping, catalog, tmp_path):
+        catalog.add(
+            "numbers",
+            IncrementalDataSet(str(tmp_path / "numbers"), "pickle.PickleDataSet"),
+            replace=True,
+        )
+        assert _expand_map_nodes(mapping, catalog) == (mapping, catalog)
+
+    def test_unregistered_input(self, mapping):
+        catalog = DataCatalog(feed_dict={"params:factor": 10})
+        assert _expand_map_nodes(mapping, catalog) == (mapping, catalog)
+
+    def test_input_produced_by_pipeline(self, mapping, catalog):
+        pipeline = mapping + Pipeline([node(make_numbers, None, "numbers")])
+        assert _expand_map_nodes(pipeline, catalog) == (pipeline, catalog)
+
+
+@pytest.mark.parametrize(
+    "runner",
+    [
+        SequentialRunner(),
+        ThreadRunner(max_workers=2),
+        ParallelRunner(max_workers=2),
+        HybridRunner(max_workers=2, default_executor="process"),
+    ],
+)
+class TestRunMapNode:
+    def test_run(self, runner, mapping, catalog):
+        assert runner.run(mapping, catalog) == {"total": 100}
+        assert {
+            partition: load() for partition, load in catalog.load("scaled").items()
+        } == {"p1": 10, "p2": 20, "p3": 30, "p4": 40}
+
+    def test_run_unexpanded(self, runner, mapping):
+        # the partitions of data produced during the run are not known before
+        pipeline = mapping + Pipeline([node(make_numbers, None, "numbers")])
+        catalog = DataCatalog(feed_dict={"params:factor": 10})
+        assert runner.run(pipeline, catalog) == {
+            "scaled": {"a": 10, "b": 20},
+            "total": 30,
+        }
+
+
+def test_resume_failed_partitions(mapping, catalog, tmp_path):
+    checkpoint = RunCheckpoint(tmp_path / "checkpoint")
+    FAILING.add(3)
+    with pytest.raises(ValueError, match="partition 3 failed"):
+        SequentialRunner().run(mapping, catalog, checkpoint=checkpoint)
+    FAILING.clear()
+    completed = set(CALLS) - {3}
+    CALLS.clear()
+
+    outputs = SequentialRunner().run(mapping, catalog, resume=checkpoint)
+    assert outputs == {"total": 100}
+    # the partitions which completed before the failure are not run again
+    assert CALLS == Counter({1, 2, 3, 4} - completed)
@@ -0,0 +1,652 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from kedro.framework.hooks import hook_impl
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import DataCatalog, DataSetError, LambdaDataSet, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import NodeCache
+from kedro.runner.runner import (
+    _AttemptDiscarded,
+    _ClaimingCatalog,
+    _duration_history,
+    _IOExecutor,
+    _Speculator,
+    _WriteBehindCatalog,
+    run_node,
+    _collect_inputs_from_hook,
+    _critical_path_priorities,
+    _estimate_durations,
+    _get_node_resources,
+    _parse_memory,
+    _ReadyQueue,
+    _ResourceBudget,
+    _simulate_makespan,
+    _validate_priority,
+)
+from tests.runner.conftest import RecordingHooks
+
+
+def identity(arg):
+    return arg
+
+
+def fan_in(*args):
+    return args
+
+
+@pytest.fixture
+def fan_out_fan_in():
+    return Pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="left"),
+            node(identity, "B", "D", name="middle"),
+            node(identity, "B", "E", name="right"),
+            node(fan_in, ["C", "D", "E"], "Z", name="last"),
+        ]
+    )
+
+
+def _names(nodes):
+    return {n.name for n in nodes}
+
+
+class TestReadyQueue:
+    def test_initially_ready(self, fan_out_fan_in):
+        ready_queue = _ReadyQueue(fan_out_fan_in.node_dependencies)
+        assert len(ready_queue) == 1
+        assert _names(ready_queue.pop_all()) == {"first"}
+        assert len(ready_queue) == 0
+        assert _names(ready_queue.todo_nodes) == {"left", "middle", "right", "last"}
+
+    def test_mark_done_releases_children(self, fan_out_fan_in):
+        ready_queue = _ReadyQueue(fan_out_fan_in.node_dependencies)
+        first = ready_queue.pop()
+
+        newly_ready = ready_queue.mark_done(first)
+
+        assert _names(newly_ready) == {"left", "middle", "right"}
+        assert _names(ready_queue.pop_all()) == {"left", "middle", "right"}
+
+    def test_child_waits_for_all_parents(self, fan_out_fan_in):
+        ready_queue = _ReadyQueue(fan_out_fan_in.node_dependencies)
+        ready_queue.mark_done(ready_queue.pop())
+        left, middle, right = ready_queue.pop_all()
+
+        assert not ready_queue.mark_done(left)
+        assert not ready_queue.mark_done(middle)
+        assert _names(ready_queue.mark_done(right)) == {"last"}
+        assert _names(ready_queue.pop_all()) == {"last"}
+        assert not ready_queue.todo_nodes
+
+    def test_unresolvable_dependencies(self, fan_out_fan_in):
+        fake_node_deps = {
+            k: {"you_shall_not_pass"} for k in fan_out_fan_in.node_dependencies
+        }
+        ready_queue = _ReadyQueue(fake_node_deps)
+        assert not ready_queue.pop_all()
+        assert len(ready_queue.todo_nodes) == 5
+
+    def test_pop_all_admit(self, fan_out_fan_in):
+        ready_queue = _ReadyQueue(fan_out_fan_in.node_dependencies)
+        ready_queue.mark_done(ready_queue.pop())
+
+        taken = ready_queue.pop_all(admit=lambda n: n.name != "middle")
+
+        assert [n.name for n in taken] == ["left", "right"]
+        assert [n.name for n in ready_queue.pop_all()] == ["middle"]
+        assert _names(ready_queue.todo_nodes) == {"last"}
+
+
+@pytest.fixture
+def uneven_branches():
+    return Pipeline(
+        [
+            node(identity, "A", "B", name="short"),
+            node(identity, "A", "C1", name="long1"),
+            node(identity, "C1", "C2", name="long2"),
+            node(identity, "C2", "C3", name="long3"),
+        ]
+    )
+
+
+class TestCriticalPath:
+    def test_estimate_durations(self, uneven_branches):
+        durations = _estimate_durations(
+            uneven_branches.nodes, {"long1": 2.0, "long2": 4.0}
+        )
+        assert {n.name: d for n, d in durations.items()} == {
+            "short": 3.0,
+            "long1": 2.0,
+            "long2": 4.0,
+            "long3": 3.0,
+        }
+
+    def test_estimate_durations_uniform_default(self, uneven_branches):
+        durations = _estimate_durations(uneven_branches.nodes)
+        assert set(durations.values()) == {1.0}
+
+    def test_priorities(self, uneven_branches):
+        node_deps = uneven_branches.node_dependencies
+        durations = _estimate_durations(uneven_branches.nodes)
+        priorities = _critical_path_priorities(node_deps, durations)
+        assert {n.name: p for n, p in priorities.items()} == {
+            "short": 1.0,
+            "long1": 3.0,
+            "long2": 2.0,
+            "long3": 1.0,
+        }
+
+    def test_ready_queue_with_priorities(self, uneven_branches):
+        node_deps = uneven_branches.node_dependencies
+        durations = _estimate_durations(uneven_branches.nodes)
+        priorities = _critical_path_priorities(node_deps, durations)
+        ready_queue = _ReadyQueue(node_deps, priorities)
+        assert [n.name for n in ready_queue.pop_all()] == ["long1", "short"]
+
+    @pytest.mark.parametrize(
+        "workers,use_priorities,expected",
+        [(1, True, 4.0), (2, True, 3.0), (4, False, 3.0)],
+    )
+    def test_simulate_makespan(
+        self, uneven_branches, workers, use_priorities, expected
+    ):
+        node_deps = uneven_branches.node_dependencies
+        durations = _estimate_durations(uneven_branches.nodes)
+        priorities = (
+            _critical_path_priorities(node_deps, durations) if use_priorities else None
+        )
+        makespan = _simulate_makespan(node_deps, durations, workers, priorities)
+        assert makespan == expected
+
+    def test_invalid_priority(self):
+        with pytest.raises(ValueError, match="Unknown priority policy `fifo`"):
+            _validate_priority("fifo")
+
+
+class TestResources:
+    @pytest.mark.parametrize(
+        "memory,expected",
+        [
+            (1000, 1000),
+            ("1000", 1000),
+            ("2K", 2048),
+            ("1.5MB", 1536 * 1024),
+            ("4 GiB", 4 * 1024 ** 3),
+            ("1tb", 1024 ** 4),
+        ],
+    )
+    def test_parse_memory(self, memory, expected):
+        assert _parse_memory(memory) == expected
+
+    def test_parse_invalid_memory(self):
+        with pytest.raises(ValueError, match="Invalid amount of memory `lots`"):
+            _parse_memory("lots")
+
+    def test_node_resources(self):
+        assert _get_node_resources(node(identity, "A", "B")) == (1, 0)
+        tagged = node(identity, "A", "B", tags=["cpus:2", "memory:1K"])
+        assert _get_node_resources(tagged) == (2, 1024)
+
+    @pytest.mark.parametrize("tag", ["cpus:0", "cpus:two"])
+    def test_invalid_cpus(self, tag):
+        with pytest.raises(ValueError, match=f"Invalid tag `{tag}`"):
+            _get_node_resources(node(identity, "A", "B", tags=tag))
+
+    def test_budget_cpus(self):
+        small = node(identity, "A", "B", name="small")
+        large = node(identity, "A", "C", name="large", tags="cpus:2")
+        budget = _ResourceBudget([small, large], cpus=2)
+
+        assert budget.acquire(small)
+        assert not budget.acquire(large)
+        budget.release(small)
+        assert budget.acquire(large)
+
+    def test_budget_memory(self):
+        first = node(identity, "A", "B", name="first", tags="memory:3G")
+        second = node(identity, "A", "C", name="second", tags="memory:2G")
+        third = node(identity, "A", "D", name="third")
+        budget = _ResourceBudget([first, second, third], cpus=4, memory=4 * 1024 ** 3)
+
+        assert budget.acquire(first)
+        assert not budget.acquire(second)
+        assert budget.acquire(third)
+        budget.release(first)
+        assert budget.acquire(second)
+
+    def test_budget_unlimited_memory(self):
+        nodes = [
+            node(identity, "A", name, name=name, tags="memory:1T") for name in "BC"
+        ]
+        budget = _ResourceBudget(nodes, cpus=2)
+        assert all(budget.acquire(n) for n in nodes)
+
+    def test_requirements_capped_to_budget(self, caplog):
+        huge = node(identity, "A", "B", name="huge", tags=["cpus:8", "memory:8G"])
+        budget = _ResourceBudget([huge], cpus=2, memory=4 * 1024 ** 3)
+
+        assert budget.acquire(huge)
+        assert "Node `huge` declares more memory" in caplog.text
+
+
+class TestWriteBehindCatalog:
+    def test_saves_in_order(self):
+        saved = []
+        unblock = threading.Event()
+
+        def save(data):
+            if data == 1:
+                assert unblock.wait(5)
+            saved.append(data)
+
+        catalog = _WriteBehindCatalog(
+            DataCatalog(
+                {"ds@a": LambdaDataSet(None, save), "ds@b": LambdaDataSet(None, save)}
+            ),
+            _IOExecutor(),
+        )
+        catalog.save("ds@a", 1)
+        catalog.save("ds@b", 2)
+        unblock.set()
+        catalog.flush()
+        assert saved == [1, 2]
+
+    def test_load_in_memory(self):
+        data_set = LambdaDataSet(lambda: "stored", lambda data: None)
+        catalog = _WriteBehindCatalog(DataCatalog({"ds": data_set}), _IOExecutor())
+        assert catalog.load("ds") == "stored"
+        catalog.save("ds", [1, 2])
+        loaded = catalog.load("ds")
+        assert loaded == [1, 2]
+        # the data held in memory is copied like in a ``MemoryDataSet``
+        loaded.append(3)
+        assert catalog.load("ds") == [1, 2]
+        catalog.flush()
+
+    def test_memory_data_sets_are_saved_directly(self):
+        data_set = MemoryDataSet()
+        catalog = _WriteBehindCatalog(DataCatalog({"ds": data_set}), _IOExecutor())
+        catalog.save("ds", 42)
+        assert data_set.load() == 42
+        assert not catalog._saves
+
+    def test_exists_waits_for_save(self):
+        stored = []
+        unblock = threading.Event()
+        threading.Timer(0.05, unblock.set).start()
+
+        def save(data):
+            assert unblock.wait(5)
+            stored.append(data)
+
+        data_set = LambdaDataSet(None, save, exists=lambda: bool(stored))
+        catalog = _WriteBehindCatalog(DataCatalog({"ds": data_set}), _IOExecutor())
+        catalog.save("ds", 42)
+        assert catalog.exists("ds")
+        catalog.flush()
+
+    def test_failed_save(self):
+        def fail(data):
+            raise ValueError("save failed")
+
+        catalog = _WriteBehindCatalog(
+            DataCatalog(
+                {
+                    "ds@a": LambdaDataSet(None, fail),
+                    "ds@b": LambdaDataSet(lambda: 42, None),
+                }
+            ),
+            _IOExecutor(),
+        )
+        catalog.save("ds@a", 1)
+        # loading the same data under another name raises the error of the save
+        with pytest.raises(DataSetError, match=r"save failed"):
+            catalog.load("ds@b")
+        with pytest.raises(DataSetError, match=r"save failed"):
+            catalog.flush()
+
+    def test_release_after_save(self, mocker):
+        release = mocker.Mock()
+        data_set = LambdaDataSet(None, lambda data: None, release=release)
+        catalog = _WriteBehindCatalog(DataCatalog({"ds": data_set}), _IOExecutor())
+        catalog.save("ds", 42)
+        catalog.flush()
+        catalog.release("ds")
+        release.assert_called_once_with()
+
+    def test_release_waits_for_save(self, mocker):
+        release = mocker.Mock()
+        unblock = threading.Event()
+
+        def save(data):
+            assert unblock.wait(5)
+
+        catalog = _WriteBehindCatalog(
+            DataCatalog({"ds": LambdaDataSet(None, save, release=release)}),
+            _IOExecutor(),
+        )
+        catalog.save("ds", 42)
+        catalog.release("ds")
+        release.assert_not_called()
+        unblock.set()
+        catalog.flush()
+        release.assert_called_once_with()
+
+
+class TestIOExecutor:
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_run_node_without_executor(self, is_async):
+        catalog = DataCatalog({"A": MemoryDataSet(42), "B": MemoryDataSet()})
+        run_node(node(identity, "A", "B"), catalog, is_async)
+        assert catalog.load("B") == 42
+
+    def test_shutdown_deferred_by_kept_alive_calls(self):
+        io_executor = _IOExecutor()
+        io_executor.submit(identity, 42).result()
+        running = running_future()
+        io_executor.keep_alive([running])
+        io_executor.shutdown()
+        # the call kept alive can still load and save
+        assert io_executor.submit(identity, 42).result() == 42
+        assert io_executor._pool is not None
+
+        running.set_result(None)
+        assert io_executor._pool is None
+
+    def test_kept_alive_calls_done_before_shutdown(self):
+        io_executor = _IOExecutor()
+        io_executor.submit(identity, 42).result()
+        running = running_future()
+        io_executor.keep_alive([running])
+        running.set_result(None)
+        # the executor is only stopped by its shutdown
+        assert io_executor._pool is not None
+        io_executor.shutdown()
+        assert io_executor._pool is None
+
+    def test_pool_started_on_first_use(self):
+        io_executor = _IOExecutor()
+        io_executor.shutdown()
+        assert io_executor.submit(identity, 42).result() == 42
+        io_executor.shutdown()
+
+    def test_limit_keys(self):
+        io_executor = _IOExecutor({"ds": 1, "MemoryDataSet": 1, "other": 1})
+        catalog = DataCatalog({"ds": MemoryDataSet()})
+        with io_executor.limit(catalog, "ds"):
+            # both the limit of the name and the one of the type are held
+            assert not io_executor._semaphores["ds"].acquire(blocking=False)
+            assert not io_executor._semaphores["MemoryDataSet"].acquire(blocking=False)
+            assert io_executor._semaphores["other"].acquire(blocking=False)
+
+
+def running_future():
+    future = Future()
+    future.set_running_or_notify_cancel()
+    return future
+
+
+class TestSpeculator:
+    @pytest.fixture
+    def straggler(self):
+        return node(identity, "A", "B", name="straggler", tags=["idempotent"])
+
+    @pytest.fixture
+    def speculator(self, mocker):
+        mocker.patch("kedro.runner.runner._MIN_SPECULATION_DELAY", 0.01)
+        return _Speculator(_duration_history({"straggler": 0.001}))
+
+    def test_attempts(self, speculator, straggler):
+        other = node(identity, "A", "C", name="other")
+        assert speculator.attempt(other) is None
+        speculator.add(other, running_future())
+        assert speculator.attempt(straggler) == 0
+        speculator.add(straggler, running_future())
+        assert speculator.attempt(straggler) == 1
+
+    def test_stragglers(self, speculator, straggler):
+        future = running_future()
+        speculator.add(straggler, future)
+        assert speculator.stragglers(1) == []
+        time.sleep(0.02)
+        assert speculator.stragglers(0) == []
+        assert speculator.stragglers(1) == [straggler]
+
+        # a node is started again only once
+        speculator.add(straggler, running_future())
+        assert speculator.stragglers(1) == []
+
+    def test_no_duration_recorded(self, speculator):
+        unknown = node(identity, "A", "C", name="unknown", tags=["idempotent"])
+        speculator.add(unknown, running_future())
+        time.sleep(0.02)
+        assert speculator.stragglers(1) == []
+
+    def test_waiting_attempt(self, speculator, straggler):
+        future = Future()
+        speculator.add(straggler, future)
+        time.sleep(0.02)
+        # the attempt has not started running yet
+        assert speculator.stragglers(1) == []
+        future.set_running_or_notify_cancel()
+        future.set_result(None)
+        assert speculator.stragglers(1) == []
+
+    def test_done(self, speculator, straggler):
+        first, second = running_future(), running_future()
+        speculator.add(straggler, first)
+        speculator.add(straggler, second)
+        second.set_result(None)
+        assert speculator.done(straggler, second) == [first]
+        assert speculator.done(straggler, first) == []
+        assert len(speculator._history["straggler"]) == 2
+        assert speculator.running() == 1
+        first.set_result(None)
+        assert speculator.running() == 0
+
+    def test_done_with_duration(self, speculator, straggler):
+        future = running_future()
+        speculator.add(straggler, future)
+        future.set_result(None)
+        assert speculator.done(straggler, future, 0.5) == []
+        assert speculator._history["straggler"][-1] == 0.5
+
+    def test_retry(self, speculator, straggler):
+        first, second = running_future(), running_future()
+        speculator.add(straggler, first)
+        speculator.add(straggler, second)
+        # the failure is ignored while the other attempt runs
+        assert speculator.retry(straggler, second)
+        assert not speculator.retry(straggler, first)
+        assert speculator.stragglers(1) == []
+
+    def test_single_attempt_failed(self, speculator, straggler):
+        future = running_future()
+        speculator.add(straggler, future)
+        assert not speculator.retry(straggler, future)
+
+    def test_duration_history_size(self):
+        history = _duration_history({"node": 1.0})
+        history["node"].extend(range(20))
+        assert len(history["node"]) == 10
+        assert history["other"] == type(history["node"])(maxlen=10)
+
+
+class TestClaimingCatalog:
+    def test_first_attempt_to_save_claims_outputs(self):
+        catalog = DataCatalog(
+            {"A": MemoryDataSet(1), "B": MemoryDataSet(), "C": MemoryDataSet()}
+        )
+        straggler = node(identity, "A", ["B", "C"], name="straggler")
+        claims = {}
+        first = _ClaimingCatalog(catalog, straggler, 0, claims)
+        second = _ClaimingCatalog(catalog, straggler, 1, claims)
+
+        assert second.load("A") == 1
+        second.save("B", "second")
+        pattern = r"Attempt 0 of node `straggler` was discarded, as attempt 1"
+        with pytest.raises(_AttemptDiscarded, match=pattern):
+            first.save("C", "first")
+        second.save("C", "second")
+        assert catalog.load("B") == catalog.load("C") == "second"
+
+    def test_loads_of_discarded_attempt(self):
+        catalog = DataCatalog({"A": MemoryDataSet(1)})
+        straggler = node(identity, "A", "B", name="straggler")
+        claims = {}
+        first = _ClaimingCatalog(catalog, straggler, 0, claims)
+        second = _ClaimingCatalog(catalog, straggler, 1, claims)
+
+        first.check()
+        second.claim()
+        second.check()
+        with pytest.raises(_AttemptDiscarded, match="claimed its outputs first"):
+            first.load("A")
+
+
+class NodeRunHooks:
+    def __init__(self):
+        self.calls = []
+
+    @hook_impl
+    def after_node_run(self, node):
+        self.calls.append(("after_node_run", node.name))
+
+    @hook_impl
+    def on_node_error(self, node):
+        self.calls.append(("on_node_error", node.name))
+
+
+class TestDiscardedAttempt:
+    """An attempt whose outputs are claimed by another one while its function
+    runs neither calls the hooks nor caches or saves its outputs."""
+
+    @pytest.fixture
+    def hooks(self, mocker):
+        hook_manager = _create_hook_manager()
+        mocker.patch("kedro.runner.runner.get_hook_manager", return_value=hook_manager)
+        hooks = NodeRunHooks()
+        hook_manager.register(hooks)
+        return hooks
+
+    @pytest.fixture
+    def claims(self):
+        return {}
+
+    @pytest.fixture
+    def overtaken(self, claims):
+        """Node function claimed by another attempt while it runs."""
+
+        def _overtaken(arg, error=None):
+            claims["straggler"] = 1
+            if error is not None:
+                raise error
+            return arg
+
+        return _overtaken
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_outputs_not_used(self, hooks, claims, overtaken, tmp_path, is_async):
+        catalog = DataCatalog({"A": MemoryDataSet(1), "B": MemoryDataSet()})
+        straggler = node(overtaken, "A", "B", name="straggler")
+        node_cache = NodeCache(tmp_path / "cache")
+        attempt = _ClaimingCatalog(catalog, straggler, 0, claims)
+
+        with pytest.raises(_AttemptDiscarded):
+            run_node(straggler, attempt, is_async, node_cache=node_cache)
+        assert hooks.calls == []
+        assert node_cache.entries() == []
+        assert not catalog.exists("B")
+
+    def test_error_not_reported(self, hooks, claims, overtaken):
+        catalog = DataCatalog({"A": MemoryDataSet(1)})
+        straggler = node(
+            lambda arg: overtaken(arg, ValueError("late")), "A", "B", name="straggler"
+        )
+        attempt = _ClaimingCatalog(catalog, straggler, 0, claims)
+
+        with pytest.raises(_AttemptDiscarded):
+            run_node(straggler, attempt)
+        assert hooks.calls == []
+
+    def test_winning_attempt(self, hooks, claims):
+        catalog = DataCatalog({"A": MemoryDataSet(1), "B": MemoryDataSet()})
+        straggler = node(identity, "A", "B", name="straggler")
+        run_node(straggler, _ClaimingCatalog(catalog, straggler, 0, claims))
+        assert hooks.calls == [("after_node_run", "straggler")]
+        assert claims == {"straggler": 0}
+        assert catalog.load("B") == 1
+
+
+def fail(arg):
+    raise ValueError("node failed")
+
+
+def split(arg):
+    return arg, arg + 1
+
+
+class TestHookDispatch:
+    @pytest.fixture
+    def hook_manager(self, mocker):
+        hook_manager = _create_hook_manager()
+        mocker.patch("kedro.runner.runner.get_hook_manager", return_value=hook_manager)
+        return hook_manager
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_batched_hooks(self, hook_manager, is_async):
+        hooks = RecordingHooks()
+        hook_manager.register(hooks)
+        catalog = DataCatalog(
+            {"B": MemoryDataSet(), "C": MemoryDataSet()}, feed_dict={"A": 1}
+        )
+        run_node(node(split, "A", ["B", "C"], name="split"), catalog, is_async)
+
+        batched = [call for call in hooks.calls if call[0] != "after_dataset_saved"]
+        assert batched == [
+            ("before_datasets_loaded", "split", ["A"]),
+            ("after_datasets_loaded", "split", {"A": 1}),
+            ("before_datasets_saved", "split", {"B": 1, "C": 2}),
+            ("after_datasets_saved", "split", {"B": 1, "C": 2}),
+        ]
+        saved = {call[1:] for call in hooks.calls if call[0] == "after_dataset_saved"}
+        assert saved == {("B", 1), ("C", 2)}
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_node_without_outputs(self, hook_manager, is_async):
+        hooks = RecordingHooks()
+        hook_manager.register(hooks)
+        catalog = DataCatalog(feed_dict={"A": 1})
+        run_node(node(identity, "A", None, name="sink"), catalog, is_async)
+        assert [call[0] for call in hooks.calls] == [
+            "before_datasets_loaded",
+            "after_datasets_loaded",
+        ]
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_hooks_without_implementation(self, hook_manager, mocker, is_async):
+        caller_spy = mocker.spy(type(hook_manager.hook.after_node_run), "__call__")
+        catalog = DataCatalog({"B": MemoryDataSet()}, feed_dict={"A": 1})
+        run_node(node(identity, "A", "B", name="identity"), catalog, is_async)
+
+        assert catalog.load("B") == 1
+        caller_spy.assert_not_called()
+
+    def test_on_node_error_without_implementation(self, hook_manager, mocker):
+        caller_spy = mocker.spy(type(hook_manager.hook.on_node_error), "__call__")
+        catalog = DataCatalog(feed_dict={"A": 1})
+        with pytest.raises(ValueError, match="node failed"):
+            run_node(node(fail, "A", "B", name="fail"), catalog)
+        caller_spy.assert_not_called()
+
+    def test_inputs_not_copied_without_before_node_run(self, hook_manager):
+        inputs = {"A": 1}
+        added = _collect_inputs_from_hook(
+            node(identity, "A", "B"), DataCatalog(), inputs, False
+        )
+        assert added == {}
@@ -1,4 +1,8 @@
 # pylint: disable=unused-argument
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from random import random
 from typing import Any, Dict
 
@@ -14,6 +18,9 @@ from kedro.io import (
 )
 from kedro.pipeline import Pipeline, node
 from kedro.runner import SequentialRunner
+from kedro.runner import runner as runner_module
+from kedro.runner.runner import _IOExecutor
+from kedro.runner.sequential_runner import _PrefetchingCatalog
 
 
 @pytest.fixture
@@ -310,3 +317,378 @@ class TestSequentialRunnerRelease:
         catalog = DataCatalog(data_sets={"ds1": fake_dataset_instance})
         SequentialRunner(is_async=is_async).run(pipeline, catalog)
         fake_dataset_instance.confirm.assert_called_once_with()
+
+
+class ThreadLoggingDataSet(LoggingDataSet):
+    def _load(self) -> Any:
+        self.log.append(("load", self.name, threading.current_thread().name))
+        return self.value
+
+
+class TestSequentialRunnerPrefetch:
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_results_unchanged(self, is_async):
+        log = []
+        pipeline = Pipeline(
+            [
+                node(identity, "in1", "middle", name="first"),
+                node(multi_input_list_output, ["middle", "in2"], ["out", "unused"]),
+                node(identity, "in1", "out2", name="again"),
+            ]
+        )
+        catalog = DataCatalog(
+            {
+                "in1": LoggingDataSet(log, "in1", 1),
+                "in2": LoggingDataSet(log, "in2", 2),
+                "middle": LoggingDataSet(log, "middle"),
+            }
+        )
+        runner = SequentialRunner(is_async=is_async, prefetch=2)
+        result = runner.run(pipeline, catalog)
+        assert result == {"out": 1, "unused": 2, "out2": 1}
+        assert sorted(log) == sorted(
+            [
+                ("load", "in1"),
+                ("load", "in1"),
+                ("load", "in2"),
+                ("load", "middle"),
+                ("release", "middle"),
+            ]
+        )
+
+    def test_overlaps_load_with_node(self):
+        log = []
+        loaded = threading.Event()
+
+        class SignallingDataSet(ThreadLoggingDataSet):
+            def _load(self) -> Any:
+                data = super()._load()
+                loaded.set()
+                return data
+
+        def wait_for_load(arg):
+            return loaded.wait(5)
+
+        pipeline = Pipeline(
+            [
+                node(wait_for_load, "in1", "waited", name="first"),
+                node(identity, "in2", "out", name="second"),
+            ]
+        )
+        catalog = DataCatalog(
+            {
+                "in1": MemoryDataSet(1),
+                "in2": SignallingDataSet(log, "in2", 2),
+            }
+        )
+        result = SequentialRunner(prefetch=1).run(pipeline, catalog)
+        # "in2" was loaded while the first node was running
+        assert result == {"waited": True, "out": 2}
+        assert log[0][2] != threading.current_thread().name
+
+    def test_waits_for_producers(self):
+        log = []
+
+        def produce():
+            log.append("produced")
+            return 42
+
+        pipeline = Pipeline(
+            [node(produce, None, "ds@save"), node(sink, "ds@load", None)]
+        )
+        catalog = DataCatalog(
+            {
+                "ds@save": LoggingDataSet(log, "save"),
+                "ds@load": LoggingDataSet(log, "load"),
+            }
+        )
+        SequentialRunner(prefetch=2).run(pipeline, catalog)
+        assert log.index(("load", "load")) > log.index("produced")
+
+    def test_memory_cap(self):
+        log = []
+        pipeline = Pipeline(
+            [
+                node(identity, "in1", "out1", name="first"),
+                node(identity, "in2", "out2", name="second"),
+            ]
+        )
+        catalog = _PrefetchingCatalog(
+            DataCatalog(
+                {
+                    "in1": LoggingDataSet(log, "in1", "a" * 1000),
+                    "in2": LoggingDataSet(log, "in2", "b"),
+                }
+            )
+        )
+        runner = SequentialRunner(prefetch=2, max_prefetch_memory="1K")
+        nodes = pipeline.compile().nodes
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            catalog.prefetch(pool, "in1")
+            catalog._prefetched["in1"][0].result()
+            runner._prefetch_inputs(
+                pool, catalog, nodes, 0, {"in1", "in2"}, {}, {(0, "in1")}
+            )
+        # the data prefetched for the first node fills the cap
+        assert log == [("load", "in1")]
+        assert catalog.load("in1") == "a" * 1000
+        assert log == [("load", "in1")]
+
+    def test_memory_cap_reserved_by_running_loads(self):
+        log = []
+        release = threading.Event()
+
+        class WaitingDataSet(LoggingDataSet):
+            def _load(self) -> Any:
+                release.wait(5)
+                return super()._load()
+
+        nodes = (
+            node(identity, "in1", "out1", name="first"),
+            node(identity, "in2", "out2", name="second"),
+        )
+        catalog = _PrefetchingCatalog(
+            DataCatalog(
+                {
+                    "in1": WaitingDataSet(log, "in1", "a"),
+                    "in2": LoggingDataSet(log, "in2", "b"),
+                }
+            )
+        )
+        runner = SequentialRunner(prefetch=2, max_prefetch_memory="1K")
+        prefetched = set()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            runner._prefetch_inputs(
+                pool, catalog, nodes, 0, {"in1", "in2"}, {}, prefetched
+            )
+            # the running load of "in1" may take the whole cap
+            assert prefetched == {(0, "in1")}
+            release.set()
+            catalog._prefetched["in1"][0].result()
+            runner._prefetch_inputs(
+                pool, catalog, nodes, 0, {"in1", "in2"}, {}, prefetched
+            )
+            catalog._prefetched["in2"][0].result()
+        assert prefetched == {(0, "in1"), (1, "in2")}
+        assert catalog.expected_size("in1") == sys.getsizeof("a")
+
+    def test_memory_cap_deep_size(self):
+        data = {"rows": [str(i) * 1000 for i in range(10)]}
+        catalog = _PrefetchingCatalog(
+            DataCatalog({"in1": LambdaDataSet(lambda: data, None)})
+        )
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            catalog.prefetch(pool, "in1")
+            catalog._prefetched["in1"][0].result()
+        # the strings held by the dictionary are counted
+        assert catalog.prefetched_size() > 10000 > sys.getsizeof(data)
+
+    def test_prefetch_within_io_limits(self, mocker):
+        io_executor = _IOExecutor({"in1": 1})
+        limit = mocker.spy(io_executor, "limit")
+        catalog = _PrefetchingCatalog(
+            DataCatalog({"in1": LambdaDataSet(lambda: 42, None)}), io_executor
+        )
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            catalog.prefetch(pool, "in1")
+            catalog._prefetched["in1"][0].result()
+        limit.assert_called_once_with(catalog, "in1")
+        assert catalog.load("in1") == 42
+
+    def test_node_failure(self):
+        def fail(arg):
+            raise ValueError("test exception")
+
+        log = []
+        pipeline = Pipeline(
+            [
+                node(fail, "in1", "middle", name="first"),
+                node(multi_input_list_output, ["middle", "in2"], ["a", "b"]),
+            ]
+        )
+        catalog = DataCatalog(
+            {"in1": MemoryDataSet(1), "in2": LoggingDataSet(log, "in2")}
+        )
+        with pytest.raises(ValueError, match=r"test exception"):
+            SequentialRunner(prefetch=1).run(pipeline, catalog)
+
+    def test_delegates_to_run_catalog(self, mocker):
+        run_catalog = DataCatalog({"ds": MemoryDataSet(42)})
+        exists = mocker.spy(run_catalog, "exists")
+        catalog = _PrefetchingCatalog(run_catalog)
+        assert catalog.exists("ds")
+        exists.assert_called_once_with("ds")
+
+    def test_negative_prefetch(self):
+        with pytest.raises(ValueError, match=r"prefetch should be non-negative"):
+            SequentialRunner(prefetch=-1)
+
+
+class BlockingDataSet(LoggingDataSet):
+    """Saves only once ``event`` is set."""
+
+    def __init__(self, log, name, event, value=None):
+        super().__init__(log, name, value)
+        self.event = event
+
+    def _save(self, data: Any) -> None:
+        assert self.event.wait(5)
+        self.log.append(("save", self.name))
+        super()._save(data)
+
+
+class TestSequentialRunnerWriteBehind:
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_consumer_does_not_wait_for_save(self, is_async):
+        log = []
+        saved = threading.Event()
+
+        def unblock_save(arg):
+            log.append(("run", "consumer"))
+            saved.set()
+            return arg
+
+        pipeline = Pipeline(
+            [
+                node(identity, "in", "persisted"),
+                node(unblock_save, "persisted", "out"),
+            ]
+        )
+        persisted = BlockingDataSet(log, "persisted", saved)
+        catalog = DataCatalog({"in": MemoryDataSet(42), "persisted": persisted})
+        runner = SequentialRunner(is_async=is_async, write_behind=True)
+
+        assert runner.run(pipeline, catalog) == {"out": 42}
+        # the consumer got the data in memory, before it was saved, and the
+        # dataset was released once saved
+        assert log == [
+            ("run", "consumer"),
+            ("save", "persisted"),
+            ("release", "persisted"),
+        ]
+        assert persisted.value is None
+
+    def test_transcoded_consumer_waits_for_save(self):
+        log = []
+        saved = threading.Event()
+        saved.set()
+        pipeline = Pipeline(
+            [node(identity, "in", "ds@save"), node(identity, "ds@load", "out")]
+        )
+        catalog = DataCatalog(
+            {
+                "in": MemoryDataSet(42),
+                "ds@save": BlockingDataSet(log, "save", saved),
+                "ds@load": LoggingDataSet(log, "load", 42),
+            }
+        )
+        SequentialRunner(write_behind=True).run(pipeline, catalog)
+        assert log.index(("save", "save")) < log.index(("load", "load"))
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    @pytest.mark.parametrize("prefetch", [0, 1])
+    def test_transcoded_consumer_with_io_limit(self, is_async, prefetch, mocker):
+        submit = _IOExecutor.submit
+
+        def delayed_submit(io_executor, func, *args):
+            # the save starts once the load holds the slot
+            def delayed(*args):
+                time.sleep(0.1)
+                return func(*args)
+
+            return submit(io_executor, delayed, *args)
+
+        mocker.patch.object(_IOExecutor, "submit", delayed_submit)
+        log = []
+        saved = threading.Event()
+        saved.set()
+        pipeline = Pipeline(
+            [node(identity, "in", "ds@save"), node(identity, "ds@load", "out")]
+        )
+        catalog = DataCatalog(
+            {
+                "in": MemoryDataSet(42),
+                "ds@save": BlockingDataSet(log, "save", saved),
+                "ds@load": BlockingDataSet(log, "load", saved, 42),
+            }
+        )
+        runner = SequentialRunner(
+            is_async=is_async,
+            prefetch=prefetch,
+            write_behind=True,
+            io_limits={"BlockingDataSet": 1},
+        )
+        # the load waits for the save before taking the only slot of both
+        run = threading.Thread(target=runner.run, args=(pipeline, catalog))
+        run.daemon = True
+        run.start()
+        run.join(5)
+        deadlocked = run.is_alive()
+        if deadlocked:
+            # let the save through, so that the threads of the run can end
+            runner._io_executor._semaphores["BlockingDataSet"].release()
+        assert not deadlocked
+        assert log.index(("save", "save")) < log.index(("load", "load"))
+
+    def test_outputs_saved_before_run_ends(self):
+        log = []
+        saved = threading.Event()
+        threading.Timer(0.1, saved.set).start()
+        pipeline = Pipeline([node(identity, "in", "out")])
+        out = BlockingDataSet(log, "out", saved)
+        catalog = DataCatalog({"in": MemoryDataSet(42), "out": out})
+
+        SequentialRunner(write_behind=True).run(pipeline, catalog)
+        assert out.value == 42
+
+    def test_save_error(self):
+        def fail(data):
+            raise ValueError("save failed")
+
+        pipeline = Pipeline(
+            [node(identity, "in", "middle"), node(identity, "middle", "out")]
+        )
+        catalog = DataCatalog(
+            {"in": MemoryDataSet(42), "middle": LambdaDataSet(None, fail)}
+        )
+        with pytest.raises(DataSetError, match=r"save failed"):
+            SequentialRunner(write_behind=True).run(pipeline, catalog)
+
+    def test_with_prefetch(self):
+        log = []
+        saved = threading.Event()
+        saved.set()
+        pipeline = Pipeline(
+            [
+                node(identity, "in", "middle"),
+                node(multi_input_list_output, ["middle", "other"], ["a", "b"]),
+            ]
+        )
+        catalog = DataCatalog(
+            {
+                "in": LoggingDataSet(log, "in", 1),
+                "other": LoggingDataSet(log, "other", 2),
+                "middle": BlockingDataSet(log, "middle", saved),
+            }
+        )
+        runner = SequentialRunner(prefetch=2, write_behind=True)
+        assert runner.run(pipeline, catalog) == {"a": 1, "b": 2}
+        # "middle" is loaded from memory, neither prefetched nor read back
+        assert ("load", "middle") not in log
+        assert ("save", "middle") in log
+
+
+class TestSequentialRunnerIOExecutor:
+    def test_one_executor_per_run(self, mocker):
+        executor = mocker.spy(runner_module, "ThreadPoolExecutor")
+        pipeline = Pipeline(
+            [
+                node(identity, "in", "middle"),
+                node(identity, "middle", "out"),
+            ]
+        )
+        catalog = DataCatalog({"in": MemoryDataSet(42)})
+        result = SequentialRunner(is_async=True).run(pipeline, catalog)
+        assert result == {"out": 42}
+        # all the nodes share the threads of the run
+        executor.assert_called_once()
@@ -0,0 +1,188 @@
+import pytest
+
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import RunTracer, ScheduleSimulator, SequentialRunner
+from kedro.runner.simulator import SimulatedRun
+
+
+def identity(arg):
+    return arg
+
+
+def combine(*args):
+    return sum(args)
+
+
+@pytest.fixture
+def fan_out_fan_in():
+    return Pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="long"),
+            node(identity, "B", "D", name="short"),
+            node(identity, "B", "E", name="other_short"),
+            node(combine, ["C", "D", "E"], "F", name="last"),
+        ]
+    )
+
+
+@pytest.fixture
+def simulator(fan_out_fan_in):
+    return ScheduleSimulator(
+        fan_out_fan_in,
+        node_durations={
+            "first": 1.0,
+            "long": 4.0,
+            "short": 2.0,
+            "other_short": 2.0,
+            "last": 1.0,
+        },
+        data_set_sizes={"A": 1000, "B": 100, "C": 10, "D": 10, "E": 10, "F": 5},
+    )
+
+
+class TestAnalysis:
+    def test_graph(self, simulator):
+        assert simulator.node_count == 5
+        assert simulator.layer_widths == [1, 3, 1]
+        assert simulator.max_width == 3
+
+    def test_critical_path(self, simulator):
+        assert [n.name for n in simulator.critical_path] == ["first", "long", "last"]
+        assert simulator.critical_path_length == 6.0
+        assert simulator.total_duration == 10.0
+        assert simulator.speedup == pytest.approx(10.0 / 6.0)
+
+    def test_default_durations(self, fan_out_fan_in):
+        simulator = ScheduleSimulator(fan_out_fan_in)
+        assert simulator.critical_path_length == 3.0
+        assert simulator.simulate("SequentialRunner").makespan == 5.0
+
+    def test_empty_pipeline(self):
+        simulator = ScheduleSimulator(Pipeline([]))
+        assert simulator.critical_path == []
+        assert simulator.speedup == 1.0
+        assert simulator.simulate("ThreadRunner", 4) == SimulatedRun(
+            "ThreadRunner", 4, 0.0, 0
+        )
+        assert simulator.recommend_workers("ThreadRunner") == 1
+
+
+class TestSimulate:
+    @pytest.mark.parametrize(
+        "workers,makespan", [(1, 10.0), (2, 6.0), (3, 6.0), (8, 6.0)]
+    )
+    def test_makespan(self, simulator, workers, makespan):
+        run = simulator.simulate("ThreadRunner", workers)
+        assert run.runner == "ThreadRunner"
+        assert run.workers == workers
+        assert run.makespan == makespan
+
+    def test_sequential_runner_uses_one_worker(self, simulator):
+        run = simulator.simulate("SequentialRunner", 4)
+        assert run.workers == 1
+        assert run.makespan == 10.0
+
+    def test_cpus_tags(self, fan_out_fan_in):
+        tagged = Pipeline(
+            [n.tag("cpus:2") if n.name == "long" else n for n in fan_out_fan_in.nodes]
+        )
+        simulator = ScheduleSimulator(tagged)
+        # the node declaring two CPU slots runs on its own on two workers
+        assert simulator.simulate("ThreadRunner", 2).makespan == 4.0
+        assert simulator.simulate("ThreadRunner", 4).makespan == 3.0
+
+    def test_peak_memory(self, simulator):
+        # the persisted input of the first node, and the data it saves
+        assert simulator.simulate("SequentialRunner").peak_memory == 1100
+        # the worker also holds a copy of the in-memory output
+        assert simulator.simulate("ParallelRunner").peak_memory == 1200
+
+    def test_peak_memory_of_parallel_nodes(self, simulator, fan_out_fan_in):
+        lean = ScheduleSimulator(
+            fan_out_fan_in, data_set_sizes={"B": 100, "C": 10, "D": 10, "E": 10}
+        )
+        # B and the outputs of the three nodes running at the same time
+        assert lean.simulate("ThreadRunner", 3).peak_memory == 130
+        # the three workers hold a copy of B and of their outputs
+        assert lean.simulate("ParallelRunner", 3).peak_memory == 130 + 330
+        # B is released once the nodes loading it are done
+        assert lean.simulate("ThreadRunner", 1).peak_memory == 130
+
+    def test_persisted_data_sets(self, fan_out_fan_in):
+        simulator = ScheduleSimulator(
+            fan_out_fan_in,
+            data_set_sizes={"B": 100, "F": 5},
+            in_memory={"C", "D", "E"},
+        )
+        # B is only in memory while the nodes saving and loading it run
+        assert simulator.simulate("ThreadRunner", 1).peak_memory == 100
+        assert simulator.simulate("ThreadRunner", 3).peak_memory == 300
+
+    def test_unknown_runner(self, simulator):
+        pattern = r"Unknown runner `DaskRunner`\. Simulated runners: SequentialRunner"
+        with pytest.raises(ValueError, match=pattern):
+            simulator.simulate("DaskRunner")
+
+    def test_invalid_workers(self, simulator):
+        with pytest.raises(ValueError, match="workers should be positive"):
+            simulator.simulate("ThreadRunner", 0)
+
+
+class TestRecommendWorkers:
+    def test_recommend_workers(self, simulator):
+        assert simulator.recommend_workers("ThreadRunner") == 2
+        assert simulator.recommend_workers("ParallelRunner") == 2
+        assert simulator.recommend_workers("SequentialRunner") == 1
+
+    def test_tolerance(self, fan_out_fan_in):
+        simulator = ScheduleSimulator(
+            fan_out_fan_in,
+            node_durations={"first": 1, "long": 3, "short": 2, "other_short": 2},
+        )
+        # the last node takes the mean duration: two workers take 7s instead of 6s
+        assert simulator.recommend_workers("ThreadRunner") == 3
+        assert simulator.recommend_workers("ThreadRunner", tolerance=0.2) == 2
+
+    def test_slower_on_more_workers(self, mocker):
+        simulator = ScheduleSimulator(
+            Pipeline([node(identity, "A", str(i), name=str(i)) for i in range(5)])
+        )
+        # list schedules may get slower with more workers
+        makespans = {1: 10.0, 2: 6.0, 3: 9.0, 4: 8.0, 5: 6.0}
+        mocker.patch.object(
+            simulator,
+            "simulate",
+            side_effect=lambda runner, workers: SimulatedRun(
+                runner, workers, makespans[workers], 0
+            ),
+        )
+        assert simulator.recommend_workers("ThreadRunner") == 2
+
+
+def test_from_trace(tmp_path, fan_out_fan_in):
+    tracer = RunTracer(tmp_path / "run.json")
+    catalog = DataCatalog({"F": MemoryDataSet()}, feed_dict={"A": 1})
+    SequentialRunner(tracer=tracer).run(fan_out_fan_in, catalog)
+    tracer.add_events(
+        [
+            # a span of an earlier run, before the spans of the latest one
+            {"name": "first", "cat": "node", "ph": "X", "ts": -1e9, "dur": 1e9},
+            {
+                "name": "save B",
+                "cat": "save",
+                "ph": "X",
+                "ts": -1e9,
+                "dur": 0,
+                "args": {"size": 10 ** 12},
+            },
+        ]
+    )
+    tracer.save()
+
+    simulator = ScheduleSimulator.from_trace(fan_out_fan_in, tracer.filepath)
+    assert simulator.node_count == 5
+    # durations of the traced run, not of the earlier one
+    assert simulator.total_duration < 1
+    assert 0 < simulator.simulate("SequentialRunner").peak_memory < 10 ** 12
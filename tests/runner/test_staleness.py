@@ -0,0 +1,264 @@
+import os
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from kedro.extras.datasets.pickle import PickleDataSet
+from kedro.io import DataCatalog, MemoryDataSet, Version
+from kedro.pipeline import Pipeline, node
+from kedro.runner import NodeCache, SequentialRunner
+from kedro.runner.staleness import (
+    _MISSING,
+    _file_status,
+    _find_stale_nodes,
+    _get_data_set_statuses,
+    _to_timestamp,
+)
+
+CALLS = Counter()  # type: Counter
+
+
+def identity(arg):
+    CALLS["identity"] += 1
+    return arg
+
+
+def add(arg, params):
+    CALLS["add"] += 1
+    return arg + params
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    CALLS.clear()
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = DataCatalog(
+        {
+            name: PickleDataSet(str(tmp_path / f"{name}.pkl"))
+            for name in ("A", "B", "C", "D")
+        }
+    )
+    catalog.add_feed_dict({"params:amount": 1})
+    return catalog
+
+
+@pytest.fixture
+def pipeline():
+    return Pipeline(
+        [
+            node(add, ["A", "params:amount"], "B", name="add"),
+            node(identity, "B", "C", name="first"),
+            node(identity, "C", "D", name="second"),
+        ]
+    )
+
+
+def touch(catalog, name, timestamp):
+    os.utime(catalog._data_sets[name]._filepath, (timestamp, timestamp))
+
+
+@pytest.fixture
+def built(catalog):
+    """Save every dataset of the pipeline, each one after its inputs."""
+    for timestamp, name in enumerate(("A", "B", "C", "D"), start=1000):
+        catalog.save(name, 1)
+        touch(catalog, name, timestamp)
+    return catalog
+
+
+def without(catalog, name):
+    return DataCatalog(
+        {key: value for key, value in catalog._data_sets.items() if key != name}
+    )
+
+
+def names(nodes):
+    return sorted(node_.name for node_ in nodes)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (datetime(2021, 1, 1), 1609459200.0),
+        (datetime(2021, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))), 1609459200.0),
+        ("2021-01-01T00:00:00Z", 1609459200.0),
+        ("yesterday", None),
+        (12, 12.0),
+        (None, None),
+    ],
+)
+def test_to_timestamp(value, expected):
+    assert _to_timestamp(value) == expected
+
+
+def test_file_status():
+    assert repr(_file_status(None)) == "_MISSING"
+    assert _file_status({"name": "A", "size": 1}) is None
+    assert _file_status({"LastModified": datetime(2021, 1, 1)}) == 1609459200.0
+
+
+class TestGetDataSetStatuses:
+    def test_statuses(self, catalog):
+        catalog.save("A", 1)
+        touch(catalog, "A", 1000)
+        statuses = _get_data_set_statuses(catalog, ["A", "B", "params:amount", "E"])
+        assert statuses == {
+            "A": 1000.0,
+            "B": _MISSING,
+            "params:amount": None,
+            "E": _MISSING,
+        }
+
+    def test_one_listing_per_directory(self, tmp_path, mocker):
+        (tmp_path / "sub").mkdir()
+        catalog = DataCatalog(
+            {
+                "A": PickleDataSet(str(tmp_path / "A.pkl")),
+                "B": PickleDataSet(str(tmp_path / "B.pkl")),
+                "C": PickleDataSet(str(tmp_path / "sub" / "C.pkl")),
+            }
+        )
+        catalog.save("A", 1)
+        catalog.save("C", 1)
+        fs = catalog._data_sets["A"]._fs
+        ls = mocker.spy(type(fs), "ls")
+        exists = mocker.spy(catalog, "exists")
+
+        statuses = _get_data_set_statuses(catalog, ["A", "B", "C"])
+        assert statuses["B"] is _MISSING
+        assert statuses["A"] is not _MISSING
+        assert statuses["C"] is not _MISSING
+        assert ls.call_count == 2
+        exists.assert_not_called()
+
+    def test_missing_directory(self, tmp_path):
+        catalog = DataCatalog({"A": PickleDataSet(str(tmp_path / "sub" / "A.pkl"))})
+        assert _get_data_set_statuses(catalog, ["A"]) == {"A": _MISSING}
+
+    def test_listing_error(self, catalog, mocker):
+        catalog.save("A", 1)
+        fs = catalog._data_sets["A"]._fs
+        mocker.patch.object(type(fs), "ls", side_effect=PermissionError)
+        exists = mocker.spy(catalog, "exists")
+
+        statuses = _get_data_set_statuses(catalog, ["A", "B"])
+        assert statuses == {"A": None, "B": _MISSING}
+        assert exists.call_count == 2
+
+    def test_versioned_data_set(self, tmp_path):
+        data_set = PickleDataSet(str(tmp_path / "A.pkl"), version=Version(None, None))
+        catalog = DataCatalog({"A": data_set})
+        assert _get_data_set_statuses(catalog, ["A"]) == {"A": _MISSING}
+
+        catalog.save("A", 1)
+        load_path = data_set._get_load_path()
+        os.utime(load_path, (1000, 1000))
+        assert _get_data_set_statuses(catalog, ["A"]) == {"A": 1000.0}
+
+
+class TestFindStaleNodes:
+    def test_up_to_date(self, pipeline, built):
+        assert _find_stale_nodes(pipeline, built) == set()
+
+    def test_missing_output(self, pipeline, built):
+        os.remove(built._data_sets["C"]._filepath)
+        assert names(_find_stale_nodes(pipeline, built)) == ["first"]
+
+    def test_newer_input(self, pipeline, built):
+        touch(built, "A", 2000)
+        assert names(_find_stale_nodes(pipeline, built)) == ["add"]
+
+    def test_unknown_time(self, pipeline, built):
+        built.add("B", MemoryDataSet(1), replace=True)
+        touch(built, "A", 2000)
+        touch(built, "C", 500)
+        assert _find_stale_nodes(pipeline, built) == set()
+
+    def test_free_output(self, pipeline, built):
+        pipeline += Pipeline([node(identity, "D", "E", name="free")])
+        assert names(_find_stale_nodes(pipeline, built)) == ["free"]
+
+    def test_unregistered_intermediate(self, pipeline, built):
+        assert _find_stale_nodes(pipeline, without(built, "C")) == set()
+
+    def test_newer_input_of_unregistered_intermediate(self, pipeline, built):
+        # C is dated by the newest input of the node producing it
+        touch(built, "B", 2000)
+        assert names(_find_stale_nodes(pipeline, without(built, "C"))) == ["second"]
+
+    def test_stale_producer_of_unregistered_intermediate(
+        self, tmp_path, pipeline, built
+    ):
+        catalog = without(built, "B")
+        node_cache = NodeCache(tmp_path / "node_cache")
+        for node_ in pipeline.nodes:
+            node_cache.record_fingerprint(node_, catalog)
+        catalog.add_feed_dict({"params:amount": 2}, replace=True)
+        # the node loading B from the changed node is stale too
+        assert names(_find_stale_nodes(pipeline, catalog, node_cache)) == [
+            "add",
+            "first",
+        ]
+
+    def test_changed_code(self, tmp_path, pipeline, built):
+        node_cache = NodeCache(tmp_path / "node_cache")
+        assert names(_find_stale_nodes(pipeline, built, node_cache)) == [
+            "add",
+            "first",
+            "second",
+        ]
+        for node_ in pipeline.nodes:
+            node_cache.record_fingerprint(node_, built)
+        assert _find_stale_nodes(pipeline, built, node_cache) == set()
+
+        built.add_feed_dict({"params:amount": 2}, replace=True)
+        assert names(_find_stale_nodes(pipeline, built, node_cache)) == ["add"]
+
+
+class TestRunOnlyStale:
+    def test_run_stale_nodes_and_descendants(self, pipeline, built):
+        touch(built, "B", 2000)
+        SequentialRunner().run_only_stale(pipeline, built)
+        assert CALLS == {"identity": 2}
+
+    def test_nothing_stale(self, pipeline, built, caplog):
+        assert SequentialRunner().run_only_stale(pipeline, built) == {}
+        assert CALLS == {}
+        assert "0 of 3 nodes are stale." in caplog.text
+
+    def test_producer_of_unregistered_input(self, pipeline, built):
+        os.remove(built._data_sets["D"]._filepath)
+        SequentialRunner().run_only_stale(pipeline, without(built, "C"))
+        assert CALLS == {"identity": 2}
+
+    def test_change_through_unregistered_intermediate(self, pipeline, built):
+        touch(built, "B", 2000)
+        SequentialRunner().run_only_stale(pipeline, without(built, "C"))
+        assert CALLS == {"identity": 2}
+
+    def test_runner_overriding_run(self, pipeline, built):
+        class LegacyRunner(SequentialRunner):
+            def run(self, pipeline, catalog, run_id=None):
+                return super().run(pipeline, catalog, run_id)
+
+        touch(built, "B", 2000)
+        LegacyRunner().run_only_stale(pipeline, built)
+        assert CALLS == {"identity": 2}
+
+    def test_changed_parameters(self, tmp_path, pipeline, catalog):
+        catalog.save("A", 1)
+        runner = SequentialRunner(node_cache=NodeCache(tmp_path / "node_cache"))
+        runner.run_only_stale(pipeline, catalog)
+        assert CALLS == {"add": 1, "identity": 2}
+
+        runner.run_only_stale(pipeline, catalog)
+        assert CALLS == {"add": 1, "identity": 2}
+
+        catalog.add_feed_dict({"params:amount": 2}, replace=True)
+        runner.run_only_stale(pipeline, catalog)
+        assert CALLS == {"add": 2, "identity": 4}
+        assert catalog.load("D") == 3
@@ -1,4 +1,6 @@
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any, Dict
 
 import pytest
@@ -111,6 +113,48 @@ class TestMaxWorkers:
             ThreadRunner(max_workers=-1)
 
 
+class TestCriticalPathPriority:
+    @pytest.fixture
+    def uneven_branches(self):
+        return Pipeline(
+            [
+                node(identity, "short_in", "short_out", name="short"),
+                node(identity, "long_in", "C1", name="long1"),
+                node(identity, "C1", "C2", name="long2"),
+                node(identity, "C2", "long_out", name="long3"),
+            ]
+        )
+
+    def test_init_with_unknown_priority(self):
+        with pytest.raises(ValueError, match="Unknown priority policy"):
+            ThreadRunner(priority="fifo")
+
+    @pytest.mark.parametrize(
+        "priority,expected_first_load", [(None, "short"), ("critical_path", "long")]
+    )
+    def test_submission_order(self, uneven_branches, priority, expected_first_load):
+        log = []
+        catalog = DataCatalog(
+            {
+                "short_in": LoggingDataSet(log, "short", "stuff"),
+                "long_in": LoggingDataSet(log, "long", "stuff"),
+            }
+        )
+        ThreadRunner(max_workers=1, priority=priority).run(uneven_branches, catalog)
+        assert log[0] == ("load", expected_first_load)
+
+    def test_node_durations_recorded(self, uneven_branches, caplog):
+        catalog = DataCatalog(feed_dict={"short_in": 1, "long_in": 2})
+        runner = ThreadRunner(priority="critical_path", node_durations={"short": 5})
+        result = runner.run(uneven_branches, catalog)
+
+        assert result == {"short_out": 1, "long_out": 2}
+        assert set(runner.node_durations) == {"short", "long1", "long2", "long3"}
+        assert runner.node_durations["short"] < 5
+        assert "Pipeline makespan" in caplog.text
+        assert "predicted 15.00s" in caplog.text
+
+
 class TestIsAsync:
     def test_thread_run(self, fan_out_fan_in, catalog):
         catalog.add_feed_dict(dict(A=42))
@@ -279,3 +323,224 @@ class TestThreadRunnerRelease:
 
         # we want to see both datasets being released
         assert list(log) == [("release", "save"), ("load", "load"), ("release", "load")]
+
+
+class ConcurrencyProbe:
+    """Record the largest number of nodes running at the same time."""
+
+    def __init__(self):
+        self.running = self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, arg):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.05)
+        with self._lock:
+            self.running -= 1
+        return arg
+
+
+class TestResourceBudget:
+    @pytest.mark.parametrize(
+        "tags,max_memory,expected_peak",
+        [
+            ([], None, 4),
+            (["memory:1G"], "2G", 2),
+            (["cpus:2"], None, 2),
+            (["memory:3G"], "2GB", 1),
+        ],
+    )
+    def test_admission(self, tags, max_memory, expected_peak):
+        probe = ConcurrencyProbe()
+        pipeline = Pipeline(
+            [node(probe, "A", f"out{i}", name=f"n{i}", tags=tags) for i in range(4)]
+        )
+        catalog = DataCatalog({"A": MemoryDataSet(42)})
+        runner = ThreadRunner(max_workers=4, max_memory=max_memory)
+
+        result = runner.run(pipeline, catalog)
+
+        assert result == {f"out{i}": 42 for i in range(4)}
+        assert probe.peak == expected_peak
+
+    def test_invalid_max_memory(self):
+        with pytest.raises(ValueError, match="Invalid amount of memory"):
+            ThreadRunner(max_memory="plenty")
+
+
+class ProbeDataSet(AbstractDataSet):
+    """Record with ``probe`` the largest number of concurrent loads."""
+
+    def __init__(self, probe, protocol="file"):
+        self._probe = probe
+        self._protocol = protocol
+
+    def _load(self) -> Any:
+        return self._probe(42)
+
+    def _save(self, data: Any) -> None:  # pragma: no cover
+        pass
+
+    def _describe(self) -> Dict[str, Any]:
+        return {}
+
+
+class TestIOLimits:
+    @pytest.mark.parametrize(
+        "io_limits,catalog_io_limits,expected_peak",
+        [
+            ({}, {}, 4),
+            ({"ProbeDataSet": 2}, {}, 2),
+            ({"s3": 1}, {}, 1),
+            ({"in0": 1, "in1": 1, "in2": 1, "in3": 1}, {}, 4),
+            # the limits of the catalog entries take precedence
+            ({"ProbeDataSet": 4, "in1": 3}, {"in1": 1}, 4),
+        ],
+    )
+    def test_limits(self, io_limits, catalog_io_limits, expected_peak):
+        probe = ConcurrencyProbe()
+        data_sets = {f"in{i}": ProbeDataSet(probe, "s3") for i in range(4)}
+        pipeline = Pipeline(
+            [node(identity, f"in{i}", f"out{i}", name=f"n{i}") for i in range(4)]
+        )
+        catalog = DataCatalog(data_sets, io_limits=catalog_io_limits)
+        runner = ThreadRunner(max_workers=4, io_limits=io_limits)
+
+        assert runner.run(pipeline, catalog) == {f"out{i}": 42 for i in range(4)}
+        assert probe.peak == expected_peak
+
+    def test_entry_limit(self):
+        probe = ConcurrencyProbe()
+        pipeline = Pipeline(
+            [node(identity, "in", f"out{i}", name=f"n{i}") for i in range(4)]
+        )
+        catalog = DataCatalog({"in": ProbeDataSet(probe)}, io_limits={"in": 2})
+        ThreadRunner(max_workers=4).run(pipeline, catalog)
+        assert probe.peak == 2
+
+    @pytest.mark.parametrize("limit", [0, -1, 1.5])
+    def test_invalid_limit(self, limit):
+        with pytest.raises(ValueError, match=r"I/O limits should be positive"):
+            ThreadRunner(io_limits={"s3": limit})
+
+
+class Attempts:
+    """Node function sleeping, then returning or raising a different value on
+    each of its attempts."""
+
+    def __init__(self, *attempts):
+        self.__name__ = "attempts"
+        self._attempts = list(attempts)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def __call__(self, arg):  # pylint: disable=unused-argument
+        with self._lock:
+            delay, result = self._attempts[self.calls]
+            self.calls += 1
+        time.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class TestSpeculativeExecution:
+    @pytest.fixture(autouse=True)
+    def short_delay(self, mocker):
+        mocker.patch("kedro.runner.runner._MIN_SPECULATION_DELAY", 0.1)
+
+    @staticmethod
+    def run(attempts, tags=("idempotent",)):
+        log = []
+        catalog = DataCatalog({"A": MemoryDataSet(1), "B": LoggingDataSet(log, "B")})
+        pipeline = Pipeline([node(attempts, "A", "B", name="straggler", tags=tags)])
+        runner = ThreadRunner(speculative=True, node_durations={"straggler": 0.01})
+        runner.run(pipeline, catalog)
+        return catalog
+
+    def test_straggler_started_again(self, caplog):
+        attempts = Attempts((1.0, "first"), (0.0, "second"))
+        start = time.perf_counter()
+        catalog = self.run(attempts)
+        assert time.perf_counter() - start < 1.0
+        assert catalog.load("B") == "second"
+        assert "Node `straggler` runs longer than expected" in caplog.text
+
+        # the outputs of the discarded attempt are never saved
+        time.sleep(1.0)
+        assert catalog.load("B") == "second"
+
+    def test_failed_attempt_ignored(self):
+        attempts = Attempts((0.4, ValueError("first failed")), (0.6, "second"))
+        assert self.run(attempts).load("B") == "second"
+
+    def test_all_attempts_failed(self):
+        attempts = Attempts(
+            (0.4, ValueError("first failed")), (0.0, ValueError("second failed"))
+        )
+        with pytest.raises(ValueError, match="first failed"):
+            self.run(attempts)
+
+    def test_attempts_completed_together(self, mocker):
+        """The attempt completed last is skipped when both attempts of a node
+        without outputs complete before the runner looks at either."""
+
+        def wait_all(futures, timeout, return_when):
+            if len(futures) > 1:
+                return wait(futures)
+            return wait(futures, timeout=timeout, return_when=return_when)
+
+        mocker.patch("kedro.runner.thread_runner.wait", side_effect=wait_all)
+        attempts = Attempts((0.3, None), (0.0, None))
+        pipeline = Pipeline([node(attempts, "A", None, name="n", tags="idempotent")])
+        runner = ThreadRunner(speculative=True, node_durations={"n": 0.01})
+        runner.run(pipeline, DataCatalog({"A": MemoryDataSet(1)}))
+        assert attempts.calls == 2
+
+    def test_resources_held_by_discarded_attempt(self):
+        times = {}
+        attempts = Attempts((0.6, "first"), (0.0, "second"))
+
+        def straggle(arg):
+            result = attempts(arg)
+            times[f"{result}_attempt_end"] = time.perf_counter()
+            return result
+
+        def record_start(arg):
+            times["next_start"] = time.perf_counter()
+            return arg
+
+        pipeline = Pipeline(
+            [
+                node(straggle, "A", "B", name="straggler", tags="idempotent"),
+                # needs both CPU slots, one of which the discarded attempt holds
+                node(record_start, "B", "C", name="next", tags="cpus:2"),
+            ]
+        )
+        runner = ThreadRunner(
+            max_workers=2, speculative=True, node_durations={"straggler": 0.01}
+        )
+        assert runner.run(pipeline, DataCatalog({"A": MemoryDataSet(1)})) == {
+            "C": "second"
+        }
+        assert times["next_start"] >= times["first_attempt_end"]
+
+    def test_node_not_idempotent(self):
+        attempts = Attempts((0.3, "first"))
+        assert self.run(attempts, tags=()).load("B") == "first"
+        assert attempts.calls == 1
+
+    def test_durations_recorded(self):
+        runner = ThreadRunner(speculative=True)
+        pipeline = Pipeline([node(identity, "A", "B", name="n", tags="idempotent")])
+        for _ in range(2):
+            runner.run(pipeline, DataCatalog(feed_dict={"A": 1}))
+        assert len(runner._duration_history["n"]) == 2
+
+    @pytest.mark.parametrize("max_workers,expected", [(None, 2), (4, 2), (1, 1)])
+    def test_workers_for_second_attempts(self, max_workers, expected):
+        runner = ThreadRunner(max_workers=max_workers, speculative=True)
+        pipeline = Pipeline([node(identity, "A", "B")])
+        assert runner._get_required_workers_count(pipeline) == expected
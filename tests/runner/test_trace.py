@@ -0,0 +1,373 @@
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from kedro.framework.hooks import hook_impl
+from kedro.framework.hooks.manager import _create_hook_manager
+from kedro.io import DataCatalog, MemoryDataSet
+from kedro.pipeline import Pipeline, node
+from kedro.runner import (
+    ParallelRunner,
+    RunTracer,
+    SequentialRunner,
+    ThreadRunner,
+    run_node,
+)
+from kedro.runner.trace import _data_size, _no_span, _read_trace
+from tests.runner.conftest import RecordingHooks
+
+
+def identity(arg):
+    return arg
+
+
+def fail(arg):
+    raise ValueError("node failed")
+
+
+class NodeHooks:
+    @hook_impl
+    def before_node_run(self):
+        return None
+
+    @hook_impl
+    def after_node_run(self):
+        pass
+
+    @hook_impl
+    def on_node_error(self):
+        pass
+
+    @hook_impl
+    def before_dataset_loaded(self):
+        pass
+
+    @hook_impl
+    def after_dataset_loaded(self):
+        pass
+
+    @hook_impl
+    def before_dataset_saved(self):
+        pass
+
+
+def load_trace(filepath):
+    with open(filepath) as trace_file:
+        trace = json.load(trace_file)
+    assert trace["displayTimeUnit"] == "ms"
+    return trace["traceEvents"]
+
+
+def spans(events, category=None):
+    return [
+        event
+        for event in events
+        if event["ph"] == "X" and category in (None, event["cat"])
+    ]
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    return RunTracer(tmp_path / "trace" / "run.json")
+
+
+class TestRunTracer:
+    def test_span(self, tracer):
+        with tracer.span("node", "node", attempt=1):
+            time.sleep(0.01)
+        (event,) = tracer.pop_events()[1:]
+        assert event["name"] == "node"
+        assert event["cat"] == "node"
+        assert event["ph"] == "X"
+        assert event["ts"] >= 0
+        assert event["dur"] >= 10000
+        assert event["pid"] == os.getpid()
+        assert event["tid"] == threading.get_ident()
+        assert event["args"] == {"attempt": 1}
+
+    def test_span_without_args(self, tracer):
+        with tracer.span("node", "node"):
+            pass
+        assert "args" not in tracer.pop_events()[-1]
+
+    def test_span_data(self, tracer):
+        data = list(range(100))
+        with tracer.span("save A", "save", data=data):
+            pass
+        size = sys.getsizeof(data) + sum(sys.getsizeof(item) for item in data)
+        assert tracer.pop_events()[-1]["args"] == {"size": size}
+
+    def test_span_recorded_on_error(self, tracer):
+        with pytest.raises(ValueError, match="failed"):
+            with tracer.span("node", "node"):
+                raise ValueError("failed")
+        assert len(spans(tracer.pop_events())) == 1
+
+    def test_origin(self, tmp_path):
+        origin = time.perf_counter()
+        tracer = RunTracer(tmp_path / "run.json", origin=origin - 1)
+        assert tracer.origin == origin - 1
+        assert tracer.filepath == tmp_path / "run.json"
+        with tracer.span("node", "node"):
+            pass
+        assert tracer.pop_events()[-1]["ts"] >= 1e6
+
+    def test_pop_events(self, tracer):
+        with tracer.span("node", "node"):
+            pass
+        events = tracer.pop_events()
+        assert events[0] == {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {"name": threading.current_thread().name},
+        }
+        assert len(spans(events)) == 1
+        # the thread names are sent again, but the spans only once
+        assert tracer.pop_events() == events[:1]
+
+    def test_add_events(self, tracer, tmp_path):
+        worker = RunTracer(tmp_path / "worker.json", origin=tracer.origin)
+        with worker.span("node", "node"):
+            pass
+        events = worker.pop_events()
+        tracer.add_events(events)
+        assert tracer.pop_events() == events
+
+    def test_save(self, tracer):
+        with tracer.span("first", "node"):
+            pass
+        tracer.add_events(
+            [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": 2,
+                    "args": {"name": "t"},
+                },
+                {
+                    "name": "second",
+                    "cat": "node",
+                    "ph": "X",
+                    "ts": 1e9,
+                    "pid": 1,
+                    "tid": 2,
+                },
+            ]
+        )
+        tracer.add_events(
+            [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": 2,
+                    "args": {"name": "t"},
+                }
+            ]
+        )
+        tracer.save()
+
+        events = load_trace(tracer.filepath)
+        assert [event["name"] for event in spans(events)] == ["first", "second"]
+        processes = {
+            event["pid"]: event["args"]["name"]
+            for event in events
+            if event["name"] == "process_name"
+        }
+        assert processes == {os.getpid(): "runner", 1: "worker 1"}
+        # the events are kept, to write them again with those of later runs
+        assert len(spans(tracer.pop_events())) == 2
+
+    def test_read_trace(self, tracer):
+        tracer.add_events(
+            [
+                {"name": "first", "cat": "node", "ph": "X", "ts": 2e6, "dur": 5e5},
+                {"name": "first", "cat": "node", "ph": "X", "ts": 1e6, "dur": 1e6},
+                {
+                    "name": "save A",
+                    "cat": "save",
+                    "ph": "X",
+                    "ts": 2e6,
+                    "dur": 0,
+                    "args": {"size": 10},
+                },
+                {"name": "save B", "cat": "save", "ph": "X", "ts": 2e6, "dur": 0},
+                {"name": "load A", "cat": "load", "ph": "X", "ts": 3e6, "dur": 1},
+            ]
+        )
+        tracer.save()
+        # the values of the latest spans are kept
+        assert _read_trace(tracer.filepath) == ({"first": 0.5}, {"A": 10})
+
+    def test_no_span(self):
+        with pytest.raises(ValueError, match="failed"):
+            with _no_span("node", "node", attempt=1):
+                raise ValueError("failed")
+
+
+class TestRunNodeTrace:
+    @pytest.fixture(autouse=True)
+    def hook_manager(self, mocker):
+        hook_manager = _create_hook_manager()
+        mocker.patch("kedro.runner.runner.get_hook_manager", return_value=hook_manager)
+        return hook_manager
+
+    @pytest.mark.parametrize("is_async", [False, True])
+    def test_spans(self, tracer, hook_manager, is_async):
+        hook_manager.register(RecordingHooks())
+        hook_manager.register(NodeHooks())
+        catalog = DataCatalog({"B": MemoryDataSet()}, feed_dict={"A": 1})
+        run_node(
+            node(identity, "A", "B", name="identity"), catalog, is_async, tracer=tracer
+        )
+
+        events = spans(tracer.pop_events())
+        node_span = events[-1]
+        assert node_span["name"] == "identity"
+        assert node_span["cat"] == "node"
+        for event in events[:-1]:
+            # the spans of the node are nested in it
+            assert node_span["ts"] <= event["ts"]
+            assert event["ts"] + event["dur"] <= node_span["ts"] + node_span["dur"]
+        assert {(event["name"], event["cat"]) for event in events[:-1]} == {
+            ("before_datasets_loaded", "hook"),
+            ("before_dataset_loaded", "hook"),
+            ("load A", "load"),
+            ("after_dataset_loaded", "hook"),
+            ("after_datasets_loaded", "hook"),
+            ("before_node_run", "hook"),
+            ("function", "function"),
+            ("after_node_run", "hook"),
+            ("before_datasets_saved", "hook"),
+            ("before_dataset_saved", "hook"),
+            ("save B", "save"),
+            ("after_dataset_saved", "hook"),
+            ("after_datasets_saved", "hook"),
+        }
+
+    def test_failed_node(self, tracer, hook_manager):
+        hook_manager.register(NodeHooks())
+        catalog = DataCatalog(feed_dict={"A": 1})
+        with pytest.raises(ValueError, match="node failed"):
+            run_node(node(fail, "A", "B", name="fail"), catalog, tracer=tracer)
+        names = [event["name"] for event in spans(tracer.pop_events())]
+        assert names[-3:] == ["function", "on_node_error", "fail"]
+
+    def test_unimplemented_hooks_not_traced(self, tracer):
+        catalog = DataCatalog({"B": MemoryDataSet()}, feed_dict={"A": 1})
+        run_node(node(identity, "A", "B", name="identity"), catalog, tracer=tracer)
+        events = spans(tracer.pop_events())
+        assert [event["name"] for event in events] == [
+            "load A",
+            "function",
+            "save B",
+            "identity",
+        ]
+        # the size of the saved data is recorded
+        assert events[2]["args"] == {"size": sys.getsizeof(1)}
+
+
+def pipeline():
+    return Pipeline(
+        [
+            node(identity, "A", "B", name="first"),
+            node(identity, "B", "C", name="second"),
+            node(identity, "B", "D", name="third"),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "runner_class,runner_args",
+    [
+        (SequentialRunner, {}),
+        (SequentialRunner, {"is_async": True}),
+        (ThreadRunner, {"max_workers": 2}),
+        (ParallelRunner, {"max_workers": 2}),
+        (ParallelRunner, {"max_workers": 2, "fuse_nodes": True}),
+    ],
+)
+class TestRunnerTrace:
+    def test_run(self, tracer, runner_class, runner_args):
+        runner = runner_class(tracer=tracer, **runner_args)
+        catalog = DataCatalog(feed_dict={"A": 1})
+        runner.run(pipeline(), catalog)
+
+        events = load_trace(tracer.filepath)
+        node_spans = spans(events, "node")
+        assert sorted(event["name"] for event in node_spans) == [
+            "first",
+            "second",
+            "third",
+        ]
+        thread_names = {
+            (event["pid"], event["tid"])
+            for event in events
+            if event["name"] == "thread_name"
+        }
+        assert {(event["pid"], event["tid"]) for event in node_spans} <= thread_names
+        processes = {
+            event["pid"] for event in events if event["name"] == "process_name"
+        }
+        if runner_class is ParallelRunner:
+            # the nodes run in the worker processes
+            assert os.getpid() not in {event["pid"] for event in node_spans}
+            assert len(processes) > 1
+        else:
+            assert processes == {os.getpid()}
+        if runner_class is not SequentialRunner:
+            assert spans(events, "scheduler")
+
+    def test_failed_run(self, tracer, runner_class, runner_args):
+        runner = runner_class(tracer=tracer, **runner_args)
+        catalog = DataCatalog(feed_dict={"A": 1})
+        failing = Pipeline(
+            [node(identity, "A", "B", name="first"), node(fail, "B", "C")]
+        )
+        with pytest.raises(ValueError, match="node failed"):
+            runner.run(failing, catalog)
+
+        names = {event["name"] for event in spans(load_trace(tracer.filepath), "node")}
+        assert names == {"first", "fail([B]) -> [C]"}
+
+
+def test_reused_workers(tracer):
+    with ParallelRunner(max_workers=2, reuse_workers=True, tracer=tracer) as runner:
+        for _ in range(2):
+            runner.run(pipeline(), DataCatalog(feed_dict={"A": 1}))
+
+    node_spans = spans(load_trace(tracer.filepath), "node")
+    assert len(node_spans) == 6
+    assert os.getpid() not in {event["pid"] for event in node_spans}
+
+
+class TestDataSize:
+    def test_containers(self):
+        rows = [str(i) * 1000 for i in range(10)]
+        data = {"rows": rows, "same": rows}
+        expected = (
+            sys.getsizeof(data)
+            + sys.getsizeof("rows")
+            + sys.getsizeof("same")
+            + sys.getsizeof(rows)
+            + sum(sys.getsizeof(row) for row in rows)
+        )
+        # the list held twice is counted once
+        assert _data_size(data) == expected
+
+    def test_array(self):
+        assert _data_size(np.zeros(1000)) == 8000
+
+    def test_dataframe(self):
+        data = pd.DataFrame({"col": [str(i) * 1000 for i in range(10)]})
+        assert _data_size(data) == data.memory_usage(deep=True).sum()
+        assert _data_size(data["col"]) == data["col"].memory_usage(deep=True)